@@ -0,0 +1,194 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark of the element index shared by the audit checks of a page.
+
+Times, on a generated page:
+
+- the element lookups the checks make, answered by BeautifulSoup tree scans
+  (as the checks did before the index) and by a DocumentIndex, including the
+  time to build the index;
+- all checks of a page with one shared index, and with one index per check;
+- the full audit of the page.
+
+Usage, from the pdf2html directory with the package installed:
+    python benchmarks/document_index_benchmark.py [--blocks 1000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import time
+
+from content_accessibility_utility_on_aws.audit.auditor import AccessibilityAuditor
+from content_accessibility_utility_on_aws.audit.checks import (
+    AltTextCheck,
+    ColorContrastCheck,
+    DocumentLanguageCheck,
+    DocumentTitleCheck,
+    FigureStructureCheck,
+    FormFieldsetCheck,
+    FormLabelCheck,
+    FormRequiredFieldCheck,
+    HeadingContentCheck,
+    HeadingHierarchyCheck,
+    LandmarksCheck,
+    LinkTextCheck,
+    MainLandmarkCheck,
+    NewWindowLinkCheck,
+    SkipLinkCheck,
+    TableHeaderCheck,
+    TableStructureCheck,
+)
+from content_accessibility_utility_on_aws.audit.document_index import DocumentIndex
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
+
+CHECKS = [
+    HeadingHierarchyCheck,
+    HeadingContentCheck,
+    DocumentTitleCheck,
+    DocumentLanguageCheck,
+    MainLandmarkCheck,
+    SkipLinkCheck,
+    LandmarksCheck,
+    AltTextCheck,
+    FigureStructureCheck,
+    LinkTextCheck,
+    NewWindowLinkCheck,
+    TableHeaderCheck,
+    TableStructureCheck,
+    ColorContrastCheck,
+    FormLabelCheck,
+    FormRequiredFieldCheck,
+    FormFieldsetCheck,
+]
+
+# Page-wide lookups made by the checks
+TAG_LOOKUPS = [
+    "h1", "h2", "h3", "h4", "h5", "h6", "img", "figure", "a", "table",
+    "form", "input", "select", "textarea", "label", "fieldset", "title",
+    "main", "nav", "body", "html",
+]
+ROLE_LOOKUPS = ["main", "navigation", "banner", "contentinfo"]
+
+
+def generate_page(blocks: int) -> str:
+    """Generate a page with headings, text, images, links, tables and forms."""
+    parts = ['<html lang="en"><head><title>Benchmark</title></head><body><main>']
+    for i in range(blocks):
+        kind = i % 6
+        if kind == 0:
+            parts.append(f"<h{i % 4 + 2}>Section {i}</h{i % 4 + 2}>")
+        elif kind == 1:
+            parts.append(
+                f'<p style="color: #777">Paragraph {i} with '
+                f'<a href="#s{i}">a link</a> and <span>inline text</span>.</p>'
+            )
+        elif kind == 2:
+            parts.append(
+                f'<figure><img src="image-{i}.png">'
+                f"<figcaption>Figure {i}</figcaption></figure>"
+            )
+        elif kind == 3:
+            rows = "".join(
+                f"<tr><td>{row}</td><td>{row * 2}</td></tr>" for row in range(4)
+            )
+            parts.append(f"<table><tr><th>A</th><th>B</th></tr>{rows}</table>")
+        elif kind == 4:
+            parts.append(
+                f'<form><label for="f{i}">Field</label><input id="f{i}" type="text">'
+                '<input type="checkbox"><select><option>1</option></select></form>'
+            )
+        else:
+            parts.append(
+                f'<div><ul><li><a href="page-{i}.html" target="_blank">Open</a></li>'
+                "<li>Item</li></ul></div>"
+            )
+    parts.append("</main></body></html>")
+    return "".join(parts)
+
+
+def _soup_lookups(soup) -> int:
+    """Run the checks' lookups with BeautifulSoup tree scans."""
+    found = 0
+    for tag in TAG_LOOKUPS:
+        found += len(soup.find_all(tag))
+    for role in ROLE_LOOKUPS:
+        found += soup.find(attrs={"role": role}) is not None
+    for table in soup.find_all("table"):
+        for row in table.find_all("tr"):
+            found += len(row.find_all(["td", "th"]))
+        found += table.find("caption") is not None
+        found += table.find("thead") is not None
+    for label in soup.find_all("label"):
+        found += soup.find(attrs={"id": label.get("for")}) is not None
+    return found
+
+
+def _index_lookups(soup) -> int:
+    """Run the checks' lookups with a DocumentIndex built for the page."""
+    index = DocumentIndex(soup)
+    found = 0
+    for tag in TAG_LOOKUPS:
+        found += len(index.find_all(tag))
+    for role in ROLE_LOOKUPS:
+        found += index.find(attrs={"role": role}) is not None
+    for table in index.find_all("table"):
+        for row in index.find_all("tr", within=table):
+            found += len(index.find_all(["td", "th"], within=row))
+        found += index.find("caption", within=table) is not None
+        found += index.find("thead", within=table) is not None
+    for label in index.find_all("label"):
+        found += index.find(attrs={"id": label.get("for")}) is not None
+    return found
+
+
+def _run_checks(soup, shared: bool) -> None:
+    """Run all checks of a page, sharing one index or with one index each."""
+    index = DocumentIndex(soup) if shared else None
+    for check_class in CHECKS:
+        check_class(soup, lambda *args, **kwargs: None, index).check()
+
+
+def _best_time(function, repeat: int) -> float:
+    """Best wall time of a function over several runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--blocks", type=int, default=1000, help="Blocks per page")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per timing")
+    args = parser.parse_args()
+    # Keep the audit's progress messages out of the timings
+    logging.disable(logging.INFO)
+
+    html = generate_page(args.blocks)
+    soup = parse_html(html, read_only=True)
+    print(f"Page: {args.blocks} blocks, {len(soup.find_all(True))} elements")
+
+    assert _soup_lookups(soup) == _index_lookups(soup)
+    timings = [
+        ("Lookups, BeautifulSoup scans", lambda: _soup_lookups(soup)),
+        ("Lookups, DocumentIndex (with build)", lambda: _index_lookups(soup)),
+        ("Checks, one index per check", lambda: _run_checks(soup, shared=False)),
+        ("Checks, shared index", lambda: _run_checks(soup, shared=True)),
+        (
+            "Full audit",
+            lambda: AccessibilityAuditor(
+                html_content=html, options={"detailed": False}
+            ).audit(),
+        ),
+    ]
+    for label, function in timings:
+        print(f"{label:40s} {_best_time(function, args.repeat):10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
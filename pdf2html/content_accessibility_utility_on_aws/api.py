@@ -19,6 +19,7 @@ from content_accessibility_utility_on_aws.utils.logging_helper import (
     AccessibilityRemediationError,
 )
 from content_accessibility_utility_on_aws.utils.config import config_manager
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
 from content_accessibility_utility_on_aws.utils.resources import ensure_directory
 from content_accessibility_utility_on_aws.utils.usage_tracker import SessionUsageTracker
 
@@ -141,6 +142,10 @@ def process_pdf_accessibility(
             if output_dir:
                 audit_output_path = os.path.join(output_dir, "accessibility_audit.json")
 
+            # Keep the pages read by the audit for the remediation, so each
+            # page is read once
+            page_store = PageStore() if perform_remediation else None
+
             # Run the audit
             logger.debug(f"Auditing HTML for accessibility: {html_path}")
             audit_result = audit_html_accessibility(
@@ -148,6 +153,7 @@ def process_pdf_accessibility(
                 image_dir=image_dir,
                 options=audit_options,
                 output_path=audit_output_path,
+                page_store=page_store,
             )
             result["audit_result"] = audit_result
 
@@ -186,6 +192,9 @@ def process_pdf_accessibility(
                     from content_accessibility_utility_on_aws.utils.html_utils import (
                         combine_html_files,
                     )
+                    from content_accessibility_utility_on_aws.utils.path_utils import (
+                        sort_html_files_by_page,
+                    )
 
                     # Get all HTML files from the extracted_html directory
                     html_files = []
@@ -194,8 +203,8 @@ def process_pdf_accessibility(
                             if file.lower().endswith(".html"):
                                 html_files.append(os.path.join(html_dir, file))
 
-                    # Sort the HTML files to ensure correct order
-                    html_files.sort()
+                    # Sort the HTML files by page number to ensure correct order
+                    html_files = sort_html_files_by_page(html_files)
 
                     if html_files:
                         # Create a combined HTML file
@@ -205,7 +214,9 @@ def process_pdf_accessibility(
                         logger.debug(
                             f"Combining {len(html_files)} HTML files into a single document for single-page mode"
                         )
-                        combine_html_files(html_files, combined_html_path)
+                        combine_html_files(
+                            html_files, combined_html_path, page_store=page_store
+                        )
 
                         # Update the html_path to use the combined file
                         html_path = combined_html_path
@@ -256,6 +267,7 @@ def process_pdf_accessibility(
                     options=remediation_options,
                     output_path=remediation_output_path,
                     image_dir=image_dir,
+                    page_store=page_store,
                 )
                 result["remediation_result"] = remediation_result
 
@@ -349,6 +361,8 @@ def convert_pdf_to_html(
             - audit_accessibility (bool): Whether to perform an accessibility audit. Default: False.
             - audit_options (dict): Options for accessibility auditing. Default: {}.
             - cleanup_bda_output (bool): Whether to remove BDA output files after processing. Default: False.
+            - page_workers (int): Number of worker processes used to build HTML pages.
+              Default: None (PDF2HTML_PAGE_WORKERS, or 1).
         bda_project_arn: ARN of an existing BDA project to use.
         create_bda_project: Whether to create a new BDA project.
         s3_bucket: Name of an existing S3 bucket to use for file uploads.
@@ -386,6 +400,7 @@ def audit_html_accessibility(
     image_dir: Optional[str] = None,
     options: Optional[Dict[str, Any]] = None,
     output_path: Optional[str] = None,
+    page_store: Optional[PageStore] = None,
 ) -> Dict[str, Any]:
     """
     Audit an HTML document for accessibility issues.
@@ -411,7 +426,16 @@ def audit_html_accessibility(
             - include_context (bool): Whether to include surrounding context. Default: True.
             - single_page (bool): Force treating html_path as a single file. Default: None (auto-detect).
             - multi_page (bool): Force treating html_path as a directory. Default: None (auto-detect).
+            - audit_workers (int): Number of worker processes used to audit the pages of a
+              directory. Default: None (serial).
+            - audit_cache (str): Cache file or directory. Pages unchanged since a cached audit
+              with the same options reuse the cached issues. Default: None (no cache).
+            - drop_context_after_report (bool): Release the detailed context of the issues once
+              the report is saved. Default: False.
         output_path: Path to save the audit report JSON file.
+        page_store: Store in which the HTML of the audited pages is kept, to be
+            passed to remediate_html_accessibility() so the pages are not read
+            again.
 
     Returns:
         Dictionary containing audit results:
@@ -445,6 +469,7 @@ def audit_html_accessibility(
             image_dir=image_dir,
             options=audit_config,
             output_path=output_path,
+            page_store=page_store,
         )
 
         return result
@@ -466,6 +491,7 @@ def remediate_html_accessibility(
     options: Optional[Dict[str, Any]] = None,
     output_path: Optional[str] = None,
     image_dir: Optional[str] = None,
+    page_store: Optional[PageStore] = None,
 ) -> Dict[str, Any]:
     """
     Remediate accessibility issues in an HTML document.
@@ -491,6 +517,8 @@ def remediate_html_accessibility(
             - multi_page (bool): Force treating html_path as a directory. Default: None (auto-detect).
         output_path: Path to save the remediated HTML file.
         image_dir: Directory containing images referenced in the HTML.
+        page_store: Store holding the pages read by audit_html_accessibility(),
+            which are then not read from disk again.
 
     Returns:
         Dictionary containing remediation results:
@@ -528,6 +556,7 @@ def remediate_html_accessibility(
             options=remediation_config,
             output_path=output_path,
             image_dir=image_dir,
+            page_store=page_store,
         )
 
         return result
@@ -623,7 +652,7 @@ def generate_remediation_report(
     Args:
         remediation_data: Dictionary containing remediation results
         output_path: Path to save the report
-        report_format: Format of the report ('html', 'json', or 'text')
+        report_format: Format of the report ('html', 'json', 'jsonl', or 'text')
 
     Returns:
         Dictionary containing the report data or text content
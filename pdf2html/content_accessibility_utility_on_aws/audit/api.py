@@ -15,7 +15,9 @@ from content_accessibility_utility_on_aws.audit.auditor import AccessibilityAudi
 
 # IMPORTANT FIX: Import from the correct module path
 from content_accessibility_utility_on_aws.audit.report_generator import generate_report
+from content_accessibility_utility_on_aws.utils.jsonl_report import JSONLReportWriter
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -26,6 +28,7 @@ def audit_html_accessibility(
     image_dir: Optional[str] = None,
     options: Optional[Dict[str, Any]] = None,
     output_path: Optional[str] = None,
+    page_store: Optional[PageStore] = None,
 ) -> Dict[str, Any]:
     """
     Audit an HTML document for accessibility issues.
@@ -33,8 +36,13 @@ def audit_html_accessibility(
     Args:
         html_path: Path to the HTML file or directory of HTML files.
         image_dir: Directory containing images referenced in the HTML.
-        options: Audit options.
-        output_path: Path to save the audit report.
+        options: Audit options. Besides the auditor options:
+            - drop_context_after_report (bool): Release the detailed context of
+              the issues once the report is saved (default: False).
+        output_path: Path to save the audit report. A 'jsonl' report is written
+            while the pages are audited.
+        page_store: Store in which the HTML of the audited pages is kept, to
+            hand the pages over to the remediation without reading them again.
 
     Returns:
         Dictionary containing audit results.
@@ -42,12 +50,31 @@ def audit_html_accessibility(
     if options is None:
         options = {}
 
+    report_format = options.get("report_format", "json")
+    # Stream JSONL reports page by page instead of writing them at the end
+    stream_report = bool(output_path) and report_format == "jsonl"
+
     try:
-        # Use the AccessibilityAuditor to perform the audit
-        auditor = AccessibilityAuditor(
-            html_path=html_path, image_dir=image_dir, options=options
-        )
-        audit_results = auditor.audit()
+        report_writer = None
+        if stream_report:
+            report_writer = JSONLReportWriter(output_path, "accessibility")
+            report_writer.write_header(html_path=html_path)
+
+        try:
+            # Use the AccessibilityAuditor to perform the audit
+            auditor = AccessibilityAuditor(
+                html_path=html_path,
+                image_dir=image_dir,
+                options=options,
+                report_writer=report_writer,
+                page_store=page_store,
+            )
+            audit_results = auditor.audit()
+            if report_writer:
+                report_writer.write_summary(audit_results)
+        finally:
+            if report_writer:
+                report_writer.close()
 
         # Log initial audit results
         logger.debug("Raw audit results type: %s", type(audit_results))
@@ -72,10 +99,15 @@ def audit_html_accessibility(
         logger.debug("Number of issues: %d", len(audit_results["issues"]))
         logger.debug("Summary data: %s", audit_results.get("summary", {}))
 
-        logger.debug("Generating text report...")
-        text_report = generate_report(
-            audit_results, output_path=output_path, report_format="text"
-        )
+        if stream_report:
+            # The text report would overwrite the streamed report, and only
+            # returns the report data anyway
+            text_report = audit_results
+        else:
+            logger.debug("Generating text report...")
+            text_report = generate_report(
+                audit_results, output_path=output_path, report_format="text"
+            )
         if text_report is None:
             logger.warning("Text report generation failed, using basic format")
             # Generate a basic text report
@@ -92,8 +124,6 @@ def audit_html_accessibility(
 
         # Generate and save report if output path is specified
         if output_path:
-            # Determine the report format
-            report_format = options.get("report_format", "json")
             logger.debug(
                 "Preparing to save %s report to: %s", report_format.upper(), output_path
             )
@@ -105,10 +135,13 @@ def audit_html_accessibility(
                 logger.debug("Created output directory: %s", output_dir)
 
             # Generate report using the specified format
-            logger.debug("Generating %s report...", report_format.upper())
-            report_result = generate_report(
-                audit_results, output_path=output_path, report_format=report_format
-            )
+            if stream_report:
+                report_result = audit_results
+            else:
+                logger.debug("Generating %s report...", report_format.upper())
+                report_result = generate_report(
+                    audit_results, output_path=output_path, report_format=report_format
+                )
 
             if report_format == "json" and report_result:
                 # Only validate if it's a json report that returns data
@@ -133,9 +166,20 @@ def audit_html_accessibility(
                 output_path,
             )
 
+            if options.get("drop_context_after_report"):
+                _drop_issue_context(audit_results["issues"])
+
     except Exception as e:
         logger.warning("Error in report generation: %s", str(e))
         logger.warning("Error details: %s", traceback.format_exc())
         raise ValueError(f"Failed to generate report: {str(e)}") from e
 
     return audit_results
+
+
+def _drop_issue_context(issues) -> None:
+    """Release the detailed context of audit issues."""
+    for issue in issues:
+        if isinstance(issue, dict) and "context" in issue:
+            issue["context"] = None
+    logger.debug("Dropped the context of %d issues", len(issues))
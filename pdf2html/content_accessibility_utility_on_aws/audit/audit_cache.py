@@ -0,0 +1,194 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cache of per-page audit results.
+
+Each audited page is stored with a hash of its content and a hash of the audit
+options that produced its issues. A later audit of the same page with unchanged
+content and options reuses the stored issues instead of parsing and checking the
+page again.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from content_accessibility_utility_on_aws import __version__
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# File name of the cache database when the cache path is a directory
+CACHE_FILE_NAME = "audit_cache.sqlite"
+
+# Bump when the layout of cached issues changes
+CACHE_FORMAT_VERSION = 2
+
+# Options that change the issues found on a page, with their defaults. Other
+# options, such as the report format or the number of workers, only change how
+# the issues are reported, so they do not invalidate cached results.
+AUDIT_SETTINGS = {
+    "issue_types": None,
+    "severity_threshold": "minor",
+    "include_remediated": True,
+    "detailed": True,
+    "skip_automated_checks": False,
+}
+
+
+class AuditCache:
+    """SQLite store of audit issues keyed by page path, content and options."""
+
+    def __init__(self, path: str):
+        """
+        Open or create the cache.
+
+        Args:
+            path: Path to the SQLite cache file, or to a directory in which the
+                cache file is created
+        """
+        if os.path.isdir(path) or not os.path.splitext(path)[1]:
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, CACHE_FILE_NAME)
+        else:
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_audits (
+                page_path TEXT NOT NULL,
+                options_hash TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                issues TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (page_path, options_hash)
+            )
+            """
+        )
+        self._connection.commit()
+        logger.debug(f"Using audit cache {path}")
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """
+        Hash the content of a page.
+
+        Args:
+            content: Raw page content
+
+        Returns:
+            str: Hex digest of the content
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def options_hash(options: Dict[str, Any], image_dir: Optional[str] = None) -> str:
+        """
+        Hash the audit settings that affect the issues found on a page.
+
+        The package version is part of the hash, so results of a different
+        version of the checks are not reused.
+
+        Args:
+            options: Auditing options
+            image_dir: Directory containing images referenced in the HTML
+
+        Returns:
+            str: Hex digest of the settings
+        """
+        settings = {
+            key: options.get(key, default) for key, default in AUDIT_SETTINGS.items()
+        }
+        payload = json.dumps(
+            {
+                "format": CACHE_FORMAT_VERSION,
+                "version": __version__,
+                "image_dir": image_dir,
+                "options": settings,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self, page_path: str, content_hash: str, options_hash: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the cached issues of a page.
+
+        Args:
+            page_path: Path of the page file
+            content_hash: Hash of the current page content
+            options_hash: Hash of the current audit settings
+
+        Returns:
+            List of issue states, or None if the page has no up-to-date entry
+        """
+        row = self._connection.execute(
+            "SELECT content_hash, issues FROM page_audits "
+            "WHERE page_path = ? AND options_hash = ?",
+            (os.path.abspath(page_path), options_hash),
+        ).fetchone()
+        if row is None or row[0] != content_hash:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[1])
+
+    def put(
+        self,
+        page_path: str,
+        content_hash: str,
+        options_hash: str,
+        issues: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Store the issues of a page, replacing any older entry.
+
+        Entries are committed when the cache is closed.
+
+        Args:
+            page_path: Path of the page file
+            content_hash: Hash of the audited page content
+            options_hash: Hash of the audit settings
+            issues: States of the issues found on the page, as returned
+                by ``AuditIssue.to_state``
+        """
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO page_audits "
+                "(page_path, options_hash, content_hash, issues, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    os.path.abspath(page_path),
+                    options_hash,
+                    content_hash,
+                    json.dumps(issues, default=str),
+                    time.time(),
+                ),
+            )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache audit results for {page_path}: {e}")
+
+    def close(self) -> None:
+        """Commit the stored entries and close the cache database."""
+        try:
+            self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save audit cache {self.path}: {e}")
+        self._connection.close()
+        logger.debug(
+            f"Audit cache {self.path}: {self.hits} pages reused, {self.misses} audited"
+        )
@@ -0,0 +1,409 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Audit issue records with lazily collected context.
+
+The auditor keeps each issue as a slotted record instead of a dictionary. The
+detailed context of an issue (attributes, text, HTML snippet and position of
+its element) is only collected when it is first read, normally when the
+report is generated. Issues of a multi-page document do not keep their page
+parsed: they refer to their element by its ordinal in the page file, and the
+page is parsed again, once for all of its issues, if their context is needed.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from content_accessibility_utility_on_aws.audit.audit_cache import AuditCache
+from content_accessibility_utility_on_aws.audit.context_collector import (
+    ContextCollector,
+)
+from content_accessibility_utility_on_aws.audit.document_index import DocumentIndex
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# Report fields of an issue, in report order
+ISSUE_FIELDS = (
+    "id",
+    "type",
+    "wcag_criterion",
+    "criterion_name",
+    "criterion_level",
+    "severity",
+    "element",
+    "description",
+    "context",
+    "location",
+    "remediation_status",
+    "remediation_source",
+    "remediation_date",
+)
+
+# Fields only set on issues of a page file
+PAGE_FIELDS = ("file_path", "file_name", "page_number")
+
+# Key of a deferred context in the state of an issue
+CONTEXT_ORDINAL_KEY = "context_ordinal"
+
+
+def collect_context(element, index: Optional[DocumentIndex]) -> Dict[str, Any]:
+    """
+    Collect the detailed context of an issue's element.
+
+    Args:
+        element: The HTML element with the issue
+        index: Element index of the page containing the element
+
+    Returns:
+        Context dictionary, or basic element information if collection fails
+    """
+    try:
+        return ContextCollector(element, index).collect()
+    except Exception as e:
+        logger.error("Error collecting enhanced context: %s", str(e))
+        # Provide a basic context as fallback
+        context = {"element_name": element.name}
+        if hasattr(element, "attrs"):
+            context["attributes"] = element.attrs
+        return context
+
+
+class PageSource:
+    """
+    Page file from which the context of its issues is collected.
+
+    The page is parsed on the first context lookup and kept parsed until
+    :meth:`release` is called. Only the path and content hash are pickled.
+    """
+
+    __slots__ = ("path", "content_hash", "page_store", "_index")
+
+    def __init__(
+        self,
+        path: str,
+        content_hash: str,
+        page_store: Optional[PageStore] = None,
+    ):
+        """
+        Initialize the page source.
+
+        Args:
+            path: Path to the page file
+            content_hash: Hash of the audited page content
+            page_store: Store holding the HTML of the page, if it is kept
+        """
+        self.path = path
+        self.content_hash = content_hash
+        self.page_store = page_store
+        self._index: Optional[DocumentIndex] = None
+
+    def _read(self) -> str:
+        """Get the HTML of the page, from the store if it is kept there."""
+        content = self.page_store.get(self.path) if self.page_store else None
+        if content is None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = f.read()
+        return content
+
+    def index(self) -> DocumentIndex:
+        """
+        Get the element index of the page, parsing the page if needed.
+
+        Returns:
+            DocumentIndex: Index of the audited page
+
+        Raises:
+            OSError: If the page cannot be read
+            ValueError: If the page changed since it was audited
+        """
+        if self._index is None:
+            content = self._read()
+            if AuditCache.content_hash(content.encode("utf-8")) != self.content_hash:
+                raise ValueError(f"{self.path} changed since it was audited")
+            self._index = DocumentIndex(parse_html(content, read_only=True))
+        return self._index
+
+    def context(self, ordinal: int) -> Dict[str, Any]:
+        """
+        Collect the context of the element with the given ordinal.
+
+        Args:
+            ordinal: Document-order index of the element in the page
+
+        Returns:
+            Context dictionary
+        """
+        index = self.index()
+        return collect_context(index.elements[ordinal], index)
+
+    def release(self) -> None:
+        """Release the parsed page."""
+        self._index = None
+
+    def __getstate__(self):
+        return (self.path, self.content_hash)
+
+    def __setstate__(self, state):
+        self.path, self.content_hash = state
+        self.page_store = None
+        self._index = None
+
+
+class _ContextSource:
+    """Element, or element ordinal in a page file, of a deferred context."""
+
+    __slots__ = ("element", "index", "page", "ordinal")
+
+    def __init__(self, element, index, page: Optional[PageSource]):
+        self.element = element
+        self.index = index
+        self.page = page
+        self.ordinal = -1
+
+    def locate(self) -> int:
+        """
+        Get the ordinal of the element in its page file.
+
+        Returns:
+            int: The ordinal, or -1 if the element cannot be found again
+        """
+        if self.page is None:
+            return -1
+        if self.element is None:
+            return self.ordinal
+        if self.index is None:
+            return -1
+        return self.index.ordinal(self.element)
+
+    def detach(self) -> bool:
+        """
+        Replace the element reference with the element's ordinal.
+
+        Returns:
+            bool: False if the element cannot be found again in its page
+        """
+        ordinal = self.locate()
+        if ordinal < 0:
+            return False
+        self.ordinal = ordinal
+        self.element = None
+        self.index = None
+        return True
+
+    def load(self) -> Any:
+        """Collect the context."""
+        if self.element is not None:
+            return collect_context(self.element, self.index)
+        try:
+            return self.page.context(self.ordinal)
+        except Exception as e:
+            logger.error("Error collecting enhanced context: %s", str(e))
+            return {"error": f"Could not extract context: {str(e)}"}
+
+
+class AuditIssue:
+    """
+    Accessibility issue found by the auditor.
+
+    The report fields are attributes; ``file_path``, ``file_name`` and
+    ``page_number`` are only set on issues of a page file. The ``context``
+    attribute is collected on first access when it was deferred.
+    """
+
+    __slots__ = tuple(f for f in ISSUE_FIELDS if f != "context") + PAGE_FIELDS + (
+        "_context",
+        "_context_source",
+    )
+
+    def __init__(self, **fields: Any):
+        """
+        Initialize the issue.
+
+        Args:
+            **fields: Issue fields; the report fields default to None
+        """
+        for name in ISSUE_FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def deferred(
+        cls,
+        element,
+        index: Optional[DocumentIndex],
+        page: Optional[PageSource] = None,
+        /,
+        **fields: Any,
+    ) -> "AuditIssue":
+        """
+        Create an issue whose context is collected from its element on demand.
+
+        Args:
+            element: The HTML element with the issue
+            index: Element index of the page containing the element
+            page: Page file containing the element, so the element reference
+                can be replaced by its ordinal
+            **fields: Issue fields, including the ``element`` name
+
+        Returns:
+            AuditIssue: The issue
+        """
+        issue = cls(**fields)
+        issue._context_source = _ContextSource(element, index, page)
+        return issue
+
+    @property
+    def context(self) -> Any:
+        """Detailed context of the issue, collected on first access."""
+        source = self._context_source
+        if source is not None:
+            self._context = source.load()
+            self._context_source = None
+        return self._context
+
+    @context.setter
+    def context(self, value: Any) -> None:
+        self._context = value
+        self._context_source = None
+
+    @property
+    def context_loaded(self) -> bool:
+        """Whether the context has been collected (or was never deferred)."""
+        return self._context_source is None
+
+    @property
+    def page_source(self) -> Optional[PageSource]:
+        """Page file of a deferred context, if any."""
+        source = self._context_source
+        return source.page if source is not None else None
+
+    def detach_context(self, collect: bool = False) -> None:
+        """
+        Release the element reference of a deferred context.
+
+        The context is then collected from the page file when needed. Contexts
+        of elements that cannot be found again by ordinal are collected now.
+
+        Args:
+            collect: Whether to collect the context now if the element is
+                still referenced, instead of parsing the page file again later
+        """
+        source = self._context_source
+        if source is None:
+            return
+        if (collect and source.element is not None) or not source.detach():
+            self.context = source.load()
+
+    def drop_context(self) -> None:
+        """Release the context, and the element reference, of the issue."""
+        self.context = None
+
+    def to_dict(self, include_context: bool = True) -> Dict[str, Any]:
+        """
+        Return the issue as a report dictionary.
+
+        Args:
+            include_context: Whether to collect and include the context; if
+                False the context field is None
+
+        Returns:
+            Dictionary of the issue fields
+        """
+        data = {}
+        for name in ISSUE_FIELDS:
+            if name == "context":
+                data[name] = self.context if include_context else None
+            else:
+                data[name] = getattr(self, name)
+        for name in PAGE_FIELDS:
+            if hasattr(self, name):
+                data[name] = getattr(self, name)
+        return data
+
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Return the issue as a JSON-compatible state, without its page.
+
+        A deferred context is stored as the ordinal of its element.
+
+        Returns:
+            Dictionary from which :meth:`from_state` recreates the issue
+        """
+        source = self._context_source
+        ordinal = source.locate() if source is not None else -1
+        state = self.to_dict(include_context=ordinal < 0)
+        if ordinal >= 0:
+            state[CONTEXT_ORDINAL_KEY] = ordinal
+        return state
+
+    @classmethod
+    def from_state(
+        cls, state: Dict[str, Any], page: Optional[PageSource] = None
+    ) -> "AuditIssue":
+        """
+        Recreate an issue from its state.
+
+        Args:
+            state: State returned by :meth:`to_state`, or an issue dictionary
+            page: Page file containing the issue's element
+
+        Returns:
+            AuditIssue: The issue
+        """
+        fields = dict(state)
+        ordinal = fields.pop(CONTEXT_ORDINAL_KEY, None)
+        if ordinal is None or page is None:
+            return cls(**fields)
+        fields.pop("context", None)
+        issue = cls.deferred(None, None, page, **fields)
+        issue._context_source.ordinal = ordinal
+        return issue
+
+    def __reduce__(self):
+        # Pickle without the element reference
+        state = self.to_state()
+        return (_restore_issue, (state, self.page_source))
+
+    def __repr__(self) -> str:
+        return f"AuditIssue(id={self.id!r}, type={self.type!r})"
+
+
+def _restore_issue(state: Dict[str, Any], page: Optional[PageSource]) -> AuditIssue:
+    """Recreate a pickled issue."""
+    return AuditIssue.from_state(state, page)
+
+
+def issues_to_dicts(
+    issues: Iterable[AuditIssue], include_context: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Convert issues to report dictionaries.
+
+    Issues are expected in page order: the page of deferred contexts is parsed
+    once for its run of issues and released before the next page.
+
+    Args:
+        issues: Issues to convert
+        include_context: Whether to collect and include the contexts
+
+    Returns:
+        List of issue dictionaries
+    """
+    result = []
+    page = None
+    for issue in issues:
+        if include_context:
+            source = issue.page_source
+            if source is not None and source is not page:
+                if page is not None:
+                    page.release()
+                page = source
+        result.append(issue.to_dict(include_context))
+    if page is not None:
+        page.release()
+    return result
@@ -10,9 +10,11 @@ HTML content against WCAG 2.1 accessibility standards.
 
 import os
 import re
-from typing import Dict, List, Any, Optional
+import sqlite3
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
 
 
 from content_accessibility_utility_on_aws.audit.checks import (
@@ -34,6 +36,13 @@ from content_accessibility_utility_on_aws.audit.checks import (
     FormRequiredFieldCheck,
     FormFieldsetCheck,
 )
+from content_accessibility_utility_on_aws.audit.audit_cache import AuditCache
+from content_accessibility_utility_on_aws.audit.audit_issue import (
+    AuditIssue,
+    PageSource,
+    issues_to_dicts,
+)
+from content_accessibility_utility_on_aws.audit.document_index import DocumentIndex
 from content_accessibility_utility_on_aws.utils.logging_helper import (
     setup_logger,
 )
@@ -41,10 +50,21 @@ from content_accessibility_utility_on_aws.audit.standards import (
     SEVERITY_LEVELS,
     get_criterion_info,
 )
+from content_accessibility_utility_on_aws.utils.html_parser import (
+    configure_html_parser,
+    get_html_parser,
+    parse_html,
+    parse_html_fragment,
+)
+from content_accessibility_utility_on_aws.utils.jsonl_report import JSONLReportWriter
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Pages submitted to the worker pool per worker ahead of the merged results
+POOL_PAGES_PER_WORKER = 2
+
 
 class AccessibilityAuditor:
     """Class for auditing HTML content for WCAG 2.1 accessibility compliance issues."""
@@ -55,6 +75,8 @@ class AccessibilityAuditor:
         html_content: Optional[str] = None,
         image_dir: Optional[str] = None,
         options: Optional[Dict[str, Any]] = None,
+        report_writer: Optional[JSONLReportWriter] = None,
+        page_store: Optional[PageStore] = None,
     ):
         """
         Initialize the accessibility auditor.
@@ -65,15 +87,42 @@ class AccessibilityAuditor:
             image_dir: Directory containing images referenced in the HTML.
             options: Auditing options:
                 - severity_threshold (str): Minimum severity level to report ('critical', 'major', 'minor').
-                - report_format (str): Format for the report ('json', 'html', 'text').
+                - report_format (str): Format for the report ('json', 'jsonl',
+                    'html', 'text').
                 - detailed (bool): Whether to include detailed context in the report.
                 - include_remediated (bool): Whether to include remediated items in
                     report (default: True).
+                - audit_workers (int): Number of worker processes used to audit
+                    the pages of a multi-page document (default: None, audit
+                    the pages serially).
+                - audit_cache (str): Path to a cache file or directory. Pages
+                    whose content and options are unchanged since a cached
+                    audit reuse the cached issues (default: None, no cache).
+                - drop_context_after_report (bool): Whether the context is
+                    dropped once the report is saved; it is then not collected
+                    for text or streamed reports (default: False).
+            report_writer: JSONL report to which the issues of each page are
+                written as soon as the page is audited.
+            page_store: Store in which the HTML of the audited pages is kept,
+                so the remediation of the document does not read the pages
+                again. Without a store, each page is kept only until it is
+                audited.
         """
         self.html_path = html_path
         self.html_content = html_content
         self.image_dir = image_dir
+        self.report_writer = report_writer
+        # Pages are read through the store, so each page is read once
+        self.page_store = page_store if page_store is not None else PageStore()
+        self._keep_pages = page_store is not None
         self.soup = None
+        # Element index of the page being audited, shared by the checks
+        self.index: Optional[DocumentIndex] = None
+        # Element paths and page numbers by element ordinal, for the indexed page
+        self._path_cache: Dict[int, str] = {}
+        self._page_cache: Dict[int, Optional[int]] = {}
+        # Page file of the page being audited, referenced by deferred contexts
+        self._page_source: Optional[PageSource] = None
         self.images = []
         self.links = []
         self.html_files = []  # Initialize html_files as an empty list
@@ -95,7 +144,7 @@ class AccessibilityAuditor:
             self.options.update(options)
 
         # Initialize issues list
-        self.issues: List[Dict[str, Any]] = []
+        self.issues: List[AuditIssue] = []
 
     def load_html(self) -> bool:
         """
@@ -107,7 +156,7 @@ class AccessibilityAuditor:
         try:
             # Case 1: HTML content is directly provided
             if self.html_content:
-                self.soup = BeautifulSoup(self.html_content, "html.parser")
+                self.soup = parse_html(self.html_content, read_only=True)
                 return True
 
             # Case 2: HTML path is provided
@@ -144,10 +193,10 @@ class AccessibilityAuditor:
                     logger.debug("Found %d HTML files in directory", len(html_files))
 
                     # Use the first HTML file for initial parsing
-                    # (We'll process all files during audit if multi-page option is set)
-                    with open(html_files[0], "r", encoding="utf-8") as f:
-                        self.html_content = f.read()
-                    self.soup = BeautifulSoup(self.html_content, "html.parser")
+                    # (We'll process all files during audit if multi-page option is set).
+                    # The page stays in the store, so its audit does not read it again
+                    self.html_content = self.page_store.read(html_files[0])
+                    self.soup = parse_html(self.html_content, read_only=True)
 
                     # Store information about all files for multi-page processing
                     self.html_files = html_files
@@ -155,9 +204,8 @@ class AccessibilityAuditor:
 
                 # Regular file handling
                 else:
-                    with open(self.html_path, "r", encoding="utf-8") as f:
-                        self.html_content = f.read()
-                    self.soup = BeautifulSoup(self.html_content, "html.parser")
+                    self.html_content = self.page_store.read(self.html_path)
+                    self.soup = parse_html(self.html_content, read_only=True)
                     return True
             else:
                 logger.error("No HTML content or valid file path provided")
@@ -173,25 +221,31 @@ class AccessibilityAuditor:
             if not self.load_html():
                 return
 
+        # Index the page once; the checks reuse the same index
+        if self.index is None or self.index.soup is not self.soup:
+            self.index = DocumentIndex(self.soup)
+            self._path_cache = {}
+            self._page_cache = {}
+
         # Extract images
-        self.images = self.soup.find_all("img")
+        self.images = self.index.find_all("img")
 
         # Extract links
-        self.links = self.soup.find_all("a")
+        self.links = self.index.find_all("a")
 
         # Extract headings
         self.headings = []
         for i in range(1, 7):
-            self.headings.extend(self.soup.find_all(f"h{i}"))
+            self.headings.extend(self.index.find_all(f"h{i}"))
 
         # Extract forms and form elements
         self.form_elements.clear()
         self.form_elements.extend(
-            self.soup.find_all(["input", "select", "textarea", "button", "label"])
+            self.index.find_all(["input", "select", "textarea", "button", "label"])
         )
 
         # Extract tables
-        self.tables = self.soup.find_all("table")
+        self.tables = self.index.find_all("table")
 
     def audit(self) -> Dict[str, Any]:
         """
@@ -213,52 +267,21 @@ class AccessibilityAuditor:
                 "Multi-page mode: Processing %d HTML files", len(self.html_files)
             )
 
-            # Process each HTML file separately
-            for html_file in self.html_files:
-                logger.debug("Processing HTML file: %s", html_file)
-                try:
-                    # Load the HTML content for this file
-                    with open(html_file, "r", encoding="utf-8") as f:
-                        html_content = f.read()
-
-                    # Parse the HTML
-                    page_soup = BeautifulSoup(html_content, "html.parser")
-
-                    # Extract the page number from the filename if it follows the page-X.html pattern
-                    page_num = None
-                    file_name = os.path.basename(html_file)
-                    match = re.search(r"page[_-]?(\d+)\.html$", file_name, re.IGNORECASE)
-                    if match:
-                        page_num = int(match.group(1))
-                        logger.debug("Extracted page number %d from filename: %s", page_num, file_name)
-
-                    # Run accessibility checks on this page
-                    self._audit_page(page_soup, page_num, html_file, file_name)
-
-                except Exception as e:
-                    logger.error("Error processing HTML file %s: %s", html_file, str(e))
+            self._audit_html_files()
         else:
             # Single page mode - audit the already loaded HTML
             logger.info("Single page mode: Processing HTML content")
             # Pass the file path if available
             file_path = self.html_path if hasattr(self, "html_path") and self.html_path else None
-            self._audit_page(self.soup, None, file_path)
+            self._audit_loaded_page(file_path)
 
         # Generate and return the report
         logger.info("Audit completed. Total issues found: %d", len(self.issues))
-        
+        self.issues = self._issue_dicts()
+
         # Ensure all issues have a valid location field
         for issue in self.issues:
-            if "location" not in issue or issue["location"] is None:
-                issue["location"] = {}
-            
-            # Ensure page_number exists in location
-            if "page_number" not in issue["location"]:
-                # Try to get page number from root level if available
-                if "page_number" in issue:
-                    issue["location"]["page_number"] = issue["page_number"]
-                else:
-                    issue["location"]["page_number"] = 0
+            self._ensure_issue_location(issue)
 
         # Group issues by page
         issues_by_page = {}
@@ -355,7 +378,384 @@ class AccessibilityAuditor:
         logger.debug("Report summary: %s", report["summary"])
         return report
 
-    def _audit_page(self, soup, page_num=None, file_path=None, file_name=None):
+    def _issue_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Convert the issues to report dictionaries.
+
+        Deferred contexts are collected page by page. They are left out of a
+        streamed report whose context is dropped once it is written.
+
+        Returns:
+            List of issue dictionaries
+        """
+        return issues_to_dicts(self.issues, self._include_context())
+
+    def _include_context(self) -> bool:
+        """
+        Whether the report dictionaries of the issues include the context.
+
+        Contexts that would be dropped after the report is written are not
+        kept when the report does not need them, that is for a text report or
+        a report whose issues are already streamed.
+        """
+        if not self.options.get("detailed", True):
+            return False
+        if not self.options.get("drop_context_after_report"):
+            return True
+        return not (
+            self.report_writer is not None
+            or self.options.get("report_format") == "text"
+        )
+
+    def _open_audit_cache(self) -> Optional[AuditCache]:
+        """Open the audit cache configured in the options, if any."""
+        cache_path = self.options.get("audit_cache")
+        if not cache_path:
+            return None
+        try:
+            return AuditCache(cache_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Audit cache %s not available: %s", cache_path, str(e))
+            return None
+
+    @staticmethod
+    def _ensure_issue_location(issue: Dict[str, Any]) -> None:
+        """Make sure an issue has a location with a page number."""
+        if "location" not in issue or issue["location"] is None:
+            issue["location"] = {}
+
+        # Ensure page_number exists in location
+        if "page_number" not in issue["location"]:
+            # Try to get page number from root level if available
+            if "page_number" in issue:
+                issue["location"]["page_number"] = issue["page_number"]
+            else:
+                issue["location"]["page_number"] = 0
+
+    def _merge_page_issues(self, page_issues: List[AuditIssue]) -> None:
+        """Append the issues of one page, renumbering their ids."""
+        for issue in page_issues:
+            issue.id = f"issue-{len(self.issues) + 1}"
+            self.issues.append(issue)
+        self._stream_issues(page_issues)
+        # The page is not kept parsed through the issues' element references.
+        # Contexts the report includes are collected now from a page that is
+        # still parsed, rather than by parsing it again for the report
+        keep_context = self._include_context()
+        for issue in page_issues:
+            if keep_context:
+                issue.detach_context(collect=True)
+            else:
+                issue.drop_context()
+
+    def _stream_issues(self, page_issues: List[AuditIssue]) -> None:
+        """Write the issues of an audited page to the JSONL report, if any."""
+        if self.report_writer is None:
+            return
+        records = issues_to_dicts(page_issues, self.options.get("detailed", True))
+        for record in records:
+            self._ensure_issue_location(record)
+        self.report_writer.write_issues(records)
+
+    def _audit_loaded_page(self, file_path: Optional[str]) -> None:
+        """
+        Audit the already loaded page, reusing cached issues when possible.
+
+        Args:
+            file_path: Path of the page file, or None for HTML content
+        """
+        if file_path is None:
+            self._audit_page(self.soup, None, file_path)
+            self._stream_issues(self.issues)
+            return
+
+        content_hash = AuditCache.content_hash(self.html_content.encode("utf-8"))
+        page = PageSource(file_path, content_hash, self.page_store)
+        cache = self._open_audit_cache()
+        try:
+            if cache:
+                options_hash = AuditCache.options_hash(self.options, self.image_dir)
+                cached_issues = cache.get(file_path, content_hash, options_hash)
+                if cached_issues is not None:
+                    logger.debug("Reusing cached audit of %s", file_path)
+                    self._merge_page_issues(
+                        [AuditIssue.from_state(state, page) for state in cached_issues]
+                    )
+                    return
+
+            self._audit_page(self.soup, None, file_path, page=page)
+            if cache:
+                cache.put(
+                    file_path,
+                    content_hash,
+                    options_hash,
+                    [issue.to_state() for issue in self.issues],
+                )
+            self._stream_issues(self.issues)
+        finally:
+            if cache:
+                cache.close()
+
+    def _audit_html_files(self) -> None:
+        """
+        Audit the page files of a multi-page document.
+
+        Pages with an up-to-date cache entry reuse the cached issues; the other
+        pages are audited, serially or in worker processes. The issues of all
+        pages are merged in file order and numbered in that order, each page
+        as soon as its issues are available.
+        """
+        cache = self._open_audit_cache()
+        options_hash = AuditCache.options_hash(self.options, self.image_dir)
+        content_hashes: Dict[str, str] = {}
+        cached: Dict[str, List[AuditIssue]] = {}
+
+        try:
+            if cache:
+                for html_file in self.html_files:
+                    try:
+                        html_content = self.page_store.read(html_file)
+                    except (OSError, UnicodeDecodeError):
+                        continue
+                    content_hash = AuditCache.content_hash(html_content.encode("utf-8"))
+                    content_hashes[html_file] = content_hash
+                    cached_issues = cache.get(html_file, content_hash, options_hash)
+                    if cached_issues is not None:
+                        page = PageSource(html_file, content_hash, self.page_store)
+                        cached[html_file] = [
+                            AuditIssue.from_state(state, page) for state in cached_issues
+                        ]
+                        if not self._keep_pages:
+                            self.page_store.discard(html_file)
+                logger.info(
+                    "Audit cache: reusing %d of %d pages",
+                    len(cached),
+                    len(self.html_files),
+                )
+
+            pending = [f for f in self.html_files if f not in cached]
+            workers = self.options.get("audit_workers") or 1
+            if workers > 1 and len(pending) > 1:
+                audited = self._audit_files_in_pool(pending, min(workers, len(pending)))
+            else:
+                # Serial pages are audited in the merge loop below
+                audited = {}
+
+            for html_file in self.html_files:
+                if html_file in cached:
+                    self._merge_page_issues(cached[html_file])
+                    continue
+                if html_file in audited:
+                    succeeded, page_issues = audited.pop(html_file)
+                else:
+                    # The page stays parsed until its issues are merged, so
+                    # their contexts are collected from it
+                    succeeded, page_issues = self._collect_file_issues(
+                        html_file, keep_elements=True
+                    )
+                if cache and succeeded and html_file in content_hashes:
+                    cache.put(
+                        html_file,
+                        content_hashes[html_file],
+                        options_hash,
+                        [issue.to_state() for issue in page_issues],
+                    )
+                self._merge_page_issues(page_issues)
+        finally:
+            if cache:
+                cache.close()
+
+    def _collect_file_issues(
+        self,
+        html_file: str,
+        html_content: Optional[str] = None,
+        keep_elements: bool = False,
+    ) -> Tuple[bool, List[AuditIssue]]:
+        """
+        Audit one page file and return its issues, numbered from 1.
+
+        Args:
+            html_file: Path to the page file
+            html_content: HTML of the page, if already read
+            keep_elements: Whether the issues keep referencing the elements of
+                the parsed page; otherwise their deferred contexts refer to the
+                page file, so the parsed page is released
+
+        Returns:
+            Tuple of (whether the page was audited without error, issues)
+        """
+        issues = self.issues
+        self.issues = []
+        try:
+            succeeded = self._audit_html_file(html_file, html_content)
+            if not keep_elements:
+                for issue in self.issues:
+                    issue.detach_context()
+            return succeeded, self.issues
+        finally:
+            self.issues = issues
+
+    def _page_html(self, html_file: str) -> str:
+        """Get the HTML of a page, keeping it in the store only if it is shared."""
+        if self._keep_pages:
+            return self.page_store.read(html_file)
+        return self.page_store.take(html_file)
+
+    def _audit_html_file(self, html_file: str, html_content: Optional[str] = None) -> bool:
+        """
+        Read, parse and audit one page file of a multi-page document.
+
+        Args:
+            html_file: Path to the page file
+            html_content: HTML of the page, if already read
+
+        Returns:
+            bool: True if the page was read and checked, False on error
+        """
+        logger.debug("Processing HTML file: %s", html_file)
+        try:
+            # Load the HTML content for this file
+            if html_content is None:
+                html_content = self._page_html(html_file)
+
+            # Parse the HTML, unless it is the first page parsed by load_html
+            if self.soup is not None and html_content is self.html_content:
+                page_soup = self.soup
+            else:
+                page_soup = parse_html(html_content, read_only=True)
+            page = PageSource(
+                html_file,
+                AuditCache.content_hash(html_content.encode("utf-8")),
+                self.page_store,
+            )
+
+            # Extract the page number from the filename if it follows the page-X.html pattern
+            page_num = None
+            file_name = os.path.basename(html_file)
+            match = re.search(r"page[_-]?(\d+)\.html$", file_name, re.IGNORECASE)
+            if match:
+                page_num = int(match.group(1))
+                logger.debug("Extracted page number %d from filename: %s", page_num, file_name)
+
+            # Run accessibility checks on this page
+            self._audit_page(page_soup, page_num, html_file, file_name, page=page)
+            return True
+
+        except Exception as e:
+            logger.error("Error processing HTML file %s: %s", html_file, str(e))
+            return False
+
+    def _audit_files_in_pool(
+        self, html_files: List[str], workers: int
+    ) -> Dict[str, Tuple[bool, List[AuditIssue]]]:
+        """
+        Audit page files of a multi-page document in worker processes.
+
+        Each worker returns the issues of one page, numbered from 1, as
+        :meth:`_collect_file_issues` does for a serial audit.
+
+        Args:
+            html_files: Paths of the page files to audit
+            workers: Number of worker processes
+
+        Returns:
+            Dictionary mapping each page file to (success, issues)
+        """
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_audit_worker,
+                initargs=(get_html_parser(), get_html_parser(read_only=True)),
+            )
+        except (OSError, NotImplementedError, ImportError) as e:
+            # Some environments, such as AWS Lambda, do not support the
+            # semaphores multiprocessing needs
+            logger.warning("Process pool not available, auditing pages serially: %s", e)
+            return {
+                html_file: self._collect_file_issues(html_file)
+                for html_file in html_files
+            }
+
+        logger.debug("Auditing %d pages with %d worker processes", len(html_files), workers)
+        results = {}
+        # Pages are submitted in a bounded window, so only the pages being
+        # audited are held for the workers at a time
+        window = workers * POOL_PAGES_PER_WORKER
+        with executor:
+            in_flight: Deque[Tuple[str, Optional[str], Future]] = deque()
+            for html_file in html_files:
+                html_content = self._pool_page_html(html_file)
+                future = executor.submit(
+                    _audit_page_file,
+                    html_file,
+                    self.options,
+                    self.image_dir,
+                    html_content,
+                )
+                in_flight.append((html_file, html_content, future))
+                if len(in_flight) >= window:
+                    self._collect_pool_result(results, *in_flight.popleft())
+            while in_flight:
+                self._collect_pool_result(results, *in_flight.popleft())
+        return results
+
+    def _pool_page_html(self, html_file: str) -> Optional[str]:
+        """
+        Get the HTML of a page to send to a worker.
+
+        Pages kept in the shared store, and pages already read, are sent to the
+        worker, so they are not read again; the worker reads the other pages
+        itself.
+
+        Args:
+            html_file: Path to the page file
+
+        Returns:
+            The HTML of the page, or None to let the worker read it
+        """
+        if not self._keep_pages:
+            html_content = self.page_store.get(html_file)
+            self.page_store.discard(html_file)
+            return html_content
+        try:
+            return self.page_store.read(html_file)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _collect_pool_result(
+        self,
+        results: Dict[str, Tuple[bool, List[AuditIssue]]],
+        html_file: str,
+        html_content: Optional[str],
+        future: Future,
+    ) -> None:
+        """
+        Wait for the audit of a page by a worker, auditing it here if the worker failed.
+
+        Args:
+            results: Results by page file, to which the page's result is added
+            html_file: Path to the page file
+            html_content: HTML of the page sent to the worker, or None
+            future: Future of the worker's audit
+        """
+        try:
+            results[html_file] = future.result()
+            # Contexts of pages kept in the store are read from there
+            for issue in results[html_file][1]:
+                page = issue.page_source
+                if page is not None:
+                    page.page_store = self.page_store
+        except Exception as e:
+            logger.warning(
+                "Worker failed to audit %s, auditing it in process: %s",
+                html_file,
+                str(e),
+            )
+            results[html_file] = self._collect_file_issues(html_file, html_content)
+
+    def _audit_page(
+        self, soup, page_num=None, file_path=None, file_name=None, page=None
+    ):
         """
         Audit a single HTML page.
 
@@ -364,11 +764,21 @@ class AccessibilityAuditor:
             page_num: Optional page number for multi-page documents
             file_path: Optional file path for reference
             file_name: Optional file name for reference
+            page: Optional page file from which deferred contexts can be
+                collected again once the page is released
         """
         # Store the current soup and extract elements
         original_soup = self.soup
+        original_index = self.index
+        original_caches = (self._path_cache, self._page_cache)
+        original_page_source = self._page_source
         self.soup = soup
+        self.index = DocumentIndex(soup)
+        self._page_source = page
+        self._path_cache = {}
+        self._page_cache = {}
         self.extract_elements()
+        index = self.index
 
         # Extract file name from file path if not provided
         if file_name is None and file_path:
@@ -391,23 +801,23 @@ class AccessibilityAuditor:
 
         # Initialize and run all checks
         checks = [
-            HeadingHierarchyCheck(self.soup, self._add_issue),
-            HeadingContentCheck(self.soup, self._add_issue),
-            DocumentTitleCheck(self.soup, self._add_issue),
-            DocumentLanguageCheck(self.soup, self._add_issue),
-            MainLandmarkCheck(self.soup, self._add_issue),
-            SkipLinkCheck(self.soup, self._add_issue),
-            LandmarksCheck(self.soup, self._add_issue),
-            AltTextCheck(self.soup, self._add_issue),
-            FigureStructureCheck(self.soup, self._add_issue),
-            LinkTextCheck(self.soup, self._add_issue),
-            NewWindowLinkCheck(self.soup, self._add_issue),
-            TableHeaderCheck(self.soup, self._add_issue),
-            TableStructureCheck(self.soup, self._add_issue),
-            ColorContrastCheck(self.soup, self._add_issue),
-            FormLabelCheck(self.soup, self._add_issue),
-            FormRequiredFieldCheck(self.soup, self._add_issue),
-            FormFieldsetCheck(self.soup, self._add_issue),
+            HeadingHierarchyCheck(self.soup, self._add_issue, index),
+            HeadingContentCheck(self.soup, self._add_issue, index),
+            DocumentTitleCheck(self.soup, self._add_issue, index),
+            DocumentLanguageCheck(self.soup, self._add_issue, index),
+            MainLandmarkCheck(self.soup, self._add_issue, index),
+            SkipLinkCheck(self.soup, self._add_issue, index),
+            LandmarksCheck(self.soup, self._add_issue, index),
+            AltTextCheck(self.soup, self._add_issue, index),
+            FigureStructureCheck(self.soup, self._add_issue, index),
+            LinkTextCheck(self.soup, self._add_issue, index),
+            NewWindowLinkCheck(self.soup, self._add_issue, index),
+            TableHeaderCheck(self.soup, self._add_issue, index),
+            TableStructureCheck(self.soup, self._add_issue, index),
+            ColorContrastCheck(self.soup, self._add_issue, index),
+            FormLabelCheck(self.soup, self._add_issue, index),
+            FormRequiredFieldCheck(self.soup, self._add_issue, index),
+            FormFieldsetCheck(self.soup, self._add_issue, index),
         ]
 
         for check in checks:
@@ -429,36 +839,39 @@ class AccessibilityAuditor:
 
         for issue in new_issues:
             # Ensure location is always a dictionary, never None
-            if "location" not in issue or issue["location"] is None:
-                issue["location"] = {}
+            if issue.location is None:
+                issue.location = {}
 
             # Always set file path if available
             if file_path:
                 # Store both in location and at the root level for compatibility
-                issue["location"]["file_path"] = file_path
-                issue["file_path"] = file_path
+                issue.location["file_path"] = file_path
+                issue.file_path = file_path
                 
                 # Also store the file name for easier reference
-                issue["location"]["file_name"] = file_name
-                issue["file_name"] = file_name
+                issue.location["file_name"] = file_name
+                issue.file_name = file_name
 
             # Set page number if available (either provided or extracted from filename)
             if page_num is not None:
-                issue["location"]["page_number"] = page_num
-                issue["page_number"] = page_num  # Also store at root level for compatibility
+                issue.location["page_number"] = page_num
+                issue.page_number = page_num  # Also store at root level for compatibility
                 
                 # Add a human-readable description that includes both file name and page number if available
                 if file_name:
-                    issue["location"]["description"] = f"File: {file_name} (Page {page_num})"
+                    issue.location["description"] = f"File: {file_name} (Page {page_num})"
                 else:
-                    issue["location"]["description"] = f"Page {page_num}"
+                    issue.location["description"] = f"Page {page_num}"
             else:
                 # If no page number, just use the file name as the description
                 if file_name:
-                    issue["location"]["description"] = f"File: {file_name}"
+                    issue.location["description"] = f"File: {file_name}"
 
         # Restore original soup
         self.soup = original_soup
+        self.index = original_index
+        self._path_cache, self._page_cache = original_caches
+        self._page_source = original_page_source
 
     def _generate_report(self) -> Dict[str, Any]:
         """
@@ -468,6 +881,7 @@ class AccessibilityAuditor:
             Report containing identified issues and remediation status.
         """
         logger.debug("Generating report with %d total issues", len(self.issues))
+        self.issues = self._issue_dicts()
 
         # Group issues by page
         issues_by_page = {}
@@ -621,22 +1035,11 @@ class AccessibilityAuditor:
         # Create a unique ID for the issue
         issue_id = f"issue-{len(self.issues) + 1}"
 
-        # Generate enhanced context if detailed option is enabled and element is provided
-        if self.options.get("detailed", True) and element and context is None:
-            try:
-                from content_accessibility_utility_on_aws.audit.context_collector import (
-                    ContextCollector,
-                )
-
-                context = ContextCollector(element).collect()
-            except Exception as e:
-                logger.error("Error collecting enhanced context: %s", str(e))
-                context = {"error": f"Could not extract context: {str(e)}"}
-                # Provide a basic context as fallback
-                if element and hasattr(element, "name"):
-                    context = {"element_name": element.name}
-                    if hasattr(element, "attrs"):
-                        context["attributes"] = element.attrs
+        # Defer enhanced context if detailed option is enabled and element is
+        # provided; it is collected from the element when first read
+        defer_context = bool(
+            self.options.get("detailed", True) and element and context is None
+        )
 
         # Generate element string representation
         element_str = (
@@ -654,7 +1057,7 @@ class AccessibilityAuditor:
         criterion_info = get_criterion_info(wcag_criterion)
 
         # Create the issue object
-        issue = {
+        fields = {
             "id": issue_id,
             "type": issue_type,
             "wcag_criterion": wcag_criterion,
@@ -663,7 +1066,6 @@ class AccessibilityAuditor:
             "severity": severity,
             "element": element_str,
             "description": description or f"WCAG {wcag_criterion} issue: {issue_type}",
-            "context": context if self.options.get("detailed", True) else None,
             "location": location,
             "remediation_status": status,
             "remediation_source": remediation_source,
@@ -673,6 +1075,15 @@ class AccessibilityAuditor:
                 else None
             ),
         }
+        if defer_context:
+            issue = AuditIssue.deferred(
+                element, self.index, self._page_source, **fields
+            )
+        else:
+            issue = AuditIssue(
+                context=context if self.options.get("detailed", True) else None,
+                **fields,
+            )
 
         # Add the issue to the list
         self.issues.append(issue)
@@ -694,10 +1105,57 @@ class AccessibilityAuditor:
             return int(page_num)
 
         # Then check for page-specific container
-        page_container = element.find_parent(
-            lambda tag: tag.get("class")
+        if self.index is not None and self.index.ordinal(element) >= 0:
+            return self._get_container_page_number(element.parent)
+
+        page_container = element.find_parent(self._is_page_container)
+        return self._page_number_from_container(page_container)
+
+    @staticmethod
+    def _is_page_container(tag) -> bool:
+        """Check whether an element's classes mark it as a page container."""
+        return bool(
+            tag.get("class")
             and any("page" in cls.lower() for cls in tag.get("class"))
         )
+
+    def _get_container_page_number(self, node) -> Optional[int]:
+        """
+        Get the page number of the nearest page container at or above a node.
+
+        Results are memoized per element of the indexed page, so elements
+        sharing ancestors do not walk the same chain again.
+
+        Args:
+            node: The element to start from (included)
+
+        Returns:
+            Page number from the nearest page container, or None
+        """
+        chain = []
+        page_num = None
+        current = node
+        while current is not None:
+            ordinal = self.index.ordinal(current)
+            if ordinal in self._page_cache:
+                page_num = self._page_cache[ordinal]
+                break
+            if self._is_page_container(current):
+                page_num = self._page_number_from_container(current)
+                if ordinal >= 0:
+                    self._page_cache[ordinal] = page_num
+                break
+            chain.append(ordinal)
+            current = current.parent
+
+        for ordinal in chain:
+            if ordinal >= 0:
+                self._page_cache[ordinal] = page_num
+        return page_num
+
+    @staticmethod
+    def _page_number_from_container(page_container) -> Optional[int]:
+        """Extract a page number from the classes or id of a page container."""
         if page_container:
             # Try to extract page number from class or id
             # Handle class attribute which could be a list
@@ -721,6 +1179,9 @@ class AccessibilityAuditor:
         """
         Get the CSS selector path to an element.
 
+        Paths of elements of the indexed page are built from the cached path
+        of the nearest ancestor already described.
+
         Args:
             element: The HTML element.
 
@@ -728,36 +1189,59 @@ class AccessibilityAuditor:
             CSS selector path.
         """
         try:
-            path = []
+            parts = []
+            path = ""
             current = element
             while current and hasattr(current, "name"):
-                # Check for ID
-                if current.get("id"):
-                    path.append(f"{current.name}#{current.get('id')}")
+                ordinal = self.index.ordinal(current) if self.index is not None else -1
+                if ordinal in self._path_cache:
+                    path = self._path_cache[ordinal]
+                    break
+                part, is_anchor = self._get_path_part(current, ordinal)
+                parts.append((ordinal, part))
+                # An element with an ID anchors the path
+                if is_anchor:
                     break
-                # Check for classes
-                elif current.get("class"):
-                    # Handle class attribute which could be a list
-                    classes = current.get("class", [])
-                    if classes:
-                        path.append(
-                            f"{current.name}.{'.'.join(str(cls) for cls in classes)}"
-                        )
-                # Check for nth-of-type
-                else:
-                    siblings = current.find_previous_siblings(current.name)
-                    if siblings:
-                        path.append(f"{current.name}:nth-of-type({len(siblings) + 1})")
-                    else:
-                        path.append(current.name)
                 current = current.parent
 
-            # Reverse path to get correct order from root to element
-            return " > ".join(reversed(path))
+            # Extend the path from the root down to the element
+            for ordinal, part in reversed(parts):
+                path = f"{path} > {part}" if path else part
+                if ordinal >= 0:
+                    self._path_cache[ordinal] = path
+            return path
         except Exception as e:
             logger.error("Error generating element path: %s", str(e))
             return "Unknown path"
 
+    def _get_path_part(self, element, ordinal: int) -> Tuple[str, bool]:
+        """
+        Get the selector for one step of an element path.
+
+        Args:
+            element: The HTML element.
+            ordinal: Ordinal of the element in the page index, or -1.
+
+        Returns:
+            Tuple of (selector, whether the selector is an ID selector)
+        """
+        # Check for ID
+        if element.get("id"):
+            return f"{element.name}#{element.get('id')}", True
+        # Check for classes
+        classes = element.get("class")
+        if classes:
+            # Handle class attribute which could be a list
+            return f"{element.name}.{'.'.join(str(cls) for cls in classes)}", False
+        # Check for nth-of-type
+        if ordinal >= 0:
+            sibling_count = self.index.sibling_rank(element)
+        else:
+            sibling_count = len(element.find_previous_siblings(element.name))
+        if sibling_count:
+            return f"{element.name}:nth-of-type({sibling_count + 1})", False
+        return element.name, False
+
     def _check_text_alternatives(self):
         """Check for WCAG 1.1.1 - Text Alternatives compliance issues."""
         if not self.images:
@@ -974,7 +1458,7 @@ class AccessibilityAuditor:
                 if isinstance(s, str) or s.name != "img"
             )
             if prev_text:
-                soup_text = BeautifulSoup(prev_text, "html.parser")
+                soup_text = parse_html_fragment(prev_text)
                 if soup_text.get_text().strip():
                     context.append(
                         f"Text before image: {soup_text.get_text().strip()[:200]}"
@@ -987,7 +1471,7 @@ class AccessibilityAuditor:
                 if isinstance(s, str) or s.name != "img"
             )
             if next_text:
-                soup_text = BeautifulSoup(next_text, "html.parser")
+                soup_text = parse_html_fragment(next_text)
                 if soup_text.get_text().strip():
                     context.append(
                         f"Text after image: {soup_text.get_text().strip()[:200]}"
@@ -1003,7 +1487,7 @@ class AccessibilityAuditor:
         if p_parent:
             p_text = "".join(str(s) for s in p_parent.contents if s != img)
             if p_text:
-                soup_text = BeautifulSoup(p_text, "html.parser")
+                soup_text = parse_html_fragment(p_text)
                 if soup_text.get_text().strip():
                     context.append(
                         f"Paragraph text: {soup_text.get_text().strip()[:200]}"
@@ -1019,3 +1503,31 @@ class AccessibilityAuditor:
             context.append(f"ARIA {attr}: {img[attr]}")
 
         return "\n".join(context) if context else "No surrounding context found"
+
+
+def _init_audit_worker(html_parser: str, audit_html_parser: str) -> None:
+    """Configure a worker process with the parent's HTML parser backends."""
+    configure_html_parser(html_parser, audit_html_parser)
+
+
+def _audit_page_file(
+    html_file: str,
+    options: Dict[str, Any],
+    image_dir: Optional[str] = None,
+    html_content: Optional[str] = None,
+) -> Tuple[bool, List[AuditIssue]]:
+    """
+    Audit one page file in a worker process.
+
+    Args:
+        html_file: Path to the page file
+        options: Auditing options of the parent auditor
+        image_dir: Directory containing images referenced in the HTML
+        html_content: HTML of the page, read by the parent, or None to read it
+
+    Returns:
+        Tuple of (whether the page was audited without error, the page's
+        issues with ids numbered from 1)
+    """
+    auditor = AccessibilityAuditor(image_dir=image_dir, options=options)
+    return auditor._collect_file_issues(html_file, html_content)
@@ -11,6 +11,8 @@ import logging
 from typing import Callable, Optional, List
 from bs4 import BeautifulSoup, Tag
 
+from content_accessibility_utility_on_aws.audit.document_index import DocumentIndex
+
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
@@ -44,16 +46,31 @@ class AccessibilityCheck:
     This class defines the interface that all specific checks must implement.
     """
 
-    def __init__(self, soup: BeautifulSoup, add_issue_callback: Callable):
+    def __init__(
+        self,
+        soup: BeautifulSoup,
+        add_issue_callback: Callable,
+        index: Optional[DocumentIndex] = None,
+    ):
         """
         Initialize the accessibility check.
 
         Args:
             soup: BeautifulSoup object of the HTML document
             add_issue_callback: Function to call to add an issue
+            index: Element index of the document, shared by the checks of a
+                page. Built on first use if not provided.
         """
         self.soup = soup
         self.add_issue = add_issue_callback
+        self._index = index
+
+    @property
+    def index(self) -> DocumentIndex:
+        """Element index of the document."""
+        if self._index is None or self._index.soup is not self.soup:
+            self._index = DocumentIndex(self.soup)
+        return self._index
 
     @safe_check
     def check(self) -> None:
@@ -5,14 +5,222 @@
 Color contrast accessibility checks.
 
 This module provides checks for proper color contrast between text and background.
+Text color, background color, font size and font weight are computed in a single
+top-down pass over the page, each element inheriting them from its parent unless
+its inline style sets them. Insufficient contrast is reported once for the
+element that sets a pair of colors, or for the first text that uses them, and
+not again for the text that inherits them.
 """
 
 import re
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Set
 from bs4 import Tag
 
 from content_accessibility_utility_on_aws.audit.base_check import AccessibilityCheck
 
+# Elements that typically contain text
+TEXT_ELEMENTS = frozenset(
+    ["p", "h1", "h2", "h3", "h4", "h5", "h6", "a", "span", "div", "li", "td", "th"]
+)
+
+# Default font sizes of headings relative to their parent, as in browsers
+HEADING_FONT_SCALES = {
+    "h1": 2.0,
+    "h2": 1.5,
+    "h3": 1.17,
+    "h4": 1.0,
+    "h5": 0.83,
+    "h6": 0.67,
+}
+
+# Elements rendered bold by default
+BOLD_ELEMENTS = frozenset(["b", "strong", "th", *HEADING_FONT_SCALES])
+
+# Headings always treated as large text
+LARGE_HEADINGS = frozenset(["h1", "h2", "h3"])
+
+# Base font size in pixels
+BASE_FONT_SIZE = 16.0
+
+_COLOR_VALUE = (
+    r"#[0-9a-fA-F]{6}\b|#[0-9a-fA-F]{3}\b|rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\)"
+)
+_TEXT_COLOR_PATTERN = re.compile(
+    r"(?:^|[;\s])color\s*:\s*(" + _COLOR_VALUE + ")", re.IGNORECASE
+)
+_BACKGROUND_COLOR_PATTERN = re.compile(
+    r"background(?:-color)?\s*:\s*(" + _COLOR_VALUE + ")", re.IGNORECASE
+)
+_FONT_SIZE_PATTERN = re.compile(
+    r"font-size\s*:\s*(\d*\.?\d+)\s*(px|pt|em|rem|%)", re.IGNORECASE
+)
+_FONT_WEIGHT_PATTERN = re.compile(
+    r"font-weight\s*:\s*(bold|bolder|normal|lighter|\d{3})", re.IGNORECASE
+)
+_RGB_PATTERN = re.compile(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", re.IGNORECASE)
+
+
+class ComputedStyle(NamedTuple):
+    """Text styling of an element after inheritance."""
+
+    color: str
+    background_color: str
+    font_size: float
+    bold: bool
+
+
+DEFAULT_STYLE = ComputedStyle("#000000", "#FFFFFF", BASE_FONT_SIZE, False)
+
+
+@lru_cache(maxsize=1024)
+def normalize_color(color: str) -> str:
+    """
+    Normalize a color value to an upper-case six digit hex string.
+
+    Args:
+        color: A hex or rgb() color value
+
+    Returns:
+        The normalized color as a hex string
+    """
+    # Handle hex colors
+    if color.startswith("#"):
+        # Convert 3-digit hex to 6-digit
+        if len(color) == 4:
+            r, g, b = color[1], color[2], color[3]
+            return f"#{r}{r}{g}{g}{b}{b}".upper()
+        return color.upper()
+
+    # Handle rgb() colors
+    rgb_match = _RGB_PATTERN.match(color)
+    if rgb_match:
+        r, g, b = (min(int(value), 255) for value in rgb_match.groups())
+        return f"#{r:02X}{g:02X}{b:02X}"
+
+    return color
+
+
+@lru_cache(maxsize=1024)
+def relative_luminance(hex_color: str) -> float:
+    """
+    Calculate the relative luminance of a hex color.
+
+    Args:
+        hex_color: The color as a six digit hex string
+
+    Returns:
+        The relative luminance as a float
+    """
+    hex_color = hex_color.lstrip("#")
+    channels = []
+    for i in (0, 2, 4):
+        value = int(hex_color[i : i + 2], 16) / 255
+        # Apply gamma correction
+        if value <= 0.03928:
+            channels.append(value / 12.92)
+        else:
+            channels.append(((value + 0.055) / 1.055) ** 2.4)
+    r, g, b = channels
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+@lru_cache(maxsize=4096)
+def contrast_ratio(color1: str, color2: str) -> float:
+    """
+    Calculate the contrast ratio between two colors.
+
+    Args:
+        color1: The first color as a hex string
+        color2: The second color as a hex string
+
+    Returns:
+        The contrast ratio as a float
+    """
+    l1 = relative_luminance(color1)
+    l2 = relative_luminance(color2)
+    if l1 > l2:
+        return (l1 + 0.05) / (l2 + 0.05)
+    return (l2 + 0.05) / (l1 + 0.05)
+
+
+def compute_style(element: Tag, parent_style: ComputedStyle) -> ComputedStyle:
+    """
+    Compute the text styling of an element from its parent's and its own.
+
+    Args:
+        element: The element
+        parent_style: Computed style of the element's parent
+
+    Returns:
+        The element's computed style
+    """
+    name = element.name
+    style = element.get("style")
+    if not style and name not in BOLD_ELEMENTS:
+        return parent_style
+
+    color, background_color, font_size, bold = parent_style
+    if name in HEADING_FONT_SCALES:
+        font_size *= HEADING_FONT_SCALES[name]
+    if name in BOLD_ELEMENTS:
+        bold = True
+
+    if style:
+        if isinstance(style, list):
+            style = " ".join(style)
+
+        match = _TEXT_COLOR_PATTERN.search(style)
+        if match:
+            color = normalize_color(match.group(1))
+
+        match = _BACKGROUND_COLOR_PATTERN.search(style)
+        if match:
+            background_color = normalize_color(match.group(1))
+
+        match = _FONT_SIZE_PATTERN.search(style)
+        if match:
+            size = float(match.group(1))
+            unit = match.group(2).lower()
+            # Convert to pixels
+            if unit == "pt":
+                size *= 1.333
+            elif unit == "em":
+                size *= parent_style.font_size
+            elif unit == "rem":
+                size *= BASE_FONT_SIZE
+            elif unit == "%":
+                size = size * parent_style.font_size / 100
+            font_size = size
+
+        match = _FONT_WEIGHT_PATTERN.search(style)
+        if match:
+            weight = match.group(1).lower()
+            if weight in ("bold", "bolder"):
+                bold = True
+            elif weight in ("normal", "lighter"):
+                bold = False
+            else:
+                bold = int(weight) >= 700
+
+    return ComputedStyle(color, background_color, font_size, bold)
+
+
+def is_large_text(name: str, style: ComputedStyle) -> bool:
+    """
+    Determine if an element's text is large under WCAG.
+
+    Args:
+        name: Tag name of the element
+        style: Computed style of the element
+
+    Returns:
+        True for 18pt (24px) text, or 14pt (18.67px) bold text
+    """
+    if name in LARGE_HEADINGS:
+        return True
+    return style.font_size >= 24 or (style.font_size >= 18.67 and style.bold)
+
 
 class ColorContrastCheck(AccessibilityCheck):
     """Check for proper color contrast (WCAG 1.4.3, 1.4.11)."""
@@ -26,290 +234,93 @@ class ColorContrastCheck(AccessibilityCheck):
                 enough contrast with background
             - potential-color-contrast-issue: When contrast can't be determined automatically
         """
-        # Elements that typically contain text
-        text_elements = self.soup.find_all(
-            [
-                "p",
-                "h1",
-                "h2",
-                "h3",
-                "h4",
-                "h5",
-                "h6",
-                "a",
-                "span",
-                "div",
-                "li",
-                "td",
-                "th",
-            ]
-        )
-
-        for element in text_elements:
-            # Skip empty elements
-            if not self.get_element_text(element).strip():
+        # Computed styles by element, filled in document order so every parent
+        # is computed before its children
+        styles: Dict[int, ComputedStyle] = {}
+        # Element that set the text and background colors each element has,
+        # by element; None for the default colors
+        color_origins: Dict[int, Optional[int]] = {}
+        # Color origins whose colors were already reported as insufficient
+        reported_origins: Set[Optional[int]] = set()
+
+        for element in self.index.elements:
+            parent = element.parent
+            parent_style = styles.get(id(parent), DEFAULT_STYLE)
+            style = compute_style(element, parent_style)
+            styles[id(element)] = style
+
+            if style is parent_style or (
+                style.color == parent_style.color
+                and style.background_color == parent_style.background_color
+            ):
+                origin = color_origins.get(id(parent))
+            else:
+                origin = id(element)
+            color_origins[id(element)] = origin
+
+            # Skip elements that are not text containers, or are empty
+            if element.name not in TEXT_ELEMENTS or not self.index.has_text(element):
                 continue
 
-            # Get text and background colors
-            text_color = self._get_text_color(element)
-            bg_color = self._get_background_color(element)
-
-            # If we couldn't determine colors, flag as potential issue
-            if not text_color or not bg_color:
-                # Only report if the element has inline style or class
-                if element.get("style") or element.get("class"):
-                    self.add_issue(
-                        "potential-color-contrast-issue",
-                        "1.4.3",
-                        "minor",
-                        element=element,
-                        description="Potential color contrast issue - colors"
-                        + "could not be determined automatically",
-                    )
+            # Text that inherits colors already reported is covered by that issue
+            if origin in reported_origins:
                 continue
 
-            # Calculate contrast ratio
-            contrast_ratio = self._calculate_contrast_ratio(text_color, bg_color)
-
-            # Determine minimum required contrast based on text size
-            is_large_text = self._is_large_text(element)
-            min_contrast = 3.0 if is_large_text else 4.5
+            if self._check_element(element, style):
+                reported_origins.add(origin)
 
-            # Check if contrast is sufficient
-            if contrast_ratio < min_contrast:
-                self.add_issue(
-                    "insufficient-color-contrast",
-                    "1.4.3",
-                    "major",
-                    element=element,
-                    description=f"Insufficient color contrast: {contrast_ratio:.2f}:1 "
-                    + "(minimum required: {min_contrast}:1)",
-                    location={
-                        "text_color": text_color,
-                        "background_color": bg_color,
-                        "contrast_ratio": f"{contrast_ratio:.2f}:1",
-                        "required_ratio": f"{min_contrast}:1",
-                        "is_large_text": is_large_text,
-                    },
-                )
-
-    def _get_text_color(self, element: Tag) -> Optional[str]:
+    def _check_element(self, element: Tag, style: ComputedStyle) -> bool:
         """
-        Get the text color of an element.
+        Check the contrast of one text element.
 
         Args:
             element: The element to check
+            style: Computed style of the element
 
         Returns:
-            The text color as a hex string, or None if it couldn't be determined
-        """
-        # Check for inline color style
-        if element.get("style"):
-            color_match = re.search(
-                r"color:\s*(#[0-9a-fA-F]{3,6}|rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\))",
-                element["style"],
-            )
-            if color_match:
-                return self._normalize_color(color_match.group(1))
-
-        # Default to black if no color is specified
-        return "#000000"
-
-    def _get_background_color(self, element: Tag) -> Optional[str]:
+            True if insufficient contrast was reported for the element
         """
-        Get the background color of an element.
-
-        Args:
-            element: The element to check
+        text_color = style.color
+        bg_color = style.background_color
 
-        Returns:
-            The background color as a hex string, or None if it couldn't be determined
-        """
-        # Check for inline background-color style
-        if element.get("style"):
-            bg_match = re.search(
-                r"background-color:\s*(#[0-9a-fA-F]{3,6}|rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\))",
-                element["style"],
-            )
-            if bg_match:
-                return self._normalize_color(bg_match.group(1))
-
-        # Check parent elements for background color
-        parent = element.parent
-        while parent and parent.name != "html":
-            if parent.get("style"):
-                bg_match = re.search(
-                    r"background-color:\s*(#[0-9a-fA-F]{3,6}|rgb\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*\))",
-                    parent["style"],
+        # If we couldn't determine colors, flag as potential issue
+        if not text_color or not bg_color:
+            # Only report if the element has inline style or class
+            if element.get("style") or element.get("class"):
+                self.add_issue(
+                    "potential-color-contrast-issue",
+                    "1.4.3",
+                    "minor",
+                    element=element,
+                    description="Potential color contrast issue - colors"
+                    + "could not be determined automatically",
                 )
-                if bg_match:
-                    return self._normalize_color(bg_match.group(1))
-            parent = parent.parent
-
-        # Default to white if no background color is specified
-        return "#FFFFFF"
-
-    def _normalize_color(self, color: str) -> str:
-        """
-        Normalize a color value to a hex string.
-
-        Args:
-            color: The color value to normalize
-
-        Returns:
-            The normalized color as a hex string
-        """
-        # Handle hex colors
-        if color.startswith("#"):
-            # Convert 3-digit hex to 6-digit
-            if len(color) == 4:
-                r, g, b = color[1], color[2], color[3]
-                return f"#{r}{r}{g}{g}{b}{b}".upper()
-            return color.upper()
-
-        # Handle rgb() colors
-        rgb_match = re.match(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", color)
-        if rgb_match:
-            r, g, b = map(int, rgb_match.groups())
-            return f"#{r:02X}{g:02X}{b:02X}"
-
-        return color
-
-    def _calculate_contrast_ratio(self, color1: str, color2: str) -> float:
-        """
-        Calculate the contrast ratio between two colors.
-
-        Args:
-            color1: The first color as a hex string
-            color2: The second color as a hex string
-
-        Returns:
-            The contrast ratio as a float
-        """
-        # Convert hex to RGB
-        rgb1 = self._hex_to_rgb(color1)
-        rgb2 = self._hex_to_rgb(color2)
-
-        # Calculate relative luminance
-        l1 = self._relative_luminance(rgb1)
-        l2 = self._relative_luminance(rgb2)
+            return False
 
         # Calculate contrast ratio
-        if l1 > l2:
-            return (l1 + 0.05) / (l2 + 0.05)
-        else:
-            return (l2 + 0.05) / (l1 + 0.05)
-
-    def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
-        """
-        Convert a hex color to RGB.
-
-        Args:
-            hex_color: The hex color string
-
-        Returns:
-            A tuple of (r, g, b) values
-        """
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-
-    def _relative_luminance(self, rgb: Tuple[int, int, int]) -> float:
-        """
-        Calculate the relative luminance of an RGB color.
-
-        Args:
-            rgb: The RGB color as a tuple of (r, g, b) values
-
-        Returns:
-            The relative luminance as a float
-        """
-        r, g, b = rgb
-
-        # Normalize RGB values
-        r = r / 255
-        g = g / 255
-        b = b / 255
-
-        # Apply gamma correction
-        r = self._gamma_correct(r)
-        g = self._gamma_correct(g)
-        b = self._gamma_correct(b)
-
-        # Calculate luminance
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-    def _gamma_correct(self, value: float) -> float:
-        """
-        Apply gamma correction to a color channel value.
-
-        Args:
-            value: The color channel value (0-1)
-
-        Returns:
-            The gamma-corrected value
-        """
-        if value <= 0.03928:
-            return value / 12.92
-        else:
-            return ((value + 0.055) / 1.055) ** 2.4
-
-    def _is_large_text(self, element: Tag) -> bool:
-        """
-        Determine if an element contains large text.
-
-        Args:
-            element: The element to check
-
-        Returns:
-            True if the element contains large text, False otherwise
-        """
-        # Check for heading elements (h1, h2, h3)
-        if element.name in ["h1", "h2", "h3"]:
-            return True
-
-        # Check for font-size style
-        if element.get("style"):
-            size_match = re.search(
-                r"font-size:\s*(\d+)(px|pt|em|rem)", element["style"]
+        ratio = contrast_ratio(text_color, bg_color)
+
+        # Determine minimum required contrast based on text size
+        large_text = is_large_text(element.name, style)
+        min_contrast = 3.0 if large_text else 4.5
+
+        # Check if contrast is sufficient
+        if ratio < min_contrast:
+            self.add_issue(
+                "insufficient-color-contrast",
+                "1.4.3",
+                "major",
+                element=element,
+                description=f"Insufficient color contrast: {ratio:.2f}:1 "
+                + "(minimum required: {min_contrast}:1)",
+                location={
+                    "text_color": text_color,
+                    "background_color": bg_color,
+                    "contrast_ratio": f"{ratio:.2f}:1",
+                    "required_ratio": f"{min_contrast}:1",
+                    "is_large_text": large_text,
+                },
             )
-            if size_match:
-                size = float(size_match.group(1))
-                unit = size_match.group(2)
-
-                # Convert to pixels (approximate)
-                if unit == "pt":
-                    size = size * 1.333
-                elif unit == "em" or unit == "rem":
-                    size = size * 16
-
-                # Large text is 18pt (24px) or 14pt (18.67px) bold
-                if size >= 24:
-                    return True
-                if size >= 18.67 and self._is_bold(element):
-                    return True
-
-        return False
-
-    def _is_bold(self, element: Tag) -> bool:
-        """
-        Determine if an element has bold text.
-
-        Args:
-            element: The element to check
-
-        Returns:
-            True if the element has bold text, False otherwise
-        """
-        # Check for bold element
-        if element.name in ["b", "strong"]:
             return True
 
-        # Check for font-weight style
-        if element.get("style"):
-            weight_match = re.search(
-                r"font-weight:\s*(bold|700|800|900)", element["style"]
-            )
-            if weight_match:
-                return True
-
         return False
@@ -28,7 +28,7 @@ class DocumentLanguageCheck(AccessibilityCheck):
             - compliant-document-language: When the document has a valid language attribute
         """
         logger.debug("Running DocumentLanguageCheck")
-        html_tag = self.soup.find("html")
+        html_tag = self.index.find("html")
 
         if not html_tag:
             logger.debug("No HTML tag found")
@@ -27,7 +27,7 @@ class FormLabelCheck(AccessibilityCheck):
             - form-label-empty: When a label element has no text content
         """
         # Check input elements
-        input_elements = self.soup.find_all("input")
+        input_elements = self.index.find_all("input")
         for input_elem in input_elements:
             # Skip hidden inputs and submit/reset buttons
             input_type = input_elem.get("type", "").lower()
@@ -57,7 +57,7 @@ class FormLabelCheck(AccessibilityCheck):
                 )
 
         # Check select elements
-        select_elements = self.soup.find_all("select")
+        select_elements = self.index.find_all("select")
         for select_elem in select_elements:
             # Check for name attribute
             if not select_elem.has_attr("name"):
@@ -82,7 +82,7 @@ class FormLabelCheck(AccessibilityCheck):
                 )
 
         # Check textarea elements
-        textarea_elements = self.soup.find_all("textarea")
+        textarea_elements = self.index.find_all("textarea")
         for textarea_elem in textarea_elements:
             # Check for name attribute
             if not textarea_elem.has_attr("name"):
@@ -107,7 +107,7 @@ class FormLabelCheck(AccessibilityCheck):
                 )
 
         # Check label elements for content
-        label_elements = self.soup.find_all("label")
+        label_elements = self.index.find_all("label")
         for label_elem in label_elements:
             label_text = self.get_element_text(label_elem)
 
@@ -133,12 +133,14 @@ class FormLabelCheck(AccessibilityCheck):
         # Check for id attribute
         if form_control.has_attr("id"):
             # Look for label with matching for attribute
-            matching_label = self.soup.find("label", attrs={"for": form_control["id"]})
+            matching_label = self.index.find(
+                "label", attrs={"for": form_control["id"]}
+            )
             if matching_label:
                 return True
 
         # Check if the control is wrapped in a label
-        parent_label = form_control.find_parent("label")
+        parent_label = self.index.closest(form_control, "label")
         if parent_label:
             return True
 
@@ -146,7 +148,7 @@ class FormLabelCheck(AccessibilityCheck):
         if form_control.has_attr("aria-labelledby"):
             label_ids = form_control["aria-labelledby"].split()
             for label_id in label_ids:
-                label_elem = self.soup.find(id=label_id)
+                label_elem = self.index.find(attrs={"id": label_id})
                 if label_elem and self.get_element_text(label_elem):
                     return True
 
@@ -177,7 +179,7 @@ class FormRequiredFieldCheck(AccessibilityCheck):
             - form-required-field-missing-aria: When a required field doesn't have aria-required
         """
         # Find all form controls
-        form_controls = self.soup.find_all(["input", "select", "textarea"])
+        form_controls = self.index.find_all(["input", "select", "textarea"])
 
         for control in form_controls:
             # Skip hidden inputs and submit/reset buttons
@@ -197,14 +199,14 @@ class FormRequiredFieldCheck(AccessibilityCheck):
 
                 # Check associated label
                 if control.has_attr("id"):
-                    label = self.soup.find("label", attrs={"for": control["id"]})
+                    label = self.index.find("label", attrs={"for": control["id"]})
                     if label:
                         label_text = self.get_element_text(label)
                         if "*" in label_text or "required" in label_text.lower():
                             has_visual_indication = True
 
                 # Check parent label
-                parent_label = control.find_parent("label")
+                parent_label = self.index.closest(control, "label")
                 if parent_label:
                     label_text = self.get_element_text(parent_label)
                     if "*" in label_text or "required" in label_text.lower():
@@ -243,9 +245,9 @@ class FormFieldsetCheck(AccessibilityCheck):
             - form-related-controls-no-fieldset: When related controls are not grouped in a fieldset
         """
         # Check fieldsets for legends
-        fieldsets = self.soup.find_all("fieldset")
+        fieldsets = self.index.find_all("fieldset")
         for fieldset in fieldsets:
-            legend = fieldset.find("legend")
+            legend = self.index.find("legend", within=fieldset)
             if not legend or not self.get_element_text(legend).strip():
                 self.add_issue(
                     "form-fieldset-missing-legend",
@@ -256,7 +258,7 @@ class FormFieldsetCheck(AccessibilityCheck):
                 )
 
         # Check for related controls that should be in fieldsets
-        forms = self.soup.find_all("form")
+        forms = self.index.find_all("form")
         for form in forms:
             # Check for groups of radio buttons
             self._check_radio_groups(form)
@@ -274,7 +276,9 @@ class FormFieldsetCheck(AccessibilityCheck):
         # Group radio buttons by name
         radio_groups: Dict[str, List[Tag]] = {}
 
-        for radio in form.find_all("input", attrs={"type": "radio"}):
+        for radio in self.index.find_all(
+            "input", attrs={"type": "radio"}, within=form
+        ):
             if radio.has_attr("name"):
                 name = radio["name"]
                 if name not in radio_groups:
@@ -288,7 +292,7 @@ class FormFieldsetCheck(AccessibilityCheck):
                 # Check if they're in a fieldset
                 in_fieldset = False
                 for radio in radios:
-                    if radio.find_parent("fieldset"):
+                    if self.index.closest(radio, "fieldset"):
                         in_fieldset = True
                         break
 
@@ -310,7 +314,9 @@ class FormFieldsetCheck(AccessibilityCheck):
             form: The form element to check
         """
         # Find all checkboxes
-        checkboxes = form.find_all("input", attrs={"type": "checkbox"})
+        checkboxes = self.index.find_all(
+            "input", attrs={"type": "checkbox"}, within=form
+        )
 
         # If there are multiple checkboxes, check if they're related
         if len(checkboxes) > 2:
@@ -342,7 +348,7 @@ class FormFieldsetCheck(AccessibilityCheck):
                 # Check if they're in a fieldset
                 in_fieldset = False
                 for checkbox in group:
-                    if checkbox.find_parent("fieldset"):
+                    if self.index.closest(checkbox, "fieldset"):
                         in_fieldset = True
                         break
 
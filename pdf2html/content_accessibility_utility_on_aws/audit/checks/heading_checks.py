@@ -25,7 +25,7 @@ class HeadingHierarchyCheck(AccessibilityCheck):
         """
         headings = []
         for i in range(1, 7):
-            for h in self.soup.find_all(f"h{i}"):
+            for h in self.index.find_all(f"h{i}"):
                 headings.append((i, h))
 
         if not headings:
@@ -33,7 +33,7 @@ class HeadingHierarchyCheck(AccessibilityCheck):
                 "no-headings",
                 "1.3.1",
                 "major",
-                element=self.soup.find("body"),
+                element=self.index.find("body"),
                 description="Document has no heading elements",
                 status="needs_remediation",
             )
@@ -46,7 +46,7 @@ class HeadingHierarchyCheck(AccessibilityCheck):
                 "no-h1",
                 "1.3.1",
                 "major",
-                element=self.soup.find("body"),
+                element=self.index.find("body"),
                 description="Document has no main heading (h1)",
                 status="needs_remediation",
             )
@@ -94,7 +94,7 @@ class HeadingContentCheck(AccessibilityCheck):
         """
         headings = []
         for i in range(1, 7):
-            for h in self.soup.find_all(f"h{i}"):
+            for h in self.index.find_all(f"h{i}"):
                 headings.append(h)
 
         if not headings:
@@ -151,14 +151,14 @@ class DocumentTitleCheck(AccessibilityCheck):
             - generic-title: When the title has generic text like "Untitled"
             - compliant-document-title: When the document has a proper title
         """
-        title = self.soup.find("title")
+        title = self.index.find("title")
 
         if not title:
             self.add_issue(
                 "missing-title",
                 "2.4.2",
                 "major",
-                element=self.soup.find("head"),
+                element=self.index.find("head"),
                 description="Document missing title element",
                 status="needs_remediation",
             )
@@ -24,7 +24,7 @@ class AltTextCheck(AccessibilityCheck):
             - generic-alt-text: When an image has generic alt text like "image"
             - compliant-alt-text: When an image has proper alt text
         """
-        images = self.soup.find_all("img")
+        images = self.index.find_all("img")
 
         if not images:
             return  # No images to check
@@ -104,13 +104,13 @@ class FigureStructureCheck(AccessibilityCheck):
             - empty-figure-caption: When a figure has an empty caption
             - compliant-figure-structure: When a figure has proper structure
         """
-        figures = self.soup.find_all("figure")
+        figures = self.index.find_all("figure")
 
         if not figures:
             return  # No figures to check
 
         for figure in figures:
-            caption = figure.find("figcaption")
+            caption = self.index.find("figcaption", within=figure)
 
             if not caption:
                 self.add_issue(
@@ -29,7 +29,7 @@ class LinkTextCheck(AccessibilityCheck):
               text go to different destinations
             - compliant-link-text: When a link has descriptive text (compliance success)
         """
-        links = self.soup.find_all("a")
+        links = self.index.find_all("a")
 
         # Track links by text for duplicate detection
         links_by_text: Dict[str, List[str]] = {}
@@ -70,7 +70,7 @@ class LinkTextCheck(AccessibilityCheck):
             # Check for empty links
             if not text:
                 # Check if there's an image with alt text
-                img = link.find("img")
+                img = self.index.find("img", within=link)
                 if img and img.get("alt"):
                     self.add_issue(
                         "compliant-image-link",
@@ -181,8 +181,8 @@ class NewWindowLinkCheck(AccessibilityCheck):
             - compliant-new-window-link: When a link opens in a new window with appropriate warning
         """
         # Find links with target="_blank" or rel="external"
-        new_window_links = self.soup.find_all("a", attrs={"target": "_blank"})
-        new_window_links.extend(self.soup.find_all("a", attrs={"rel": "external"}))
+        new_window_links = self.index.find_all("a", attrs={"target": "_blank"})
+        new_window_links.extend(self.index.find_all("a", attrs={"rel": "external"}))
 
         for link in new_window_links:
             text = self.get_element_text(link)
@@ -22,7 +22,7 @@ class DocumentLanguageCheck(AccessibilityCheck):
             - invalid-document-language: When the lang attribute has an invalid value
             - compliant-document-language: When the document has a valid language attribute
         """
-        html_tag = self.soup.find("html")
+        html_tag = self.index.find("html")
 
         if not html_tag:
             return
@@ -72,15 +72,15 @@ class MainLandmarkCheck(AccessibilityCheck):
             - missing-main-landmark: When there is no main element or role="main"
             - compliant-main-landmark: When there is a main element or role="main"
         """
-        main_element = self.soup.find("main")
-        main_role = self.soup.find(attrs={"role": "main"})
+        main_element = self.index.find("main")
+        main_role = self.index.find(attrs={"role": "main"})
 
         if not main_element and not main_role:
             self.add_issue(
                 "missing-main-landmark",
                 "1.3.1",
                 "major",
-                element=self.soup.find("body"),
+                element=self.index.find("body"),
                 description="Document missing main landmark (main element or role='main')",
                 status="needs_remediation",
             )
@@ -109,7 +109,7 @@ class SkipLinkCheck(AccessibilityCheck):
             - compliant-skip-link: When there is a skip navigation link
         """
         # Look for the first few links in the document
-        links = self.soup.find_all("a", limit=5)
+        links = self.index.find_all("a", limit=5)
         has_skip_link = False
         skip_link = None
 
@@ -129,7 +129,7 @@ class SkipLinkCheck(AccessibilityCheck):
                 "missing-skip-link",
                 "2.4.1",
                 "major",
-                element=self.soup.find("body"),
+                element=self.index.find("body"),
                 description="Document missing skip navigation link",
                 status="needs_remediation",
             )
@@ -161,15 +161,15 @@ class LandmarksCheck(AccessibilityCheck):
             - compliant-footer-landmark: When there is a footer element or role="contentinfo"
         """
         # Check for navigation landmark
-        nav_element = self.soup.find("nav")
-        nav_role = self.soup.find(attrs={"role": "navigation"})
+        nav_element = self.index.find("nav")
+        nav_role = self.index.find(attrs={"role": "navigation"})
 
         if not nav_element and not nav_role:
             self.add_issue(
                 "missing-navigation-landmark",
                 "1.3.1",
                 "minor",
-                element=self.soup.find("body"),
+                element=self.index.find("body"),
                 description="Document missing navigation landmark "
                 + "(nav element or role='navigation')",
                 status="needs_remediation",
@@ -187,15 +187,15 @@ class LandmarksCheck(AccessibilityCheck):
             )
 
         # Check for header landmark
-        header_element = self.soup.find("header")
-        banner_role = self.soup.find(attrs={"role": "banner"})
+        header_element = self.index.find("header")
+        banner_role = self.index.find(attrs={"role": "banner"})
 
         if not header_element and not banner_role:
             self.add_issue(
                 "missing-header-landmark",
                 "1.3.1",
                 "minor",
-                element=self.soup.find("body"),
+                element=self.index.find("body"),
                 description="Document missing header landmark (header element or role='banner')",
                 status="needs_remediation",
             )
@@ -212,15 +212,15 @@ class LandmarksCheck(AccessibilityCheck):
             )
 
         # Check for footer landmark
-        footer_element = self.soup.find("footer")
-        contentinfo_role = self.soup.find(attrs={"role": "contentinfo"})
+        footer_element = self.index.find("footer")
+        contentinfo_role = self.index.find(attrs={"role": "contentinfo"})
 
         if not footer_element and not contentinfo_role:
             self.add_issue(
                 "missing-footer-landmark",
                 "1.3.1",
                 "minor",
-                element=self.soup.find("body"),
+                element=self.index.find("body"),
                 description="Document missing footer landmark "
                 + "(footer element or role='contentinfo')",
                 status="needs_remediation",
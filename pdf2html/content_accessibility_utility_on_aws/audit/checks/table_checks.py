@@ -24,7 +24,7 @@ class TableHeaderCheck(AccessibilityCheck):
             - table-missing-scope: When table headers don't have scope attributes
             - table-missing-caption: When a complex table has no caption
         """
-        tables = self.soup.find_all("table")
+        tables = self.index.find_all("table")
 
         for table in tables:
             # Skip tables that appear to be for layout
@@ -32,7 +32,7 @@ class TableHeaderCheck(AccessibilityCheck):
                 continue
 
             # Check for headers
-            headers = table.find_all("th")
+            headers = self.index.find_all("th", within=table)
             if not headers:
                 self.add_issue(
                     "table-missing-headers",
@@ -54,7 +54,7 @@ class TableHeaderCheck(AccessibilityCheck):
                         )
 
             # Check for caption
-            if self._is_complex_table(table) and not table.find("caption"):
+            if self._is_complex_table(table) and not self.index.find("caption", within=table):
                 self.add_issue(
                     "table-missing-caption",
                     "1.3.1",
@@ -87,14 +87,16 @@ class TableHeaderCheck(AccessibilityCheck):
             return True
 
         # Check for absence of th elements and caption
-        if not table.find("th") and not table.find("caption"):
+        if not self.index.find("th", within=table) and not self.index.find("caption", within=table):
             # If it has very few cells, it's likely a layout table
-            rows = table.find_all("tr")
+            rows = self.index.find_all("tr", within=table)
             if len(rows) <= 1:
                 return True
 
             # Count cells in first row
-            first_row_cells = rows[0].find_all(["td", "th"]) if rows else []
+            first_row_cells = (
+                self.index.find_all(["td", "th"], within=rows[0]) if rows else []
+            )
             if len(first_row_cells) <= 1:
                 return True
 
@@ -111,7 +113,7 @@ class TableHeaderCheck(AccessibilityCheck):
             True if the table appears to be complex, False otherwise
         """
         # Check for merged cells (rowspan or colspan)
-        cells = table.find_all(["td", "th"])
+        cells = self.index.find_all(["td", "th"], within=table)
         for cell in cells:
             if cell.has_attr("rowspan") and int(cell["rowspan"]) > 1:
                 return True
@@ -119,12 +121,16 @@ class TableHeaderCheck(AccessibilityCheck):
                 return True
 
         # Check for multiple header rows or columns
-        header_rows = [row for row in table.find_all("tr") if row.find("th")]
+        header_rows = [
+            row
+            for row in self.index.find_all("tr", within=table)
+            if self.index.find("th", within=row)
+        ]
         if len(header_rows) > 1:
             return True
 
         # Check for many rows (large tables benefit from captions)
-        rows = table.find_all("tr")
+        rows = self.index.find_all("tr", within=table)
         if len(rows) > 10:
             return True
 
@@ -144,7 +150,7 @@ class TableStructureCheck(AccessibilityCheck):
             - table-missing-headers-id: When a complex table doesn't use headers/id attributes
             - table-irregular-headers: When a table has irregular header structure
         """
-        tables = self.soup.find_all("table")
+        tables = self.index.find_all("table")
 
         for table in tables:
             # Skip tables that appear to be for layout
@@ -152,8 +158,12 @@ class TableStructureCheck(AccessibilityCheck):
                 continue
 
             # Check for thead when there are headers in the first row
-            first_row = table.find("tr")
-            if first_row and first_row.find("th") and not table.find("thead"):
+            first_row = self.index.find("tr", within=table)
+            if (
+                first_row
+                and self.index.find("th", within=first_row)
+                and not self.index.find("thead", within=table)
+            ):
                 self.add_issue(
                     "table-missing-thead",
                     "1.3.1",
@@ -163,7 +173,10 @@ class TableStructureCheck(AccessibilityCheck):
                 )
 
             # Check for tbody
-            if not table.find("tbody") and len(table.find_all("tr")) > 1:
+            if (
+                not self.index.find("tbody", within=table)
+                and len(self.index.find_all("tr", within=table)) > 1
+            ):
                 self.add_issue(
                     "table-missing-tbody",
                     "1.3.1",
@@ -175,8 +188,12 @@ class TableStructureCheck(AccessibilityCheck):
             # Check for headers/id attributes in complex tables
             if self._is_complex_table(table):
                 # Check if any cells use headers attribute
-                cells_with_headers = table.find_all("td", attrs={"headers": True})
-                headers_with_id = table.find_all("th", attrs={"id": True})
+                cells_with_headers = self.index.find_all(
+                    "td", attrs={"headers": True}, within=table
+                )
+                headers_with_id = self.index.find_all(
+                    "th", attrs={"id": True}, within=table
+                )
 
                 if not cells_with_headers and not headers_with_id:
                     self.add_issue(
@@ -215,14 +232,16 @@ class TableStructureCheck(AccessibilityCheck):
             return True
 
         # Check for absence of th elements and caption
-        if not table.find("th") and not table.find("caption"):
+        if not self.index.find("th", within=table) and not self.index.find("caption", within=table):
             # If it has very few cells, it's likely a layout table
-            rows = table.find_all("tr")
+            rows = self.index.find_all("tr", within=table)
             if len(rows) <= 1:
                 return True
 
             # Count cells in first row
-            first_row_cells = rows[0].find_all(["td", "th"]) if rows else []
+            first_row_cells = (
+                self.index.find_all(["td", "th"], within=rows[0]) if rows else []
+            )
             if len(first_row_cells) <= 1:
                 return True
 
@@ -239,7 +258,7 @@ class TableStructureCheck(AccessibilityCheck):
             True if the table appears to be complex, False otherwise
         """
         # Check for merged cells (rowspan or colspan)
-        cells = table.find_all(["td", "th"])
+        cells = self.index.find_all(["td", "th"], within=table)
         for cell in cells:
             if cell.has_attr("rowspan") and int(cell["rowspan"]) > 1:
                 return True
@@ -247,12 +266,16 @@ class TableStructureCheck(AccessibilityCheck):
                 return True
 
         # Check for multiple header rows or columns
-        header_rows = [row for row in table.find_all("tr") if row.find("th")]
+        header_rows = [
+            row
+            for row in self.index.find_all("tr", within=table)
+            if self.index.find("th", within=row)
+        ]
         if len(header_rows) > 1:
             return True
 
         # Check for many rows (large tables benefit from captions)
-        rows = table.find_all("tr")
+        rows = self.index.find_all("tr", within=table)
         if len(rows) > 10:
             return True
 
@@ -265,21 +288,23 @@ class TableStructureCheck(AccessibilityCheck):
         Args:
             table: The table element to check
         """
-        rows = table.find_all("tr")
+        rows = self.index.find_all("tr", within=table)
 
         # Skip tables with fewer than 2 rows
         if len(rows) < 2:
             return
 
         # Check if headers are consistently in the first row or first column
-        first_row_headers = len(rows[0].find_all("th"))
+        first_row_headers = len(self.index.find_all("th", within=rows[0]))
         first_col_headers = sum(
-            1 for row in rows if row.find_all(["td", "th"])[0].name == "th"
+            1
+            for row in rows
+            if self.index.find_all(["td", "th"], within=row)[0].name == "th"
         )
 
         # If we have some headers but they're not consistently in first row or column
         if first_row_headers > 0 and first_row_headers < len(
-            rows[0].find_all(["td", "th"])
+            self.index.find_all(["td", "th"], within=rows[0])
         ):
             # Check if there are non-header cells mixed with headers in the first row
             self.add_issue(
@@ -8,9 +8,11 @@ This module provides functionality for collecting context information around acc
 """
 
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from bs4 import Tag
 
+from .document_index import DocumentIndex
+
 from ..utils.logging_helper import setup_logger
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -19,14 +21,17 @@ logger = setup_logger(__name__)
 class ContextCollector:
     """Class for collecting context information around an element."""
 
-    def __init__(self, element: Tag):
+    def __init__(self, element: Tag, index: Optional[DocumentIndex] = None):
         """
         Initialize the context collector.
 
         Args:
             element: The HTML element to collect context for.
+            index: Optional element index of the page containing the element,
+                used to look up its position without scanning the page.
         """
         self.element = element
+        self.index = index
 
     def collect(self) -> Dict[str, Any]:
         """
@@ -81,6 +86,12 @@ class ContextCollector:
         position = {}
 
         try:
+            if self.element.name and self.index is not None:
+                tag_position = self.index.tag_position(self.element)
+                if tag_position is not None:
+                    position["index"], position["total"] = tag_position
+                    return position
+
             # Find all elements of the same type
             if self.element.name:
                 all_elements = self.element.find_all_previous(self.element.name) + [
@@ -0,0 +1,355 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Element index shared by the accessibility checks of a page.
+
+The index is built in a single traversal of the parsed page and answers the
+lookups the checks need (elements by tag or attribute, descendants of an
+element, nearest ancestor, whether an element has text) and the positions used
+to describe issues (position among elements of the same tag, position among
+siblings of the same tag) without rescanning the tree.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# String node types that contribute to an element's text, as in Tag.get_text()
+_TEXT_TYPES = (NavigableString, CData)
+
+
+def _attr_matches(value: Any, expected: Any) -> bool:
+    """
+    Check an attribute value the way BeautifulSoup's attribute filters do.
+
+    Args:
+        value: The attribute value, a list for multi-valued attributes
+        expected: True to require presence, otherwise the expected string
+
+    Returns:
+        True if the value matches
+    """
+    if value is None:
+        return False
+    if expected is True:
+        return True
+    if isinstance(value, list):
+        return expected in value or " ".join(value) == expected
+    return value == expected
+
+
+class DocumentIndex:
+    """
+    Index of the elements of a parsed HTML page.
+
+    Elements are numbered in document order. Every element also records the
+    ordinal just past its last descendant, so the descendants of an element
+    with a given tag are a contiguous slice of that tag's element list.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Build the index in a single traversal of the page.
+
+        Args:
+            soup: The parsed page
+        """
+        self.soup = soup
+        # All elements in document order
+        self.elements: List[Tag] = []
+        # Elements by tag name and by attribute name, in document order
+        self.by_tag: Dict[str, List[Tag]] = {}
+        self.by_attr: Dict[str, List[Tag]] = {}
+
+        self._ordinals: Dict[int, int] = {}
+        self._tag_ordinals: Dict[str, List[int]] = {}
+        # Per ordinal: ordinal just past the last descendant, and the number of
+        # non-blank text nodes before the element and before its end
+        self._end: List[int] = []
+        # Per ordinal: number of preceding siblings with the same tag name
+        self._sibling_ranks: List[int] = []
+        self._text_start: List[int] = []
+        self._text_end: List[int] = []
+        # Lazily built (tag, attribute) -> value -> elements maps
+        self._value_maps: Dict[Tuple[Optional[str], str], Dict[Any, List[Tag]]] = {}
+
+        self._build()
+        logger.debug(f"Indexed {len(self.elements)} elements")
+
+    def _build(self) -> None:
+        """Traverse the page once and fill the index."""
+        text_count = 0
+        # Stack of (node, ordinal, sibling rank); the ordinal is set for an
+        # element whose end still needs recording
+        stack: List[Tuple[Any, Optional[int], int]] = self._children(self.soup)
+        while stack:
+            node, ordinal, rank = stack.pop()
+            if ordinal is not None:
+                self._end[ordinal] = len(self.elements)
+                self._text_end[ordinal] = text_count
+                continue
+
+            if isinstance(node, Tag):
+                ordinal = len(self.elements)
+                self.elements.append(node)
+                self._ordinals[id(node)] = ordinal
+                self._end.append(ordinal + 1)
+                self._sibling_ranks.append(rank)
+                self._text_start.append(text_count)
+                self._text_end.append(text_count)
+
+                self.by_tag.setdefault(node.name, []).append(node)
+                self._tag_ordinals.setdefault(node.name, []).append(ordinal)
+                for attr in node.attrs:
+                    self.by_attr.setdefault(attr, []).append(node)
+
+                stack.append((node, ordinal, rank))
+                stack.extend(self._children(node))
+            elif type(node) in _TEXT_TYPES and node.strip():
+                text_count += 1
+
+    @staticmethod
+    def _children(node: Tag) -> List[Tuple[Any, None, int]]:
+        """Get stack entries for the children of a node, last child first."""
+        counts: Dict[str, int] = {}
+        entries = []
+        for child in node.contents:
+            rank = 0
+            if isinstance(child, Tag):
+                rank = counts.get(child.name, 0)
+                counts[child.name] = rank + 1
+            entries.append((child, None, rank))
+        entries.reverse()
+        return entries
+
+    def ordinal(self, element: Tag) -> int:
+        """
+        Get the document-order position of an element.
+
+        Args:
+            element: An element of the page
+
+        Returns:
+            int: The ordinal, or -1 if the element is not in the index
+        """
+        return self._ordinals.get(id(element), -1)
+
+    def contains(self, container: Tag, element: Tag) -> bool:
+        """
+        Check whether an element is a descendant of another.
+
+        Args:
+            container: The possible ancestor
+            element: The possible descendant
+
+        Returns:
+            bool: True if ``element`` is inside ``container``
+        """
+        start = self.ordinal(container)
+        position = self.ordinal(element)
+        return start >= 0 and start < position < self._end[start]
+
+    def tag_position(self, element: Tag) -> Optional[Tuple[int, int]]:
+        """
+        Get the position of an element among the elements with its tag name.
+
+        Args:
+            element: An element of the page
+
+        Returns:
+            Tuple of (zero-based position, number of elements with the tag
+            name), or None if the element is not in the index
+        """
+        ordinal = self.ordinal(element)
+        if ordinal < 0:
+            return None
+        ordinals = self._tag_ordinals[element.name]
+        return bisect_left(ordinals, ordinal), len(ordinals)
+
+    def sibling_rank(self, element: Tag) -> int:
+        """
+        Get the number of preceding siblings with the element's tag name.
+
+        Args:
+            element: An element of the page
+
+        Returns:
+            int: The rank, or -1 if the element is not in the index
+        """
+        ordinal = self.ordinal(element)
+        if ordinal < 0:
+            return -1
+        return self._sibling_ranks[ordinal]
+
+    def has_text(self, element: Tag) -> bool:
+        """
+        Check whether an element has non-blank text.
+
+        Equivalent to ``bool(element.get_text(strip=True))``.
+
+        Args:
+            element: An element of the page
+
+        Returns:
+            bool: True if the element contains non-blank text
+        """
+        ordinal = self.ordinal(element)
+        if ordinal < 0:
+            return bool(element.get_text(strip=True))
+        return self._text_end[ordinal] > self._text_start[ordinal]
+
+    def _tag_slice(self, name: str, within: Optional[Tag]) -> List[Tag]:
+        """Get the elements with a tag name, optionally inside a container."""
+        elements = self.by_tag.get(name, [])
+        if within is None or not elements:
+            return elements
+
+        start = self.ordinal(within)
+        if start < 0:
+            return within.find_all(name)
+        ordinals = self._tag_ordinals[name]
+        return elements[
+            bisect_right(ordinals, start) : bisect_left(ordinals, self._end[start])
+        ]
+
+    def _value_map(self, name: Optional[str], attr: str) -> Dict[Any, List[Tag]]:
+        """Get the elements with a tag name grouped by an attribute value."""
+        key = (name, attr)
+        value_map = self._value_maps.get(key)
+        if value_map is None:
+            value_map = {}
+            candidates = self.by_tag.get(name, []) if name else self.by_attr.get(attr, [])
+            for element in candidates:
+                value = element.get(attr)
+                if value is None:
+                    continue
+                values = value if isinstance(value, list) else [value]
+                if isinstance(value, list) and len(value) > 1:
+                    values = values + [" ".join(value)]
+                for item in dict.fromkeys(values):
+                    value_map.setdefault(item, []).append(element)
+            self._value_maps[key] = value_map
+        return value_map
+
+    def find_all(
+        self,
+        name: Optional[Union[str, Iterable[str]]] = None,
+        attrs: Optional[Dict[str, Any]] = None,
+        within: Optional[Tag] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tag]:
+        """
+        Find elements in document order, like ``Tag.find_all``.
+
+        Args:
+            name: Tag name or list of tag names, or None for any tag
+            attrs: Attribute filters; a value of True requires the attribute to
+                be present, a string requires that value
+            within: Only return descendants of this element
+            limit: Maximum number of elements to return
+
+        Returns:
+            List of matching elements
+        """
+        attrs = attrs or {}
+
+        if isinstance(name, str) or name is None:
+            if (
+                within is None
+                and len(attrs) == 1
+                and isinstance(next(iter(attrs.values())), str)
+            ):
+                # Exact attribute value lookups use a value map
+                attr, value = next(iter(attrs.items()))
+                candidates = self._value_map(name, attr).get(value, [])
+                attrs = {}
+            elif name is not None:
+                candidates = self._tag_slice(name, within)
+            else:
+                # Narrow by the first attribute filter when no tag name is given
+                if attrs:
+                    candidates = self.by_attr.get(next(iter(attrs)), [])
+                else:
+                    candidates = self.elements
+                if within is not None:
+                    candidates = [
+                        element
+                        for element in candidates
+                        if self.contains(within, element)
+                    ]
+        else:
+            names = list(dict.fromkeys(name))
+            slices = [self._tag_slice(tag_name, within) for tag_name in names]
+            slices = [elements for elements in slices if elements]
+            if len(slices) == 1:
+                candidates = slices[0]
+            else:
+                candidates = list(heapq.merge(*slices, key=self.ordinal))
+
+        if attrs:
+            candidates = [
+                element
+                for element in candidates
+                if all(
+                    _attr_matches(element.get(attr), expected)
+                    for attr, expected in attrs.items()
+                )
+            ]
+        else:
+            candidates = list(candidates)
+
+        if limit is not None:
+            return candidates[:limit]
+        return candidates
+
+    def find(
+        self,
+        name: Optional[Union[str, Iterable[str]]] = None,
+        attrs: Optional[Dict[str, Any]] = None,
+        within: Optional[Tag] = None,
+    ) -> Optional[Tag]:
+        """
+        Find the first matching element, like ``Tag.find``.
+
+        Args:
+            name: Tag name or list of tag names, or None for any tag
+            attrs: Attribute filters, see :meth:`find_all`
+            within: Only consider descendants of this element
+
+        Returns:
+            The first matching element, or None
+        """
+        if isinstance(name, str) and not attrs:
+            elements = self._tag_slice(name, within)
+            return elements[0] if elements else None
+
+        elements = self.find_all(name, attrs, within, limit=1)
+        return elements[0] if elements else None
+
+    def closest(self, element: Tag, name: str) -> Optional[Tag]:
+        """
+        Find the nearest ancestor with a tag name, like ``Tag.find_parent``.
+
+        Args:
+            element: The element to start from (not included)
+            name: Tag name of the ancestor
+
+        Returns:
+            The nearest matching ancestor, or None
+        """
+        if name not in self.by_tag:
+            return None
+        parent = element.parent
+        while parent is not None and not isinstance(parent, BeautifulSoup):
+            if parent.name == name:
+                return parent
+            parent = parent.parent
+        return None
@@ -29,7 +29,7 @@ def generate_report(
     Args:
         audit_data: Dictionary containing the audit results
         output_path: Path where the report should be saved
-        report_format: Format of the report (json, html, or text)
+        report_format: Format of the report (json, jsonl, html, or text)
         unified: If True, generates a unified report that can show both audit and remediation data
 
     Returns:
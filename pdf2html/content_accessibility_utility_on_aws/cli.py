@@ -15,7 +15,7 @@ import logging
 import json
 import tempfile
 import zipfile
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from content_accessibility_utility_on_aws import __version__
 from content_accessibility_utility_on_aws.api import generate_remediation_report
@@ -32,6 +32,13 @@ from content_accessibility_utility_on_aws.api import (
 )
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from content_accessibility_utility_on_aws.utils.config import config_manager, load_config_file, ConfigurationError
+from content_accessibility_utility_on_aws.utils.html_parser import (
+    SUPPORTED_PARSERS,
+    SUPPORTED_READ_ONLY_PARSERS,
+    configure_html_parser,
+)
+from content_accessibility_utility_on_aws.utils.jsonl_report import read_remediable_issues
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -57,6 +64,30 @@ def get_default_output_path(
     return os.path.join(".", f"{input_base}_output")
 
 
+def find_default_audit_report(input_path: str) -> Optional[str]:
+    """
+    Find the audit report of the HTML to remediate.
+
+    Looks for audit_report.json, then audit_report.jsonl, in the input
+    directory and then in its parent, the output directory of the process
+    command.
+
+    Args:
+        input_path: Path to the HTML file or directory to remediate
+
+    Returns:
+        Path to the audit report, or None if there is none
+    """
+    input_dir = os.path.dirname(input_path) if os.path.isfile(input_path) else input_path
+    parent_dir = os.path.dirname(os.path.normpath(input_dir))
+    for report_dir in (input_dir, parent_dir):
+        for report_name in ("audit_report.json", "audit_report.jsonl"):
+            report_path = os.path.join(report_dir, report_name)
+            if os.path.exists(report_path):
+                return report_path
+    return None
+
+
 def configure_logging(debug: bool = False, quiet: bool = False) -> None:
     """Configure logging based on debug and quiet flags."""
     if quiet:
@@ -116,6 +147,18 @@ def _add_standardized_arguments(parser: argparse.ArgumentParser) -> None:
         help="Create a new BDA project if needed",
     )
 
+    # HTML parser options
+    parser.add_argument(
+        "--html-parser",
+        choices=list(SUPPORTED_PARSERS),
+        help="HTML parser backend to use (default: html.parser)",
+    )
+    parser.add_argument(
+        "--audit-html-parser",
+        choices=list(SUPPORTED_READ_ONLY_PARSERS),
+        help="HTML parser backend to use for read-only audit passes (default: same as --html-parser)",
+    )
+
 
 def _add_convert_arguments(parser: argparse.ArgumentParser) -> None:
     """Add PDF conversion arguments to the convert command parser."""
@@ -169,6 +212,11 @@ def _add_convert_arguments(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Do not include images in the output",
     )
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        help="Number of worker processes used to build HTML pages (default: PDF2HTML_PAGE_WORKERS or 1)",
+    )
 
 
 def _add_audit_arguments(parser: argparse.ArgumentParser) -> None:
@@ -180,11 +228,20 @@ def _add_audit_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--format",
         "-f",
-        choices=["json", "html", "text"],
+        choices=["json", "jsonl", "html", "text"],
         default="json",
-        help="Output format for audit report",
+        help="Output format for audit report (jsonl is written page by page)",
     )
     parser.add_argument("--checks", help="Comma-separated list of checks to run")
+    parser.add_argument(
+        "--audit-workers",
+        type=int,
+        help="Number of worker processes used to audit multi-page documents (default: 1)",
+    )
+    parser.add_argument(
+        "--audit-cache",
+        help="Cache file or directory; unchanged pages reuse their cached audit results",
+    )
     parser.add_argument(
         "--severity",
         choices=["minor", "major", "critical"],
@@ -233,6 +290,40 @@ def _add_remediate_arguments(parser: argparse.ArgumentParser) -> None:
         default="us.amazon.nova-lite-v1:0",
         help="Bedrock model ID to use for remediation",
     )
+    parser.add_argument(
+        "--ai-concurrency",
+        type=int,
+        help="Number of concurrent Bedrock requests while remediating a page (default: 4, 1 sends them one at a time)",
+    )
+    parser.add_argument(
+        "--ai-requests-per-second",
+        type=float,
+        help="Maximum rate of Bedrock requests while remediating (default: no limit)",
+    )
+    parser.add_argument(
+        "--bedrock-cache",
+        help="Cache file or directory of Bedrock responses, reused when remediation is run again",
+    )
+    parser.add_argument(
+        "--bedrock-cache-mode",
+        choices=["record", "replay", "passthrough"],
+        default="record",
+        help="record: reuse stored responses and store new ones; replay: only use stored responses (offline); passthrough: ignore the cache",
+    )
+    parser.add_argument(
+        "--alt-text-batch-size",
+        type=int,
+        help="Maximum number of images described per Bedrock request (default: 1, one image per request)",
+    )
+    parser.add_argument(
+        "--alt-text-cache",
+        help="Cache file, directory or s3://bucket/prefix; images already described reuse their alt text",
+    )
+    parser.add_argument(
+        "--alt-text-cache-perceptual",
+        action="store_true",
+        help="Also match cached alt text by perceptual image hash (re-encoded or resized copies)",
+    )
     parser.add_argument(
         "--severity-threshold",
         choices=["minor", "major", "critical"],
@@ -250,7 +341,7 @@ def _add_remediate_arguments(parser: argparse.ArgumentParser) -> None:
     )
     parser.add_argument(
         "--report-format",
-        choices=["html", "json", "text"],
+        choices=["html", "json", "jsonl", "text"],
         default="html",
         help="Format for the remediation report",
     )
@@ -277,7 +368,7 @@ def _add_process_arguments(parser: argparse.ArgumentParser) -> None:
     )
     parser.add_argument(
         "--audit-format",
-        choices=["json", "html", "text"],
+        choices=["json", "jsonl", "html", "text"],
         default="json",
         help="Format for the audit report",
     )
@@ -319,11 +410,25 @@ def _add_process_arguments(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Do not include images in the output",
     )
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        help="Number of worker processes used to build HTML pages (default: PDF2HTML_PAGE_WORKERS or 1)",
+    )
 
     # Add audit options
     parser.add_argument(
         "--checks", help="Comma-separated list of checks to run for audit"
     )
+    parser.add_argument(
+        "--audit-workers",
+        type=int,
+        help="Number of worker processes used to audit multi-page documents (default: 1)",
+    )
+    parser.add_argument(
+        "--audit-cache",
+        help="Cache file or directory; unchanged pages reuse their cached audit results",
+    )
     parser.add_argument(
         "--detailed",
         action="store_true",
@@ -347,6 +452,40 @@ def _add_process_arguments(parser: argparse.ArgumentParser) -> None:
         default="us.amazon.nova-lite-v1:0",
         help="Bedrock model ID to use for remediation",
     )
+    parser.add_argument(
+        "--ai-concurrency",
+        type=int,
+        help="Number of concurrent Bedrock requests while remediating a page (default: 4, 1 sends them one at a time)",
+    )
+    parser.add_argument(
+        "--ai-requests-per-second",
+        type=float,
+        help="Maximum rate of Bedrock requests while remediating (default: no limit)",
+    )
+    parser.add_argument(
+        "--bedrock-cache",
+        help="Cache file or directory of Bedrock responses, reused when remediation is run again",
+    )
+    parser.add_argument(
+        "--bedrock-cache-mode",
+        choices=["record", "replay", "passthrough"],
+        default="record",
+        help="record: reuse stored responses and store new ones; replay: only use stored responses (offline); passthrough: ignore the cache",
+    )
+    parser.add_argument(
+        "--alt-text-batch-size",
+        type=int,
+        help="Maximum number of images described per Bedrock request (default: 1, one image per request)",
+    )
+    parser.add_argument(
+        "--alt-text-cache",
+        help="Cache file, directory or s3://bucket/prefix; images already described reuse their alt text",
+    )
+    parser.add_argument(
+        "--alt-text-cache-perceptual",
+        action="store_true",
+        help="Also match cached alt text by perceptual image hash (re-encoded or resized copies)",
+    )
 
     # Shared options
     parser.add_argument(
@@ -504,7 +643,7 @@ def save_configuration_from_args(args_dict: Dict[str, Any]) -> None:
     pdf_params = [
         "extract_images", "image_format", "single_file", "single_page", 
         "multi_page", "continuous", "embed_images", "exclude_images", 
-        "embed_fonts", "inline_css", "cleanup_bda_output"
+        "embed_fonts", "inline_css", "cleanup_bda_output", "page_workers"
     ]
     
     for param in pdf_params:
@@ -535,7 +674,8 @@ def save_configuration_from_args(args_dict: Dict[str, Any]) -> None:
     # Remediation parameters
     remediate_params = [
         "severity_threshold", "auto_fix", "max_issues", "model_id", 
-        "issue_types", "report_format"
+        "issue_types", "report_format", "ai_concurrency", "ai_requests_per_second",
+        "alt_text_cache", "alt_text_batch_size", "bedrock_cache", "bedrock_cache_mode"
     ]
     
     for param in remediate_params:
@@ -589,6 +729,7 @@ def run_convert_command(args: Dict[str, Any]) -> int:
             "continuous": args.get("continuous", True),
             "embed_images": args.get("embed_images", False),
             "exclude_images": args.get("exclude_images", False),
+            "page_workers": args.get("page_workers"),
         }
 
         if not args.get("quiet"):
@@ -635,6 +776,12 @@ def run_audit_command(args: Dict[str, Any]) -> int:
         if args.get("checks"):
             options["issue_types"] = [t.strip() for t in args["checks"].split(",")]
 
+        if args.get("audit_workers"):
+            options["audit_workers"] = args["audit_workers"]
+
+        if args.get("audit_cache"):
+            options["audit_cache"] = args["audit_cache"]
+
         if not args.get("quiet"):
             logger.info(f"Auditing HTML for accessibility: {args['input']}")
 
@@ -690,6 +837,25 @@ def run_remediate_command(args: Dict[str, Any]) -> int:
             "profile": args.get("profile"),  # Pass the profile parameter
         }
 
+        if args.get("ai_concurrency"):
+            options["ai_concurrency"] = args["ai_concurrency"]
+
+        if args.get("ai_requests_per_second"):
+            options["ai_requests_per_second"] = args["ai_requests_per_second"]
+
+        if args.get("alt_text_batch_size"):
+            options["alt_text_batch_size"] = args["alt_text_batch_size"]
+
+        if args.get("bedrock_cache"):
+            options["bedrock_cache"] = args["bedrock_cache"]
+            options["bedrock_cache_mode"] = args.get("bedrock_cache_mode", "record")
+
+        if args.get("alt_text_cache"):
+            options["alt_text_cache"] = args["alt_text_cache"]
+            options["alt_text_cache_perceptual"] = args.get(
+                "alt_text_cache_perceptual", False
+            )
+
         if not args.get("quiet"):
             logger.info("Remediating HTML: %s", args["input"])
 
@@ -703,52 +869,36 @@ def run_remediate_command(args: Dict[str, Any]) -> int:
             logger.debug(f"Using specified audit report path: {audit_report_path}")
         else:
             # Otherwise, try to find the default audit report
-            input_path = args["input"]
-            input_dir = (
-                os.path.dirname(input_path)
-                if os.path.isfile(input_path)
-                else input_path
-            )
-
-            # Look for audit_report.json in the input directory
-            default_report_path = os.path.join(input_dir, "audit_report.json")
-            if os.path.exists(default_report_path):
-                audit_report_path = default_report_path
+            audit_report_path = find_default_audit_report(args["input"])
+            if audit_report_path:
                 logger.debug(f"Found default audit report at: {audit_report_path}")
 
-                # Also look for the standard output directory structure from the process command
-                if not os.path.exists(default_report_path):
-                    parent_dir = os.path.dirname(input_dir)
-                    if os.path.exists(os.path.join(parent_dir, "audit_report.json")):
-                        audit_report_path = os.path.join(
-                            parent_dir, "audit_report.json"
-                        )
-                        logger.debug(
-                            f"Found audit report in parent directory: {audit_report_path}"
-                        )
-
         # Load the audit report if a path was found
         if audit_report_path:
             try:
-                with open(audit_report_path, "r", encoding="utf-8") as f:
-                    audit_report = json.load(f)
-                # Filter audit report to only include issues that need remediation
-                if audit_report:
-                    audit_report = {
-                        "issues": [
-                            issue
-                            for issue in audit_report.get("issues", [])
-                            if issue.get("remediation_status") == "needs_remediation"
-                        ],
-                        "summary": audit_report.get("summary", {}),
-                    }
-                    if not args.get("quiet"):
-                        logger.debug(
-                            "Loaded audit report from %s with "
-                            + "%s remediable issues",
-                            audit_report_path,
-                            len(audit_report["issues"]),
-                        )
+                if audit_report_path.endswith(".jsonl"):
+                    # Keep only the issues that need remediation while reading
+                    audit_report = read_remediable_issues(audit_report_path)
+                else:
+                    with open(audit_report_path, "r", encoding="utf-8") as f:
+                        audit_report = json.load(f)
+                    # Filter audit report to only include issues that need remediation
+                    if audit_report:
+                        audit_report = {
+                            "issues": [
+                                issue
+                                for issue in audit_report.get("issues", [])
+                                if issue.get("remediation_status")
+                                == "needs_remediation"
+                            ],
+                            "summary": audit_report.get("summary", {}),
+                        }
+                if audit_report and not args.get("quiet"):
+                    logger.debug(
+                        "Loaded audit report from %s with " + "%s remediable issues",
+                        audit_report_path,
+                        len(audit_report["issues"]),
+                    )
             except Exception as e:
                 logger.error(
                     f"Error loading audit report from {audit_report_path}: {e}"
@@ -776,6 +926,8 @@ def run_remediate_command(args: Dict[str, Any]) -> int:
                 report_path += ".html"
             elif report_format == "json":
                 report_path += ".json"
+            elif report_format == "jsonl":
+                report_path += ".jsonl"
             elif report_format == "text":
                 report_path += ".txt"
 
@@ -843,6 +995,7 @@ def run_process_command(args: Dict[str, Any]) -> int:
             "continuous": args.get("continuous", True),
             "embed_images": args.get("embed_images", False),
             "exclude_images": args.get("exclude_images", False),
+            "page_workers": args.get("page_workers"),
             "profile": profile,  # Add profile to conversion options
         }
 
@@ -884,11 +1037,23 @@ def run_process_command(args: Dict[str, Any]) -> int:
                     t.strip() for t in args["checks"].split(",")
                 ]
 
+            if args.get("audit_workers"):
+                audit_options["audit_workers"] = args["audit_workers"]
+
+            if args.get("audit_cache"):
+                audit_options["audit_cache"] = args["audit_cache"]
+
             # Save the audit report with the appropriate file extension
             audit_output = os.path.join(output_dir, f"audit_report.{audit_format}")
 
+            # Keep the pages read by the audit for the remediation step
+            page_store = PageStore() if not args.get("skip_remediation") else None
+
             audit_result = audit_html_accessibility(
-                html_path=html_path, options=audit_options, output_path=audit_output
+                html_path=html_path,
+                options=audit_options,
+                output_path=audit_output,
+                page_store=page_store,
             )
 
             if not args.get("quiet"):
@@ -919,6 +1084,29 @@ def run_process_command(args: Dict[str, Any]) -> int:
                 "profile": profile,  # Add profile to remediation options
             }
 
+            if args.get("ai_concurrency"):
+                remediate_options["ai_concurrency"] = args["ai_concurrency"]
+
+            if args.get("ai_requests_per_second"):
+                remediate_options["ai_requests_per_second"] = args[
+                    "ai_requests_per_second"
+                ]
+
+            if args.get("alt_text_batch_size"):
+                remediate_options["alt_text_batch_size"] = args["alt_text_batch_size"]
+
+            if args.get("bedrock_cache"):
+                remediate_options["bedrock_cache"] = args["bedrock_cache"]
+                remediate_options["bedrock_cache_mode"] = args.get(
+                    "bedrock_cache_mode", "record"
+                )
+
+            if args.get("alt_text_cache"):
+                remediate_options["alt_text_cache"] = args["alt_text_cache"]
+                remediate_options["alt_text_cache_perceptual"] = args.get(
+                    "alt_text_cache_perceptual", False
+                )
+
             if args.get("multi_page", False):
                 remediate_output = os.path.join(output_dir, "remediated_html")
             else:
@@ -950,6 +1138,7 @@ def run_process_command(args: Dict[str, Any]) -> int:
                 audit_report=filtered_audit_report,
                 output_path=remediate_output,
                 options=remediate_options,
+                page_store=page_store,
             )
 
         # Apply enhanced table remediation
@@ -1217,6 +1406,10 @@ def main() -> int:
         # Save configuration if requested
         save_configuration_from_args(args)
 
+        configure_html_parser(
+            args.get("html_parser"), args.get("audit_html_parser")
+        )
+
         if args["command"] == "convert":
             return run_convert_command(args)
         elif args["command"] == "audit":
@@ -19,6 +19,11 @@ from content_accessibility_utility_on_aws.utils.logging_helper import (
     DocumentAccessibilityError,
 )
 from content_accessibility_utility_on_aws.utils.resources import ensure_directory
+from content_accessibility_utility_on_aws.utils.asset_registry import (
+    AssetRegistry,
+    IMAGE_EXTENSIONS,
+    asset_scope,
+)
 from content_accessibility_utility_on_aws.pdf2html.services.bedrock_client import (
     ExtendedBDAClient,
     resolve_bda_project,
@@ -109,6 +114,7 @@ def cleanup_output_files(
                 logger.warning(f"Failed to remove combined remediated file: {e}")
 
 
+@asset_scope()
 def convert_pdf_to_html(
     pdf_path: str,
     output_dir: Optional[str] = None,
@@ -141,6 +147,8 @@ def convert_pdf_to_html(
             - audit_accessibility (bool): Whether to perform an accessibility audit. Default: False.
             - audit_options (dict): Options for accessibility auditing. Default: {}.
             - cleanup_bda_output (bool): Whether to remove BDA output files after processing. Default: False.
+            - page_workers (int): Number of worker processes used to build HTML pages.
+              Default: None (PDF2HTML_PAGE_WORKERS, or 1).
         bda_project_arn: ARN of an existing BDA project to use.
         create_bda_project: Whether to create a new BDA project.
         s3_bucket: Name of an existing S3 bucket to use for file uploads.
@@ -176,6 +184,7 @@ def convert_pdf_to_html(
         "audit_accessibility": False,
         "audit_options": {},
         "cleanup_bda_output": False,
+        "page_workers": None,
         "create_bda_project": create_bda_project,  # Pass this flag through to the BDA client
         "profile": profile,  # Store the AWS profile in options
     }
@@ -403,13 +412,14 @@ def copy_images_to_extracted_html_dir(
         logger.debug("No image files to copy")
         return {"copied_files": 0}
 
-    # Find the BDA output directory with the images
+    # Find the BDA output directory with the images from the asset index
+    registry = AssetRegistry.for_directory(output_dir)
     bda_output_dir = None
-    for root, dirs, files in os.walk(output_dir):
+    for image_file in registry.images():
+        root = os.path.dirname(image_file)
         if "standard_output" in root and "assets" in root:
-            if any(f.endswith(".png") or f.endswith(".jpg") for f in files):
-                bda_output_dir = root
-                break
+            bda_output_dir = root
+            break
 
     if not bda_output_dir:
         logger.warning("Could not find BDA output directory with images")
@@ -420,38 +430,23 @@ def copy_images_to_extracted_html_dir(
     if not os.path.exists(html_dir):
         os.makedirs(html_dir, exist_ok=True)
 
-    # Copy each image file to the extracted_html directory
+    # Stage each downloaded image file in the extracted_html directory
     copied_files = 0
     for image_file in image_files:
-        if os.path.exists(image_file):
-            import shutil
+        if image_file.endswith(IMAGE_EXTENSIONS) and os.path.exists(image_file):
+            if registry.stage(image_file, html_dir, overwrite=True):
+                copied_files += 1
+                logger.debug(f"Staged image file: {image_file} -> {html_dir}")
 
-            try:
-                dest_file = os.path.join(html_dir, os.path.basename(image_file))
-                shutil.copy2(image_file, dest_file)
+    # Also stage any image files from the assets directory
+    for file in os.listdir(bda_output_dir):
+        if file.endswith(IMAGE_EXTENSIONS):
+            src_file = os.path.join(bda_output_dir, file)
+            if registry.stage(src_file, html_dir, overwrite=True):
                 copied_files += 1
-                logger.debug(f"Copied image file: {image_file} -> {dest_file}")
-            except Exception as e:
-                logger.warning(f"Failed to copy image file {image_file}: {e}")
-
-    # Also copy any PNG files from the assets directory
-    if bda_output_dir:
-        for file in os.listdir(bda_output_dir):
-            if file.endswith(".png") or file.endswith(".jpg"):
-                src_file = os.path.join(bda_output_dir, file)
-                dest_file = os.path.join(html_dir, file)
-                try:
-                    shutil.copy2(src_file, dest_file)
-                    copied_files += 1
-                    logger.debug(
-                        f"Copied additional image file: {src_file} -> {dest_file}"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to copy additional image file {src_file}: {e}"
-                    )
+                logger.debug(f"Staged additional image file: {src_file} -> {html_dir}")
 
-    logger.debug(f"Copied {copied_files} image files to extracted_html directory")
+    logger.debug(f"Staged {copied_files} image files in extracted_html directory")
     return {"copied_files": copied_files}
 
 
@@ -10,19 +10,19 @@ to convert PDFs to HTML.
 
 import os
 import uuid
-import json
 import time
 import boto3
 import tempfile
-import shutil
-from bs4 import BeautifulSoup
 from datetime import datetime
 
 from content_accessibility_utility_on_aws.utils.logging_helper import (
     setup_logger,
 )
 from content_accessibility_utility_on_aws.utils.usage_tracker import SessionUsageTracker
-from content_accessibility_utility_on_aws.pdf2html.services.page_builder import build_html_data
+from content_accessibility_utility_on_aws.utils.asset_registry import AssetRegistry
+from content_accessibility_utility_on_aws.pdf2html.services.page_builder import HTMLPageWriter
+from content_accessibility_utility_on_aws.pdf2html.services.result_reader import BDAResultReader
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html_fragment
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -643,25 +643,16 @@ class ExtendedBDAClient(BDAClient):
 
             # Extract HTML content
             extract_result = self._extract_html_from_result_json(
-                result_json, output_dir
+                result_json, output_dir, page_workers=options.get("page_workers")
             )
 
             # Calculate processing time
             end_time = datetime.now()
             processing_time_ms = int((end_time - start_time).total_seconds() * 1000)
             
-            # Count pages from the result data
-            page_count = 0
-            
-            # Read the result data to count pages
-            try:
-                with open(result_json, "r", encoding="utf-8") as f:
-                    result_data = json.load(f)
-                    if "pages" in result_data:
-                        page_count = len(result_data["pages"])
-            except Exception as e:
-                logger.warning(f"Error reading result data for page count: {e}")
-            
+            # Page count is collected while streaming the result data
+            page_count = extract_result.get("page_count", 0)
+
             # Fallback to counting HTML files if we couldn't get page count from result data
             if page_count == 0 and extract_result["html_files"]:
                 # If we don't have explicit page data, count HTML files as a fallback
@@ -704,24 +695,29 @@ class ExtendedBDAClient(BDAClient):
             logger.warning(f"Error processing PDF: {e}")
             raise
 
-    def _extract_html_from_result_json(self, json_file_path, output_dir):
+    def _extract_html_from_result_json(
+        self, json_file_path, output_dir, page_workers=None
+    ):
         """
         Extract HTML content from BDA result.json file.
 
+        The result file is streamed page by page and element by element, so page
+        HTML files are written as pages arrive and only lightweight image element
+        metadata is kept in memory.
+
         Args:
             json_file_path: Path to the result.json file
             output_dir: Directory to save extracted HTML files
+            page_workers: Number of worker processes used to build pages, or
+                None for the PDF2HTML_PAGE_WORKERS setting
 
         Returns:
-            dict: Dictionary containing paths to extracted HTML files and element data
+            dict: Dictionary containing paths to extracted HTML files, element data
+                and the page count
         """
         logger.debug(f"Extracting HTML content from BDA result.json: {json_file_path}")
 
         try:
-            # Read the JSON file
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                result_data = json.load(f)
-
             # Determine if we should use single-page or multi-page mode ONLY from the CLI/API parameters
             # NOT based on what exists in the results
             single_file = (
@@ -737,29 +733,6 @@ class ExtendedBDAClient(BDAClient):
                 f"Mode selection based on parameters: single_file={single_file}, multiple_documents={multiple_documents}, using single-page={is_single_page}"
             )
 
-            # Ensure the required data is available - if not, log a warning but still try to process
-            if is_single_page and (
-                "document" not in result_data
-                or "representation" not in result_data["document"]
-                or "html" not in result_data["document"]["representation"]
-            ):
-                logger.warning(
-                    "Single-page mode requested but document.representation.html not found in result data"
-                )
-                # Note: We still continue with is_single_page=True as requested by parameters
-
-            if "pages" not in result_data:
-                logger.warning(f"No pages data found in result JSON: {json_file_path}")
-                if (
-                    not is_single_page
-                    or "document" not in result_data
-                    or "representation" not in result_data["document"]
-                    or "html" not in result_data["document"]["representation"]
-                ):
-                    # Only return empty if we don't have any usable data
-                    logger.warning("No usable HTML data found in the result")
-                    return {"html_files": [], "element_data": {}}
-
             # Create a subdirectory for extracted HTML files - with full normalized path
             # Use realpath to resolve any symlinks in the path
             norm_output_dir = os.path.realpath(output_dir)
@@ -788,71 +761,43 @@ class ExtendedBDAClient(BDAClient):
             # This ensures they're available for the page builder
             self._copy_all_images_to_html_dir(output_dir, html_output_dir)
 
-            # Use the new page builder to generate HTML from elements
-            build_result = build_html_data(result_data, output_dir, is_single_page)
-            extracted_html_files = build_result["html_files"]
-
-            # Extract element data for images
-            element_data = {}
-            if "elements" in result_data:
-                # Process each element
-                for element in result_data["elements"]:
-                    # Only process image elements
-                    if element.get("type") == "FIGURE" and element.get("sub_type") in [
-                        "IMAGE",
-                        "ICON",
-                        "DIAGRAM",
-                    ]:
-                        element_id = element.get("id")
-                        page_indices = element.get("page_indices", [])
-                        crop_images = element.get("crop_images", [])
-                        representation = element.get("representation", {}).get(
-                            "html", ""
+            # Stream the result data, writing pages as they arrive and keeping
+            # only the image element metadata
+            with HTMLPageWriter(
+                output_dir, is_single_page, workers=page_workers
+            ) as writer:
+                element_data = {}
+                seen_keys = set()
+                reader = BDAResultReader(json_file_path)
+                for key, value in reader.iter_items():
+                    seen_keys.add(key)
+                    if key == "pages":
+                        writer.add_page(writer.page_count, value)
+                    elif key == "elements":
+                        self._collect_image_element(
+                            value, element_data, output_dir, html_output_dir
                         )
+                    elif key == "metadata" and isinstance(value, dict):
+                        writer.title = value.get("asset_id", "Document")
+
+                # The whole-document representation is skipped by the reader, so only
+                # its presence can be checked here
+                if is_single_page and "document" not in seen_keys:
+                    logger.warning(
+                        "Single-page mode requested but document.representation.html not found in result data"
+                    )
+                    # Note: We still continue with is_single_page=True as requested by parameters
+
+                if "pages" not in seen_keys:
+                    logger.warning(f"No pages data found in result JSON: {json_file_path}")
+                    if not is_single_page or "document" not in seen_keys:
+                        # Only return empty if we don't have any usable data
+                        logger.warning("No usable HTML data found in the result")
+                        return {"html_files": [], "element_data": {}, "page_count": 0}
 
-                        if element_id and crop_images:
-                            # Extract filename from S3 path
-                            image_filename = os.path.basename(crop_images[0])
-                            element_data[element_id] = {
-                                "page_indices": page_indices,
-                                "filename": image_filename,
-                                "s3_path": crop_images[0],
-                                "html": representation,
-                            }
-
-                            # Extract the image src from the HTML representation
-                            if representation:
-                                soup = BeautifulSoup(representation, "html.parser")
-                                img_tags = soup.find_all("img")
-                                for img_tag in img_tags:
-                                    src = img_tag.get("src", "")
-                                    if src:
-                                        src_filename = os.path.basename(
-                                            src.replace("./", "").strip()
-                                        )
-                                        element_data[element_id]["src"] = src_filename
-
-                                        # Copy the image if needed
-                                        crop_file = os.path.join(
-                                            output_dir, image_filename
-                                        )
-                                        dest_file = os.path.join(
-                                            html_output_dir, src_filename
-                                        )
-                                        if os.path.exists(
-                                            crop_file
-                                        ) and not os.path.exists(dest_file):
-                                            try:
-                                                shutil.copy2(crop_file, dest_file)
-                                                logger.debug(
-                                                    f"Copied image for element {element_id}: {crop_file} -> {dest_file}"
-                                                )
-                                            except Exception as e:
-                                                logger.warning(
-                                                    f"Failed to copy image for element {element_id}: {e}"
-                                                )
-
-                logger.debug(f"Extracted data for {len(element_data)} image elements")
+                build_result = writer.finish()
+            extracted_html_files = build_result["html_files"]
+            logger.debug(f"Extracted data for {len(element_data)} image elements")
 
             # Final check to ensure all images referenced in HTML are available
             from content_accessibility_utility_on_aws.pdf2html.services.image_mapper import (
@@ -878,43 +823,85 @@ class ExtendedBDAClient(BDAClient):
                 # Update the list to only include the combined file
                 extracted_html_files = [extracted_html_files[0]]
 
-            return {"html_files": extracted_html_files, "element_data": element_data}
+            return {
+                "html_files": extracted_html_files,
+                "element_data": element_data,
+                "page_count": build_result["page_count"],
+            }
         except Exception as e:
             logger.warning(f"Error extracting HTML from result JSON: {e}")
-            return {"html_files": [], "element_data": {}}
+            return {"html_files": [], "element_data": {}, "page_count": 0}
 
-    def _copy_all_images_to_html_dir(self, output_dir, html_output_dir):
+    def _collect_image_element(self, element, element_data, output_dir, html_output_dir):
         """
-        Copy all image files to the extracted_html directory.
+        Record the metadata of a single BDA image element.
 
         Args:
+            element: The element data from the BDA result
+            element_data: Dictionary of image element metadata to update
             output_dir: Base output directory
             html_output_dir: HTML output directory
         """
-        logger.debug("Copying all image files to HTML directory...")
-
-        # Find all image files in the output directory
-        image_files = []
-        for root, dirs, files in os.walk(output_dir):
-            for file in files:
-                if file.endswith(".png") or file.endswith(".jpg"):
-                    image_files.append(os.path.join(root, file))
-
-        logger.debug(f"Found {len(image_files)} image files")
-
-        # Copy each image file to the HTML directory
-        copied_files = 0
-        for image_file in image_files:
-            dest_file = os.path.join(html_output_dir, os.path.basename(image_file))
-            # Skip copy if source and destination are the same file
-            if os.path.abspath(image_file) == os.path.abspath(dest_file):
-                logger.debug(f"Skipping copy of identical paths: {image_file}")
+        # Only process image elements
+        if element.get("type") != "FIGURE" or element.get("sub_type") not in [
+            "IMAGE",
+            "ICON",
+            "DIAGRAM",
+        ]:
+            return
+
+        element_id = element.get("id")
+        crop_images = element.get("crop_images", [])
+        if not element_id or not crop_images:
+            return
+
+        representation = element.get("representation", {}).get("html", "")
+
+        # Extract filename from S3 path
+        image_filename = os.path.basename(crop_images[0])
+        element_data[element_id] = {
+            "page_indices": element.get("page_indices", []),
+            "filename": image_filename,
+            "s3_path": crop_images[0],
+            "html": representation,
+        }
+
+        # Extract the image src from the HTML representation
+        if not representation:
+            return
+
+        soup = parse_html_fragment(representation)
+        for img_tag in soup.find_all("img"):
+            src = img_tag.get("src", "")
+            if not src:
                 continue
-            try:
-                shutil.copy2(image_file, dest_file)
-                copied_files += 1
-                logger.debug(f"Copied image file: {image_file} -> {dest_file}")
-            except Exception as e:
-                logger.warning(f"Failed to copy image file {image_file}: {e}")
 
-        logger.debug(f"Copied {copied_files} image files to HTML directory")
+            src_filename = os.path.basename(src.replace("./", "").strip())
+            element_data[element_id]["src"] = src_filename
+
+            # Stage the image under its src name if needed
+            registry = AssetRegistry.for_directory(output_dir)
+            crop_file = registry.find(image_filename)
+            dest_file = os.path.join(html_output_dir, src_filename)
+            if crop_file and not os.path.exists(dest_file):
+                if registry.stage(crop_file, html_output_dir, src_filename):
+                    logger.debug(
+                        f"Staged image for element {element_id}: {crop_file} -> {dest_file}"
+                    )
+
+    def _copy_all_images_to_html_dir(self, output_dir, html_output_dir):
+        """
+        Stage all image files in the extracted_html directory.
+
+        Args:
+            output_dir: Base output directory
+            html_output_dir: HTML output directory
+        """
+        logger.debug("Staging all image files in HTML directory...")
+
+        # Index the downloaded output once for this conversion
+        AssetRegistry.reset(output_dir)
+        registry = AssetRegistry.for_directory(output_dir)
+        staged_files = registry.stage_all(html_output_dir, overwrite=True)
+
+        logger.debug(f"Staged {staged_files} image files in HTML directory")
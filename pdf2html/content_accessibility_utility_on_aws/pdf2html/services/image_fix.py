@@ -9,8 +9,8 @@ This module provides a function to fix image src attributes in HTML generated fr
 
 import os
 import logging
-import shutil
-from bs4 import BeautifulSoup
+from content_accessibility_utility_on_aws.utils.asset_registry import AssetRegistry
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html_fragment
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +47,7 @@ def fix_image_src_attributes(soup, element, image_dir=None):
         # Try to find elements by their HTML representation
         element_html = element.get("representation", {}).get("html", "")
         if element_html:
-            element_soup = BeautifulSoup(element_html, "html.parser")
+            element_soup = parse_html_fragment(element_html)
             first_tag = element_soup.find()
             if first_tag:
                 # Find matching elements in the page
@@ -98,28 +98,22 @@ def fix_image_src_attributes(soup, element, image_dir=None):
                 logger.debug(f"Source file exists: {os.path.exists(src_file)}")
 
                 # Try to find the source file in other locations if it doesn't exist
+                registry = AssetRegistry.for_directory(image_dir)
                 if not os.path.exists(src_file):
-                    # Look for the file in the image_dir structure
-                    for root, dirs, files in os.walk(image_dir):
-                        for file in files:
-                            if file == expected_filename or file == image_filename:
-                                src_file = os.path.join(root, file)
-                                logger.debug(f"Found source file at: {src_file}")
-                                break
-                        if os.path.exists(src_file):
-                            break
-
-                # Copy the crop image to match the src in the HTML
-                if os.path.exists(src_file):
-                    try:
-                        shutil.copy2(src_file, dest_file)
-                        logger.debug(f"SUCCESS: Copied image {src_file} to {dest_file}")
-                        fixed_count += 1
-                        continue  # Skip updating the src since we've copied the file
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to copy image file {src_file} to {dest_file}: {e}"
-                        )
+                    src_file = (
+                        registry.find(expected_filename)
+                        or registry.find(image_filename)
+                        or src_file
+                    )
+                    logger.debug(f"Found source file at: {src_file}")
+
+                # Stage the crop image to match the src in the HTML
+                if os.path.exists(src_file) and registry.stage(
+                    src_file, image_dir, src_filename, overwrite=True
+                ):
+                    logger.debug(f"SUCCESS: Staged image {src_file} as {dest_file}")
+                    fixed_count += 1
+                    continue  # Skip updating the src since we've staged the file
 
             # Update the src attribute if we couldn't copy the file or no image_dir was provided
             new_src = expected_filename
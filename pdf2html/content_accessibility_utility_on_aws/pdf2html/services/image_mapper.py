@@ -9,8 +9,8 @@ This module provides functionality to map image references in HTML to their actu
 
 import os
 import logging
-import shutil
-from bs4 import BeautifulSoup
+from content_accessibility_utility_on_aws.utils.asset_registry import AssetRegistry
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
@@ -26,12 +26,7 @@ def find_all_images(output_dir):
     Returns:
         dict: Dictionary mapping image filenames to their full paths
     """
-    image_files = {}
-    for root, dirs, files in os.walk(output_dir):
-        for file in files:
-            if file.endswith(".png") or file.endswith(".jpg"):
-                image_files[file] = os.path.join(root, file)
-
+    image_files = dict(AssetRegistry.for_directory(output_dir).by_name)
     logger.debug(f"Found {len(image_files)} image files in {output_dir}")
     return image_files
 
@@ -55,14 +50,14 @@ def copy_missing_images(html_file, output_dir, html_output_dir):
         html_content = f.read()
 
     # Parse the HTML
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = parse_html(html_content, read_only=True)
 
     # Find all image tags
     img_tags = soup.find_all("img")
     logger.debug(f"Found {len(img_tags)} img tags in {html_file}")
 
-    # Find all image files in the output directory
-    all_images = find_all_images(output_dir)
+    # Use the image index of the output directory
+    registry = AssetRegistry.for_directory(output_dir)
 
     # Check each image tag
     copied_count = 0
@@ -82,24 +77,18 @@ def copy_missing_images(html_file, output_dir, html_output_dir):
             continue
 
         # If the image doesn't exist, try to find it in the output directory
-        if src_filename in all_images:
-            src_file = all_images[src_filename]
-            try:
-                shutil.copy2(src_file, dest_file)
-                logger.debug(f"Copied missing image: {src_file} -> {dest_file}")
+        src_file = registry.find(src_filename)
+        if src_file:
+            if registry.stage(src_file, html_output_dir, src_filename):
+                logger.debug(f"Staged missing image: {src_file} -> {dest_file}")
                 copied_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to copy image {src_file}: {e}")
         else:
             # Try to find a similar image
-            for img_name, img_path in all_images.items():
-                try:
-                    shutil.copy2(img_path, dest_file)
-                    logger.debug(f"Copied alternative image: {img_path} -> {dest_file}")
+            for img_path in registry.images():
+                if registry.stage(img_path, html_output_dir, src_filename):
+                    logger.debug(f"Staged alternative image: {img_path} -> {dest_file}")
                     copied_count += 1
                     break
-                except Exception as e:
-                    logger.warning(f"Failed to copy alternative image: {e}")
 
     return copied_count
 
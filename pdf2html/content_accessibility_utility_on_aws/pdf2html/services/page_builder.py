@@ -10,10 +10,13 @@ using page indices and reading order to ensure correct page generation.
 
 import os
 import logging
-import shutil
-from bs4 import BeautifulSoup
-from typing import Dict, List, Any
-import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from content_accessibility_utility_on_aws.utils.asset_registry import AssetRegistry
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html_fragment
+from content_accessibility_utility_on_aws.utils.html_utils import StreamedHTMLDocument
+from typing import Dict, List, Any, Optional, Tuple
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
@@ -48,6 +51,7 @@ def handle_image_element(element_tag, element, output_dir):
     # Create the extracted_html directory path
     html_output_dir = os.path.join(output_dir, "extracted_html")
     os.makedirs(html_output_dir, exist_ok=True)
+    registry = AssetRegistry.for_directory(output_dir)
 
     fixed_count = 0
     for img_tag in img_tags:
@@ -69,95 +73,200 @@ def handle_image_element(element_tag, element, output_dir):
         logger.debug(f"  img src: {old_src}")
 
         # Find the crop image file in the output directory
-        crop_image_file = None
-        for root, dirs, files in os.walk(output_dir):
-            for file in files:
-                if file == expected_filename:
-                    crop_image_file = os.path.join(root, file)
-                    break
-            if crop_image_file:
-                break
+        crop_image_file = registry.find(expected_filename)
 
         if not crop_image_file:
             logger.warning(f"Could not find crop image file: {expected_filename}")
             continue
 
-        # Copy the crop image to match the src in the HTML
-        dest_file = os.path.join(html_output_dir, src_filename)
-        try:
-            shutil.copy2(crop_image_file, dest_file)
+        # Stage the crop image under the src name used in the HTML
+        dest_file = registry.stage(
+            crop_image_file, html_output_dir, src_filename, overwrite=True
+        )
+        if dest_file:
             logger.debug(
-                f"Copied image {crop_image_file} to {dest_file} to match HTML src"
+                f"Staged image {crop_image_file} as {dest_file} to match HTML src"
             )
             fixed_count += 1
-        except Exception as e:
-            logger.warning(
-                f"Failed to copy image file {crop_image_file} to {dest_file}: {e}"
-            )
 
     return fixed_count > 0
 
 
-def identify_duplicate_html_elements(html_content: str) -> List[Dict[str, Any]]:
+# Elements that are checked for duplicated content
+_SIGNIFICANT_TAGS = frozenset(
+    ["p", "h1", "h2", "h3", "h4", "h5", "h6", "div", "table", "ul", "ol"]
+)
+
+# String node types that contribute to an element's text, as in Tag.get_text()
+_TEXT_TYPES = (NavigableString, CData)
+
+# Modulus and per-character base of the polynomial text hash. Encoding text as
+# UTF-32 and reading it as an integer evaluates the polynomial at 2**32 in C.
+_HASH_MOD = (1 << 61) - 1
+_HASH_BITS_PER_CHAR = 32
+
+
+def _text_hash(text: str) -> int:
+    """Return the polynomial hash of a string."""
+    return int.from_bytes(text.encode("utf-32-be"), "big") % _HASH_MOD
+
+
+def _concat_hash(left_hash: int, right_hash: int, right_length: int) -> int:
+    """Return the hash of the concatenation of two strings from their hashes."""
+    shift = pow(2, _HASH_BITS_PER_CHAR * right_length, _HASH_MOD)
+    return (left_hash * shift + right_hash) % _HASH_MOD
+
+
+class _PageText:
     """
-    Identify potentially duplicated HTML elements in the content.
+    Text of a parsed page, indexed for constant-time hashing of element text.
 
-    Args:
-        html_content: The HTML content to parse and check for duplicates
+    The text nodes of the page are collected in document order. Every element
+    covers a contiguous range of text nodes, so the hash of its stripped text is
+    combined from prefix hashes instead of re-reading its subtree.
+    """
 
-    Returns:
-        List of dictionaries containing information about duplicate elements
+    def __init__(self, soup: BeautifulSoup):
+        self.nodes: List[str] = []
+        # [element, start, end] in document order
+        self.ranges: List[List[Any]] = []
+        self._collect(soup)
+
+        count = len(self.nodes)
+        self.prefix_hash = [0] * (count + 1)
+        self.prefix_length = [0] * (count + 1)
+        # Index of the first non-blank node at or after / last non-blank node before k
+        self.next_text = [count] * (count + 1)
+        self.prev_text = [-1] * (count + 1)
+
+        for k, text in enumerate(self.nodes):
+            self.prefix_hash[k + 1] = _concat_hash(
+                self.prefix_hash[k], _text_hash(text), len(text)
+            )
+            self.prefix_length[k + 1] = self.prefix_length[k] + len(text)
+            self.prev_text[k + 1] = k if text.strip() else self.prev_text[k]
+        for k in range(count - 1, -1, -1):
+            self.next_text[k] = k if self.nodes[k].strip() else self.next_text[k + 1]
+
+    def _collect(self, soup: BeautifulSoup) -> None:
+        """Collect text nodes and the node range of each significant element."""
+        # Stack of (node, range_index) pairs; range_index is set once the
+        # significant element has been entered and its range needs closing
+        stack = [(soup, None)]
+        while stack:
+            node, range_index = stack.pop()
+            if range_index is not None:
+                self.ranges[range_index][2] = len(self.nodes)
+                continue
+            if isinstance(node, Tag):
+                if node.name in _SIGNIFICANT_TAGS:
+                    stack.append((node, len(self.ranges)))
+                    self.ranges.append([node, len(self.nodes), len(self.nodes)])
+                stack.extend((child, None) for child in reversed(node.contents))
+            elif type(node) in _TEXT_TYPES:
+                self.nodes.append(str(node))
+
+    def _range_hash(self, start: int, end: int) -> int:
+        """Return the hash of the concatenated nodes in [start, end)."""
+        length = self.prefix_length[end] - self.prefix_length[start]
+        shift = pow(2, _HASH_BITS_PER_CHAR * length, _HASH_MOD)
+        return (self.prefix_hash[end] - self.prefix_hash[start] * shift) % _HASH_MOD
+
+    def signature(self, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """
+        Return the (length, hash) signature of the stripped text of a node range.
+
+        Args:
+            start: Index of the first text node of the element
+            end: Index just past the last text node of the element
+
+        Returns:
+            Tuple of text length and hash, or None if the text is blank
+        """
+        first = self.next_text[start]
+        last = self.prev_text[end]
+        if first >= end or last < start:
+            return None
+
+        if first == last:
+            text = self.nodes[first].strip()
+            return len(text), _text_hash(text)
+
+        head = self.nodes[first].lstrip()
+        tail = self.nodes[last].rstrip()
+        middle_length = self.prefix_length[last] - self.prefix_length[first + 1]
+        text_hash = _concat_hash(
+            _text_hash(head), self._range_hash(first + 1, last), middle_length
+        )
+        text_hash = _concat_hash(text_hash, _text_hash(tail), len(tail))
+        return len(head) + middle_length + len(tail), text_hash
+
+    def text(self, start: int, end: int) -> str:
+        """Return the stripped text of a node range."""
+        return "".join(self.nodes[start:end]).strip()
+
+
+def find_duplicate_html_elements(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     """
-    if not html_content:
-        return []
+    Identify potentially duplicated HTML elements in a parsed page.
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    Elements are compared by tag name and stripped text content. The parse tree
+    is walked once and element text is hashed without re-serializing subtrees.
 
-    # Find all significant elements that might be duplicated
-    significant_elements = soup.find_all(
-        ["p", "h1", "h2", "h3", "h4", "h5", "h6", "div", "table", "ul", "ol"]
-    )
+    Args:
+        soup: The parsed page HTML
+
+    Returns:
+        List of dictionaries containing information about duplicate elements,
+        including the duplicate ``element`` itself
+    """
+    page_text = _PageText(soup)
 
-    # Dictionary to track elements by their content signature
-    element_map = {}
+    # First occurrences of each content signature, as (index, start, end);
+    # elements with different text only share a signature on a hash collision
+    element_map: Dict[Tuple[str, int, int], List[Tuple[int, int, int]]] = {}
     duplicates = []
 
-    for idx, element in enumerate(significant_elements):
-        # Create a signature based on text content and tag type
-        # Strip whitespace to normalize comparison
-        element_text = element.get_text().strip()
+    for idx, (element, start, end) in enumerate(page_text.ranges):
+        text_signature = page_text.signature(start, end)
 
         # Skip empty elements
-        if not element_text:
+        if text_signature is None:
             continue
 
-        # Create a signature that includes tag name and content
-        signature = f"{element.name}:{element_text}"
-
-        # Hash longer content for efficiency
-        if len(signature) > 100:
-            signature = hashlib.md5(
-                signature.encode(), usedforsecurity=False
-            ).hexdigest()
-
-        # Check if we've seen this element before
-        if signature in element_map:
-            # Found a duplicate
-            duplicates.append(
-                {
-                    "first_occurrence": element_map[signature],
-                    "duplicate_idx": idx,
-                    "element_type": element.name,
-                    "element_text": (
-                        element_text[:100] + "..."
-                        if len(element_text) > 100
-                        else element_text
-                    ),
-                    "html": str(element),
-                }
-            )
-        else:
-            element_map[signature] = idx
+        signature = (element.name,) + text_signature
+        occurrences = element_map.get(signature)
+        if occurrences is None:
+            element_map[signature] = [(idx, start, end)]
+            continue
+
+        # Confirm the hash match against the actual text
+        element_text = page_text.text(start, end)
+        first_idx = next(
+            (
+                first_idx
+                for first_idx, first_start, first_end in occurrences
+                if page_text.text(first_start, first_end) == element_text
+            ),
+            None,
+        )
+        if first_idx is None:
+            occurrences.append((idx, start, end))
+            continue
+
+        duplicates.append(
+            {
+                "first_occurrence": first_idx,
+                "duplicate_idx": idx,
+                "element_type": element.name,
+                "element_text": (
+                    element_text[:100] + "..."
+                    if len(element_text) > 100
+                    else element_text
+                ),
+                "element": element,
+            }
+        )
 
     if duplicates:
         logger.debug(f"Found {len(duplicates)} potentially duplicated HTML elements")
@@ -165,224 +274,443 @@ def identify_duplicate_html_elements(html_content: str) -> List[Dict[str, Any]]:
     return duplicates
 
 
-def remove_duplicate_html_elements(
-    html_content: str, duplicates: List[Dict[str, Any]]
-) -> str:
+def deduplicate_html_elements(html_content: str) -> Tuple[str, int]:
     """
-    Remove duplicate HTML elements from the content based on identified duplicates.
+    Remove duplicated HTML elements from page content.
+
+    The content is parsed once, duplicates are removed from that tree and the
+    cleaned HTML is serialized once.
 
     Args:
-        html_content: The original HTML content
-        duplicates: List of dictionaries with information about duplicate elements
+        html_content: The HTML content to clean
 
     Returns:
-        The cleaned HTML content with duplicates removed
+        Tuple of the cleaned HTML content and the number of duplicates found
     """
-    if not html_content or not duplicates:
-        return html_content
-
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    # Find all significant elements
-    significant_elements = soup.find_all(
-        ["p", "h1", "h2", "h3", "h4", "h5", "h6", "div", "table", "ul", "ol"]
-    )
+    if not html_content:
+        return html_content, 0
 
-    # Sort duplicates in reverse order to avoid index shifting when removing elements
-    duplicates_sorted = sorted(
-        duplicates, key=lambda x: x["duplicate_idx"], reverse=True
-    )
+    soup = parse_html_fragment(html_content)
+    duplicates = find_duplicate_html_elements(soup)
+    if not duplicates:
+        return html_content, 0
 
+    # Remove in reverse document order so nested duplicates go before their
+    # parents. A duplicate that had a nested duplicate removed no longer has
+    # the content found to be duplicated, and is kept.
     elements_removed = 0
-    for duplicate in duplicates_sorted:
+    changed = set()
+    for duplicate in reversed(duplicates):
+        element = duplicate["element"]
+        if id(element) in changed:
+            logger.warning(
+                f"Element mismatch during duplicate removal: {duplicate['element_text'][:50]}"
+            )
+            continue
         try:
-            duplicate_idx = duplicate["duplicate_idx"]
-
-            # Make sure the index is valid
-            if duplicate_idx < len(significant_elements):
-                element_to_remove = significant_elements[duplicate_idx]
-
-                # Double-check this is the right element by comparing HTML content
-                if str(element_to_remove) == duplicate["html"]:
-                    element_to_remove.decompose()
-                    elements_removed += 1
-                else:
-                    logger.warning(
-                        f"Element mismatch during duplicate removal: {duplicate['element_text'][:50]}"
-                    )
+            changed.update(id(parent) for parent in element.parents)
+            element.decompose()
+            elements_removed += 1
         except Exception as e:
             logger.error(f"Error removing duplicate element: {e}")
 
     if elements_removed > 0:
         logger.debug(f"Removed {elements_removed} duplicate elements from HTML content")
 
-    return str(soup)
+    return str(soup), len(duplicates)
 
 
-def build_html_data(
-    result_data: Dict[str, Any], output_dir: str, is_single_page: bool = False
-) -> Dict[str, Any]:
+# Number of pages below which pages are built serially, to avoid the cost of
+# starting a process pool for small documents
+DEFAULT_PARALLEL_THRESHOLD = 16
+
+# Number of pages sent to a worker process at a time
+DEFAULT_PAGE_CHUNK_SIZE = 8
+
+
+def resolve_page_workers(workers: Optional[int] = None) -> int:
     """
-    Build HTML pages from BDA result elements.
+    Determine the number of worker processes used to build pages.
+
+    Pages are built serially unless more workers are requested, as starting
+    worker processes is not possible or worthwhile everywhere.
 
     Args:
-        result_data: The BDA result data containing elements and pages
-        output_dir: Directory to save HTML files
-        is_single_page: Whether to use the single continuous HTML from document.representation.html
+        workers: Requested number of workers. None or 0 uses the
+            PDF2HTML_PAGE_WORKERS environment variable, or 1.
 
     Returns:
-        Dict containing paths to extracted HTML files
+        int: Number of workers, at least 1
     """
-    logger.debug("Building document from elements")
-    extracted_html_files = []
+    if not workers:
+        try:
+            workers = int(os.environ.get("PDF2HTML_PAGE_WORKERS", "0"))
+        except ValueError:
+            workers = 0
+    return max(1, workers)
 
-    # Create a subdirectory for extracted HTML files
-    html_output_dir = os.path.join(output_dir, "extracted_html")
-    os.makedirs(html_output_dir, exist_ok=True)
 
-    # Get the total number of pages
-    num_pages = len(result_data.get("pages", []))
+def _write_page_file(html_output_dir: str, index: int, page_html: str) -> Optional[str]:
+    """
+    Write an individual page HTML file.
+
+    Args:
+        html_output_dir: Directory to write the page file to
+        index: Zero-based page index
+        page_html: Cleaned page body HTML
+
+    Returns:
+        Path to the page file, or None if it could not be written
+    """
+    page_file_path = os.path.join(html_output_dir, f"page-{index}.html")
+    try:
+        with open(page_file_path, "w", encoding="utf-8") as f:
+            f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n')
+            f.write('    <meta charset="UTF-8">\n')
+            f.write(
+                '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+            )
+            f.write(f"    <title>Page {index+1}</title>\n")
+            f.write(
+                "    <style>\n        body { font-family: Arial, sans-serif; line-height: 1.6; }\n    </style>\n"
+            )
+            f.write("</head>\n<body>\n")
+            f.write(page_html)
+            f.write("\n</body>\n</html>")
+
+        logger.debug(f"Created HTML file for page {index+1}: {page_file_path}")
+        return page_file_path
+    except Exception as e:
+        logger.error(f"Error writing page HTML file {page_file_path}: {e}")
+        return None
+
 
-    # Track elements we've already processed to avoid duplicates
-    processed_pages = set()
+def _build_page(
+    index: int, page_html: str, html_output_dir: str, write_file: bool
+) -> Tuple[int, Optional[str], int, Optional[str]]:
+    """
+    Clean one page and optionally write its page file.
+
+    Args:
+        index: Zero-based page index
+        page_html: Page HTML from the BDA result
+        html_output_dir: Directory to write the page file to
+        write_file: Whether to write the page file
+
+    Returns:
+        Tuple of (index, cleaned HTML or None if it was written to a file,
+        number of duplicates removed, page file path or None)
+    """
+    duplicate_count = 0
+    if page_html:
+        # Check for duplicated elements in the page and remove them
+        page_html, duplicate_count = deduplicate_html_elements(page_html)
+
+    if write_file:
+        page_file_path = (
+            _write_page_file(html_output_dir, index, page_html) if page_html else None
+        )
+        return index, None, duplicate_count, page_file_path
+    return index, page_html, duplicate_count, None
+
+
+def _build_page_chunk(
+    pages: List[Tuple[int, str]], html_output_dir: str, write_files: bool
+) -> List[Tuple[int, Optional[str], int, Optional[str]]]:
+    """
+    Build a chunk of pages in a worker process.
+
+    Args:
+        pages: (index, page HTML) pairs
+        html_output_dir: Directory to write the page files to
+        write_files: Whether to write the page files
+
+    Returns:
+        List of :func:`_build_page` results in the order of ``pages``
+    """
+    return [
+        _build_page(index, page_html, html_output_dir, write_files)
+        for index, page_html in pages
+    ]
+
+
+class HTMLPageWriter:
+    """
+    Incremental writer for the HTML pages of a BDA result.
+
+    Pages are added one at a time as they are read from the result file. In
+    multi-page mode each page file is written as soon as its page has been
+    cleaned; in single-page mode the cleaned page bodies are streamed to the
+    combined document in page order, and :meth:`finish` writes the navigation
+    and the document around them. Only about one page is held in memory.
+
+    With more than one worker, once a document reaches ``parallel_threshold``
+    pages, page cleanup and serialization are farmed out to a process pool in
+    chunks. Results are recorded in page order, so the output is the same as a
+    serial build. Use the writer as a context manager, or call :meth:`close`,
+    so the pool is shut down when reading the pages fails::
+
+        with HTMLPageWriter(output_dir, workers=4) as writer:
+            for index, page in enumerate(pages):
+                writer.add_page(index, page)
+            result = writer.finish()
+    """
 
-    # Process each page
-    for i in range(num_pages):
-        # Build the page HTML
-        page_html = result_data["pages"][i].get("representation", {}).get("html", "")
+    def __init__(
+        self,
+        output_dir: str,
+        is_single_page: bool = False,
+        workers: Optional[int] = None,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+        chunk_size: int = DEFAULT_PAGE_CHUNK_SIZE,
+    ):
+        """
+        Initialize the page writer.
+
+        Args:
+            output_dir: Directory to save HTML files
+            is_single_page: Whether to write a single combined HTML file
+            workers: Number of worker processes, see :func:`resolve_page_workers`.
+                1 builds every page serially.
+            parallel_threshold: Number of pages below which pages are built serially
+            chunk_size: Number of pages sent to a worker process at a time
+        """
+        self.output_dir = output_dir
+        self.is_single_page = is_single_page
+        self.title = "Document"
+        self.page_count = 0
+        self.html_files: List[str] = []
+        self.workers = resolve_page_workers(workers)
+        self.parallel_threshold = max(1, parallel_threshold)
+        self.chunk_size = max(1, chunk_size)
+
+        # Create a subdirectory for extracted HTML files
+        self.html_output_dir = os.path.join(output_dir, "extracted_html")
+        os.makedirs(self.html_output_dir, exist_ok=True)
+
+        # In single-page mode pages are streamed into the combined document
+        self._combined = (
+            StreamedHTMLDocument(
+                os.path.join(self.html_output_dir, "remediated.html"),
+                separator='\n<div class="page-break"></div>',
+            )
+            if is_single_page
+            else None
+        )
+        # Pages waiting to be built, and chunks submitted to the pool in page order
+        self._pending: List[Tuple[int, str]] = []
+        self._futures = deque()
+        self._executor = None
+
+    def __enter__(self) -> "HTMLPageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool, cancelling the pages not yet built."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._futures.clear()
+        self._pending = []
+
+    def add_page(self, index: int, page: Dict[str, Any]) -> None:
+        """
+        Add a page from the BDA result.
+
+        Args:
+            index: Zero-based index of the page in the result
+            page: The page data from the BDA result
+        """
+        self.page_count += 1
+
+        page_html = page.get("representation", {}).get("html", "")
         if not page_html:
-            logger.warning(f"Page {i+1} has no HTML representation")
-            continue
+            logger.warning(f"Page {index+1} has no HTML representation")
 
-        # Check for duplicated elements in the page
-        duplicates = identify_duplicate_html_elements(page_html)
-        if duplicates:
-            logger.warning(f"Page {i+1} contains {len(duplicates)} duplicated elements")
-            # Clean the HTML by removing duplicates
-            page_html = remove_duplicate_html_elements(page_html, duplicates)
-            # Update the page HTML in the result data
-            result_data["pages"][i]["representation"]["html"] = page_html
-
-        processed_pages.add(i)
-
-    if not is_single_page:
-        for i in processed_pages:
-            # Get the page HTML
-            page_html = (
-                result_data["pages"][i].get("representation", {}).get("html", "")
+        if self.workers <= 1:
+            self._record(
+                _build_page(
+                    index, page_html, self.html_output_dir, not self.is_single_page
+                )
             )
-            # Create individual page HTML file
-            page_file_path = os.path.join(html_output_dir, f"page-{i}.html")
-            try:
-                with open(page_file_path, "w", encoding="utf-8") as f:
-                    f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n')
-                    f.write('    <meta charset="UTF-8">\n')
-                    f.write(
-                        '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
-                    )
-                    f.write(f"    <title>Page {i+1}</title>\n")
-                    f.write(
-                        "    <style>\n        body { font-family: Arial, sans-serif; line-height: 1.6; }\n    </style>\n"
-                    )
-                    f.write("</head>\n<body>\n")
-                    f.write(page_html)
-                    f.write("\n</body>\n</html>")
-
-                extracted_html_files.append(page_file_path)
-                logger.debug(f"Created HTML file for page {i+1}: {page_file_path}")
-            except Exception as e:
-                logger.error(f"Error writing page HTML file {page_file_path}: {e}")
-
-    else:
-        # Create combined HTML file
-        combined_html_parts = [
-            "<!DOCTYPE html>",
-            '<html lang="en">',
-            "<head>",
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            f'    <title>{"Document" if "metadata" not in result_data else result_data["metadata"].get("asset_id", "Document")}</title>',
-            "    <style>",
-            "        body { font-family: Arial, sans-serif; line-height: 1.6; }",
-            "        .page-break { page-break-after: always; margin-bottom: 30px; border-bottom: 1px dashed #ccc; }",
-            "    </style>",
-            "</head>",
-            "<body>",
-            "<nav><ul>"
-        ]
-        pages = []
-        for i in range(num_pages):
-            page_html = (
-                result_data["pages"][i].get("representation", {}).get("html", "")
+            return
+
+        self._pending.append((index, page_html))
+        if self._executor is None and self.page_count >= self.parallel_threshold:
+            self._start_pool()
+        if self._executor is not None and len(self._pending) >= self.chunk_size:
+            self._submit_pending()
+
+    def _start_pool(self) -> None:
+        """Start the worker pool, staying serial if processes are not available."""
+        try:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            logger.debug(f"Building pages with {self.workers} worker processes")
+        except (OSError, NotImplementedError, ImportError) as e:
+            # Some environments, such as AWS Lambda, do not support the
+            # semaphores multiprocessing needs
+            logger.warning(f"Process pool not available, building pages serially: {e}")
+            self.workers = 1
+            self._build_pending_serially()
+
+    def _submit_pending(self) -> None:
+        """Submit the pending pages to the pool in chunks."""
+        while self._pending:
+            chunk = self._pending[: self.chunk_size]
+            del self._pending[: self.chunk_size]
+            self._futures.append(
+                self._executor.submit(
+                    _build_page_chunk,
+                    chunk,
+                    self.html_output_dir,
+                    not self.is_single_page,
+                )
             )
-            menu_link = f'<li><a href="#page-{i}">Page {i+1}</a></li>'
-            combined_html_parts.append(menu_link)
 
-            duplicates = identify_duplicate_html_elements(page_html)
-            if duplicates:
-                logger.warning(
-                    f"Page {i+1} contains {len(duplicates)} duplicated elements in combined view"
+        # Bound the number of chunks in flight so pages do not pile up in memory
+        while len(self._futures) > 2 * self.workers:
+            self._collect_next()
+
+    def _collect_next(self) -> None:
+        """Record the results of the oldest submitted chunk."""
+        for result in self._futures.popleft().result():
+            self._record(result)
+
+    def _build_pending_serially(self) -> None:
+        """Build the pending pages in this process."""
+        pending, self._pending = self._pending, []
+        for index, page_html in pending:
+            self._record(
+                _build_page(
+                    index, page_html, self.html_output_dir, not self.is_single_page
                 )
-                # Clean the HTML by removing duplicates
-                page_html = remove_duplicate_html_elements(page_html, duplicates)
-
-            pages.append(f'<div id="page-{i}" class="page">')
-            pages.append(page_html)
-            pages.append("</div>")
-            if i < num_pages - 1:
-                pages.append('<div class="page-break"></div>')
-
-        combined_html_parts.append("</ul></nav>")
-        combined_html_parts.extend(pages)
-        combined_html_parts.append("</body>\n</html>")
-        combined_html = "\n".join(combined_html_parts)
+            )
+
+    def _record(self, result: Tuple[int, Optional[str], int, Optional[str]]) -> None:
+        """Record the result of building a page."""
+        index, page_html, duplicate_count, page_file_path = result
+        if duplicate_count:
+            logger.warning(
+                f"Page {index+1} contains {duplicate_count} duplicated elements"
+            )
+
+        if self.is_single_page:
+            # Stream the page into the combined document in page order
+            position = self._combined.section_count
+            self._combined.add_section(
+                f'\n<div id="page-{position}" class="page">\n{page_html}\n</div>',
+                f'\n<li><a href="#page-{position}">Page {position+1}</a></li>',
+            )
+        elif page_file_path:
+            self.html_files.append(page_file_path)
+
+    def _flush_pages(self) -> None:
+        """Build every page that has been added but not yet recorded."""
+        if self._executor is None:
+            self._build_pending_serially()
+            return
+
+        try:
+            self._submit_pending()
+            while self._futures:
+                self._collect_next()
+        finally:
+            self.close()
+
+    def _write_combined_file(self) -> None:
+        """Write the combined single-page HTML file around the streamed pages."""
+        combined_file_path = self._combined.output_path
+        prefix = "\n".join(
+            [
+                "<!DOCTYPE html>",
+                '<html lang="en">',
+                "<head>",
+                '    <meta charset="UTF-8">',
+                '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
+                f"    <title>{self.title}</title>",
+                "    <style>",
+                "        body { font-family: Arial, sans-serif; line-height: 1.6; }",
+                "        .page-break { page-break-after: always; margin-bottom: 30px; border-bottom: 1px dashed #ccc; }",
+                "    </style>",
+                "</head>",
+                "<body>",
+            ]
+        )
         try:
-            combined_file_path = os.path.join(html_output_dir, "remediated.html")
-            with open(combined_file_path, "w", encoding="utf-8") as f:
-                f.write(combined_html)
-            extracted_html_files.insert(
+            self._combined.finish(
+                prefix,
+                "\n</body>\n</html>",
+                nav_start="\n<nav><ul>",
+                nav_end="\n</ul></nav>",
+            )
+            self.html_files.insert(
                 0, combined_file_path
             )  # Put the combined file first in the list
             logger.debug(f"Created combined HTML file: {combined_file_path}")
         except Exception as e:
             logger.error(f"Error creating combined HTML file {combined_file_path}: {e}")
 
-    copy_all_images_to_html_dir(output_dir, html_output_dir)
+    def finish(self) -> Dict[str, Any]:
+        """
+        Complete the document once all pages have been added.
 
-    return {
-        "html_files": extracted_html_files,
-    }
+        Returns:
+            Dict containing paths to extracted HTML files and the page count
+        """
+        self._flush_pages()
 
+        if self.is_single_page:
+            self._write_combined_file()
 
-def copy_all_images_to_html_dir(output_dir, html_output_dir):
+        copy_all_images_to_html_dir(self.output_dir, self.html_output_dir)
+
+        return {
+            "html_files": self.html_files,
+            "page_count": self.page_count,
+        }
+
+
+def build_html_data(
+    result_data: Dict[str, Any],
+    output_dir: str,
+    is_single_page: bool = False,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
     """
-    Copy all image files to the extracted_html directory.
+    Build HTML pages from BDA result elements.
 
     Args:
-        output_dir: Base output directory
-        html_output_dir: HTML output directory
+        result_data: The BDA result data containing elements and pages
+        output_dir: Directory to save HTML files
+        is_single_page: Whether to write a single combined HTML file
+        workers: Number of worker processes used to build pages, see
+            :func:`resolve_page_workers`
+
+    Returns:
+        Dict containing paths to extracted HTML files and the page count
     """
-    logger.debug("Copying all image files to HTML directory...")
+    logger.debug("Building document from elements")
+    with HTMLPageWriter(output_dir, is_single_page, workers=workers) as writer:
+        if "metadata" in result_data:
+            writer.title = result_data["metadata"].get("asset_id", "Document")
 
-    # Find all image files in the output directory
-    image_files = []
-    for root, dirs, files in os.walk(output_dir):
-        for file in files:
-            if file.endswith(".png") or file.endswith(".jpg"):
-                image_files.append(os.path.join(root, file))
+        for i, page in enumerate(result_data.get("pages", [])):
+            writer.add_page(i, page)
 
-    logger.debug(f"Found {len(image_files)} image files")
+        return writer.finish()
 
-    # Copy each image file to the HTML directory
-    copied_files = 0
-    for image_file in image_files:
-        try:
-            dest_file = os.path.join(html_output_dir, os.path.basename(image_file))
-            if not os.path.exists(dest_file):
-                shutil.copy2(image_file, dest_file)
-                copied_files += 1
-                logger.debug(f"Copied image file: {image_file} -> {dest_file}")
-        except Exception as e:
-            logger.warning(f"Failed to copy image file {image_file}: {e}")
 
-    logger.debug(f"Copied {copied_files} image files to HTML directory")
+def copy_all_images_to_html_dir(output_dir, html_output_dir):
+    """
+    Stage all image files in the extracted_html directory.
+
+    Args:
+        output_dir: Base output directory
+        html_output_dir: HTML output directory
+    """
+    logger.debug("Staging all image files in HTML directory...")
+    staged_files = AssetRegistry.for_directory(output_dir).stage_all(html_output_dir)
+    logger.debug(f"Staged {staged_files} image files in HTML directory")
@@ -0,0 +1,272 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Streaming reader for BDA result.json files.
+
+This module provides an incremental reader that yields the pages and elements of a
+BDA result.json file one at a time, so large documents never have to be loaded into
+memory as a whole.
+"""
+
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# Number of characters read from the result file at a time
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_SCALAR_END = re.compile(r"[\s,\]}]")
+
+
+class BDAResultReader:
+    """
+    Incremental reader for the top-level object of a BDA result.json file.
+
+    Array values listed in ``array_keys`` (by default ``pages`` and ``elements``)
+    are yielded item by item. Values listed in ``skip_keys`` (by default the
+    whole-document ``document`` representation) are scanned past without being
+    decoded. All other top-level values are decoded and yielded whole.
+    """
+
+    def __init__(self, json_file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            json_file_path: Path to the BDA result.json file
+            chunk_size: Number of characters to read from the file at a time
+        """
+        self.json_file_path = json_file_path
+        self.chunk_size = chunk_size
+        self._file = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_items(
+        self,
+        array_keys: Iterable[str] = ("pages", "elements"),
+        skip_keys: Iterable[str] = ("document",),
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the top-level content of the result file.
+
+        Args:
+            array_keys: Top-level keys whose array values are yielded one item at a time
+            skip_keys: Top-level keys whose values are skipped without decoding
+
+        Yields:
+            Tuples of (key, value). For array keys there is one tuple per array item,
+            for skipped keys the value is None.
+
+        Raises:
+            ValueError: If the file is not a well-formed JSON object
+        """
+        array_keys = set(array_keys)
+        skip_keys = set(skip_keys)
+
+        with open(self.json_file_path, "r", encoding="utf-8") as f:
+            self._file = f
+            self._buf = ""
+            self._pos = 0
+            self._eof = False
+            try:
+                self._expect("{")
+                if self._peek() == "}":
+                    return
+
+                while True:
+                    key = self._read_value()
+                    if not isinstance(key, str):
+                        raise ValueError(
+                            f"Expected an object key in {self.json_file_path}"
+                        )
+                    self._expect(":")
+
+                    if key in array_keys and self._peek() == "[":
+                        yield from self._iter_array(key)
+                    elif key in skip_keys:
+                        self._scan_value(capture=False)
+                        logger.debug(f"Skipped top-level key '{key}' in result JSON")
+                        yield key, None
+                    else:
+                        yield key, self._read_value()
+
+                    separator = self._next_char()
+                    if separator == "}":
+                        break
+                    if separator != ",":
+                        raise ValueError(
+                            f"Expected ',' or '}}' in {self.json_file_path}, got '{separator}'"
+                        )
+            finally:
+                self._file = None
+                self._buf = ""
+
+    def _iter_array(self, key: str) -> Iterator[Tuple[str, Any]]:
+        """Yield the items of the array value at the current position."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield key, self._read_value()
+            separator = self._next_char()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(
+                    f"Expected ',' or ']' in '{key}' array, got '{separator}'"
+                )
+
+    def _fill(self) -> bool:
+        """
+        Replace the consumed buffer with the next chunk of the file.
+
+        Only called once the whole buffer has been consumed, so the buffer never
+        holds more than one chunk.
+
+        Returns:
+            True if data was read, False at end of file
+        """
+        if self._eof:
+            return False
+        data = self._file.read(self.chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = data
+        self._pos = 0
+        return True
+
+    def _skip_ws(self) -> None:
+        """Advance past whitespace, reading more data as needed."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        self._skip_ws()
+        if self._pos >= len(self._buf):
+            raise ValueError(f"Unexpected end of file in {self.json_file_path}")
+        return self._buf[self._pos]
+
+    def _next_char(self) -> str:
+        """Consume and return the next non-whitespace character."""
+        char = self._peek()
+        self._pos += 1
+        return char
+
+    def _expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be ``char``."""
+        found = self._next_char()
+        if found != char:
+            raise ValueError(
+                f"Expected '{char}' in {self.json_file_path}, got '{found}'"
+            )
+
+    def _read_value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        return json.loads(self._scan_value(capture=True))
+
+    def _scan_value(self, capture: bool) -> Optional[str]:
+        """
+        Consume the next JSON value without decoding it.
+
+        The value is scanned one buffer at a time, keeping the string and nesting
+        state between buffers, so every character is looked at once and a value
+        that is only skipped is never held in memory.
+
+        Args:
+            capture: Whether to collect and return the text of the value
+
+        Returns:
+            The text of the value if ``capture`` is set, None otherwise
+
+        Raises:
+            ValueError: If the file ends inside the value
+        """
+        self._peek()
+        parts = [] if capture else None
+        start = pos = self._pos
+        first = self._buf[start]
+        scalar = first not in '"{['
+        in_string = first == '"'
+        if in_string:
+            pos += 1
+        escaped = False
+        depth = 0
+
+        while True:
+            buf = self._buf
+            size = len(buf)
+            end = None
+            while pos < size:
+                if escaped:
+                    escaped = False
+                    pos += 1
+                elif in_string:
+                    match = _STRING_SPECIAL.search(buf, pos)
+                    if match is None:
+                        pos = size
+                    elif match.group() == "\\":
+                        escaped = True
+                        pos = match.end()
+                    else:
+                        in_string = False
+                        pos = match.end()
+                        if depth == 0:
+                            end = pos
+                            break
+                elif scalar:
+                    # Number, true, false or null
+                    match = _SCALAR_END.search(buf, pos)
+                    if match is None:
+                        pos = size
+                    else:
+                        end = match.start()
+                        break
+                else:
+                    match = _STRUCTURAL.search(buf, pos)
+                    if match is None:
+                        pos = size
+                        continue
+                    token = match.group()
+                    pos = match.end()
+                    if token == '"':
+                        in_string = True
+                    elif token in "{[":
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            end = pos
+                            break
+
+            if end is not None:
+                self._pos = end
+                if capture:
+                    parts.append(buf[start:end])
+                    return "".join(parts)
+                return None
+
+            if capture:
+                parts.append(buf[start:])
+            self._pos = size
+            if not self._fill():
+                if scalar:
+                    return "".join(parts) if capture else None
+                raise ValueError(f"Truncated JSON value in {self.json_file_path}")
+            start = pos = 0
@@ -6,37 +6,180 @@
 PDF utility functions.
 """
 
+import re
+from typing import Dict, List, Optional, Tuple
+
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from pypdf import PdfReader
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
-def is_image_only_pdf(pdf_path: str) -> bool:
+# Page classifications
+PAGE_TEXT = "text"
+PAGE_IMAGE = "image"
+PAGE_EMPTY = "empty"
+
+# Number of pages inspected when checking whether a PDF is image-only
+DEFAULT_SAMPLE_SIZE = 8
+
+# Maximum nesting depth followed into form XObjects
+_MAX_FORM_DEPTH = 3
+
+_BEGIN_TEXT = re.compile(rb"(?<![A-Za-z])BT(?![A-Za-z])")
+_SHOW_TEXT = re.compile(rb"(?<![A-Za-z])T[jJ](?![A-Za-z])|[)\]>]\s*['\"]")
+_INLINE_IMAGE = re.compile(rb"(?<![A-Za-z])BI(?![A-Za-z])")
+
+
+def _scan_content(resources, content: bytes, depth: int = 0) -> Tuple[bool, bool]:
+    """
+    Check a content stream and its resources for text and images.
+
+    Text is only counted when the resources define fonts and the content stream
+    contains a text object with a text-showing operator.
+
+    Args:
+        resources: The resource dictionary of the content stream
+        content: The raw content stream data
+        depth: Current form XObject nesting depth
+
+    Returns:
+        Tuple of (has_text, has_image)
+    """
+    if resources is not None:
+        resources = resources.get_object()
+    content = content or b""
+
+    has_image = bool(_INLINE_IMAGE.search(content))
+    fonts = resources.get("/Font") if resources else None
+    has_text = bool(
+        fonts and _BEGIN_TEXT.search(content) and _SHOW_TEXT.search(content)
+    )
+
+    xobjects = resources.get("/XObject") if resources else None
+    if has_text or not xobjects:
+        return has_text, has_image
+
+    xobjects = xobjects.get_object()
+    for name in xobjects:
+        xobject = xobjects[name].get_object()
+        subtype = xobject.get("/Subtype")
+        if subtype == "/Image":
+            has_image = True
+        elif subtype == "/Form" and depth < _MAX_FORM_DEPTH:
+            form_text, form_image = _scan_content(
+                xobject.get("/Resources", resources), xobject.get_data(), depth + 1
+            )
+            has_image = has_image or form_image
+            if form_text:
+                return True, has_image
+
+    return has_text, has_image
+
+
+def classify_pdf_page(page) -> str:
+    """
+    Classify a PDF page without extracting its text.
+
+    Args:
+        page: A pypdf page object
+
+    Returns:
+        str: PAGE_TEXT if the page draws text, PAGE_IMAGE if it only draws
+            images, PAGE_EMPTY otherwise
+    """
+    try:
+        contents = page.get_contents()
+        content = contents.get_data() if contents is not None else b""
+        has_text, has_image = _scan_content(page.get("/Resources"), content)
+    except Exception as e:
+        # Fall back to text extraction for pages with unusual structure
+        logger.debug(f"Falling back to text extraction for page classification: {e}")
+        return PAGE_TEXT if page.extract_text().strip() else PAGE_IMAGE
+
+    if has_text:
+        return PAGE_TEXT
+    if has_image:
+        return PAGE_IMAGE
+    return PAGE_EMPTY
+
+
+def _sample_page_indices(num_pages: int, sample_size: Optional[int]) -> List[int]:
+    """
+    Select the pages to inspect: first, last and evenly spaced pages between.
+
+    The selection only depends on the page count, so a document always gets
+    the same verdict.
+
+    Args:
+        num_pages: Number of pages in the document
+        sample_size: Maximum number of pages to select, or None for all pages
+
+    Returns:
+        List of zero-based page indices
+    """
+    if sample_size is None or num_pages <= max(sample_size, 2):
+        return list(range(num_pages))
+
+    middle_count = max(sample_size - 2, 0)
+    stride = (num_pages - 1) / (middle_count + 1)
+    middle = [int(stride * (i + 1)) for i in range(middle_count)]
+    return [0, num_pages - 1] + middle
+
+
+def classify_pdf_pages(
+    pdf_path: str,
+    sample_size: Optional[int] = None,
+    stop_on_text: bool = False,
+) -> Dict[int, str]:
+    """
+    Classify the pages of a PDF as text, image or empty.
+
+    Args:
+        pdf_path: Path to the PDF file
+        sample_size: Number of pages to inspect (first, last and evenly spaced
+            pages between), or None to inspect every page
+        stop_on_text: Stop as soon as a page with text is found
+
+    Returns:
+        Dict mapping zero-based page index to its classification, for the
+        inspected pages only
+    """
+    classification = {}
+    with open(pdf_path, "rb") as file:
+        reader = PdfReader(file)
+        for index in _sample_page_indices(len(reader.pages), sample_size):
+            classification[index] = classify_pdf_page(reader.pages[index])
+            if stop_on_text and classification[index] == PAGE_TEXT:
+                break
+
+    return classification
+
+
+def is_image_only_pdf(pdf_path: str, sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE) -> bool:
     """
     Check if a PDF is image-only (scanned) or contains actual text.
 
+    Only a sample of pages is inspected, and inspection stops at the first page
+    that draws text.
+
     Args:
         pdf_path: Path to the PDF file
+        sample_size: Number of pages to inspect, or None to inspect every page
 
     Returns:
         bool: True if the PDF is likely image-only, False otherwise
     """
     try:
         logger.debug(f"Checking if PDF is image-only: {pdf_path}")
-        
-        with open(pdf_path, 'rb') as file:
-            reader = PdfReader(file)
-            
-            # Check each page for text content
-            for page in reader.pages:
-                text = page.extract_text().strip()
-                if text:  # If any page has text, it's not image-only
-                    return False
-                    
-            # If we get here, no text was found in any page
-            return True
-            
+
+        classification = classify_pdf_pages(
+            pdf_path, sample_size=sample_size, stop_on_text=True
+        )
+
+        # If any inspected page has text, it's not image-only
+        return PAGE_TEXT not in classification.values()
+
     except Exception as e:
         logger.warning(f"Error checking if PDF is image-only: {e}")
         return False
@@ -10,7 +10,6 @@ This module provides functionality for remediating accessibility issues in HTML
 from typing import Dict, List, Any, Optional
 import os
 import shutil
-import re
 from bs4 import BeautifulSoup
 
 from content_accessibility_utility_on_aws.utils.logging_helper import (
@@ -22,27 +21,38 @@ from content_accessibility_utility_on_aws.utils.image_utils import (
     find_image_directory,
 )
 from content_accessibility_utility_on_aws.remediate.remediation_manager import RemediationManager
+from content_accessibility_utility_on_aws.utils.asset_registry import asset_scope
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
+from content_accessibility_utility_on_aws.utils.path_utils import IssueFileIndex
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
 
+@asset_scope()
 def remediate_html_accessibility(
     html_path: str,
     audit_report: Optional[Dict[str, Any]] = None,
     options: Optional[Dict[str, Any]] = None,
     output_path: Optional[str] = None,
     image_dir: Optional[str] = None,
+    page_store: Optional[PageStore] = None,
 ) -> Dict[str, Any]:
     """
     Remediate accessibility issues in an HTML document.
 
+    Each page is read once, from the page store when the audit kept it there,
+    remediated in memory and written once to the output.
+
     Args:
         html_path: Path to the HTML file or directory of HTML files.
         audit_report: Optional audit report from audit_html_accessibility().
         options: Remediation options.
         output_path: Path to save the remediated HTML file or directory.
         image_dir: Directory containing images referenced in the HTML.
+        page_store: Optional store holding the pages read by the audit. Pages
+            are removed from it once remediated.
 
     Returns:
         Dictionary containing remediation results.
@@ -75,6 +85,9 @@ def remediate_html_accessibility(
 
         options = default_options
 
+        if page_store is None:
+            page_store = PageStore()
+
         # Auto-detect image directory if not specified
         if not image_dir:
             image_dir = find_image_directory(html_path)
@@ -116,7 +129,6 @@ def remediate_html_accessibility(
                 output_dir = os.path.dirname(output_path)
                 if output_dir:  # Only create directories if there's a directory part
                     os.makedirs(output_dir, exist_ok=True)
-                shutil.copy2(html_path, output_path)
                 result["remediated_html_path"] = output_path
 
                 # Process the audit report and remediate issues
@@ -128,33 +140,27 @@ def remediate_html_accessibility(
                         if issue.get("remediation_status") == "needs_remediation"
                     ]
 
-                    # Read and parse the HTML
-                    with open(output_path, "r", encoding="utf-8") as f:
-                        soup = BeautifulSoup(f.read(), "html.parser")
-
-                    # Skip copying images here - we'll do it once at the end to the images/ folder
-                    # This prevents duplicate images in the root directory
-
-                    # Remediate the issues
-                    remediation_result = _remediate_html_file(
-                        html_path=output_path,
-                        issues=file_issues,
-                        options=options,
-                        image_dir=image_dir,
-                        soup=soup,
-                    )
-
-                    # Save the modified HTML
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(str(soup))
+                    # Read and parse the HTML, from the store if the audit kept it
+                    html_content = page_store.take(html_path)
+                    soup = parse_html(html_content)
+
+                    try:
+                        # Remediate the issues
+                        remediation_result = _remediate_html_file(
+                            html_path=output_path,
+                            issues=file_issues,
+                            options=options,
+                            image_dir=image_dir,
+                            soup=soup,
+                        )
+                    except Exception:
+                        # Leave the original page in the output
+                        _write_page(output_path, html_content)
+                        raise
 
                     # Update result with remediation counts
                     result.update(remediation_result)
 
-                    # Write the updated HTML back to the file
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(str(soup))
-
                     # Copy images if specified
                     if image_dir and os.path.exists(image_dir):
                         # Create images subdirectory in the output directory
@@ -163,15 +169,16 @@ def remediate_html_accessibility(
                             f"Copying images from {image_dir} to {images_dest_dir}"
                         )
                         copy_images_to_output(image_dir, images_dest_dir, soup, use_images_prefix=True)
-
-                        # Write the updated HTML with image references back to the file
-                        with open(output_path, "w", encoding="utf-8") as f:
-                            f.write(str(soup))
                     else:
                         logger.warning(
                             f"Image directory not specified or does not exist: {image_dir}"
                         )
 
+                    # Write the remediated HTML, with its image references, once
+                    _write_page(output_path, str(soup))
+                else:
+                    shutil.copy2(html_path, output_path)
+
         # Handle multi-page remediation
         elif is_multi_page:
             # Get list of HTML files in the directory
@@ -198,7 +205,13 @@ def remediate_html_accessibility(
 
                 # If we have an audit report, process each file with its issues
                 if audit_report:
+                    # Assign the issues to their files once, instead of
+                    # scanning the whole report for every file
+                    issue_index = IssueFileIndex(
+                        audit_report.get("issues", []), html_files
+                    )
                     for html_file in html_files:
+                        html_content = None
                         try:
                             # Just use the basename of the HTML file for the output
                             filename = os.path.basename(html_file)
@@ -207,55 +220,8 @@ def remediate_html_accessibility(
                             # Create output directory if needed
                             os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-                            # Get issues for this file - normalize paths for comparison
-                            file_issues = []
-                            for issue in audit_report.get("issues", []):
-                                if (
-                                    issue.get("remediation_status")
-                                    != "needs_remediation"
-                                ):
-                                    continue
-
-                                # Try multiple places where the path might be stored
-                                issue_path = issue.get("file_path", "")
-                                issue_file_name = issue.get("file_name", "")
-                                issue_page_number = issue.get("page_number")
-                                
-                                # Check location field if root level fields aren't available
-                                if "location" in issue and issue["location"]:
-                                    if not issue_path:
-                                        issue_path = issue["location"].get("file_path", "")
-                                    if not issue_file_name:
-                                        issue_file_name = issue["location"].get("file_name", "")
-                                    if issue_page_number is None:
-                                        issue_page_number = issue["location"].get("page_number")
-
-                                # Get current file name for comparison
-                                current_file_name = os.path.basename(html_file)
-                                
-                                # Match by file path (exact or basename)
-                                if issue_path and (issue_path == html_file or 
-                                                  os.path.basename(issue_path) == current_file_name or
-                                                  os.path.abspath(issue_path) == os.path.abspath(html_file)):
-                                    file_issues.append(issue)
-                                    continue
-                                    
-                                # Match by file name
-                                if issue_file_name and issue_file_name == current_file_name:
-                                    file_issues.append(issue)
-                                    continue
-                                
-                                # Match by page number (extracted from filename)
-                                if issue_page_number is not None:
-                                    match = re.search(r"page[_-]?(\d+)\.html$", current_file_name, re.IGNORECASE)
-                                    if match and int(match.group(1)) == issue_page_number:
-                                        file_issues.append(issue)
-                                        continue
-
-                                # If no file_path, file_name, or page_number found and this is the first HTML file, 
-                                # assign all issues with no location info to it
-                                if not issue_path and not issue_file_name and issue_page_number is None and html_file == html_files[0]:
-                                    file_issues.append(issue)
+                            # Get issues for this file from the index
+                            file_issues = issue_index.issues_for(html_file)
 
                             # Log the number of issues found for this file
                             if file_issues:
@@ -267,15 +233,9 @@ def remediate_html_accessibility(
                                     f"No issues found for file: {os.path.basename(html_file)}"
                                 )
 
-                            # Copy the original file to output
-                            shutil.copy2(html_file, output_file)
-
-                            # Read and parse the HTML
-                            with open(output_file, "r", encoding="utf-8") as f:
-                                soup = BeautifulSoup(f.read(), "html.parser")
-
-                            # Skip copying images here - we'll do it once at the end to the images/ folder
-                            # This prevents duplicate images in the root directory
+                            # Read and parse the HTML, from the store if the audit kept it
+                            html_content = page_store.take(html_file)
+                            soup = parse_html(html_content)
 
                             # Remediate the issues
                             file_result = _remediate_html_file(
@@ -286,9 +246,25 @@ def remediate_html_accessibility(
                                 soup=soup,
                             )
 
-                            # Save the modified HTML
-                            with open(output_file, "w", encoding="utf-8") as f:
-                                f.write(str(soup))
+                            # Copy images if specified
+                            if image_dir and os.path.exists(image_dir):
+                                images_dest_dir = os.path.join(output_path, "images")
+                                logger.debug(
+                                    f"Copying images from {image_dir} to {images_dest_dir}"
+                                )
+                                copy_images_to_output(image_dir, images_dest_dir, soup, use_images_prefix=True)
+                            else:
+                                logger.warning(
+                                    f"Image directory not specified or does not exist: {image_dir}"
+                                )
+
+                            # Write the remediated HTML, with its image references, once
+                            remediated_html = str(soup)
+                            _write_page(output_file, remediated_html)
+                            html_content = None
+                            if options.get("single_page", False):
+                                # Keep the page for the combined document
+                                page_store.put(output_file, remediated_html)
 
                             # Store file result for later aggregation, include the full remediation details
                             file_result["file_path"] = os.path.relpath(
@@ -326,26 +302,18 @@ def remediate_html_accessibility(
                                 result["failed_issue_types"].extend(
                                     file_result.get("failed_issue_types", [])
                                 )
-
-                            # Copy images if specified
-                            if image_dir and os.path.exists(image_dir):
-                                images_dest_dir = os.path.join(output_path, "images")
-                                logger.debug(
-                                    f"Copying images from {image_dir} to {images_dest_dir}"
-                                )
-                                copy_images_to_output(image_dir, images_dest_dir, soup, use_images_prefix=True)
-
-                                # Write the updated HTML with image references back to the file
-                                with open(output_file, "w", encoding="utf-8") as f:
-                                    f.write(str(soup))
-                            else:
-                                logger.warning(
-                                    f"Image directory not specified or does not exist: {image_dir}"
-                                )
                         except Exception as e:
                             logger.warning(f"Error remediating HTML file: {e}")
                             total_processed += len(file_issues)
                             total_failed += len(file_issues)
+                            if html_content is not None:
+                                # Leave the original page in the output
+                                try:
+                                    _write_page(output_file, html_content)
+                                except OSError as write_error:
+                                    logger.warning(
+                                        f"Could not write {output_file}: {write_error}"
+                                    )
 
                     # Update result with total counts
                     result["issues_processed"] = total_processed
@@ -404,7 +372,7 @@ def remediate_html_accessibility(
                         )
 
                         # Create base document structure
-                        combined_soup = BeautifulSoup(
+                        combined_soup = parse_html(
                             """
                         <!DOCTYPE html>
                         <html lang="en">
@@ -445,8 +413,7 @@ def remediate_html_accessibility(
                             </main>
                         </body>
                         </html>
-                        """,
-                            "html.parser",
+                        """
                         )
 
                         # Get the main content container
@@ -458,8 +425,7 @@ def remediate_html_accessibility(
                                 rel_path = os.path.relpath(html_file, html_path)
                                 remediate_path = os.path.join(output_path, rel_path)
 
-                                with open(remediate_path, "r", encoding="utf-8") as f:
-                                    page_soup = BeautifulSoup(f.read(), "html.parser")
+                                page_soup = parse_html(page_store.read(remediate_path))
 
                                 # Look for a title or h1
                                 title = page_soup.find("title")
@@ -489,8 +455,7 @@ def remediate_html_accessibility(
                                 rel_path = os.path.relpath(html_file, html_path)
                                 remediate_path = os.path.join(output_path, rel_path)
 
-                                with open(remediate_path, "r", encoding="utf-8") as f:
-                                    page_soup = BeautifulSoup(f.read(), "html.parser")
+                                page_soup = parse_html(page_store.take(remediate_path))
 
                                 # Create a section for this page
                                 page_section = combined_soup.new_tag("section")
@@ -558,6 +523,12 @@ def remediate_html_accessibility(
         raise DocumentAccessibilityError(f"Failed to remediate HTML accessibility: {e}")
 
 
+def _write_page(path: str, content: str) -> None:
+    """Write the HTML of a page."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
 def _remediate_html_file(
     html_path: str,
     issues: List[Dict[str, Any]],
@@ -589,7 +560,7 @@ def _remediate_html_file(
         # Parse HTML if not already provided
         if not soup:
             with open(html_path, "r", encoding="utf-8") as f:
-                soup = BeautifulSoup(f.read(), "html.parser")
+                soup = parse_html(f.read())
 
         # Store original URL in soup object for context
         soup.original_url = html_path
@@ -8,12 +8,22 @@ This module provides functionality for indexing and organizing BDA elements
 and connecting them with accessibility issues.
 """
 
+import re
+from bisect import bisect_left, bisect_right, insort
 from typing import Dict, List, Any, Optional, Union
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+_SRC_PATTERN = re.compile(r'src=["\'](.*?)["\']')
+_ALT_PATTERN = re.compile(r'alt=["\'](.*?)["\']')
+
+
+def _element_html(element: Dict[str, Any]) -> str:
+    """Get the HTML representation of a BDA element."""
+    return element.get("representation", {}).get("html", "")
+
 
 class ElementIndex:
     """Indexes BDA elements and connects them with accessibility issues."""
@@ -53,6 +63,16 @@ class ElementIndex:
             {}
         )  # Track remediation status by page
 
+        # Lookup structures for navigation and issue binding. Page element
+        # lists keep the order of elements_data, in which issues are bound.
+        self.page_elements: Dict[int, List[Dict[str, Any]]] = {}
+        self.page_images: Dict[int, List[Dict[str, Any]]] = {}
+        self._page_srcs: Dict[int, Dict[str, int]] = {}
+        self._page_alts: Dict[int, Dict[str, int]] = {}
+        self.element_positions: Dict[str, int] = {}  # Element ID -> ordinal
+        # Sorted ordinals of the elements with issues
+        self._issue_ordinals: List[int] = []
+
         # Build indexes
         self._build_indexes()
 
@@ -66,9 +86,16 @@ class ElementIndex:
             self.element_order = []
             self.pages_with_issues = {}
             self.page_remediation_status = {}
+            self.page_elements = {}
+            self.page_images = {}
+            self._page_srcs = {}
+            self._page_alts = {}
+            self._issue_ordinals = []
 
             # First, index elements by page and build element order
             for element_id, element in self.elements_data.items():
+                self._index_page_lookups(element)
+
                 # Add to page index
                 for page_index in element.get("page_indices", []):
                     if page_index not in self.elements_by_page:
@@ -101,6 +128,10 @@ class ElementIndex:
             self.element_order.sort(
                 key=lambda x: self._get_element_sort_key(self.elements_data[x])
             )
+            self.element_positions = {
+                element_id: ordinal
+                for ordinal, element_id in enumerate(self.element_order)
+            }
 
             # Then, connect issues with elements
             if self.issues:
@@ -114,6 +145,35 @@ class ElementIndex:
             logger.warning(f"Error building element indexes: {e}")
             raise
 
+    def _index_page_lookups(self, element: Dict[str, Any]) -> None:
+        """Add an element to the page lookups used to bind issues."""
+        html = _element_html(element)
+        src_match = _SRC_PATTERN.search(html)
+        alt_match = _ALT_PATTERN.search(html)
+        for page_index in dict.fromkeys(element.get("page_indices", [])):
+            page_elements = self.page_elements.setdefault(page_index, [])
+            position = len(page_elements)
+            page_elements.append(element)
+            if html.startswith("<img"):
+                self.page_images.setdefault(page_index, []).append(element)
+            if src_match:
+                self._page_srcs.setdefault(page_index, {}).setdefault(
+                    src_match.group(1), position
+                )
+            if alt_match:
+                self._page_alts.setdefault(page_index, {}).setdefault(
+                    alt_match.group(1), position
+                )
+
+    def _add_element_issue(self, element_id: str, issue: Dict[str, Any]) -> None:
+        """Add an issue to an element's issues, keeping the issue ordinals sorted."""
+        if element_id not in self.elements_with_issues:
+            self.elements_with_issues[element_id] = []
+            position = self.element_positions.get(element_id)
+            if position is not None:
+                insort(self._issue_ordinals, position)
+        self.elements_with_issues[element_id].append(issue)
+
     def _connect_issues_with_elements(self) -> None:
         """Connect accessibility issues with their corresponding elements."""
         for issue in self.issues:
@@ -122,9 +182,7 @@ class ElementIndex:
                 continue
 
             # Add issue to element's issues list
-            if element_id not in self.elements_with_issues:
-                self.elements_with_issues[element_id] = []
-            self.elements_with_issues[element_id].append(issue)
+            self._add_element_issue(element_id, issue)
 
             # Add to issue type index
             issue_type = issue.get("type", "unknown")
@@ -284,11 +342,7 @@ class ElementIndex:
 
             if page_number is not None:
                 # Find elements on this page
-                page_elements = [
-                    element
-                    for element in self.elements_data.values()
-                    if page_number in element.get("page_indices", [])
-                ]
+                page_elements = self.page_elements.get(page_number, [])
 
                 # If we have a path, try to match by position in the page
                 if path and ":nth-of-type(" in path:
@@ -296,13 +350,7 @@ class ElementIndex:
                         # Extract position from path (e.g., 'div#page-0 > img:nth-of-type(2)')
                         position = int(path.split(":nth-of-type(")[-1].rstrip(")"))
                         # Get elements of the same type on this page
-                        matching_elements = [
-                            element
-                            for element in page_elements
-                            if element.get("representation", {})
-                            .get("html", "")
-                            .startswith("<img")
-                        ]
+                        matching_elements = self.page_images.get(page_number, [])
                         # Return the element at the specified position
                         if 0 < position <= len(matching_elements):
                             return matching_elements[position - 1].get("id")
@@ -311,17 +359,29 @@ class ElementIndex:
 
                 # Try to match by context if available
                 if "context" in issue and isinstance(issue["context"], str):
-                    import re
-
                     # Extract src and alt attributes from context
-                    src_match = re.search(r'src=["\'](.*?)["\']', issue["context"])
-                    alt_match = re.search(r'alt=["\'](.*?)["\']', issue["context"])
+                    src_match = _SRC_PATTERN.search(issue["context"])
+                    alt_match = _ALT_PATTERN.search(issue["context"])
 
                     if src_match or alt_match:
                         src = src_match.group(1) if src_match else None
                         alt = alt_match.group(1) if alt_match else None
 
-                        # Try to find matching element
+                        # Look up elements with the same src or alt first
+                        positions = []
+                        if src:
+                            positions.append(
+                                self._page_srcs.get(page_number, {}).get(src)
+                            )
+                        if alt:
+                            positions.append(
+                                self._page_alts.get(page_number, {}).get(alt)
+                            )
+                        positions = [p for p in positions if p is not None]
+                        if positions:
+                            return page_elements[min(positions)].get("id")
+
+                        # Then elements whose HTML contains them
                         for element in page_elements:
                             element_html = element.get("representation", {}).get(
                                 "html", ""
@@ -353,13 +413,7 @@ class ElementIndex:
                                 return element.get("id")
 
                         # If no direct match, try to find any image element on the page
-                        img_elements = [
-                            element
-                            for element in page_elements
-                            if element.get("representation", {})
-                            .get("html", "")
-                            .startswith("<img")
-                        ]
+                        img_elements = self.page_images.get(page_number, [])
 
                         if img_elements:
                             # Use the first image element that has alt text
@@ -418,59 +472,46 @@ class ElementIndex:
             if element_id in self.elements_data
         ]
 
+    def _element_with_issues_at(self, ordinal: int) -> Dict[str, Any]:
+        """Get a copy of the element at an ordinal, with its issues."""
+        element_id = self.element_order[ordinal]
+        element = self.elements_data[element_id].copy()
+        element["accessibility_issues"] = self.elements_with_issues[element_id]
+        return element
+
     def get_next_element_with_issues(
         self, current_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get the next element with issues after the current element."""
-        elements_with_issues = set(self.elements_with_issues.keys())
-        if not elements_with_issues:
+        ordinals = self._issue_ordinals
+        if not ordinals:
             return None
 
         if current_id is None:
             # Get first element with issues
-            for element_id in self.element_order:
-                if element_id in elements_with_issues:
-                    element = self.elements_data[element_id].copy()
-                    element["accessibility_issues"] = self.elements_with_issues[
-                        element_id
-                    ]
-                    return element
-        else:
-            # Find current position and get next element with issues
-            try:
-                current_index = self.element_order.index(current_id)
-                for element_id in self.element_order[current_index + 1 :]:
-                    if element_id in elements_with_issues:
-                        element = self.elements_data[element_id].copy()
-                        element["accessibility_issues"] = self.elements_with_issues[
-                            element_id
-                        ]
-                        return element
-            except ValueError:
-                return None
+            return self._element_with_issues_at(ordinals[0])
 
+        # Find current position and get next element with issues
+        current_index = self.element_positions.get(current_id)
+        if current_index is None:
+            return None
+        next_index = bisect_right(ordinals, current_index)
+        if next_index < len(ordinals):
+            return self._element_with_issues_at(ordinals[next_index])
         return None
 
     def get_previous_element_with_issues(
         self, current_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get the previous element with issues before the current element."""
-        elements_with_issues = set(self.elements_with_issues.keys())
-        if not elements_with_issues:
-            return None
-
-        try:
-            current_index = self.element_order.index(current_id)
-            for element_id in reversed(self.element_order[:current_index]):
-                if element_id in elements_with_issues:
-                    element = self.elements_data[element_id].copy()
-                    element["accessibility_issues"] = self.elements_with_issues[
-                        element_id
-                    ]
-                    return element
-        except ValueError:
+        ordinals = self._issue_ordinals
+        current_index = self.element_positions.get(current_id)
+        if not ordinals or current_index is None:
             return None
 
+        previous_index = bisect_left(ordinals, current_index) - 1
+        if previous_index >= 0:
+            return self._element_with_issues_at(ordinals[previous_index])
         return None
 
     def add_issue(self, issue: Dict[str, Any]) -> None:
@@ -490,9 +531,7 @@ class ElementIndex:
             return
 
         # Add to elements_with_issues
-        if element_id not in self.elements_with_issues:
-            self.elements_with_issues[element_id] = []
-        self.elements_with_issues[element_id].append(issue)
+        self._add_element_issue(element_id, issue)
 
         # Add to issue_types
         issue_type = issue.get("type", "unknown")
@@ -514,16 +553,12 @@ class ElementIndex:
     def get_element_position_info(self, element_id: str) -> Dict[str, Any]:
         """Get position information for an element."""
         try:
-            index = self.element_order.index(element_id)
+            index = self.element_positions[element_id]
             total_elements = len(self.element_order)
             elements_with_issues = len(self.elements_with_issues)
 
             # Count elements with issues before this one
-            issues_before = sum(
-                1
-                for eid in self.element_order[:index]
-                if eid in self.elements_with_issues
-            )
+            issues_before = bisect_left(self._issue_ordinals, index)
 
             # Get page information
             element = self.elements_data[element_id]
@@ -543,5 +578,5 @@ class ElementIndex:
                     else None
                 ),
             }
-        except ValueError:
+        except KeyError:
             return {}
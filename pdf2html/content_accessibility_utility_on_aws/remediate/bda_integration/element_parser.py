@@ -11,8 +11,8 @@ import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from bs4 import BeautifulSoup
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html_fragment
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -117,9 +117,7 @@ class BDAElementParser:
 
                     # Extract img elements from the page HTML
                     if "representation" in page and "html" in page["representation"]:
-                        soup = BeautifulSoup(
-                            page["representation"]["html"], "html.parser"
-                        )
+                        soup = parse_html_fragment(page["representation"]["html"])
                         img_tags = soup.find_all("img")
                         for img in img_tags:
                             img_element = {
@@ -152,7 +150,7 @@ class BDAElementParser:
         # Process HTML representation if present
         if "representation" in element and "html" in element["representation"]:
             html = element["representation"]["html"]
-            soup = BeautifulSoup(html, "html.parser")
+            soup = parse_html_fragment(html)
 
             # Process img tags
             img_tags = soup.find_all("img")
@@ -216,7 +214,7 @@ class BDAElementParser:
                 page_html = page["representation"]["html"]
 
                 # Process any img tags in the page HTML
-                soup = BeautifulSoup(page_html, "html.parser")
+                soup = parse_html_fragment(page_html)
                 img_tags = soup.find_all("img")
                 if img_tags:
                     # Set bda-data-id on all img tags using the containing element's ID
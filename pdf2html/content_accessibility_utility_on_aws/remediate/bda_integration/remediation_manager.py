@@ -10,11 +10,11 @@ using BDA element data and accessibility issues.
 
 import os
 import re
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any, Optional, Tuple
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from content_accessibility_utility_on_aws.remediate.helpers.html_updater import HTMLUpdater
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html, parse_html_fragment
 from .element_index import ElementIndex
 
 # Set up module-level logger
@@ -237,6 +237,11 @@ class RemediationManager:
         """
         Apply a remediation fix to the current element.
 
+        The fix is applied in one HTML updater transaction, so its fallback
+        attempts write the file at most once, and not at all inside a batch
+        from apply_fixes(). A fix that fails is rolled back, undoing the edits
+        of any fallback attempt.
+
         Args:
             fix_data: Dictionary containing fix information:
                 - type: Type of fix (attribute_update, content_update, etc.)
@@ -246,8 +251,71 @@ class RemediationManager:
             issue: Optional accessibility issue data for better element location
 
         Returns:
-            True if fix was applied successfully, False otherwise
+            True if fix was applied and saved successfully, False otherwise
+        """
+        if not self._apply_fix_in_transaction(fix_data, issue):
+            return False
+        return self.html_updater.commit()
+
+    def apply_fixes(
+        self, fixes: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> List[bool]:
+        """
+        Apply fixes to several elements, writing the HTML file once.
+
+        Args:
+            fixes: List of (element ID, fix data, optional issue) tuples, with
+                the fix data and issue as for apply_fix()
+
+        Returns:
+            Whether each fix was applied, in the order of the fixes
+        """
+        current_element_id, current_page = self.current_element_id, self.current_page
+        results = []
+        try:
+            with self.html_updater.transaction():
+                for element_id, fix_data, issue in fixes:
+                    self.current_element_id = element_id
+                    element = self.element_index.get_element_by_id(element_id)
+                    page_indices = element.get("page_indices", []) if element else []
+                    self.current_page = min(page_indices) if page_indices else current_page
+                    applied = self._apply_fix_in_transaction(fix_data, issue)
+                    results.append(applied and self.html_updater.commit())
+        finally:
+            self.current_element_id, self.current_page = current_element_id, current_page
+
+        logger.debug(
+            "Applied %d of %d fixes in one batch" % (sum(results), len(fixes))
+        )
+        return results
+
+    def _apply_fix_in_transaction(
+        self, fix_data: Dict[str, Any], issue: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
+        Apply a fix in a new HTML updater transaction, left open when the fix
+        is applied for the caller to commit, and rolled back when it fails.
+        """
+        history_length = len(self.remediation_history)
+        self.html_updater.begin()
+        try:
+            applied = self._apply_fix(fix_data, issue)
+        except BaseException:
+            self._roll_back_fix(history_length)
+            raise
+        if not applied:
+            self._roll_back_fix(history_length)
+        return applied
+
+    def _roll_back_fix(self, history_length: int) -> None:
+        """Roll back the transaction of a fix and forget its history entry."""
+        self.html_updater.rollback()
+        del self.remediation_history[history_length:]
+
+    def _apply_fix(
+        self, fix_data: Dict[str, Any], issue: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Apply a remediation fix to the current element, see apply_fix()."""
         if not self.current_element_id:
             logger.error("No current element selected for remediation")
             return False
@@ -280,6 +348,9 @@ class RemediationManager:
             # Get location information from issue if available
             location = issue.get("location") if issue else None
 
+            # Journal position before the fix, to undo it
+            journal_mark = self.html_updater.journal_mark
+
             # Special handling for long-alt-text issues
             if (
                 issue
@@ -323,7 +394,7 @@ class RemediationManager:
 
             if success:
                 # Record the fix in history
-                self._record_fix(fix_data)
+                self._record_fix(fix_data, journal_mark)
                 # Update issue status using the fix's element ID if provided
                 element_id = fix_data.get("element_id", self.current_element_id)
                 issue_type = fix_data.get("issue_type", "unknown")
@@ -357,11 +428,8 @@ class RemediationManager:
     ) -> bool:
         """Apply an attribute update fix."""
         try:
-            # Import BeautifulSoup here to ensure it's available in this method's scope
-            from bs4 import BeautifulSoup
-
             # Parse the original HTML
-            soup = BeautifulSoup(original_html, "html.parser")
+            soup = parse_html_fragment(original_html)
             element = soup.find()  # Get the first element
 
             if not element:
@@ -420,9 +488,7 @@ class RemediationManager:
                     logger.debug("Trying to find image by existing alt text pattern")
 
                     # Extract current alt text from original HTML
-                    from bs4 import BeautifulSoup
-
-                    orig_soup = BeautifulSoup(original_html, "html.parser")
+                    orig_soup = parse_html_fragment(original_html)
                     orig_img = orig_soup.find("img")
 
                     if (
@@ -452,9 +518,7 @@ class RemediationManager:
                 # Last resort: find all images and try the first one with similar length alt text
                 if not success:
                     logger.debug("Trying to find any image with long alt text")
-                    soup = BeautifulSoup(
-                        self.html_updater.get_html_content(), "html.parser"
-                    )
+                    soup = parse_html(self.html_updater.get_html_content())
                     images = soup.find_all("img")
 
                     # Look for images with long alt text (characteristic of long-alt-text issues)
@@ -506,7 +570,7 @@ class RemediationManager:
         """Apply a content update fix."""
         try:
             # Parse the content to check for img tags
-            soup = BeautifulSoup(fix_data["content"], "html.parser")
+            soup = parse_html_fragment(fix_data["content"])
             img_tags = soup.find_all("img")
 
             # Set both BDA ID formats on all img tags found
@@ -548,7 +612,7 @@ class RemediationManager:
         """Apply a complete HTML replacement fix."""
         try:
             # Parse the HTML content to check for img tags
-            soup = BeautifulSoup(fix_data["html"], "html.parser")
+            soup = parse_html_fragment(fix_data["html"])
             img_tags = soup.find_all("img")
 
             # Set both BDA ID formats on all img tags found
@@ -604,7 +668,7 @@ class RemediationManager:
                 return False
 
             # Parse the HTML
-            soup = BeautifulSoup(original_html, "html.parser")
+            soup = parse_html_fragment(original_html)
             img = soup.find("img")
             if not img:
                 return False
@@ -662,7 +726,9 @@ class RemediationManager:
             logger.error("Error applying figure structure fix: %s" % e)
             return False
 
-    def _record_fix(self, fix_data: Dict[str, Any]) -> None:
+    def _record_fix(
+        self, fix_data: Dict[str, Any], journal_mark: Optional[int] = None
+    ) -> None:
         """Record a fix in the remediation history."""
         if self.current_element_id:
             self.remediation_history.append(
@@ -671,6 +737,7 @@ class RemediationManager:
                     "page_number": self.current_page,
                     "timestamp": self.html_updater.get_timestamp(),
                     "fix": fix_data,
+                    "journal_mark": journal_mark,
                 }
             )
 
@@ -766,8 +833,20 @@ class RemediationManager:
 
         # Remove the last fix from history
         last_fix = element_fixes[-1]
+        is_latest_fix = self.remediation_history[-1] is last_fix
         self.remediation_history.remove(last_fix)
 
+        # The latest fix overall is undone from the HTML updater's edit journal
+        if is_latest_fix and last_fix.get("journal_mark") is not None:
+            self.html_updater.undo_to(last_fix["journal_mark"])
+            self.element_index.update_issue_status(
+                self.current_element_id,
+                last_fix["fix"].get("issue_type", "unknown"),
+                "needs_remediation",
+                None,
+            )
+            return self.get_current_element_context()
+
         # Get original element HTML from BDA data
         element = self.element_index.get_element_by_id(self.current_element_id)
         if element and "representation" in element:
@@ -5,16 +5,35 @@
 HTML updater for accessibility remediation.
 
 This module provides utilities for updating HTML elements to fix accessibility issues.
+
+Edits are applied to the parsed document in memory and recorded in an edit
+journal, from which they can be undone. Outside a transaction, each edit is
+saved to the file right away. Inside a transaction, edits are only saved when
+the outermost transaction is committed, so a batch of fixes writes the file
+once::
+
+    with updater.transaction():
+        for selector, alt_text in fixes:
+            updater.update_element_attribute(selector, "alt", alt_text)
 """
 
+import contextlib
 import os
 import logging
-from typing import Optional
-from bs4 import BeautifulSoup
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html, parse_html_fragment
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+# Journal entry kinds
+_ATTRIBUTE_EDIT = "attribute"
+_REPLACE_EDIT = "replace"
+
+# Old value of an attribute that the element did not have
+_MISSING = object()
+
 
 class HTMLUpdater:
     """Class for updating HTML elements to fix accessibility issues."""
@@ -28,6 +47,12 @@ class HTMLUpdater:
         """
         self.html_path = html_path
         self.soup = None
+        # Edits applied to the document, oldest first, for undo
+        self._journal: List[Tuple[Any, ...]] = []
+        # Journal length at the start of each open transaction
+        self._transactions: List[int] = []
+        # Whether the document has edits that are not saved yet
+        self._dirty = False
         self.load_html()
 
     def load_html(self) -> bool:
@@ -44,12 +69,149 @@ class HTMLUpdater:
                 html_content = f.read()
 
             logger.debug(f"Loaded {len(html_content)} characters from HTML file")
-            self.soup = BeautifulSoup(html_content, "html.parser")
+            self.soup = parse_html(html_content)
+            self._journal = []
+            self._dirty = False
             return True
         except Exception as e:
             logger.error(f"Error loading HTML: {e}")
             return False
 
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is open."""
+        return bool(self._transactions)
+
+    @property
+    def journal_mark(self) -> int:
+        """Position in the edit journal, to undo back to with undo_to()."""
+        return len(self._journal)
+
+    def begin(self) -> None:
+        """
+        Open a transaction. Edits are saved when the outermost transaction is
+        committed. Transactions can be nested.
+        """
+        self._transactions.append(len(self._journal))
+
+    def commit(self) -> bool:
+        """
+        Close the innermost transaction, saving the edits if it is the outermost.
+
+        Returns:
+            True if the transaction was closed and any save succeeded
+        """
+        if not self._transactions:
+            logger.warning("No transaction to commit")
+            return False
+
+        self._transactions.pop()
+        if self._transactions or not self._dirty:
+            return True
+        return self.save_html()
+
+    def rollback(self) -> None:
+        """Close the innermost transaction, undoing the edits made in it."""
+        if not self._transactions:
+            logger.warning("No transaction to roll back")
+            return
+
+        mark = self._transactions.pop()
+        self._undo_entries(mark)
+        if not self._transactions:
+            # The document is back to its state at the start of the
+            # transaction, which was saved
+            self._dirty = False
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["HTMLUpdater"]:
+        """
+        Group edits in a transaction, committed when the block exits normally
+        and rolled back when it raises.
+
+        Yields:
+            The updater
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+
+    def undo(self, steps: int = 1) -> int:
+        """
+        Undo the last edits.
+
+        Inside a transaction, only edits made in that transaction can be undone.
+
+        Args:
+            steps: Number of edits to undo
+
+        Returns:
+            Number of edits undone
+        """
+        floor = self._transactions[-1] if self._transactions else 0
+        return self.undo_to(max(floor, len(self._journal) - steps))
+
+    def undo_to(self, mark: int) -> int:
+        """
+        Undo the edits made after a journal mark.
+
+        Args:
+            mark: Journal position, from journal_mark
+
+        Returns:
+            Number of edits undone
+        """
+        floor = self._transactions[-1] if self._transactions else 0
+        undone = self._undo_entries(max(floor, mark))
+        if undone:
+            self._edited()
+        return undone
+
+    def _undo_entries(self, mark: int) -> int:
+        """Undo the journal entries after a position, newest first."""
+        undone = 0
+        while len(self._journal) > mark:
+            entry = self._journal.pop()
+            if entry[0] == _ATTRIBUTE_EDIT:
+                _, element, attribute, old_value = entry
+                if old_value is _MISSING:
+                    del element[attribute]
+                else:
+                    element[attribute] = old_value
+            else:
+                _, parent, index, old_element, new_nodes = entry
+                for node in new_nodes:
+                    node.extract()
+                parent.insert(index, old_element)
+            undone += 1
+        return undone
+
+    def _edited(self) -> None:
+        """Note an edit, saving it unless a transaction is open."""
+        self._dirty = True
+        if not self._transactions:
+            self.save_html()
+
+    def _set_attribute(self, element, attribute: str, value: str) -> None:
+        """Set an attribute, recording its old value in the journal."""
+        old_value = element.attrs.get(attribute, _MISSING)
+        element[attribute] = value
+        self._journal.append((_ATTRIBUTE_EDIT, element, attribute, old_value))
+
+    def _replace(self, element, new_nodes: List[Any]) -> None:
+        """Replace an element by new nodes, recording it in the journal."""
+        parent = element.parent
+        index = parent.index(element)
+        if new_nodes:
+            element.replace_with(*new_nodes)
+        else:
+            element.extract()
+        self._journal.append((_REPLACE_EDIT, parent, index, element, new_nodes))
+
     def update_element_attribute(
         self, selector: str, attribute: str, value: str
     ) -> bool:
@@ -77,14 +239,14 @@ class HTMLUpdater:
 
             # Update the attribute
             old_value = element.get(attribute, "")
-            element[attribute] = value
+            self._set_attribute(element, attribute, value)
             logger.debug(f"Setting attribute: {attribute}='{value}'")
             logger.debug(
                 f"Attribute updated: {attribute} from '{old_value}' to '{value}'"
             )
 
-            # Save the updated HTML
-            self.save_html()
+            # Save the updated HTML, or leave it to the transaction
+            self._edited()
 
             return True
         except Exception as e:
@@ -116,14 +278,13 @@ class HTMLUpdater:
 
             # Update the content
             old_content = str(element)[:50] + ("..." if len(str(element)) > 50 else "")
-            new_soup = BeautifulSoup(content, "html.parser")
-            element.replace_with(new_soup)
+            self._replace(element, list(parse_html_fragment(content).contents))
 
             logger.debug(f"Updating content with {len(content)} characters")
             logger.debug(f"Content updated from '{old_content}' to '{content[:50]}...'")
 
-            # Save the updated HTML
-            self.save_html()
+            # Save the updated HTML, or leave it to the transaction
+            self._edited()
 
             logger.debug("Fix applied successfully")
             return True
@@ -155,14 +316,13 @@ class HTMLUpdater:
             logger.debug(f"Found element with {selector}")
 
             # Replace the element
-            new_soup = BeautifulSoup(new_element, "html.parser")
-            new_tag = new_soup.contents[0]
-            element.replace_with(new_tag)
+            new_soup = parse_html_fragment(new_element)
+            self._replace(element, [new_soup.contents[0]])
 
             logger.debug(f"Element replaced with {len(new_element)} characters of HTML")
 
-            # Save the updated HTML
-            self.save_html()
+            # Save the updated HTML, or leave it to the transaction
+            self._edited()
 
             logger.debug("Fix applied successfully")
             return True
@@ -170,6 +330,122 @@ class HTMLUpdater:
             logger.error(f"Error replacing element: {e}")
             return False
 
+    def _find_element(
+        self,
+        selector: Optional[str] = None,
+        element_html: Optional[str] = None,
+        location: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Find the element a fix applies to.
+
+        The selector is tried first, then the element path of the location,
+        then the id, BDA id or image source of the element's original HTML.
+        """
+        selectors = []
+        if selector:
+            selectors.append(selector)
+        if location and location.get("path"):
+            # Audit paths start with the document node, which is not a selector
+            path = location["path"]
+            if path.startswith("[document]"):
+                path = path[len("[document]") :].lstrip(" >")
+            selectors.append(path)
+
+        for candidate in selectors:
+            try:
+                element = self.soup.select_one(candidate)
+            except Exception as e:
+                logger.debug(f"Invalid selector {candidate}: {e}")
+                continue
+            if element:
+                return element
+
+        if element_html:
+            original = parse_html_fragment(element_html).find()
+            if original:
+                for attribute in ("data-bda-id", "bda-data-id", "id", "src"):
+                    value = original.get(attribute)
+                    if value:
+                        element = self.soup.find(original.name, attrs={attribute: value})
+                        if element:
+                            return element
+        return None
+
+    def apply_fix(
+        self,
+        selector: Optional[str] = None,
+        attribute_updates: Optional[Dict[str, str]] = None,
+        content_updates: Optional[str] = None,
+        new_element: Optional[Dict[str, Any]] = None,
+        replace_element: bool = False,
+        element_html: Optional[str] = None,
+        location: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Apply a fix to one element, as a single transaction.
+
+        Args:
+            selector: CSS selector for the element
+            attribute_updates: Attributes to set on the element
+            content_updates: HTML replacing the element
+            new_element: Element replacing the element, with 'tag',
+                'attributes' and 'content' (its HTML) keys
+            replace_element: Whether to replace the element with new_element
+            element_html: Original HTML of the element, used to find it when
+                the selector does not match
+            location: Issue location, whose element path is used to find the
+                element when the selector does not match
+
+        Returns:
+            True if the element was found, the fix applied and, outside a
+            transaction, saved; False otherwise
+        """
+        element = self._find_element(selector, element_html, location)
+        if element is None:
+            logger.debug(f"Element not found for fix with selector: {selector}")
+            return False
+
+        self.begin()
+        try:
+            if attribute_updates:
+                for attribute, value in attribute_updates.items():
+                    self._set_attribute(element, attribute, value)
+            if replace_element and new_element:
+                markup = new_element.get("content")
+                if not markup:
+                    tag = self.soup.new_tag(
+                        new_element.get("tag", "div"),
+                        attrs=new_element.get("attributes", {}),
+                    )
+                    markup = str(tag)
+                self._replace(element, list(parse_html_fragment(markup).contents))
+            elif content_updates is not None:
+                self._replace(
+                    element, list(parse_html_fragment(content_updates).contents)
+                )
+            self._edited()
+        except Exception as e:
+            self.rollback()
+            logger.error(f"Error applying fix: {e}")
+            return False
+        # Saving fails the fix when this is the outermost transaction
+        return self.commit()
+
+    def get_html_content(self) -> str:
+        """
+        Get the HTML of the document, with the edits applied so far.
+
+        Returns:
+            The serialized document
+        """
+        return str(self.soup) if self.soup else ""
+
+    @staticmethod
+    def get_timestamp() -> str:
+        """Get the current time in ISO format, for the remediation history."""
+        return datetime.now().isoformat()
+
     def save_html(self, output_path: Optional[str] = None) -> bool:
         """
         Save the updated HTML to file.
@@ -189,10 +465,10 @@ class HTMLUpdater:
 
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            logger.debug(
-                f"Creating directory if needed: {os.path.dirname(output_path)}"
-            )
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            logger.debug(f"Creating directory if needed: {output_dir}")
 
             # Save the HTML
             html_output = str(self.soup)
@@ -201,6 +477,8 @@ class HTMLUpdater:
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(html_output)
 
+            if output_path == self.html_path:
+                self._dirty = False
             logger.debug(f"HTML successfully saved to {output_path}")
             return True
         except Exception as e:
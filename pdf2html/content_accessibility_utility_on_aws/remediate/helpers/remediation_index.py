@@ -0,0 +1,624 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Lookup index used by the remediation strategies to resolve issue elements.
+
+The index is built in a single traversal of the document and maps images by
+src, file name, data-bda-id, alt text and position, tables by fingerprint
+(markup without whitespace), caption and position, and elements by id and
+data-bda-id, through which it also resolves selectors and element paths
+anchored on an element id. Strategies resolve the element of an issue without
+scanning the document for every issue.
+
+Strategies change the elements they resolve. Every element returned by a lookup
+is re-indexed, along with its descendants and enclosing tables, before the next
+lookup, so the index follows the changes of the strategies that use it.
+Strategies that change the document without going through the index must be
+followed by invalidate_remediation_index(); the index is then rebuilt on the
+next lookup.
+
+Only the image and table strategies use the index. The heading and form
+strategies do not look up images or tables, and the figure strategy matches
+element paths against the markup of every image and removes caption
+paragraphs, which may hold images; the manager drops the index after they
+change the document.
+"""
+
+import os
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# Attributes indexed for every element
+INDEXED_ATTRIBUTES = ("id", "data-bda-id", "src", "alt")
+
+# Attribute of the document holding its index
+_INDEX_ATTRIBUTE = "_remediation_index"
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# One step of a selector: tag, id, classes, nth-of-type and attribute value,
+# as in the element paths of the audit report and the selectors of BDA issues
+_SELECTOR_STEP_PATTERN = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?"
+    r"(?:#(?P<id>[\w-]+))?"
+    r"(?P<classes>(?:\.[\w-]+)*)"
+    r"(?::nth-of-type\((?P<nth>\d+)\))?"
+    r"(?:\[(?P<attr>[\w-]+)=(?P<quote>[\"'])(?P<value>[^\"'\]]*)(?P=quote)\])?$"
+)
+
+
+def table_fingerprint(markup: str) -> str:
+    """
+    Get the fingerprint of a table's markup, its markup without whitespace.
+
+    Args:
+        markup: HTML of the table
+
+    Returns:
+        str: The fingerprint
+    """
+    return _WHITESPACE_PATTERN.sub("", markup)
+
+
+def _caption_text(table: Tag) -> str:
+    """Get the text of a table's caption, or an empty string."""
+    caption = table.find("caption", recursive=False)
+    return caption.get_text(strip=True) if caption else ""
+
+
+def _table_structure(table: Tag) -> Dict[str, bool]:
+    """Get the header structure flags of a table."""
+    headers = table.find_all("th")
+    return {
+        "has_th": bool(headers),
+        "has_th_without_scope": any(not th.has_attr("scope") for th in headers),
+        "has_unscoped_th": any(not th.get("scope") for th in headers),
+        "has_thead": table.find("thead") is not None,
+        "has_tbody": table.find("tbody") is not None,
+    }
+
+
+# Values computed for each table on first use
+TABLE_VALUES: Dict[str, Callable[[Tag], Any]] = {
+    "fingerprint": lambda table: table_fingerprint(str(table)),
+    "text": lambda table: table.get_text(),
+    "caption": _caption_text,
+    "structure": _table_structure,
+}
+
+
+class RemediationIndex:
+    """Index of the images, tables and identified elements of a document."""
+
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Build the index in a single traversal of the document.
+
+        Args:
+            soup: The document being remediated
+        """
+        self.soup = soup
+        # Images and tables in document order
+        self.images: List[Tag] = []
+        self.tables: List[Tag] = []
+
+        self._image_ordinals: Dict[int, int] = {}
+        self._table_ordinals: Dict[int, int] = {}
+        # (attribute, value) -> elements, and image file name / upper-cased
+        # alt text -> images; buckets map id(element) to the element, as tags
+        # compare by content
+        self._by_attr: Dict[Tuple[str, str], Dict[int, Tag]] = {}
+        self._by_basename: Dict[str, Dict[int, Tag]] = {}
+        self._by_folded_alt: Dict[str, Dict[int, Tag]] = {}
+        # Keys under which each element is indexed, to re-index it
+        self._keys: Dict[int, List[Tuple[Dict[Any, Dict[int, Tag]], Any]]] = {}
+
+        # Values of each table from TABLE_VALUES, computed on first use, and
+        # the tables by fingerprint and caption
+        self._table_values: Dict[str, Dict[int, Any]] = {
+            name: {} for name in TABLE_VALUES
+        }
+        self._tables_by_value: Dict[str, Dict[str, Dict[int, Tag]]] = {
+            "fingerprint": {},
+            "caption": {},
+        }
+
+        # Elements returned by lookups, re-indexed before the next lookup
+        self._pending: Dict[int, Tag] = {}
+
+        for element in soup.find_all(True):
+            if element.name == "img":
+                self._image_ordinals[id(element)] = len(self.images)
+                self.images.append(element)
+            elif element.name == "table":
+                self._table_ordinals[id(element)] = len(self.tables)
+                self.tables.append(element)
+            if element.attrs:
+                self._add_keys(element)
+
+        logger.debug(
+            f"Indexed {len(self.images)} images and {len(self.tables)} tables for remediation"
+        )
+
+    # Maintenance
+
+    def _add_keys(self, element: Tag) -> None:
+        """Index an element under its current attribute values."""
+        attrs = element.attrs
+        keys = []
+        for attr in INDEXED_ATTRIBUTES:
+            value = attrs.get(attr)
+            if isinstance(value, str):
+                keys.append((self._by_attr, (attr, value)))
+
+        if element.name == "img":
+            src = attrs.get("src")
+            if src and isinstance(src, str):
+                keys.append((self._by_basename, os.path.basename(src)))
+            alt = attrs.get("alt")
+            if alt and isinstance(alt, str):
+                keys.append((self._by_folded_alt, alt.upper()))
+
+        for mapping, key in keys:
+            mapping.setdefault(key, {})[id(element)] = element
+        if keys:
+            self._keys[id(element)] = keys
+
+    def _remove_keys(self, element: Tag) -> None:
+        """Remove an element from the maps it is indexed in."""
+        for mapping, key in self._keys.pop(id(element), []):
+            bucket = mapping.get(key)
+            if bucket is not None:
+                bucket.pop(id(element), None)
+                if not bucket:
+                    del mapping[key]
+
+    def refresh(self, element: Tag) -> None:
+        """
+        Re-index an element changed by a strategy.
+
+        The element's descendants are re-indexed too, and the values of the
+        tables containing it are recomputed on their next use.
+
+        Args:
+            element: The changed element
+        """
+        nodes = [element]
+        if element.contents:
+            nodes.extend(element.find_all(True))
+        for node in nodes:
+            self._remove_keys(node)
+            self._add_keys(node)
+
+        current = element
+        while current is not None:
+            if id(current) in self._table_ordinals:
+                self._forget_table(current)
+            current = current.parent
+
+    def checkout(self, element: Optional[Tag]) -> Optional[Tag]:
+        """
+        Record an element handed to a strategy, which may change it.
+
+        Elements returned by lookups are recorded already; strategies record
+        the elements they find without the index.
+
+        Args:
+            element: The element, or None
+
+        Returns:
+            The element
+        """
+        if element is not None:
+            self._pending[id(element)] = element
+        return element
+
+    def _sync(self) -> None:
+        """Re-index the elements returned by previous lookups."""
+        while self._pending:
+            _, element = self._pending.popitem()
+            self.refresh(element)
+
+    def _attached(self, element: Tag) -> bool:
+        """Check whether an element is still part of the document."""
+        current = element
+        while current.parent is not None:
+            current = current.parent
+        return current is self.soup
+
+    # Images
+
+    def _images_in(
+        self, bucket: Optional[Dict[int, Tag]], valid: Callable[[Tag], bool]
+    ) -> Iterator[Tag]:
+        """Iterate over the images of a map bucket still matching, in document order."""
+        images = sorted(
+            (element for element in (bucket or {}).values() if element.name == "img"),
+            key=lambda image: self._image_ordinals.get(id(image), -1),
+        )
+        return (image for image in images if valid(image) and self._attached(image))
+
+    def _first_image(
+        self, bucket: Optional[Dict[int, Tag]], valid: Callable[[Tag], bool]
+    ) -> Optional[Tag]:
+        """Get the first image of a map bucket still matching, in document order."""
+        return next(self._images_in(bucket, valid), None)
+
+    def image_with(self, attr: str, value: str) -> Optional[Tag]:
+        """
+        Get the first image with an attribute value, like soup.find("img", attr=value).
+
+        Args:
+            attr: One of 'id', 'data-bda-id', 'src' and 'alt'
+            value: The attribute value
+
+        Returns:
+            The image, or None if there is none
+        """
+        self._sync()
+        return self.checkout(
+            self._first_image(
+                self._by_attr.get((attr, value)),
+                lambda image: image.get(attr) == value,
+            )
+        )
+
+    def images_with(self, attr: str, value: str) -> List[Tag]:
+        """
+        Get the images with an attribute value, in document order.
+
+        Unlike other lookups, the images are not checked out: callers check
+        out the images they change.
+
+        Args:
+            attr: One of 'id', 'data-bda-id', 'src' and 'alt'
+            value: The attribute value
+
+        Returns:
+            The images
+        """
+        self._sync()
+        return list(
+            self._images_in(
+                self._by_attr.get((attr, value)),
+                lambda image: image.get(attr) == value,
+            )
+        )
+
+    def image_by_basename(self, file_name: str) -> Optional[Tag]:
+        """
+        Get the first image whose src has a file name.
+
+        Args:
+            file_name: File name of the image, without directory
+
+        Returns:
+            The image, or None if there is none
+        """
+        self._sync()
+        return self.checkout(
+            self._first_image(
+                self._by_basename.get(file_name),
+                lambda image: bool(image.get("src"))
+                and os.path.basename(image["src"]) == file_name,
+            )
+        )
+
+    def image_by_folded_alt(self, alt: str) -> Optional[Tag]:
+        """
+        Get the first image with an alt text, ignoring case.
+
+        Args:
+            alt: The alt text
+
+        Returns:
+            The image, or None if there is none
+        """
+        self._sync()
+        folded = alt.upper()
+        return self.checkout(
+            self._first_image(
+                self._by_folded_alt.get(folded),
+                lambda image: bool(image.get("alt")) and image["alt"].upper() == folded,
+            )
+        )
+
+    def image_at(self, position: int) -> Optional[Tag]:
+        """
+        Get the image at a position in document order.
+
+        Args:
+            position: 0-based position among the images of the document
+
+        Returns:
+            The image, or None if the position is out of range
+        """
+        self._sync()
+        if 0 <= position < len(self.images):
+            return self.checkout(self.images[position])
+        return None
+
+    def find_image(self, predicate: Callable[[Tag], bool]) -> Optional[Tag]:
+        """
+        Get the first image matching a predicate.
+
+        Args:
+            predicate: Function of an image returning whether it matches
+
+        Returns:
+            The image, or None if there is none
+        """
+        self._sync()
+        for image in self.images:
+            if predicate(image):
+                return self.checkout(image)
+        return None
+
+    # Tables
+
+    def _forget_table(self, table: Tag) -> None:
+        """Forget the values computed for a changed table."""
+        for name, values in self._table_values.items():
+            value = values.pop(id(table), None)
+            mapping = self._tables_by_value.get(name)
+            if value is None or mapping is None:
+                continue
+            bucket = mapping.get(value)
+            if bucket is not None:
+                bucket.pop(id(table), None)
+                if not bucket:
+                    del mapping[value]
+
+    def _table_value(self, table: Tag, name: str) -> Any:
+        """Get a value of a table from TABLE_VALUES, computed on first use."""
+        values = self._table_values[name]
+        value = values.get(id(table))
+        if value is None:
+            value = TABLE_VALUES[name](table)
+            values[id(table)] = value
+            mapping = self._tables_by_value.get(name)
+            if mapping is not None and value:
+                mapping.setdefault(value, {})[id(table)] = table
+        return value
+
+    def _tables_by(self, name: str, value: Any) -> List[Tag]:
+        """Get the tables with a value, computing the value for every table."""
+        for table in self.tables:
+            self._table_value(table, name)
+        return list(self._tables_by_value[name].get(value, {}).values())
+
+    def table_structure(self, table: Tag) -> Dict[str, bool]:
+        """
+        Get the header structure of a table, computed on first use.
+
+        Args:
+            table: A table of the document
+
+        Returns:
+            Dictionary with the has_th, has_th_without_scope, has_unscoped_th,
+            has_thead and has_tbody flags
+        """
+        return self._table_value(table, "structure")
+
+    def _first_table(self, candidates: List[Tag]) -> Optional[Tag]:
+        """Get the first table of a list still in the document, in document order."""
+        tables = [table for table in candidates if self._attached(table)]
+        if not tables:
+            return None
+        return min(tables, key=lambda table: self._table_ordinals.get(id(table), -1))
+
+    def table_at(self, position: int) -> Optional[Tag]:
+        """
+        Get the table at a position in document order.
+
+        Args:
+            position: 0-based position among the tables of the document
+
+        Returns:
+            The table, or None if the position is out of range
+        """
+        self._sync()
+        if 0 <= position < len(self.tables):
+            return self.checkout(self.tables[position])
+        return None
+
+    def all_tables(self) -> List[Tag]:
+        """
+        Get all tables of the document, for strategies changing every table.
+
+        Returns:
+            The tables, in document order
+        """
+        self._sync()
+        for table in self.tables:
+            self.checkout(table)
+        return list(self.tables)
+
+    def table_by_fingerprint(self, markup: str) -> Optional[Tag]:
+        """
+        Get the first table whose markup is the given one, ignoring whitespace.
+
+        Args:
+            markup: HTML of the table
+
+        Returns:
+            The table, or None if there is none
+        """
+        self._sync()
+        return self.checkout(
+            self._first_table(self._tables_by("fingerprint", table_fingerprint(markup)))
+        )
+
+    def tables_by_caption(self, caption: str) -> List[Tag]:
+        """
+        Get the tables with a caption, in document order.
+
+        Args:
+            caption: Caption text, without surrounding whitespace
+
+        Returns:
+            The tables
+        """
+        self._sync()
+        tables = [
+            table for table in self._tables_by("caption", caption) if self._attached(table)
+        ]
+        tables.sort(key=lambda table: self._table_ordinals.get(id(table), -1))
+        for table in tables:
+            self.checkout(table)
+        return tables
+
+    def table_containing_text(self, text: str) -> Optional[Tag]:
+        """
+        Get the first table whose text contains the given text.
+
+        Args:
+            text: Text to look for
+
+        Returns:
+            The table, or None if there is none
+        """
+        self._sync()
+        # A table captioned with the text contains it; only the tables
+        # before it need their text searched
+        tables = self.tables
+        captioned = self._first_table(self._tables_by("caption", text.strip()))
+        if captioned is not None and text in self._table_value(captioned, "text"):
+            tables = tables[: self._table_ordinals[id(captioned)] + 1]
+        for table in tables:
+            if text in self._table_value(table, "text"):
+                return self.checkout(table)
+        return None
+
+    def find_table(self, predicate: Callable[[Dict[str, Any]], bool]) -> Optional[Tag]:
+        """
+        Get the first table whose header structure matches a predicate.
+
+        Args:
+            predicate: Function of a table structure (see table_structure())
+                returning whether the table matches
+
+        Returns:
+            The table, or None if there is none
+        """
+        self._sync()
+        for table in self.tables:
+            if predicate(self.table_structure(table)):
+                return self.checkout(table)
+        return None
+
+    # Selectors
+
+    def _step_matches(self, element: Tag, step: Dict[str, Any]) -> bool:
+        """Check whether an element matches one step of a selector."""
+        if step["tag"] and element.name != step["tag"].lower():
+            return False
+        if step["id"] and element.get("id") != step["id"]:
+            return False
+        if step["classes"]:
+            classes = element.get("class") or []
+            if not all(cls in classes for cls in step["classes"][1:].split(".")):
+                return False
+        if step["attr"]:
+            value = element.get(step["attr"])
+            if isinstance(value, list):
+                value = " ".join(value)
+            if value != step["value"]:
+                return False
+        if step["nth"]:
+            rank = 0
+            for sibling in element.previous_siblings:
+                if isinstance(sibling, Tag) and sibling.name == element.name:
+                    rank += 1
+            if rank + 1 != int(step["nth"]):
+                return False
+        return True
+
+    def select_one(self, selector: str) -> Optional[Tag]:
+        """
+        Get the first element matching a CSS selector, like soup.select_one().
+
+        Selectors made of child steps whose first step has an id or an indexed
+        attribute value, such as the element paths of the audit report and the
+        [data-bda-id="..."] selectors of BDA issues, are resolved through the
+        index. Other selectors are passed to soup.select_one().
+
+        Args:
+            selector: The CSS selector
+
+        Returns:
+            The element, or None if no element matches
+
+        Raises:
+            Exception: If soup.select_one() cannot parse the selector
+        """
+        self._sync()
+        steps = []
+        for part in selector.strip().split(">"):
+            match = _SELECTOR_STEP_PATTERN.match(part.strip())
+            if not match or not part.strip():
+                steps = None
+                break
+            steps.append(match.groupdict())
+
+        first = steps[0] if steps else None
+        if first is not None and first["id"]:
+            key = ("id", first["id"])
+        elif first is not None and first["attr"] in INDEXED_ATTRIBUTES:
+            key = (first["attr"], first["value"])
+        else:
+            return self.checkout(self.soup.select_one(selector))
+
+        anchors = [
+            element
+            for element in self._by_attr.get(key, {}).values()
+            if self._step_matches(element, first) and self._attached(element)
+        ]
+        if len(anchors) > 1:
+            # The index does not order arbitrary elements
+            return self.checkout(self.soup.select_one(selector))
+
+        matches = anchors
+        for step in steps[1:]:
+            matches = [
+                child
+                for element in matches
+                for child in element.children
+                if isinstance(child, Tag) and self._step_matches(child, step)
+            ]
+        return self.checkout(matches[0] if matches else None)
+
+
+def get_remediation_index(soup: BeautifulSoup) -> RemediationIndex:
+    """
+    Get the remediation index of a document, building it on first use.
+
+    Args:
+        soup: The document being remediated
+
+    Returns:
+        The document's index
+    """
+    index = soup.__dict__.get(_INDEX_ATTRIBUTE)
+    if index is None:
+        index = RemediationIndex(soup)
+        setattr(soup, _INDEX_ATTRIBUTE, index)
+    return index
+
+
+def invalidate_remediation_index(soup: BeautifulSoup) -> None:
+    """
+    Drop the remediation index of a document changed without going through it.
+
+    Args:
+        soup: The document being remediated
+    """
+    soup.__dict__.pop(_INDEX_ATTRIBUTE, None)
@@ -12,6 +12,7 @@ from typing import Optional
 from bs4 import BeautifulSoup
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html, parse_html_fragment
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -38,7 +39,7 @@ class SelectorHelper:
         """
         try:
             # Parse the element HTML
-            soup = BeautifulSoup(element_html, "html.parser")
+            soup = parse_html_fragment(element_html)
             element = soup.find()
 
             if not element:
@@ -72,7 +73,7 @@ class SelectorHelper:
 
             # If we have context, try to create a more specific selector
             if context_html:
-                context_soup = BeautifulSoup(context_html, "html.parser")
+                context_soup = parse_html_fragment(context_html)
                 parent = context_soup.find(element.name)
 
                 if parent:
@@ -104,7 +105,7 @@ class SelectorHelper:
             BeautifulSoup element or None if not found
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = parse_html(html)
             return soup.select_one(selector)
         except Exception as e:
             logger.warning(f"Error getting element by selector: {e}")
@@ -126,7 +127,7 @@ class SelectorHelper:
             HTML context or None if element not found
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = parse_html(html)
             element = soup.select_one(selector)
 
             if not element:
@@ -153,7 +154,7 @@ class SelectorHelper:
             end = min(len(siblings), element_index + context_size + 1)
 
             # Create a new element with just the context
-            context_soup = BeautifulSoup("<div></div>", "html.parser")
+            context_soup = parse_html_fragment("<div></div>")
             context_div = context_soup.div
 
             # Add siblings in context range
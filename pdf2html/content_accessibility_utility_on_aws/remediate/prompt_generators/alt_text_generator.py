@@ -7,20 +7,49 @@ Alt text generator module.
 This module provides functionality for generating alt text for images using GenAI.
 """
 
+import json
 import os
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from bs4 import BeautifulSoup, Tag, NavigableString
 from PIL import Image
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
     BedrockClient,
     AltTextGenerationError,
+    get_bedrock_client,
 )
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Bump when the alt text prompt changes, so cached alt text is regenerated
+ALT_TEXT_PROMPT_VERSION = 1
+
+ALT_TEXT_GUIDELINES = """Guidelines for generating good alt text:
+1. Be concise but descriptive (aim for 125 characters or less)
+2. Describe the content and function of the image
+3. Don't start with phrases like "Image of" or "Picture of"
+4. Include relevant details but omit unnecessary information
+5. If the image contains text, include the important text in the alt text
+6. Focus on what's important about the image in its context
+"""
+
+# Instructions of a prompt for several images, sent once before the images
+ALT_TEXT_BATCH_INSTRUCTIONS = (
+    "You are an accessibility expert specializing in generating descriptive alt text for images.\n\n"
+    + ALT_TEXT_GUIDELINES
+    + "\nI need you to generate concise, accurate alt text for each of the {count} images below. "
+    "Each image follows its number and characteristics.\n"
+)
+
+# Closing instructions of a prompt for several images
+ALT_TEXT_BATCH_RESPONSE_FORMAT = (
+    "Respond ONLY with a JSON object mapping each image number to its alt text, "
+    "with no additional explanation or commentary, for example:\n"
+    '{"1": "alt text of image 1", "2": "alt text of image 2"}'
+)
+
 
 def extract_image_context(img: Tag, soup: BeautifulSoup) -> Dict[str, Any]:
     """
@@ -232,7 +261,7 @@ def generate_alt_text(
 
     # Generate alt text using Bedrock
     if not bedrock_client:
-        bedrock_client = BedrockClient()
+        bedrock_client = get_bedrock_client()
 
     try:
         # Generate prompt for alt text
@@ -250,9 +279,56 @@ def generate_alt_text(
         raise AltTextGenerationError(f"Failed to generate alt text: {e}")
 
 
+class AltTextPrompt(str):
+    """
+    Alt text prompt of one image, with the image details it was built from.
+
+    The prompt is sent as it is for a single image. When the request is
+    batched with others, only its details are sent with the image.
+    """
+
+    def __new__(cls, prompt: str, details: str):
+        instance = super().__new__(cls, prompt)
+        instance.details = details
+        return instance
+
+    def __reduce__(self):
+        return AltTextPrompt, (str(self), self.details)
+
+
+def _image_dimensions(image_path: str) -> Tuple[int, int]:
+    """Get the width and height of an image, or (0, 0) if it cannot be read."""
+    try:
+        with Image.open(image_path) as img:
+            return img.size
+    except Exception as e:
+        logger.warning(f"Error reading image {image_path}: {e}")
+        return 0, 0
+
+
+def _dimensions_details(width: int, height: int) -> str:
+    """Describe the dimensions of an image, as in an alt text prompt."""
+    return f"- Dimensions: {width}x{height} pixels\n"
+
+
+def _context_details(context: Optional[Dict[str, Any]]) -> str:
+    """Describe the context of an image, as in an alt text prompt."""
+    details = ""
+    if context:
+        if "surrounding_text" in context and context["surrounding_text"]:
+            details += f"\n\nThe image appears in the following context:\n{context['surrounding_text']}\n"
+
+        if "caption" in context and context["caption"]:
+            details += f"\nThe image has this caption: {context['caption']}\n"
+
+        if "figure_number" in context and context["figure_number"]:
+            details += f"\nThis is Figure {context['figure_number']}.\n"
+    return details
+
+
 def generate_alt_text_prompt(
     image_path: str, context: Optional[Dict[str, Any]] = None
-) -> str:
+) -> AltTextPrompt:
     """
     Generate a prompt for generating alt text for an image.
 
@@ -261,42 +337,76 @@ def generate_alt_text_prompt(
         context: Optional context information about the image
 
     Returns:
-        str: Prompt for generating alt text
+        AltTextPrompt: Prompt for generating alt text, with the image details
+            used if the request is batched
     """
     # Get the image dimensions and format
-    try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-    except Exception as e:
-        logger.warning(f"Error reading image {image_path}: {e}")
-        width, height = 0, 0
+    width, height = _image_dimensions(image_path)
+    dimensions = _dimensions_details(width, height)
+    context_details = _context_details(context)
 
     # Build the prompt
     prompt = f"""You are an accessibility expert specializing in generating descriptive alt text for images.
 
 I need you to generate concise, accurate alt text for an image with the following characteristics:
-- Dimensions: {width}x{height} pixels
-
-Guidelines for generating good alt text:
-1. Be concise but descriptive (aim for 125 characters or less)
-2. Describe the content and function of the image
-3. Don't start with phrases like "Image of" or "Picture of"
-4. Include relevant details but omit unnecessary information
-5. If the image contains text, include the important text in the alt text
-6. Focus on what's important about the image in its context
-
+{dimensions}
+{ALT_TEXT_GUIDELINES}
 Please provide only the alt text with no additional explanation or commentary.
 """
 
     # Add context information if available
-    if context:
-        if "surrounding_text" in context and context["surrounding_text"]:
-            prompt += f"\n\nThe image appears in the following context:\n{context['surrounding_text']}\n"
+    prompt += context_details
 
-        if "caption" in context and context["caption"]:
-            prompt += f"\nThe image has this caption: {context['caption']}\n"
+    return AltTextPrompt(prompt, dimensions + context_details)
 
-        if "figure_number" in context and context["figure_number"]:
-            prompt += f"\nThis is Figure {context['figure_number']}.\n"
 
-    return prompt
+def alt_text_prompt_details(prompt: str) -> Optional[str]:
+    """
+    Get the image details of an alt text prompt.
+
+    Args:
+        prompt: A prompt, possibly built by generate_alt_text_prompt
+
+    Returns:
+        The details of the image, or None if the prompt was not built by
+        generate_alt_text_prompt
+    """
+    if isinstance(prompt, AltTextPrompt):
+        return prompt.details
+    return None
+
+
+def parse_batch_alt_text(response: str, count: int) -> List[Optional[str]]:
+    """
+    Parse the response to a prompt for several images.
+
+    Args:
+        response: Text generated by the model
+        count: Number of images in the prompt
+
+    Returns:
+        Alt text of each image, in order, or None for images the response has
+        no alt text for
+    """
+    alt_texts: List[Optional[str]] = [None] * count
+
+    json_start = response.find("{")
+    json_end = response.rfind("}") + 1
+    if json_start < 0 or json_end <= json_start:
+        logger.warning("No JSON object in batch alt text response")
+        return alt_texts
+
+    try:
+        parsed = json.loads(response[json_start:json_end])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid JSON in batch alt text response: {e}")
+        return alt_texts
+
+    if not isinstance(parsed, dict):
+        return alt_texts
+
+    for index in range(count):
+        alt_text = parsed.get(str(index + 1))
+        if isinstance(alt_text, str) and alt_text.strip():
+            alt_texts[index] = alt_text.strip()
+    return alt_texts
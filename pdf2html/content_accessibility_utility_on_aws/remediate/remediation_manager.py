@@ -7,6 +7,10 @@ Remediation manager for HTML accessibility issues.
 This module provides functionality for managing the remediation of accessibility issues.
 """
 
+import copy
+import logging
+import threading
+from contextlib import contextmanager
 from typing import Dict, Any, List, Optional, Callable
 from bs4 import BeautifulSoup
 
@@ -15,8 +19,22 @@ from content_accessibility_utility_on_aws.utils.logging_helper import (
     AIRemediationRequiredError,
 )
 from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
-    BedrockClient,
     AltTextGenerationError,
+    get_bedrock_client,
+)
+from content_accessibility_utility_on_aws.remediate.services.alt_text_cache import (
+    open_alt_text_cache,
+)
+from content_accessibility_utility_on_aws.remediate.services.response_cache import (
+    open_response_cache,
+)
+from content_accessibility_utility_on_aws.remediate.services.bedrock_scheduler import (
+    BedrockRequestScheduler,
+    RecordingBedrockClient,
+    ScheduledBedrockClient,
+)
+from content_accessibility_utility_on_aws.remediate.helpers.remediation_index import (
+    invalidate_remediation_index,
 )
 
 # Import remediation strategies
@@ -73,6 +91,82 @@ from content_accessibility_utility_on_aws.remediate.remediation_strategies.figur
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Strategies that may send requests to Bedrock
+AI_STRATEGIES = frozenset(
+    [
+        remediate_missing_alt_text,
+        remediate_empty_alt_text,
+        remediate_generic_alt_text,
+        remediate_long_alt_text,
+        remediate_table_missing_scope,
+        remediate_table_missing_thead,
+        remediate_table_irregular_headers,
+    ]
+)
+
+# Default number of Bedrock requests in flight while remediating a page
+DEFAULT_AI_CONCURRENCY = 4
+
+# Loggers of the code the strategies run while their requests are collected
+STRATEGY_LOGGER_PREFIXES = (
+    "content_accessibility_utility_on_aws.remediate.remediation_strategies",
+    "content_accessibility_utility_on_aws.remediate.prompt_generators",
+)
+
+# Strategies that resolve and change elements through the document's
+# RemediationIndex; the index is rebuilt after other strategies change the
+# document
+INDEXED_STRATEGIES = frozenset(
+    [
+        remediate_missing_alt_text,
+        remediate_empty_alt_text,
+        remediate_generic_alt_text,
+        remediate_long_alt_text,
+        remediate_table_missing_headers,
+        remediate_table_missing_scope,
+        remediate_table_missing_caption,
+        remediate_table_missing_thead,
+        remediate_table_missing_tbody,
+        remediate_table_irregular_headers,
+        remediate_table_headers_id,
+    ]
+)
+
+
+class _ThreadLogFilter(logging.Filter):
+    """Log filter dropping the records of the thread that created it."""
+
+    def __init__(self):
+        super().__init__()
+        self.thread = threading.get_ident()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.thread != self.thread
+
+
+@contextmanager
+def _muted_strategy_loggers():
+    """
+    Drop the strategy log records of the current thread.
+
+    The strategies log the requests deferred during the collection pass as
+    failures, which they are not. Other loggers, and other threads, still log.
+    """
+    log_filter = _ThreadLogFilter()
+    loggers = [
+        strategy_logger
+        for name, strategy_logger in list(logging.root.manager.loggerDict.items())
+        if name.startswith(STRATEGY_LOGGER_PREFIXES)
+        and isinstance(strategy_logger, logging.Logger)
+    ]
+    for strategy_logger in loggers:
+        strategy_logger.addFilter(log_filter)
+    try:
+        yield
+    finally:
+        for strategy_logger in loggers:
+            strategy_logger.removeFilter(log_filter)
+
 
 class RemediationManager:
     """Manager for HTML accessibility remediation."""
@@ -100,7 +194,30 @@ class RemediationManager:
                     "model_id", "us.amazon.nova-lite-v1:0"
                 )
                 profile = self.options.get("profile")
-                self.bedrock_client = BedrockClient(model_id=model_id, profile=profile)
+                alt_text_cache = None
+                if self.options.get("alt_text_cache"):
+                    alt_text_cache = open_alt_text_cache(
+                        self.options["alt_text_cache"],
+                        profile=profile,
+                        perceptual=self.options.get("alt_text_cache_perceptual", False),
+                        max_entries=self.options.get("alt_text_cache_size"),
+                    )
+                response_cache = None
+                if self.options.get("bedrock_cache"):
+                    response_cache = open_response_cache(
+                        self.options["bedrock_cache"],
+                        self.options.get("bedrock_cache_mode", "record"),
+                    )
+                # Shared by every page of the run, with a connection pool
+                # sized for the concurrent Bedrock requests
+                self.bedrock_client = get_bedrock_client(
+                    model_id=model_id,
+                    profile=profile,
+                    alt_text_cache=alt_text_cache,
+                    response_cache=response_cache,
+                    max_pool_connections=self.options.get("ai_concurrency")
+                    or DEFAULT_AI_CONCURRENCY,
+                )
                 logger.debug(
                     f"Initialized Bedrock client with model: {model_id}, profile: {profile}"
                 )
@@ -197,16 +314,12 @@ class RemediationManager:
                             f"No BedrockClient available for {issue_type}. Creating one with profile: {self.options.get('profile')}"
                         )
                         try:
-                            # Try to create a new BedrockClient with the profile
-                            from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
-                                BedrockClient,
-                            )
-
+                            # Try to get the shared BedrockClient of the profile
                             model_id = self.options.get(
                                 "model_id", "us.amazon.nova-lite-v1:0"
                             )
                             profile = self.options.get("profile")
-                            client_to_use = BedrockClient(
+                            client_to_use = get_bedrock_client(
                                 model_id=model_id, profile=profile
                             )
                             logger.debug(
@@ -251,11 +364,7 @@ class RemediationManager:
                 logger.warning(f"AI required for {issue_type}: {e}")
 
                 try:
-                    # Always attempt to create a fresh client for this remediation
-                    from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
-                        BedrockClient,
-                    )
-
+                    # Get the shared client of the profile for this remediation
                     model_id = self.options.get(
                         "model_id", "us.amazon.nova-lite-v1:0"
                     )
@@ -266,7 +375,9 @@ class RemediationManager:
                             f"Creating BedrockClient with profile {profile} for {issue_type}"
                         )
                         try:
-                            client = BedrockClient(model_id=model_id, profile=profile)
+                            client = get_bedrock_client(
+                                model_id=model_id, profile=profile
+                            )
                             # Try remediation again with the new client
                             logger.debug(f"Retrying {issue_type} with new client")
                             result = self.remediation_strategies[issue_type](
@@ -325,6 +436,7 @@ class RemediationManager:
                                 f"Could not find specific table for {issue_type}. Applying fix to ALL tables."
                             )
                             all_tables = self.soup.find_all("table")
+                            invalidate_remediation_index(self.soup)
                             total_tables_modified = 0
                             total_headers_modified = 0
 
@@ -365,11 +477,85 @@ class RemediationManager:
                 return f"Image file not found: {str(e)}"
             except Exception as e:
                 logger.error(f"Error remediating issue {issue_type}: {e}")
+                # The strategy may have changed the document before failing
+                invalidate_remediation_index(self.soup)
                 return None
         else:
             logger.debug(f"No remediation strategy for issue type: {issue_type}")
             return None
 
+    def _prefetch_ai_responses(
+        self, issues: List[Dict[str, Any]]
+    ) -> Optional[ScheduledBedrockClient]:
+        """
+        Send the Bedrock requests of a list of issues concurrently, batching
+        alt text requests if alt_text_batch_size is set.
+
+        The strategies are first run on a copy of the document with a client
+        that only records their requests, then the requests are sent through a
+        BedrockRequestScheduler. Applying the strategies afterwards with the
+        returned client uses the prefetched responses in issue order, so the
+        remediated document is the same as with sequential requests.
+
+        Args:
+            issues: Issues that will be remediated, in order
+
+        Returns:
+            Client answering with the prefetched responses, or None if there
+            is nothing to prefetch
+        """
+        concurrency = self.options.get("ai_concurrency") or DEFAULT_AI_CONCURRENCY
+        batch_size = self.options.get("alt_text_batch_size") or 1
+        if self.bedrock_client is None or (concurrency <= 1 and batch_size <= 1):
+            return None
+
+        ai_issues = [
+            index
+            for index, issue in enumerate(issues)
+            if self.remediation_strategies.get(issue.get("type")) in AI_STRATEGIES
+        ]
+        if not ai_issues:
+            return None
+
+        # Strategies run on a copy so the document is only modified once the
+        # responses are known; issues are copied as some strategies update them
+        soup = copy.copy(self.soup)
+        soup.original_url = getattr(self.soup, "original_url", None)
+        recorder = RecordingBedrockClient(self.bedrock_client)
+
+        with _muted_strategy_loggers():
+            for issue in issues[: ai_issues[-1] + 1]:
+                strategy = self.remediation_strategies.get(issue.get("type"))
+                if strategy is None:
+                    continue
+                recorder.start_issue()
+                try:
+                    changed = strategy(soup, dict(issue), recorder)
+                except Exception as e:
+                    logger.debug(
+                        f"Strategy for {issue.get('type')} failed while collecting "
+                        f"Bedrock requests: {e}"
+                    )
+                    # The strategy may have changed the document before failing
+                    changed = True
+                if changed and strategy not in INDEXED_STRATEGIES:
+                    invalidate_remediation_index(soup)
+
+        if not recorder.requests:
+            return None
+
+        scheduler = BedrockRequestScheduler(
+            max_concurrency=concurrency,
+            requests_per_second=self.options.get("ai_requests_per_second"),
+            max_retries=self.options.get("ai_max_retries", 5),
+            batch_size=batch_size,
+        )
+        outcomes = scheduler.run(self.bedrock_client, recorder.requests)
+        logger.debug(
+            f"Prefetched {len(outcomes)} Bedrock responses for {len(ai_issues)} issues"
+        )
+        return ScheduledBedrockClient(self.bedrock_client, recorder.requests, outcomes)
+
     def remediate_issues(self, issues: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Remediate multiple accessibility issues.
@@ -424,193 +610,215 @@ class RemediationManager:
         # Track changes applied across all issues
         total_changes_applied = 0
 
-        # Remediate each issue
-        for issue in issues:
-            issue_type = issue.get("type")
+        # Send the Bedrock requests of all issues up front, then apply the
+        # fixes one issue at a time with the responses
+        bedrock_client = self.bedrock_client
+        scheduled_client = self._prefetch_ai_responses(issues)
+        if scheduled_client is not None:
+            self.bedrock_client = scheduled_client
 
-            # Ensure issue has a proper ID - preserve the original ID from audit
-            issue_id = issue.get("id")
-            if not issue_id:
-                issue_id = f"issue-{id(issue)}"  # Generate a unique ID if none exists
+        try:
+            # Remediate each issue
+            for issue in issues:
+                issue_type = issue.get("type")
 
-            try:
-                # For landmark issues, we need to handle counting differently
-                # since one landmark issue can cause multiple fixes
-                is_landmark_issue = issue_type.startswith(
-                    "missing-"
-                ) and issue_type.endswith("-landmark")
-
-                result = self.remediate_issue(issue)
-
-                # Create detailed result entry - preserve original ID
-                detail = {
-                    "id": issue_id,  # Preserve original ID from audit report
-                    "type": issue_type,
-                    "severity": issue.get("severity", "minor"),
-                    "message": result or f"Failed to remediate {issue_type}",
-                    "context": issue.get("context", ""),
-                    "selector": issue.get("selector", ""),
-                    "remediated": result is not None,
-                    "remediation_status": (
-                        "remediated" if result is not None else "failed"
-                    ),
-                    "before_content": issue.get("before_content", ""),
-                    "after_content": issue.get("after_content", ""),
-                    "fix_description": (
-                        result
-                        if result and not result.endswith("no remediation needed")
-                        else ""
-                    ),
-                    "failure_reason": (
-                        None if result else "Unable to apply fix automatically"
-                    ),
-                    "file_path": issue.get("file_path")
-                    or (issue.get("location", {}) or {}).get("file_path", ""),
-                    "file_name": issue.get("file_name")
-                    or (issue.get("location", {}) or {}).get("file_name", ""),
-                    "page_number": issue.get("page_number")
-                    or (issue.get("location", {}) or {}).get("page_number"),
-                }
-
-                # For unified format in report generation, include a location field if not present
-                if "location" not in detail:
-                    detail["location"] = {
-                        "file_path": detail.get("file_path", ""),
-                        "file_name": detail.get("file_name", ""),
-                        "page_number": detail.get("page_number")
-                    }
-                    # Add a human-readable description
-                    if detail.get("file_name") and detail.get("page_number") is not None:
-                        detail["location"]["description"] = f"File: {detail['file_name']} (Page {detail['page_number']})"
-                    elif detail.get("file_name"):
-                        detail["location"]["description"] = f"File: {detail['file_name']}"
-                    elif detail.get("page_number") is not None:
-                        detail["location"]["description"] = f"Page {detail['page_number']}"
-
-                # Track changes applied to this issue
-                if result:
-                    changes_applied = 1
-
-                    # For landmark issues, determine actual changes from the result
-                    if is_landmark_issue:
-                        # Set different values based on issue type
-                        if issue_type == "missing-main-landmark":
-                            # Main landmark triggers navigation, header, footer, skip link
-                            changes_applied = 1
-                            detail["actual_changes"] = "Added main landmark"
-                        elif issue_type == "missing-navigation-landmark":
-                            # Navigation triggers header, footer, skip link
-                            changes_applied = 1
-                            detail["actual_changes"] = "Added navigation landmark"
-                        elif issue_type == "missing-header-landmark":
-                            # Header triggers footer, skip link
-                            changes_applied = 1
-                            detail["actual_changes"] = "Added header landmark"
-                        elif issue_type == "missing-footer-landmark":
-                            # Footer triggers skip link
-                            changes_applied = 1
-                            detail["actual_changes"] = "Added footer landmark"
-                        else:
-                            # Other landmarks like skip link are standalone
-                            changes_applied = 1
-                            detail["actual_changes"] = (
-                                f'Added {issue_type.replace("missing-", "")}'
-                            )
-                    # For table remediation, we might have applied multiple fixes
-                    elif "header cells across" in result:
-                        # Extract the count from the message like "Added scope attributes to 15 header cells..."
-                        import re
-
-                        cells_match = re.search(r"to (\d+) header cells", result)
-                        if cells_match:
-                            cells_count = int(cells_match.group(1))
-                            if cells_count > 1:
-                                changes_applied = (
-                                    1  # Count as 1 issue fixed, not multiple cells
-                                )
+                # Ensure issue has a proper ID - preserve the original ID from audit
+                issue_id = issue.get("id")
+                if not issue_id:
+                    issue_id = f"issue-{id(issue)}"  # Generate a unique ID if none exists
 
-                    detail["changes_applied"] = changes_applied
-                    total_changes_applied += changes_applied
-                else:
-                    detail["changes_applied"] = 0
+                try:
+                    # For landmark issues, we need to handle counting differently
+                    # since one landmark issue can cause multiple fixes
+                    is_landmark_issue = issue_type.startswith(
+                        "missing-"
+                    ) and issue_type.endswith("-landmark")
+
+                    result = self.remediate_issue(issue)
+
+                    # Strategies return None when they leave the document unchanged
+                    if result and (
+                        self.remediation_strategies.get(issue_type) not in INDEXED_STRATEGIES
+                    ):
+                        invalidate_remediation_index(self.soup)
+
+                    # Create detailed result entry - preserve original ID
+                    detail = {
+                        "id": issue_id,  # Preserve original ID from audit report
+                        "type": issue_type,
+                        "severity": issue.get("severity", "minor"),
+                        "message": result or f"Failed to remediate {issue_type}",
+                        "context": issue.get("context", ""),
+                        "selector": issue.get("selector", ""),
+                        "remediated": result is not None,
+                        "remediation_status": (
+                            "remediated" if result is not None else "failed"
+                        ),
+                        "before_content": issue.get("before_content", ""),
+                        "after_content": issue.get("after_content", ""),
+                        "fix_description": (
+                            result
+                            if result and not result.endswith("no remediation needed")
+                            else ""
+                        ),
+                        "failure_reason": (
+                            None if result else "Unable to apply fix automatically"
+                        ),
+                        "file_path": issue.get("file_path")
+                        or (issue.get("location", {}) or {}).get("file_path", ""),
+                        "file_name": issue.get("file_name")
+                        or (issue.get("location", {}) or {}).get("file_name", ""),
+                        "page_number": issue.get("page_number")
+                        or (issue.get("location", {}) or {}).get("page_number"),
+                    }
 
-            except AIRemediationRequiredError as e:
-                # Handle AI requirement error
-                error_message = f"AI is required for remediating {issue_type}: {str(e)}"
-                logger.error(error_message)
-
-                # Create detailed failure entry - preserve original ID
-                detail = {
-                    "id": issue_id,  # Preserve original ID from audit report
-                    "type": issue_type,
-                    "severity": issue.get("severity", "minor"),
-                    "message": error_message,
-                    "context": issue.get("context", ""),
-                    "selector": issue.get("selector", ""),
-                    "remediated": False,
-                    "remediation_status": "failed",
-                    "before_content": issue.get("before_content", ""),
-                    "after_content": issue.get("after_content", ""),
-                    "fix_description": "",
-                    "failure_reason": "AI service required but not available",
-                    "changes_applied": 0,
-                    "file_path": issue.get("file_path")
-                    or (issue.get("location", {}) or {}).get("file_path", ""),
-                    "file_name": issue.get("file_name")
-                    or (issue.get("location", {}) or {}).get("file_name", ""),
-                    "page_number": issue.get("page_number")
-                    or (issue.get("location", {}) or {}).get("page_number"),
-                }
-
-                # For unified format in report generation, include a location field if not present
-                if "location" not in detail:
-                    detail["location"] = {
-                        "file_path": detail.get("file_path", ""),
-                        "file_name": detail.get("file_name", ""),
-                        "page_number": detail.get("page_number")
+                    # For unified format in report generation, include a location field if not present
+                    if "location" not in detail:
+                        detail["location"] = {
+                            "file_path": detail.get("file_path", ""),
+                            "file_name": detail.get("file_name", ""),
+                            "page_number": detail.get("page_number")
+                        }
+                        # Add a human-readable description
+                        if detail.get("file_name") and detail.get("page_number") is not None:
+                            detail["location"]["description"] = f"File: {detail['file_name']} (Page {detail['page_number']})"
+                        elif detail.get("file_name"):
+                            detail["location"]["description"] = f"File: {detail['file_name']}"
+                        elif detail.get("page_number") is not None:
+                            detail["location"]["description"] = f"Page {detail['page_number']}"
+
+                    # Track changes applied to this issue
+                    if result:
+                        changes_applied = 1
+
+                        # For landmark issues, determine actual changes from the result
+                        if is_landmark_issue:
+                            # Set different values based on issue type
+                            if issue_type == "missing-main-landmark":
+                                # Main landmark triggers navigation, header, footer, skip link
+                                changes_applied = 1
+                                detail["actual_changes"] = "Added main landmark"
+                            elif issue_type == "missing-navigation-landmark":
+                                # Navigation triggers header, footer, skip link
+                                changes_applied = 1
+                                detail["actual_changes"] = "Added navigation landmark"
+                            elif issue_type == "missing-header-landmark":
+                                # Header triggers footer, skip link
+                                changes_applied = 1
+                                detail["actual_changes"] = "Added header landmark"
+                            elif issue_type == "missing-footer-landmark":
+                                # Footer triggers skip link
+                                changes_applied = 1
+                                detail["actual_changes"] = "Added footer landmark"
+                            else:
+                                # Other landmarks like skip link are standalone
+                                changes_applied = 1
+                                detail["actual_changes"] = (
+                                    f'Added {issue_type.replace("missing-", "")}'
+                                )
+                        # For table remediation, we might have applied multiple fixes
+                        elif "header cells across" in result:
+                            # Extract the count from the message like "Added scope attributes to 15 header cells..."
+                            import re
+
+                            cells_match = re.search(r"to (\d+) header cells", result)
+                            if cells_match:
+                                cells_count = int(cells_match.group(1))
+                                if cells_count > 1:
+                                    changes_applied = (
+                                        1  # Count as 1 issue fixed, not multiple cells
+                                    )
+
+                        detail["changes_applied"] = changes_applied
+                        total_changes_applied += changes_applied
+                    else:
+                        detail["changes_applied"] = 0
+
+                except AIRemediationRequiredError as e:
+                    # Handle AI requirement error
+                    error_message = f"AI is required for remediating {issue_type}: {str(e)}"
+                    logger.error(error_message)
+
+                    # Create detailed failure entry - preserve original ID
+                    detail = {
+                        "id": issue_id,  # Preserve original ID from audit report
+                        "type": issue_type,
+                        "severity": issue.get("severity", "minor"),
+                        "message": error_message,
+                        "context": issue.get("context", ""),
+                        "selector": issue.get("selector", ""),
+                        "remediated": False,
+                        "remediation_status": "failed",
+                        "before_content": issue.get("before_content", ""),
+                        "after_content": issue.get("after_content", ""),
+                        "fix_description": "",
+                        "failure_reason": "AI service required but not available",
+                        "changes_applied": 0,
+                        "file_path": issue.get("file_path")
+                        or (issue.get("location", {}) or {}).get("file_path", ""),
+                        "file_name": issue.get("file_name")
+                        or (issue.get("location", {}) or {}).get("file_name", ""),
+                        "page_number": issue.get("page_number")
+                        or (issue.get("location", {}) or {}).get("page_number"),
                     }
-                    # Add a human-readable description
-                    if detail.get("file_name") and detail.get("page_number") is not None:
-                        detail["location"]["description"] = f"File: {detail['file_name']} (Page {detail['page_number']})"
-                    elif detail.get("file_name"):
-                        detail["location"]["description"] = f"File: {detail['file_name']}"
-                    elif detail.get("page_number") is not None:
-                        detail["location"]["description"] = f"Page {detail['page_number']}"
-
-                # Set result to None for failure counting
-                result = None
-
-                # Add to failed issue types
-                failed_issue_types.add(issue_type)
-
-            # Update counts based on result
-            if result:
-                # Check if this is an "already exists" message
-                if "already exists" in result.lower():
-                    # Count as remediated since the feature is already present
-                    results["issues_remediated"] += 1
-                    results["remediated_issues_details"].append(detail)
-                    logger.debug(f"{issue_type}: {result}")
-                else:
-                    # Successful new remediation
-                    results["issues_remediated"] += 1
-                    results["remediated_issues_details"].append(detail)
-                    logger.debug(f"Remediated {issue_type}: {result}")
-            else:
-                if issue_type in self.remediation_strategies:
-                    # Failed remediation (strategy exists but failed)
-                    results["issues_failed"] += 1
-                    results["failed_issues_details"].append(detail)
-                    failed_issue_types.add(issue_type)
-                    logger.warning(f"Failed to remediate {issue_type}")
-                else:
-                    # Skipped remediation (no strategy exists)
-                    results["skipped_issues"] += 1
-                    results["failed_issues_details"].append(detail)
+
+                    # For unified format in report generation, include a location field if not present
+                    if "location" not in detail:
+                        detail["location"] = {
+                            "file_path": detail.get("file_path", ""),
+                            "file_name": detail.get("file_name", ""),
+                            "page_number": detail.get("page_number")
+                        }
+                        # Add a human-readable description
+                        if detail.get("file_name") and detail.get("page_number") is not None:
+                            detail["location"]["description"] = f"File: {detail['file_name']} (Page {detail['page_number']})"
+                        elif detail.get("file_name"):
+                            detail["location"]["description"] = f"File: {detail['file_name']}"
+                        elif detail.get("page_number") is not None:
+                            detail["location"]["description"] = f"Page {detail['page_number']}"
+
+                    # Set result to None for failure counting
+                    result = None
+
+                    # Add to failed issue types
                     failed_issue_types.add(issue_type)
-                    logger.debug(f"Skipped remediation for {issue_type} (no strategy)")
 
-            results["details"].append(detail)
+                # Update counts based on result
+                if result:
+                    # Check if this is an "already exists" message
+                    if "already exists" in result.lower():
+                        # Count as remediated since the feature is already present
+                        results["issues_remediated"] += 1
+                        results["remediated_issues_details"].append(detail)
+                        logger.debug(f"{issue_type}: {result}")
+                    else:
+                        # Successful new remediation
+                        results["issues_remediated"] += 1
+                        results["remediated_issues_details"].append(detail)
+                        logger.debug(f"Remediated {issue_type}: {result}")
+                else:
+                    if issue_type in self.remediation_strategies:
+                        # Failed remediation (strategy exists but failed)
+                        results["issues_failed"] += 1
+                        results["failed_issues_details"].append(detail)
+                        failed_issue_types.add(issue_type)
+                        logger.warning(f"Failed to remediate {issue_type}")
+                    else:
+                        # Skipped remediation (no strategy exists)
+                        results["skipped_issues"] += 1
+                        results["failed_issues_details"].append(detail)
+                        failed_issue_types.add(issue_type)
+                        logger.debug(f"Skipped remediation for {issue_type} (no strategy)")
+
+                results["details"].append(detail)
+        finally:
+            if scheduled_client is not None:
+                self.bedrock_client = bedrock_client
+                logger.debug(
+                    f"Used {scheduled_client.hits} prefetched Bedrock responses, "
+                    f"sent {scheduled_client.misses} requests directly, "
+                    f"{scheduled_client.unused} responses unused"
+                )
 
         # Add failed issue types to result
         results["failed_issue_types"] = list(failed_issue_types)
@@ -29,7 +29,7 @@ def generate_remediation_report(
     Args:
         remediation_data: Dictionary containing the remediation data
         output_path: Path where the report will be saved
-        report_format: Type of report to generate ('html', 'json', or 'text')
+        report_format: Type of report to generate ('html', 'json', 'jsonl', or 'text')
         format_type: Alternative parameter name for backward compatibility
 
     Returns:
@@ -12,6 +12,7 @@ from bs4 import BeautifulSoup
 import re
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html_fragment
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -267,7 +268,7 @@ def remediate_missing_fieldsets(
         parent.clear()
 
         # Add content to fieldset
-        fieldset.append(BeautifulSoup(content, "html.parser"))
+        fieldset.append(parse_html_fragment(content))
 
         # Add fieldset to parent
         parent.append(fieldset)
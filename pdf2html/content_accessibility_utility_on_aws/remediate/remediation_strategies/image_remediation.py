@@ -20,6 +20,9 @@ from content_accessibility_utility_on_aws.remediate.services.bedrock_client impo
     BedrockClient,
     AltTextGenerationError,
 )
+from content_accessibility_utility_on_aws.remediate.helpers.remediation_index import (
+    get_remediation_index,
+)
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -57,23 +60,20 @@ def remediate_missing_alt_text(
 
     # Try to find the image using multiple strategies
     img = None
+    index = get_remediation_index(soup)
 
     # Strategy 1: Try to find by data-bda-id if available
     if data_bda_id_match:
         bda_id = data_bda_id_match.group(1)
-        img = soup.find("img", attrs={"data-bda-id": bda_id})
+        img = index.image_with("data-bda-id", bda_id)
 
     # Strategy 2: Try to find by src
     if not img:
-        img = soup.find("img", src=src)
+        img = index.image_with("src", src)
 
         # If not found, try matching just the filename
         if not img:
-            filename = os.path.basename(src)
-            for image in soup.find_all("img"):
-                if image.get("src") and os.path.basename(image["src"]) == filename:
-                    img = image
-                    break
+            img = index.image_by_basename(os.path.basename(src))
 
     if not img:
         return None
@@ -127,23 +127,20 @@ def remediate_empty_alt_text(
 
     # Try to find the image using multiple strategies
     img = None
+    index = get_remediation_index(soup)
 
     # Strategy 1: Try to find by data-bda-id if available
     if data_bda_id_match:
         bda_id = data_bda_id_match.group(1)
-        img = soup.find("img", attrs={"data-bda-id": bda_id})
+        img = index.image_with("data-bda-id", bda_id)
 
     # Strategy 2: Try to find by src
     if not img:
-        img = soup.find("img", src=src)
+        img = index.image_with("src", src)
 
         # If not found, try matching just the filename
         if not img:
-            filename = os.path.basename(src)
-            for image in soup.find_all("img"):
-                if image.get("src") and os.path.basename(image["src"]) == filename:
-                    img = image
-                    break
+            img = index.image_by_basename(os.path.basename(src))
 
     if not img:
         return None
@@ -189,11 +186,12 @@ def find_image_by_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional[
     # Try to get image information from the issue
     element_str = issue.get("element", "")
     element_selector = issue.get("selector", "")
+    index = get_remediation_index(soup)
 
     # Strategy 1: Try to use the selector if available
     if element_selector:
         try:
-            img = soup.select_one(element_selector)
+            img = index.select_one(element_selector)
             if img and img.name == "img":
                 logger.debug(f"Found image using selector: {element_selector}")
                 return img
@@ -210,7 +208,7 @@ def find_image_by_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional[
     # Strategy 3: Try to find by data-bda-id if available
     if data_bda_id_match:
         bda_id = data_bda_id_match.group(1)
-        img = soup.find("img", attrs={"data-bda-id": bda_id})
+        img = index.image_with("data-bda-id", bda_id)
         if img:
             logger.debug(f"Found image using data-bda-id: {bda_id}")
             return img
@@ -218,34 +216,32 @@ def find_image_by_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional[
     # Strategy 4: Try to find by src if available
     if src_match:
         src = src_match.group(1)
-        img = soup.find("img", src=src)
+        img = index.image_with("src", src)
         if img:
             logger.debug(f"Found image using src: {src}")
             return img
 
         # If not found, try matching just the filename
         filename = os.path.basename(src)
-        for image in soup.find_all("img"):
-            if image.get("src") and os.path.basename(image["src"]) == filename:
-                logger.debug(f"Found image using filename: {filename}")
-                return image
+        img = index.image_by_basename(filename)
+        if img:
+            logger.debug(f"Found image using filename: {filename}")
+            return img
 
     # Strategy 5: Try to find by alt text if available
     generic_alt = None
     if alt_match:
         generic_alt = alt_match.group(1)
-        images_with_alt = soup.find_all("img", alt=generic_alt)
-        if images_with_alt:
+        img = index.image_with("alt", generic_alt)
+        if img:
             logger.debug(f"Found image using alt text: {generic_alt}")
-            return images_with_alt[0]  # Use the first match
+            return img  # Use the first match
 
         # Case-insensitive match
-        for image in soup.find_all("img"):
-            if image.get("alt") and image["alt"].upper() == generic_alt.upper():
-                logger.debug(
-                    f"Found image using case-insensitive alt text: {generic_alt}"
-                )
-                return image
+        img = index.image_by_folded_alt(generic_alt)
+        if img:
+            logger.debug(f"Found image using case-insensitive alt text: {generic_alt}")
+            return img
 
     # Strategy 6: Use context information
     context = issue.get("context", {})
@@ -253,12 +249,12 @@ def find_image_by_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional[
         # Check for position information
         position = context.get("position")
         if position:
-            all_images = soup.find_all("img")
             try:
-                index = int(position) - 1  # Convert from 1-based to 0-based
-                if 0 <= index < len(all_images):
+                # Convert from 1-based to 0-based
+                img = index.image_at(int(position) - 1)
+                if img:
                     logger.debug(f"Found image using position: {position}")
-                    return all_images[index]
+                    return img
             except (ValueError, TypeError):
                 pass
 
@@ -281,14 +277,14 @@ def find_image_by_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional[
                         logger.debug(
                             f"Found image using surrounding text (previous): {surrounding_text}"
                         )
-                        return img
+                        return index.checkout(img)
 
                     img = element.find_next("img")
                     if img:
                         logger.debug(
                             f"Found image using surrounding text (next): {surrounding_text}"
                         )
-                        return img
+                        return index.checkout(img)
 
     # Strategy 7: Check for issue type specific matching
     issue_type = issue.get("type", "")
@@ -308,16 +304,19 @@ def find_image_by_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional[
             r"^no description$",
             r"^photograph$",
         ]
-        for image in soup.find_all("img"):
-            if image.has_attr("alt"):
-                alt_text = image["alt"].strip().lower()
-                if alt_text and any(
-                    re.match(pattern, alt_text) for pattern in generic_patterns
-                ):
-                    logger.debug(
-                        f"Found image with generic alt text pattern: {alt_text}"
-                    )
-                    return image
+        img = index.find_image(
+            lambda image: image.has_attr("alt")
+            and bool(image["alt"].strip())
+            and any(
+                re.match(pattern, image["alt"].strip().lower())
+                for pattern in generic_patterns
+            )
+        )
+        if img:
+            logger.debug(
+                f"Found image with generic alt text pattern: {img['alt'].strip().lower()}"
+            )
+            return img
 
     # If we've tried everything and failed, log the failure
     logger.warning(f"Could not find image for issue: {issue.get('type', 'unknown')}")
@@ -362,25 +361,22 @@ def remediate_generic_alt_text(soup, issue, bedrock_client=None):
     img = find_image_by_issue(soup, issue)
     
     # If not found and we have a generic alt value from the issue, try direct search
+    index = get_remediation_index(soup)
     if not img and generic_alt:
-        images = soup.find_all("img", alt=generic_alt)
-        if images:
-            img = images[0]
+        img = index.image_with("alt", generic_alt)
+        if img:
             logger.debug(f"Found image with exact alt text: '{generic_alt}'")
         else:
             # Try case-insensitive search
-            for image in soup.find_all("img"):
-                if image.has_attr("alt") and image["alt"].upper() == generic_alt.upper():
-                    img = image
-                    logger.debug(f"Found image with case-insensitive alt text: '{generic_alt}'")
-                    break
+            img = index.image_by_folded_alt(generic_alt)
+            if img:
+                logger.debug(f"Found image with case-insensitive alt text: '{generic_alt}'")
 
     # If still not found, search for all images with generic alt text
     if not img:
         for pattern in generic_patterns:
-            images = soup.find_all("img", alt=pattern)
-            if images:
-                img = images[0]
+            img = index.image_with("alt", pattern)
+            if img:
                 generic_alt = pattern
                 logger.debug(f"Found image with generic alt text: '{pattern}'")
                 break
@@ -463,13 +459,15 @@ def remediate_long_alt_text(
     long_alt = alt_match.group(1)
 
     # Find the image in the document
-    images = soup.find_all("img", src=src)
+    index = get_remediation_index(soup)
+    images = index.images_with("src", src)
     if not images:
         return None
 
     # Find the image with long alt text
     for img in images:
         if img.has_attr("alt") and img["alt"] == long_alt and len(img["alt"]) > 125:
+            index.checkout(img)
             # Generate concise alt text using GenAI
             alt_text = generate_alt_text(img, soup, bedrock_client)
 
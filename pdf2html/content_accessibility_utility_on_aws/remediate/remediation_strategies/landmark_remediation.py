@@ -11,6 +11,7 @@ from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup, Tag
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html_fragment
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -117,7 +118,7 @@ def remediate_missing_skip_link(
                 break
 
         if not skip_style_exists:
-            head.append(BeautifulSoup(skip_link_style, "html.parser"))
+            head.append(parse_html_fragment(skip_link_style))
 
     # Add skip link to the beginning of the body
     body = soup.find("body")
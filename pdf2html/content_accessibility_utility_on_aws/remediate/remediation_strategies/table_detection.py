@@ -8,9 +8,10 @@ This module provides functions to detect and preprocess tables for remediation,
 particularly handling cases where tables from PDF conversions lack proper semantic markup.
 """
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -70,7 +71,7 @@ def preprocess_tables(html: str) -> str:
     Returns:
         Preprocessed HTML with improved table structure with proper borders
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html(html)
     tables = soup.find_all("table")
 
     tables_processed = 0
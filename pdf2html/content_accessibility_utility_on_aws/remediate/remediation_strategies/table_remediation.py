@@ -18,10 +18,25 @@ from content_accessibility_utility_on_aws.utils.logging_helper import (
 from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
     BedrockClient,
 )
+from content_accessibility_utility_on_aws.remediate.helpers.remediation_index import (
+    get_remediation_index,
+)
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Conditions on a table's header structure (see
+# RemediationIndex.table_structure) under which it may have an issue of the
+# given type
+TABLE_ISSUE_CONDITIONS = {
+    "table-missing-headers": lambda structure: not structure["has_th"],
+    "table-missing-scope": lambda structure: structure["has_th_without_scope"],
+    "table-missing-thead": lambda structure: not structure["has_thead"],
+    "table-missing-tbody": lambda structure: not structure["has_tbody"],
+    "table-irregular-headers": lambda structure: structure["has_th"]
+    and structure["has_unscoped_th"],
+}
+
 
 def get_table_from_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional[Tag]:
     """
@@ -44,12 +59,13 @@ def get_table_from_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional
     logger.debug(f"Element string: {element_str[:100]}...")
     logger.debug(f"Context data: {json.dumps(context, indent=2)}")
     logger.debug(f"File path from issue: {file_path}")
+    index = get_remediation_index(soup)
 
     # First try direct selector match
     if element_selector:
         try:
             logger.debug(f"Attempting selector match: {element_selector}")
-            table = soup.select_one(element_selector)
+            table = index.select_one(element_selector)
             if table and table.name == "table":
                 logger.debug(f"Found table via selector: {element_selector}")
                 return table
@@ -70,50 +86,38 @@ def get_table_from_issue(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional
 
             # Try to find table by surrounding text content
             if text_content:
-                for table in soup.find_all("table"):
-                    if text_content in table.get_text():
-                        return table
+                table = index.table_containing_text(text_content)
+                if table:
+                    return table
 
             # If no text match, try using position/index if available
-            index = context.get("index", 0)
-            tables = soup.find_all("table")
-            if 0 <= index < len(tables):
-                return tables[index]
+            position = context.get("index", 0)
+            table = index.table_at(position)
+            if table:
+                return table
 
         # If it's an HTML string
         elif element_str.startswith("<table"):
-            # Try to find matching table structure
-            for table in soup.find_all("table"):
-                # Compare structure (ignoring whitespace)
-                if re.sub(r"\s+", "", str(table)) == re.sub(r"\s+", "", element_str):
-                    return table
+            # Try to find matching table structure (ignoring whitespace)
+            table = index.table_by_fingerprint(element_str)
+            if table:
+                return table
 
     # If we have multiple tables, try to find one that matches the issue type
     issue_type = issue.get("type", "")
-    if issue_type:
-        for table in soup.find_all("table"):
-            if issue_type == "table-missing-headers" and not table.find("th"):
-                return table
-            elif issue_type == "table-missing-scope" and table.find("th", scope=False):
-                return table
-            elif issue_type == "table-missing-thead" and not table.find("thead"):
-                return table
-            elif issue_type == "table-missing-tbody" and not table.find("tbody"):
-                return table
-            elif issue_type == "table-irregular-headers" and table.find("th"):
-                # Check for irregular header structure
-                headers = table.find_all("th")
-                if any(not h.get("scope") for h in headers):
-                    return table
+    if issue_type in TABLE_ISSUE_CONDITIONS:
+        table = index.find_table(TABLE_ISSUE_CONDITIONS[issue_type])
+        if table:
+            return table
 
     # If all else fails, try finding all tables and adding scope to all headers
     if issue_type and issue_type.startswith("table-"):
-        tables = soup.find_all("table")
-        if tables:
+        table = index.table_at(0)
+        if table:
             logger.debug(
                 f"No specific table found for {issue_type}, returning first table as fallback"
             )
-            return tables[0]
+            return table
 
     return None
 
@@ -396,7 +400,7 @@ def remediate_table_missing_scope(
         logger.warning(
             "No specific table found for this issue - will attempt to fix all tables"
         )
-        tables = soup.find_all("table")
+        tables = get_remediation_index(soup).all_tables()
         if not tables:
             logger.warning("No tables found in document")
             return None
@@ -743,7 +747,9 @@ def remediate_table_missing_thead(
         A message describing the remediation, or None if no remediation was performed
     """
     logger.debug("Remediating table missing thead")
-    table = get_table_from_issue(soup, issue) or soup.find("table")
+    table = get_table_from_issue(soup, issue) or get_remediation_index(
+        soup
+    ).table_at(0)
     if not table:
         return None
 
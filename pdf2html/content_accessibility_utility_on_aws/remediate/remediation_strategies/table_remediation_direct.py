@@ -9,7 +9,6 @@ applied correctly during the document processing workflow.
 """
 
 from typing import Dict, List, Optional, Any, Tuple
-from bs4 import BeautifulSoup
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from content_accessibility_utility_on_aws.remediate.remediation_strategies.table_remediation import (
@@ -17,6 +16,7 @@ from content_accessibility_utility_on_aws.remediate.remediation_strategies.table
     remediate_table_missing_thead,
     remediate_table_missing_tbody,
 )
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -38,7 +38,7 @@ def apply_table_remediation(
     Returns:
         Tuple of (remediated_html, fixed_count, failed_count)
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = parse_html(html_content)
 
     # Ensure we have a BedrockClient with credentials
     if bedrock_client:
@@ -157,7 +157,7 @@ def ensure_table_structure(html_content: str) -> str:
     Returns:
         Fixed HTML content
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = parse_html(html_content)
     tables = soup.find_all("table")
 
     for table in tables:
@@ -8,10 +8,10 @@ This module provides functionality for remediating accessibility issues in HTML
 """
 
 from typing import Dict, List, Any
-from bs4 import BeautifulSoup
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from content_accessibility_utility_on_aws.remediate.remediation_manager import RemediationManager
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
 
 # Set up module-level logger
 logger = setup_logger(__name__)
@@ -41,7 +41,7 @@ class Remediator:
             Dictionary containing remediation results and updated HTML
         """
         # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_html(html)
 
         # Create remediation manager
         remediation_manager = RemediationManager(soup, self.options)
@@ -7,6 +7,10 @@ Services for HTML accessibility remediation.
 This package provides services used by the HTML accessibility remediator.
 """
 
-from content_accessibility_utility_on_aws.remediate.services.bedrock_client import BedrockClient
+from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
+    BedrockClient,
+    clear_bedrock_clients,
+    get_bedrock_client,
+)
 
-__all__ = ["BedrockClient"]
+__all__ = ["BedrockClient", "clear_bedrock_clients", "get_bedrock_client"]
@@ -0,0 +1,443 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cache of AI-generated alt text keyed by image content.
+
+Logos, seals and other repeated graphics appear on many pages of a document,
+and across documents. Alt text generated for an image is stored under a hash of
+the image content, the model id and the version of the alt text prompt, so
+later occurrences of the same image reuse it instead of sending the image to
+Bedrock again. Optionally, a perceptual hash of the image is used as a second
+key, to also match re-encoded or slightly resized copies.
+
+Entries are kept in a local SQLite file, with least recently used entries
+evicted beyond a maximum size, or in S3 under a key prefix, where expiry is left
+to the bucket's lifecycle rules. A small in-memory LRU sits in front of both.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import boto3
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.usage_tracker import SessionUsageTracker
+from content_accessibility_utility_on_aws.remediate.prompt_generators.alt_text_generator import (
+    ALT_TEXT_PROMPT_VERSION,
+)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# File name of the cache database when the cache path is a directory
+CACHE_FILE_NAME = "alt_text_cache.sqlite"
+
+# Bump when the layout of cache entries changes
+CACHE_FORMAT_VERSION = 1
+
+# Default maximum number of entries of a SQLite cache
+DEFAULT_MAX_ENTRIES = 10000
+
+# Number of entries kept in memory in front of the store
+MEMORY_ENTRIES = 256
+
+# Minimum standard deviation of the reduced grayscale pixels of an image with a
+# perceptual hash; flat and near-uniform images would all share the same hash
+MIN_PERCEPTUAL_STDDEV = 4.0
+
+# Open caches by location, shared by all documents of a session
+_open_caches: Dict[str, "AltTextCache"] = {}
+_open_caches_lock = threading.Lock()
+
+
+def perceptual_hash(image_path: str) -> Optional[str]:
+    """
+    Compute a difference hash of an image.
+
+    The image is reduced to 9x8 grayscale pixels and each bit of the hash tells
+    whether a pixel is brighter than its right neighbour, so copies of an image
+    that were re-encoded or resized get the same hash.
+
+    Images with too little detail to be told apart by their hash, such as
+    blank, single-color or smoothly shaded images, get no hash.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        str: 16 hex digit hash, or None if the image cannot be read or has too
+        little detail
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(image_path) as img:
+            pixels = list(img.convert("L").resize((9, 8)).getdata())
+    except Exception as e:
+        logger.debug(f"Could not compute perceptual hash of {image_path}: {e}")
+        return None
+
+    mean = sum(pixels) / len(pixels)
+    variance = sum((pixel - mean) ** 2 for pixel in pixels) / len(pixels)
+    if variance < MIN_PERCEPTUAL_STDDEV**2:
+        return None
+
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            bits = (bits << 1) | (left > right)
+    # Images getting brighter, or darker, all the way across share a hash too
+    if bits in (0, (1 << 64) - 1):
+        return None
+    return f"{bits:016x}"
+
+
+class SQLiteAltTextStore:
+    """Thread-safe local SQLite store of cache entries with LRU eviction."""
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Open or create the store.
+
+        Args:
+            path: Path to the SQLite file, or to a directory in which the file
+                is created
+            max_entries: Number of entries kept; least recently used entries
+                beyond it are evicted
+        """
+        if os.path.isdir(path) or not os.path.splitext(path)[1]:
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, CACHE_FILE_NAME)
+        else:
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        # The connection is shared by the threads remediating pages
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS alt_texts (
+                cache_key TEXT PRIMARY KEY,
+                entry TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS alt_texts_last_used ON alt_texts (last_used)"
+        )
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if there is none
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT entry FROM alt_texts WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE alt_texts SET last_used = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            self._connection.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry, evicting the least recently used ones if the store is full.
+
+        Args:
+            key: Cache key
+            entry: Entry to store
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO alt_texts (cache_key, entry, last_used) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(entry), time.time()),
+            )
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM alt_texts"
+            ).fetchone()
+            if count > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM alt_texts WHERE cache_key IN "
+                    "(SELECT cache_key FROM alt_texts ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+
+class S3AltTextStore:
+    """S3 store of cache entries, one JSON object per entry."""
+
+    def __init__(self, uri: str, profile: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            uri: S3 location of the entries, as s3://bucket/prefix
+            profile: Optional AWS profile name
+        """
+        bucket, _, prefix = uri[len("s3://") :].partition("/")
+        self.path = uri
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+        self._s3_client = session.client("s3")
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}.json" if self.prefix else f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if there is none
+        """
+        try:
+            response = self._s3_client.get_object(
+                Bucket=self.bucket, Key=self._object_key(key)
+            )
+        except self._s3_client.exceptions.NoSuchKey:
+            return None
+        return json.loads(response["Body"].read())
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            entry: Entry to store
+        """
+        self._s3_client.put_object(
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=json.dumps(entry),
+            ContentType="application/json",
+        )
+
+    def close(self) -> None:
+        """Nothing to release; entries are written as they are stored."""
+
+
+class AltTextCache:
+    """
+    Thread-safe alt text cache in front of a SQLite or S3 store.
+
+    The lock of the cache only guards the in-memory entries and counters;
+    lookups and writes of the store run outside it, so a slow S3 request does
+    not hold up the threads finding their images in memory.
+    """
+
+    def __init__(self, store, perceptual: bool = False):
+        """
+        Initialize the cache.
+
+        Args:
+            store: SQLiteAltTextStore or S3AltTextStore holding the entries
+            perceptual: Whether to also match images by perceptual hash
+        """
+        self.store = store
+        self.perceptual = perceptual
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def image_keys(self, image_path: str, model_id: str) -> List[str]:
+        """
+        Compute the cache keys of an image.
+
+        Args:
+            image_path: Path to the image file
+            model_id: Bedrock model generating the alt text
+
+        Returns:
+            Keys to look the image up with, most specific first
+        """
+        with open(image_path, "rb") as f:
+            hashes = ["sha256:" + hashlib.sha256(f.read()).hexdigest()]
+        if self.perceptual:
+            dhash = perceptual_hash(image_path)
+            if dhash:
+                hashes.append("dhash:" + dhash)
+
+        keys = []
+        for image_hash in hashes:
+            payload = json.dumps(
+                {
+                    "format": CACHE_FORMAT_VERSION,
+                    "prompt": ALT_TEXT_PROMPT_VERSION,
+                    "model_id": model_id,
+                    "image": image_hash,
+                },
+                sort_keys=True,
+            )
+            keys.append(hashlib.sha256(payload.encode("utf-8")).hexdigest())
+        return keys
+
+    def get(self, keys: List[str]) -> Optional[str]:
+        """
+        Look up the alt text of an image.
+
+        Args:
+            keys: Keys of the image, from image_keys()
+
+        Returns:
+            The cached alt text, or None on a miss
+        """
+        entry = None
+        for key in keys:
+            with self._lock:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    self._memory.move_to_end(key)
+                    break
+            try:
+                entry = self.store.get(key)
+            except Exception as e:
+                logger.warning(f"Could not read alt text cache {self.store.path}: {e}")
+            if entry is not None:
+                with self._lock:
+                    self._remember(key, entry)
+                break
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        SessionUsageTracker.get_instance().track_alt_text_cache_lookup(
+            hit=entry is not None,
+            input_tokens=entry.get("input_tokens", 0) if entry else 0,
+            output_tokens=entry.get("output_tokens", 0) if entry else 0,
+        )
+        return entry["alt_text"] if entry else None
+
+    def put(
+        self,
+        keys: List[str],
+        alt_text: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """
+        Store the alt text of an image.
+
+        Args:
+            keys: Keys of the image, from image_keys()
+            alt_text: Alt text generated for the image
+            input_tokens: Input tokens of the request that generated it
+            output_tokens: Output tokens of the request that generated it
+        """
+        entry = {
+            "alt_text": alt_text,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "created_at": time.time(),
+        }
+        with self._lock:
+            for key in keys:
+                self._remember(key, entry)
+        for key in keys:
+            try:
+                self.store.put(key, entry)
+            except Exception as e:
+                logger.warning(f"Could not write alt text cache {self.store.path}: {e}")
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Keep an entry in memory, dropping the least recently used one if full."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the store."""
+        self.store.close()
+        logger.debug(
+            f"Alt text cache {self.store.path}: {self.hits} hits, {self.misses} misses"
+        )
+
+
+def open_alt_text_cache(
+    location: str,
+    profile: Optional[str] = None,
+    perceptual: bool = False,
+    max_entries: Optional[int] = None,
+) -> Optional[AltTextCache]:
+    """
+    Get the alt text cache at a location, opening it on first use.
+
+    A cache stays open for the rest of the session, so every page and document
+    remediated in the process shares it.
+
+    Args:
+        location: Path to a SQLite file or directory, or an s3://bucket/prefix URI
+        profile: Optional AWS profile name, for S3 locations
+        perceptual: Whether to also match images by perceptual hash
+        max_entries: Maximum number of entries of a SQLite cache
+
+    Returns:
+        The cache, or None if it cannot be opened
+    """
+    with _open_caches_lock:
+        cache = _open_caches.get(location)
+        if cache is not None:
+            cache.perceptual = cache.perceptual or perceptual
+            return cache
+
+        try:
+            if location.startswith("s3://"):
+                store = S3AltTextStore(location, profile=profile)
+            else:
+                store = SQLiteAltTextStore(
+                    location, max_entries=max_entries or DEFAULT_MAX_ENTRIES
+                )
+        except Exception as e:
+            logger.warning(f"Could not open alt text cache {location}: {e}")
+            return None
+
+        cache = AltTextCache(store, perceptual=perceptual)
+        _open_caches[location] = cache
+        logger.debug(f"Using alt text cache {store.path}")
+        return cache
@@ -5,20 +5,172 @@
 Bedrock client for AI text and image analysis.
 
 This module provides a client for interacting with AWS Bedrock for multimodal AI capabilities.
+
+Creating a boto3 session and client takes tens of milliseconds, and each new
+client opens its own HTTPS connections. Bedrock runtime clients are therefore
+created once per profile and region and shared by every BedrockClient of the
+process; boto3 clients are thread-safe, so the Bedrock scheduler's worker
+threads share one connection pool, sized for their number.
+:func:`get_bedrock_client` also shares the BedrockClient objects themselves,
+by profile, model and region, until :func:`clear_bedrock_clients` is called.
 """
 
 import boto3
 import os
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from botocore.config import Config
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from content_accessibility_utility_on_aws.utils.usage_tracker import SessionUsageTracker
 from content_accessibility_utility_on_aws.utils.image_utils import resize_image
+from content_accessibility_utility_on_aws.remediate.services.response_cache import (
+    REPLAY_MODE,
+    response_cache_from_environment,
+)
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Default model of the Bedrock clients
+DEFAULT_MODEL_ID = "us.amazon.nova-lite-v1:0"
+
+# Minimum size of the connection pool of a Bedrock runtime client
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+# Bedrock runtime clients by (profile, region), with their pool size
+_runtime_clients: Dict[tuple, Tuple[Any, int]] = {}
+_runtime_clients_lock = threading.Lock()
+
+# Shared BedrockClients by profile, model, region and caches
+_bedrock_clients: Dict[tuple, "BedrockClient"] = {}
+_bedrock_clients_lock = threading.Lock()
+
+
+def _create_session(profile: Optional[str]) -> "boto3.Session":
+    """Create a boto3 session, with default credentials if the profile is unusable."""
+    if profile:
+        try:
+            # Try to create a session with the provided profile
+            session = boto3.Session(profile_name=profile)
+            logger.debug(f"Using AWS profile: {profile}")
+            return session
+        except Exception as profile_error:
+            # If profile doesn't exist or other error, try default credentials
+            logger.warning(
+                f"Couldn't use AWS profile '{profile}', falling back to default credentials: {profile_error}"
+            )
+    # No profile specified, use default credentials
+    return boto3.Session()
+
+
+def get_runtime_client(
+    profile: Optional[str] = None,
+    region: Optional[str] = None,
+    max_pool_connections: Optional[int] = None,
+):
+    """
+    Get the shared Bedrock runtime client of a profile and region.
+
+    The client is created on first use, with keep-alive connections and a
+    pool of at least max_pool_connections connections. A client with a
+    smaller pool is replaced when a larger pool is requested.
+
+    Args:
+        profile: AWS profile name, or None for default credentials
+        region: AWS region, or None for the session's default region
+        max_pool_connections: Number of requests that may run concurrently
+
+    Returns:
+        The boto3 bedrock-runtime client
+
+    Raises:
+        Exception: If the client cannot be created, for example without a region
+    """
+    pool_size = max(DEFAULT_MAX_POOL_CONNECTIONS, max_pool_connections or 0)
+    key = (profile, region)
+    with _runtime_clients_lock:
+        entry = _runtime_clients.get(key)
+        if entry is not None and entry[1] >= pool_size:
+            return entry[0]
+
+        config = Config(max_pool_connections=pool_size, tcp_keepalive=True)
+        client = _create_session(profile).client(
+            "bedrock-runtime", region_name=region, config=config
+        )
+        _runtime_clients[key] = (client, pool_size)
+        logger.debug(
+            f"Created Bedrock runtime client for profile {profile}, region {region} "
+            f"with {pool_size} pooled connections"
+        )
+        return client
+
+
+def get_bedrock_client(
+    model_id: str = DEFAULT_MODEL_ID,
+    profile: Optional[str] = None,
+    region: Optional[str] = None,
+    alt_text_cache=None,
+    response_cache=None,
+    max_pool_connections: Optional[int] = None,
+) -> "BedrockClient":
+    """
+    Get the BedrockClient of a profile, model and region, creating it on first use.
+
+    Every page and strategy of a remediation run gets the same client, and with
+    it warm connections to Bedrock. Clients using different caches are kept
+    apart.
+
+    Args:
+        model_id: The ID of the Bedrock model to use
+        profile: AWS profile name to use for authentication
+        region: AWS region, or None for the session's default region
+        alt_text_cache: Optional AltTextCache of the client
+        response_cache: Optional BedrockResponseCache of the client (default:
+            the cache set by BEDROCK_RESPONSE_CACHE)
+        max_pool_connections: Number of requests that may run concurrently
+
+    Returns:
+        The shared client
+
+    Raises:
+        Exception: If the client cannot be created
+    """
+    response_cache = response_cache or response_cache_from_environment()
+    key = (profile, model_id, region, alt_text_cache, response_cache)
+    with _bedrock_clients_lock:
+        client = _bedrock_clients.get(key)
+        if client is None:
+            client = BedrockClient(
+                model_id=model_id,
+                profile=profile,
+                alt_text_cache=alt_text_cache,
+                response_cache=response_cache,
+                region=region,
+                max_pool_connections=max_pool_connections,
+            )
+            _bedrock_clients[key] = client
+        elif max_pool_connections:
+            client.ensure_pool_size(max_pool_connections)
+        return client
+
+
+def clear_bedrock_clients() -> None:
+    """
+    Forget the shared Bedrock runtime clients and BedrockClients.
+
+    Later calls create new clients, for example in tests or in a warm Lambda
+    container whose credentials or caches changed. Clients already handed out
+    keep working; the caches they use are not closed.
+    """
+    with _bedrock_clients_lock:
+        _bedrock_clients.clear()
+    with _runtime_clients_lock:
+        _runtime_clients.clear()
+    logger.debug("Cleared shared Bedrock clients")
+
 
 class AltTextGenerationError(Exception):
     """Exception raised when alt text generation fails."""
@@ -31,6 +183,8 @@ class BedrockClient:
         model_id: The Bedrock model ID to use
         profile: AWS credentials profile name
         client: Boto3 Bedrock runtime client
+        alt_text_cache: Optional AltTextCache reused for images already described
+        response_cache: Optional BedrockResponseCache the converse calls go through
         MAX_IMAGE_SIZE: Maximum allowed image size in bytes
     """
 
@@ -39,42 +193,81 @@ class BedrockClient:
 
     def __init__(
         self,
-        model_id: str = "us.amazon.nova-lite-v1:0",
+        model_id: str = DEFAULT_MODEL_ID,
         profile: Optional[str] = None,
+        alt_text_cache=None,
+        response_cache=None,
+        region: Optional[str] = None,
+        max_pool_connections: Optional[int] = None,
+        runtime_client=None,
     ):
         """
         Initialize the Bedrock client.
 
+        The boto3 runtime client is shared with the other BedrockClients of
+        the same profile and region; see get_runtime_client().
+
         Args:
             model_id: The ID of the Bedrock model to use
             profile: AWS profile name to use for authentication
+            alt_text_cache: Optional AltTextCache; alt text of images found in
+                it is not generated again
+            response_cache: Optional BedrockResponseCache for the responses of
+                the model (default: the cache set by BEDROCK_RESPONSE_CACHE)
+            region: AWS region, or None for the session's default region
+            max_pool_connections: Number of requests that may run concurrently
+            runtime_client: Runtime client of another BedrockClient to send the
+                requests with, as it is; it already goes through the response
+                cache, if any
         """
         self.model_id = model_id
         self.profile = profile
+        self.region = region
+        self.alt_text_cache = alt_text_cache
+        self._pool_size = max(DEFAULT_MAX_POOL_CONNECTIONS, max_pool_connections or 0)
+        if runtime_client is not None:
+            self.response_cache = response_cache
+            self.client = runtime_client
+            return
+
+        self.response_cache = response_cache or response_cache_from_environment()
         try:
-            # Create a boto3 session with the provided profile
-            if profile:
-                try:
-                    # Try to create a session with the provided profile
-                    session = boto3.Session(profile_name=profile)
-                    logger.debug(f"Using AWS profile: {profile}")
-                except Exception as profile_error:
-                    # If profile doesn't exist or other error, try default credentials
-                    logger.warning(
-                        f"Couldn't use AWS profile '{profile}', falling back to default credentials: {profile_error}"
-                    )
-                    session = boto3.Session()
-            else:
-                # No profile specified, use default credentials
-                session = boto3.Session()
-
-            self.client = session.client("bedrock-runtime")
+            self.client = get_runtime_client(profile, region, self._pool_size)
             logger.debug(
                 f"Initialized Bedrock client with model: {model_id}, profile: {profile}"
             )
         except Exception as e:
-            logger.warning(f"Failed to initialize Bedrock client: {e}")
-            raise
+            # Replaying stored responses does not need a Bedrock endpoint
+            if not self.response_cache or self.response_cache.mode != REPLAY_MODE:
+                logger.warning(f"Failed to initialize Bedrock client: {e}")
+                raise
+            logger.debug(f"Replaying Bedrock responses without a client: {e}")
+            self.client = None
+
+        if self.response_cache:
+            self.client = self.response_cache.wrap(self.client)
+
+    def ensure_pool_size(self, max_pool_connections: int) -> None:
+        """
+        Make sure the client can run a number of requests concurrently.
+
+        Args:
+            max_pool_connections: Number of requests that may run concurrently
+        """
+        if max_pool_connections <= self._pool_size:
+            return
+        try:
+            runtime_client = get_runtime_client(
+                self.profile, self.region, max_pool_connections
+            )
+        except Exception as e:
+            logger.warning(f"Could not enlarge Bedrock connection pool: {e}")
+            return
+        self._pool_size = max_pool_connections
+        if self.response_cache:
+            self.client = self.response_cache.wrap(runtime_client)
+        else:
+            self.client = runtime_client
 
     def generate_text(
         self, prompt: str, purpose: str = "general", max_tokens: int = 500
@@ -187,51 +380,16 @@ class BedrockClient:
                 logger.warning(f"Image file not found: {image_path}")
                 raise FileNotFoundError(f"Image file not found: {image_path}")
 
-            # Check image size and resize if needed
-            temp_image_path = None
-            try:
-                image_size = os.path.getsize(image_path)
-                if image_size > self.MAX_IMAGE_SIZE:
-                    logger.warning(
-                        f"Image size {image_size} bytes exceeds limit of {self.MAX_IMAGE_SIZE}, resizing"
-                    )
-
-                    temp_image_path = resize_image(
-                        image_path, max_size=self.MAX_IMAGE_SIZE
-                    )
-                    if temp_image_path and temp_image_path != image_path:
-                        logger.info(
-                            f"Image resized successfully: {os.path.getsize(temp_image_path)} bytes"
-                        )
-                        image_path = temp_image_path
-                    else:
-                        logger.warning(
-                            "Image resizing did not produce a new file, using original"
-                        )
-            except Exception as resize_error:
-                logger.warning(
-                    f"Failed to resize large image: {str(resize_error)}, attempting with original"
-                )
+            # Reuse the alt text of an identical image
+            cache_keys = None
+            if self.alt_text_cache is not None:
+                cache_keys = self.alt_text_cache.image_keys(image_path, self.model_id)
+                cached_text = self.alt_text_cache.get(cache_keys)
+                if cached_text is not None:
+                    logger.debug(f"Using cached alt text for {image_path}")
+                    return cached_text
 
-            # Read and encode the image
-            try:
-                with open(image_path, "rb") as image_file:
-                    image_data = image_file.read()
-
-            finally:
-                # Clean up temporary file if created
-                if (
-                    temp_image_path
-                    and temp_image_path != image_path
-                    and os.path.exists(temp_image_path)
-                ):
-                    try:
-                        os.unlink(temp_image_path)
-                        logger.debug(
-                            f"Removed temporary resized image: {temp_image_path}"
-                        )
-                    except Exception as e:
-                        logger.debug(f"Failed to remove temporary file: {e}")
+            image_data, image_format = self._read_image(image_path)
 
     
             content = [
@@ -240,9 +398,7 @@ class BedrockClient:
                 },
                 {
                     "image": {
-                        "format": self._get_media_type(image_path)
-                        .split("/")[1]
-                        .lower(),
+                        "format": image_format,
                         "source": {"bytes": image_data},
                     },
                 },
@@ -292,6 +448,11 @@ class BedrockClient:
                 except Exception as track_error:
                     logger.warning(f"Failed to track Bedrock usage: {track_error}")
 
+                if cache_keys:
+                    self.alt_text_cache.put(
+                        cache_keys, generated_text, input_tokens, output_tokens
+                    )
+
                 return generated_text
             else:
                 logger.warning("No content in Bedrock response")
@@ -304,6 +465,197 @@ class BedrockClient:
             logger.warning(f"Error generating alt text with Bedrock: {e}")
             raise AltTextGenerationError(f"Failed to generate alt text: {str(e)}")
 
+    def generate_alt_text_for_images(
+        self, images: List[Tuple[str, str]], max_tokens: int = 500
+    ) -> List[Optional[str]]:
+        """
+        Generate alt text for several images with a single request.
+
+        The alt text instructions are sent once, followed by the number,
+        details and content of each image, and the model answers with a JSON
+        object mapping image numbers to alt text.
+
+        Args:
+            images: Tuples of (image path, image details), the details being the
+                image-specific part of an alt text prompt
+            max_tokens: Maximum number of tokens to generate per image
+
+        Returns:
+            Alt text of each image, in order, or None for images the response
+            has no usable alt text for
+
+        Raises:
+            AltTextGenerationError: If the request fails
+            FileNotFoundError: If an image file is not found
+        """
+        from content_accessibility_utility_on_aws.remediate.prompt_generators.alt_text_generator import (
+            ALT_TEXT_BATCH_INSTRUCTIONS,
+            ALT_TEXT_BATCH_RESPONSE_FORMAT,
+            parse_batch_alt_text,
+        )
+
+        alt_texts: List[Optional[str]] = [None] * len(images)
+
+        # Reuse the alt text of identical images and only send the others
+        cache_keys: List[Optional[List[str]]] = [None] * len(images)
+        pending = []
+        for index, (image_path, _) in enumerate(images):
+            if not os.path.exists(image_path):
+                logger.warning(f"Image file not found: {image_path}")
+                raise FileNotFoundError(f"Image file not found: {image_path}")
+            if self.alt_text_cache is not None:
+                cache_keys[index] = self.alt_text_cache.image_keys(
+                    image_path, self.model_id
+                )
+                alt_texts[index] = self.alt_text_cache.get(cache_keys[index])
+            if alt_texts[index] is None:
+                pending.append(index)
+
+        if not pending:
+            return alt_texts
+
+        start_time = datetime.now()
+        try:
+            content = [
+                {"text": ALT_TEXT_BATCH_INSTRUCTIONS.format(count=len(pending))}
+            ]
+            prompt_text = content[0]["text"] + ALT_TEXT_BATCH_RESPONSE_FORMAT
+            for number, index in enumerate(pending, 1):
+                image_path, details = images[index]
+                image_data, image_format = self._read_image(image_path)
+                text = f"\nImage {number}:\n{details}"
+                prompt_text += text
+                content.append({"text": text})
+                content.append(
+                    {
+                        "image": {
+                            "format": image_format,
+                            "source": {"bytes": image_data},
+                        }
+                    }
+                )
+            content.append({"text": ALT_TEXT_BATCH_RESPONSE_FORMAT})
+
+            # Add 1000 tokens per image, as for single images
+            input_tokens = SessionUsageTracker.estimate_tokens(prompt_text) + 1000 * len(
+                pending
+            )
+
+            response = self.client.converse(
+                modelId=self.model_id,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": content,
+                    }
+                ],
+                inferenceConfig={
+                    "maxTokens": max_tokens * len(pending),
+                },
+            )
+
+            output = response.get("output", {}).get("message", {}).get("content", [])
+            if not output or "text" not in output[0]:
+                logger.warning("No content in Bedrock response")
+                raise AltTextGenerationError("No content in Bedrock response")
+            generated_text = output[0]["text"]
+
+        except FileNotFoundError:
+            # Re-raise file not found errors
+            raise
+        except Exception as e:
+            logger.warning(f"Error generating alt text with Bedrock: {e}")
+            raise AltTextGenerationError(f"Failed to generate alt text: {str(e)}")
+
+        # Track token usage
+        processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        output_tokens = SessionUsageTracker.estimate_tokens(generated_text)
+        try:
+            SessionUsageTracker.get_instance().track_bedrock_call(
+                model_id=self.model_id,
+                purpose="alt_text_generation_batch",
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                processing_time_ms=processing_time_ms,
+            )
+        except Exception as track_error:
+            logger.warning(f"Failed to track Bedrock usage: {track_error}")
+
+        parsed = parse_batch_alt_text(generated_text, len(pending))
+        for index, alt_text in zip(pending, parsed):
+            alt_texts[index] = alt_text
+            if alt_text is not None and cache_keys[index]:
+                self.alt_text_cache.put(
+                    cache_keys[index],
+                    alt_text,
+                    input_tokens // len(pending),
+                    SessionUsageTracker.estimate_tokens(alt_text),
+                )
+
+        logger.debug(
+            f"Generated alt text for {sum(text is not None for text in parsed)} "
+            f"of {len(pending)} images in one request"
+        )
+        return alt_texts
+
+    def _read_image(self, image_path: str) -> Tuple[bytes, str]:
+        """
+        Read an image for a request, resizing it first if it is too large.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Tuple of (image bytes, image format for the converse API)
+        """
+        # Check image size and resize if needed
+        temp_image_path = None
+        try:
+            image_size = os.path.getsize(image_path)
+            if image_size > self.MAX_IMAGE_SIZE:
+                logger.warning(
+                    f"Image size {image_size} bytes exceeds limit of {self.MAX_IMAGE_SIZE}, resizing"
+                )
+
+                temp_image_path = resize_image(
+                    image_path, max_size=self.MAX_IMAGE_SIZE
+                )
+                if temp_image_path and temp_image_path != image_path:
+                    logger.info(
+                        f"Image resized successfully: {os.path.getsize(temp_image_path)} bytes"
+                    )
+                    image_path = temp_image_path
+                else:
+                    logger.warning(
+                        "Image resizing did not produce a new file, using original"
+                    )
+        except Exception as resize_error:
+            logger.warning(
+                f"Failed to resize large image: {str(resize_error)}, attempting with original"
+            )
+
+        # Read and encode the image
+        try:
+            with open(image_path, "rb") as image_file:
+                image_data = image_file.read()
+
+        finally:
+            # Clean up temporary file if created
+            if (
+                temp_image_path
+                and temp_image_path != image_path
+                and os.path.exists(temp_image_path)
+            ):
+                try:
+                    os.unlink(temp_image_path)
+                    logger.debug(
+                        f"Removed temporary resized image: {temp_image_path}"
+                    )
+                except Exception as e:
+                    logger.debug(f"Failed to remove temporary file: {e}")
+
+        return image_data, self._get_media_type(image_path).split("/")[1].lower()
+
     def _get_media_type(self, file_path: str) -> str:
         """
         Get the media type based on file extension.
@@ -0,0 +1,459 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Concurrent scheduling of Bedrock requests for remediation.
+
+Remediation of a page runs in two phases. The requests that the AI-backed
+strategies would send are first collected with a :class:`RecordingBedrockClient`,
+then sent concurrently by a :class:`BedrockRequestScheduler`, which bounds the
+number of requests in flight, rate limits them with a token bucket and backs off
+when Bedrock throttles. The strategies are then applied in the original issue
+order with a :class:`ScheduledBedrockClient`, which answers each request with its
+prefetched response, so the remediated page does not depend on the order in
+which the responses arrived.
+
+Alt text requests can also be batched: the scheduler then packs the images of
+several requests into one request, within image size and token limits, and
+sends an image on its own only if the batched response has no usable alt text
+for it.
+"""
+
+import os
+import random
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
+    BedrockClient,
+    AltTextGenerationError,
+)
+from content_accessibility_utility_on_aws.remediate.prompt_generators.alt_text_generator import (
+    alt_text_prompt_details,
+)
+from content_accessibility_utility_on_aws.utils.usage_tracker import SessionUsageTracker
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# Error codes of Bedrock responses that ask the caller to slow down
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "ServiceUnavailableException",
+        "ModelNotReadyException",
+        "RequestLimitExceeded",
+    ]
+)
+
+
+# Limits of a batched alt text request
+MAX_BATCH_IMAGE_BYTES = 16_000_000
+MAX_BATCH_INPUT_TOKENS = 16_000
+MAX_BATCH_OUTPUT_TOKENS = 4_096
+
+# Estimated input tokens of an image, as in BedrockClient usage tracking
+IMAGE_TOKENS = 1000
+
+
+class BedrockRequest(NamedTuple):
+    """A call of a BedrockClient method, with its positional arguments."""
+
+    method: str
+    args: Tuple[Any, ...]
+
+
+# Response to a request: the result, or the error raised by the call
+Outcome = Tuple[Any, Optional[Exception]]
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Check whether an error, or an error it was raised from, is a throttling error.
+
+    BedrockClient wraps the botocore error in an AltTextGenerationError, so the
+    whole chain of causes is checked.
+
+    Args:
+        error: The error raised by a request
+
+    Returns:
+        bool: True if Bedrock asked to slow down
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        response = getattr(error, "response", None)
+        if isinstance(response, dict):
+            code = response.get("Error", {}).get("Code")
+            if code in THROTTLING_ERROR_CODES:
+                return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the rate of requests."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the largest burst of
+                requests (default: one second worth of tokens, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class BedrockRequestScheduler:
+    """Sends Bedrock requests concurrently, with rate limiting and backoff."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 20.0,
+        batch_size: int = 1,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight
+            requests_per_second: Maximum request rate, or None for no limit
+            burst: Largest burst of requests allowed by the rate limit
+            max_retries: Number of retries of a throttled request
+            base_delay: Backoff delay after the first throttling, in seconds
+            max_delay: Maximum backoff delay, in seconds
+            batch_size: Maximum number of images per alt text request; 1
+                sends every image in its own request
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.bucket = (
+            TokenBucket(requests_per_second, burst) if requests_per_second else None
+        )
+        self.throttled = 0
+        # Requests wait until this time after Bedrock throttled one of them
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def run(self, client: BedrockClient, requests: Sequence[BedrockRequest]) -> List[Outcome]:
+        """
+        Send requests and wait for all their responses.
+
+        Args:
+            client: Client sending the requests
+            requests: Requests to send
+
+        Returns:
+            Outcome of each request, in the order of the requests
+        """
+        if not requests:
+            return []
+
+        jobs = self._plan_jobs(requests)
+        workers = min(self.max_concurrency, len(jobs))
+        start = time.monotonic()
+        outcomes: List[Outcome] = [(None, None)] * len(requests)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bedrock"
+        ) as executor:
+            futures = [
+                executor.submit(self._send_job, client, requests, job) for job in jobs
+            ]
+            for job, future in zip(jobs, futures):
+                for index, outcome in zip(job, future.result()):
+                    outcomes[index] = outcome
+
+        logger.debug(
+            f"Sent {len(requests)} Bedrock requests as {len(jobs)} jobs with "
+            f"{workers} workers in {time.monotonic() - start:.1f}s "
+            f"({self.throttled} throttled)"
+        )
+        return outcomes
+
+    def _plan_jobs(self, requests: Sequence[BedrockRequest]) -> List[List[int]]:
+        """
+        Group requests into jobs, each sent as one request.
+
+        Consecutive alt text requests are batched up to the batch size and the
+        image size and token limits of a request; other requests are sent alone.
+
+        Args:
+            requests: Requests to send
+
+        Returns:
+            Indices of the requests of each job
+        """
+        if self.batch_size <= 1:
+            return [[index] for index in range(len(requests))]
+
+        jobs: List[List[int]] = []
+        batch: List[int] = []
+        batch_bytes = batch_tokens = batch_max_tokens = 0
+        for index, request in enumerate(requests):
+            details = (
+                alt_text_prompt_details(request.args[1])
+                if request.method == "generate_alt_text_for_image"
+                else None
+            )
+            if details is None:
+                jobs.append([index])
+                continue
+
+            image_path, _, max_tokens = request.args
+            try:
+                image_bytes = min(
+                    os.path.getsize(image_path), BedrockClient.MAX_IMAGE_SIZE
+                )
+            except OSError:
+                image_bytes = 0
+            tokens = SessionUsageTracker.estimate_tokens(details) + IMAGE_TOKENS
+
+            if batch and (
+                len(batch) >= self.batch_size
+                or max_tokens != batch_max_tokens
+                or batch_bytes + image_bytes > MAX_BATCH_IMAGE_BYTES
+                or batch_tokens + tokens > MAX_BATCH_INPUT_TOKENS
+                or (len(batch) + 1) * max_tokens > MAX_BATCH_OUTPUT_TOKENS
+            ):
+                jobs.append(batch)
+                batch, batch_bytes, batch_tokens = [], 0, 0
+            batch.append(index)
+            batch_bytes += image_bytes
+            batch_tokens += tokens
+            batch_max_tokens = max_tokens
+
+        if batch:
+            jobs.append(batch)
+        return jobs
+
+    def _send_job(
+        self,
+        client: BedrockClient,
+        requests: Sequence[BedrockRequest],
+        job: List[int],
+    ) -> List[Outcome]:
+        """
+        Send the requests of a job.
+
+        Images without usable alt text in the response to a batched request are
+        sent again on their own.
+        """
+        if len(job) == 1:
+            return [self._send(client, requests[job[0]])]
+
+        images = [
+            (requests[index].args[0], alt_text_prompt_details(requests[index].args[1]))
+            for index in job
+        ]
+        max_tokens = requests[job[0]].args[2]
+        alt_texts, error = self._call(
+            lambda: client.generate_alt_text_for_images(images, max_tokens)
+        )
+        if error is not None:
+            logger.warning(f"Batched alt text request failed, sending images one by one: {error}")
+            alt_texts = [None] * len(job)
+
+        return [
+            (alt_text, None) if alt_text is not None else self._send(client, requests[index])
+            for index, alt_text in zip(job, alt_texts)
+        ]
+
+    def _send(self, client: BedrockClient, request: BedrockRequest) -> Outcome:
+        """Send one request, retrying it with backoff while it is throttled."""
+        return self._call(lambda: getattr(client, request.method)(*request.args))
+
+    def _call(self, function: Callable[[], Any]) -> Outcome:
+        """Call a client method, retrying it with backoff while it is throttled."""
+        attempt = 0
+        while True:
+            self._wait_for_turn()
+            try:
+                return function(), None
+            except Exception as e:
+                if attempt >= self.max_retries or not is_throttling_error(e):
+                    return None, e
+                attempt += 1
+                self._back_off(attempt)
+
+    def _wait_for_turn(self) -> None:
+        """Wait for the end of any backoff, then for the rate limit."""
+        while True:
+            with self._lock:
+                wait = self._resume_at - time.monotonic()
+            if wait <= 0:
+                break
+            time.sleep(wait)
+        if self.bucket:
+            self.bucket.acquire()
+
+    def _back_off(self, attempt: int) -> None:
+        """Hold back all requests after Bedrock throttled one of them."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        # Full jitter keeps the workers from retrying in lockstep
+        delay = random.uniform(delay / 2, delay)
+        with self._lock:
+            self.throttled += 1
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+        logger.debug(f"Bedrock throttled a request, backing off {delay:.1f}s")
+
+
+class _DelegatingBedrockClient(BedrockClient, metaclass=ABCMeta):
+    """
+    Stand-in for a BedrockClient, recognized as one by the strategies.
+
+    The requests of the strategies are passed to :meth:`_request` instead of
+    being sent to Bedrock.
+    """
+
+    def __init__(self, client: BedrockClient):
+        """
+        Initialize the stand-in with the settings and runtime client of a client.
+
+        Args:
+            client: The client the stand-in replaces
+        """
+        super().__init__(
+            model_id=client.model_id,
+            profile=client.profile,
+            alt_text_cache=client.alt_text_cache,
+            response_cache=client.response_cache,
+            region=client.region,
+            max_pool_connections=client._pool_size,
+            runtime_client=client.client,
+        )
+        self.wrapped = client
+
+    def generate_text(
+        self, prompt: str, purpose: str = "general", max_tokens: int = 500
+    ) -> str:
+        return self._request(
+            BedrockRequest("generate_text", (prompt, purpose, max_tokens))
+        )
+
+    def generate_alt_text_for_image(
+        self, image_path: str, prompt: str, max_tokens: int = 500
+    ) -> str:
+        return self._request(
+            BedrockRequest(
+                "generate_alt_text_for_image", (image_path, prompt, max_tokens)
+            )
+        )
+
+    @abstractmethod
+    def _request(self, request: BedrockRequest) -> str:
+        """
+        Answer a request of a strategy.
+
+        Args:
+            request: The request
+
+        Returns:
+            The generated text
+
+        Raises:
+            AltTextGenerationError: If no text is generated for the request
+        """
+
+
+class RecordingBedrockClient(_DelegatingBedrockClient):
+    """
+    Client that records requests instead of sending them.
+
+    Every request fails with an AltTextGenerationError, so the strategies take
+    their non-AI path for the rest of the collection pass.
+    """
+
+    def __init__(self, client: BedrockClient):
+        super().__init__(client)
+        self.requests: List[BedrockRequest] = []
+        self._issue_requests: Set[BedrockRequest] = set()
+
+    def start_issue(self) -> None:
+        """
+        Start recording the requests of the next issue.
+
+        A strategy that retries a request within an issue records it once.
+        """
+        self._issue_requests = set()
+
+    def _request(self, request: BedrockRequest) -> str:
+        if request not in self._issue_requests:
+            self._issue_requests.add(request)
+            self.requests.append(request)
+        raise AltTextGenerationError("Request deferred to the Bedrock scheduler")
+
+
+class ScheduledBedrockClient(_DelegatingBedrockClient):
+    """
+    Client answering requests with the responses of a scheduler run.
+
+    Each response is used once, by the first identical request; requests that
+    were not collected, or were sent more often than collected, such as retries
+    after an unusable response, are sent to Bedrock directly.
+    """
+
+    def __init__(
+        self,
+        client: BedrockClient,
+        requests: Sequence[BedrockRequest],
+        outcomes: Sequence[Outcome],
+    ):
+        super().__init__(client)
+        self._outcomes: Dict[BedrockRequest, Deque[Outcome]] = {}
+        for request, outcome in zip(requests, outcomes):
+            self._outcomes.setdefault(request, deque()).append(outcome)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def unused(self) -> int:
+        """Number of responses no strategy asked for."""
+        return sum(len(outcomes) for outcomes in self._outcomes.values())
+
+    def _request(self, request: BedrockRequest) -> str:
+        outcomes = self._outcomes.get(request)
+        if not outcomes:
+            self.misses += 1
+            return getattr(self.wrapped, request.method)(*request.args)
+
+        self.hits += 1
+        result, error = outcomes.popleft()
+        if error is not None:
+            raise error
+        return result
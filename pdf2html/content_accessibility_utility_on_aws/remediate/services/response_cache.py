@@ -0,0 +1,298 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Persistent cache of Bedrock responses, with record and replay modes.
+
+Responses of the Bedrock converse API are stored in a SQLite file, keyed by a
+hash of all the arguments of the request. In the request messages, whitespace in
+text is normalized and images are represented by a hash of their content.
+The cache runs in one of three modes:
+
+- ``record``: stored responses are reused and other requests are sent to Bedrock
+  and stored, so a re-run after a crash or timeout only sends what is missing;
+- ``replay``: only stored responses are used and other requests fail with a
+  :class:`ResponseCacheMissError`, so remediation runs offline, without AWS
+  credentials or a Bedrock endpoint;
+- ``passthrough``: every request is sent to Bedrock and nothing is stored.
+
+A cache can also be set for the whole process with the
+``BEDROCK_RESPONSE_CACHE`` and ``BEDROCK_RESPONSE_CACHE_MODE`` environment
+variables, for example to run tests or benchmarks in replay mode.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+RECORD_MODE = "record"
+REPLAY_MODE = "replay"
+PASSTHROUGH_MODE = "passthrough"
+CACHE_MODES = (RECORD_MODE, REPLAY_MODE, PASSTHROUGH_MODE)
+
+# Environment variables setting the cache of every BedrockClient
+CACHE_PATH_VARIABLE = "BEDROCK_RESPONSE_CACHE"
+CACHE_MODE_VARIABLE = "BEDROCK_RESPONSE_CACHE_MODE"
+
+# File name of the cache database when the cache path is a directory
+CACHE_FILE_NAME = "bedrock_responses.sqlite"
+
+# Bump when the request key or the layout of stored responses changes
+CACHE_FORMAT_VERSION = 2
+
+# Response fields that are stored
+STORED_FIELDS = ("output", "stopReason", "usage")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Open caches by path and mode
+_open_caches: Dict[tuple, "BedrockResponseCache"] = {}
+_open_caches_lock = threading.Lock()
+
+
+class ResponseCacheMissError(Exception):
+    """Exception raised in replay mode for a request without a stored response."""
+
+
+def _normalize_content(block: Any) -> Any:
+    """Replace text by its normalized form and images by their content hash."""
+    if isinstance(block, dict):
+        normalized = {}
+        for key, value in block.items():
+            if key == "bytes" and isinstance(value, (bytes, bytearray)):
+                normalized["sha256"] = hashlib.sha256(value).hexdigest()
+            elif key == "text" and isinstance(value, str):
+                normalized[key] = _WHITESPACE_PATTERN.sub(" ", value).strip()
+            else:
+                normalized[key] = _normalize_content(value)
+        return normalized
+    if isinstance(block, (list, tuple)):
+        return [_normalize_content(item) for item in block]
+    return block
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """
+    Compute the cache key of a converse request.
+
+    Every argument of the request is part of the key. Only the messages are
+    normalized.
+
+    Args:
+        request: Arguments of the converse request
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    arguments = dict(request)
+    arguments["messages"] = _normalize_content(arguments.get("messages"))
+    payload = json.dumps(
+        {"format": CACHE_FORMAT_VERSION, "request": arguments},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BedrockResponseCache:
+    """Thread-safe SQLite store of converse responses."""
+
+    def __init__(self, path: str, mode: str = RECORD_MODE):
+        """
+        Open or create the cache.
+
+        Args:
+            path: Path to the SQLite cache file, or to a directory in which the
+                cache file is created
+            mode: 'record', 'replay' or 'passthrough'
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(
+                f"Unknown Bedrock cache mode '{mode}', expected one of {', '.join(CACHE_MODES)}"
+            )
+
+        if os.path.isdir(path) or not os.path.splitext(path)[1]:
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, CACHE_FILE_NAME)
+        else:
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+
+        self.path = path
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                request_key TEXT PRIMARY KEY,
+                model_id TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+        logger.debug(f"Using Bedrock response cache {path} in {mode} mode")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored response.
+
+        Args:
+            key: Request key, from request_key()
+
+        Returns:
+            The response, or None if there is none
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response FROM responses WHERE request_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, model_id: str, response: Dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Request key, from request_key()
+            model_id: Bedrock model id of the request
+            response: Converse response
+        """
+        stored = {field: response[field] for field in STORED_FIELDS if field in response}
+        try:
+            data = json.dumps(stored)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not cache Bedrock response: {e}")
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(request_key, model_id, response, created_at) VALUES (?, ?, ?, ?)",
+                (key, model_id, data, time.time()),
+            )
+            self._connection.commit()
+
+    def wrap(self, client: Any) -> "CachingConverseClient":
+        """
+        Wrap a bedrock-runtime client so its converse calls use the cache.
+
+        Args:
+            client: Boto3 bedrock-runtime client, or None in replay mode
+
+        Returns:
+            The wrapped client
+        """
+        return CachingConverseClient(client, self)
+
+
+class CachingConverseClient:
+    """Bedrock runtime client whose converse calls go through a response cache."""
+
+    def __init__(self, client: Any, cache: BedrockResponseCache):
+        """
+        Initialize the wrapper.
+
+        Args:
+            client: Boto3 bedrock-runtime client, or None in replay mode
+            cache: The response cache
+        """
+        self.client = client
+        self.cache = cache
+
+    def converse(self, **kwargs) -> Dict[str, Any]:
+        """
+        Get the response to a converse request, from the cache if possible.
+
+        Args:
+            **kwargs: Arguments of the converse API
+
+        Returns:
+            The converse response
+
+        Raises:
+            ResponseCacheMissError: In replay mode, if the response is not stored
+        """
+        cache = self.cache
+        if cache.mode == PASSTHROUGH_MODE:
+            return self.client.converse(**kwargs)
+
+        model_id = kwargs.get("modelId", "")
+        key = request_key(kwargs)
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        if cache.mode == REPLAY_MODE:
+            raise ResponseCacheMissError(
+                f"No stored Bedrock response for request {key[:12]} in {cache.path}"
+            )
+
+        response = self.client.converse(**kwargs)
+        if response.get("output"):
+            cache.put(key, model_id, response)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        # Other client methods are not cached
+        return getattr(self.client, name)
+
+
+def open_response_cache(
+    path: str, mode: str = RECORD_MODE
+) -> Optional[BedrockResponseCache]:
+    """
+    Get the response cache at a path, opening it on first use.
+
+    Args:
+        path: Path to a SQLite cache file or directory
+        mode: 'record', 'replay' or 'passthrough'
+
+    Returns:
+        The cache, or None if it cannot be opened
+    """
+    with _open_caches_lock:
+        cache = _open_caches.get((path, mode))
+        if cache is None:
+            try:
+                cache = BedrockResponseCache(path, mode)
+            except (OSError, sqlite3.Error, ValueError) as e:
+                logger.warning(f"Could not open Bedrock response cache {path}: {e}")
+                return None
+            _open_caches[(path, mode)] = cache
+        return cache
+
+
+def response_cache_from_environment() -> Optional[BedrockResponseCache]:
+    """
+    Get the response cache set by the environment, if any.
+
+    Returns:
+        The cache at BEDROCK_RESPONSE_CACHE, in the BEDROCK_RESPONSE_CACHE_MODE
+        mode (default: record), or None if the variable is not set
+    """
+    path = os.environ.get(CACHE_PATH_VARIABLE)
+    if not path:
+        return None
+    return open_response_cache(path, os.environ.get(CACHE_MODE_VARIABLE, RECORD_MODE))
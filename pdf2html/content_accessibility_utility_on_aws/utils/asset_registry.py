@@ -0,0 +1,320 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Asset registry for image files produced during conversion.
+
+The registry walks an output directory once and maps image basenames and content
+hashes to their paths. Images are staged into the HTML output directories with
+hardlinks or reflinks where the filesystem allows it, falling back to a copy, and
+identical images are only ever stored once per destination directory.
+
+Registries are shared within an :func:`asset_scope`, which covers one conversion
+or remediation run, and dropped when it ends, so a long-lived process never
+reuses the index or the content hashes of an earlier run.
+"""
+
+import contextlib
+import contextvars
+import hashlib
+import os
+import shutil
+from typing import Dict, Iterator, List, Optional
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# Image file extensions tracked by the registry
+IMAGE_EXTENSIONS = (".png", ".jpg")
+
+# Extensions accepted when looking for an image with a similar name
+SIMILAR_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+
+# Linux ioctl request to clone a file's extents (reflink)
+_FICLONE = 0x40049409
+
+# Registries of the active scope, by real path of the indexed directory
+_scope_registries: contextvars.ContextVar[Optional[Dict[str, "AssetRegistry"]]] = (
+    contextvars.ContextVar("asset_registries", default=None)
+)
+
+
+@contextlib.contextmanager
+def asset_scope() -> Iterator[None]:
+    """
+    Share asset registries for the duration of one conversion or remediation run.
+
+    Also usable as a function decorator. Scopes nest: an inner scope reuses the
+    registries of the outer one.
+
+    Yields:
+        None
+    """
+    if _scope_registries.get() is not None:
+        yield
+        return
+    token = _scope_registries.set({})
+    try:
+        yield
+    finally:
+        _scope_registries.reset(token)
+
+
+def _reflink(src_path: str, dest_path: str) -> bool:
+    """
+    Clone a file with a copy-on-write reflink.
+
+    Args:
+        src_path: Source file path
+        dest_path: Destination file path, which must not exist
+
+    Returns:
+        bool: True if the reflink was created
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        with open(src_path, "rb") as src, open(dest_path, "xb") as dest:
+            try:
+                fcntl.ioctl(dest.fileno(), _FICLONE, src.fileno())
+                return True
+            except OSError:
+                pass
+        os.remove(dest_path)
+    except OSError:
+        pass
+    return False
+
+
+class AssetRegistry:
+    """
+    Index of the image files under a directory.
+
+    Use :meth:`for_directory` to share one registry per output directory within
+    an :func:`asset_scope`.
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Initialize the registry and index the directory.
+
+        Args:
+            root_dir: Directory to index
+        """
+        self.root_dir = os.path.realpath(root_dir)
+        self.by_name: Dict[str, str] = {}
+        self._hashes: Dict[str, str] = {}
+        # Destination directory -> content hash -> staged path
+        self._staged: Dict[str, Dict[str, str]] = {}
+        self.scan()
+
+    @classmethod
+    def for_directory(cls, root_dir: str) -> "AssetRegistry":
+        """
+        Get the registry for a directory, building it on first use in the scope.
+
+        Outside an :func:`asset_scope` every call indexes the directory afresh.
+
+        Args:
+            root_dir: Directory to index
+
+        Returns:
+            AssetRegistry: The registry for the directory
+        """
+        key = os.path.realpath(root_dir)
+        registries = _scope_registries.get()
+        if registries is None:
+            return cls(key)
+        registry = registries.get(key)
+        if registry is None:
+            registry = cls(key)
+            registries[key] = registry
+        return registry
+
+    @staticmethod
+    def reset(root_dir: Optional[str] = None) -> None:
+        """
+        Drop registries of the active scope so the next use re-indexes the directory.
+
+        Args:
+            root_dir: Directory whose registry to drop, or None to drop all
+        """
+        registries = _scope_registries.get()
+        if registries is None:
+            return
+        if root_dir is None:
+            registries.clear()
+        else:
+            registries.pop(os.path.realpath(root_dir), None)
+
+    def scan(self) -> None:
+        """Walk the root directory once and index all image files."""
+        self.by_name = {}
+        staged_names: Dict[str, str] = {}
+        for root, dirs, files in os.walk(self.root_dir):
+            # Copies in the HTML directories only count when no original exists
+            is_staging_dir = os.path.basename(root) in ("extracted_html", "images")
+            for file in files:
+                if not file.endswith(IMAGE_EXTENSIONS):
+                    continue
+                path = os.path.join(root, file)
+                if is_staging_dir:
+                    staged_names.setdefault(file, path)
+                else:
+                    self.by_name.setdefault(file, path)
+
+        for file, path in staged_names.items():
+            self.by_name.setdefault(file, path)
+
+        logger.debug(f"Indexed {len(self.by_name)} image files in {self.root_dir}")
+
+    def add(self, path: str) -> None:
+        """
+        Register an image file created after the registry was built.
+
+        Args:
+            path: Path to the image file
+        """
+        self.by_name.setdefault(os.path.basename(path), path)
+
+    def images(self) -> List[str]:
+        """
+        Get the paths of all indexed images.
+
+        Returns:
+            List of image file paths
+        """
+        return list(self.by_name.values())
+
+    def find(self, filename: str, allow_similar: bool = False) -> Optional[str]:
+        """
+        Find an image by basename.
+
+        Args:
+            filename: Image file name
+            allow_similar: Also accept an image with the same base name and a
+                different image extension
+
+        Returns:
+            Path to the image, or None if not found
+        """
+        path = self.by_name.get(filename)
+        if path and os.path.isfile(path):
+            return path
+
+        if allow_similar:
+            base_name = os.path.splitext(filename)[0]
+            for name, candidate in self.by_name.items():
+                if name.startswith(base_name) and name.lower().endswith(
+                    SIMILAR_IMAGE_EXTENSIONS
+                ):
+                    logger.debug(f"Found similar filename: {name} instead of {filename}")
+                    return candidate
+
+        return None
+
+    def content_hash(self, path: str) -> str:
+        """
+        Get the content hash of a file, computing it once.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            str: Hex digest of the file content
+        """
+        digest = self._hashes.get(path)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._hashes[path] = digest
+        return digest
+
+    def stage(
+        self,
+        src_path: str,
+        dest_dir: str,
+        dest_name: Optional[str] = None,
+        overwrite: bool = False,
+    ) -> Optional[str]:
+        """
+        Make an image available in a destination directory.
+
+        An image whose content is already staged in the directory is hardlinked
+        to that file. Otherwise it is hardlinked to the source, or reflinked or
+        copied when the source is on a different filesystem.
+
+        Args:
+            src_path: Path to the source image
+            dest_dir: Destination directory
+            dest_name: File name in the destination directory, defaults to the
+                source basename
+            overwrite: Replace an existing file with the same name
+
+        Returns:
+            Path to the staged file, or None if staging failed
+        """
+        dest_path = os.path.join(dest_dir, dest_name or os.path.basename(src_path))
+        try:
+            if os.path.exists(dest_path):
+                if os.path.samefile(src_path, dest_path) or not overwrite:
+                    return dest_path
+                os.remove(dest_path)
+
+            os.makedirs(dest_dir, exist_ok=True)
+            staged = self._staged.setdefault(os.path.realpath(dest_dir), {})
+            digest = self.content_hash(src_path)
+            existing = staged.get(digest)
+            if existing and os.path.exists(existing):
+                try:
+                    os.link(existing, dest_path)
+                    logger.debug(f"Linked duplicate image {dest_path} to {existing}")
+                    self.add(dest_path)
+                    return dest_path
+                except OSError:
+                    pass
+
+            try:
+                os.link(src_path, dest_path)
+            except OSError:
+                # Different filesystem
+                if not _reflink(src_path, dest_path):
+                    shutil.copy2(src_path, dest_path)
+            staged[digest] = dest_path
+            self.add(dest_path)
+            return dest_path
+        except Exception as e:
+            logger.warning(f"Failed to stage image {src_path} to {dest_path}: {e}")
+            return None
+
+    def stage_all(self, dest_dir: str, overwrite: bool = False) -> int:
+        """
+        Stage every indexed image into a destination directory.
+
+        Args:
+            dest_dir: Destination directory
+            overwrite: Replace existing files with the same name
+
+        Returns:
+            int: Number of images newly staged
+        """
+        staged_count = 0
+        for name, path in list(self.by_name.items()):
+            dest_path = os.path.join(dest_dir, name)
+            if os.path.exists(dest_path) and (
+                not overwrite or os.path.samefile(path, dest_path)
+            ):
+                continue
+            if self.stage(path, dest_dir, name, overwrite=overwrite):
+                staged_count += 1
+
+        logger.debug(f"Staged {staged_count} image files in {dest_dir}")
+        return staged_count
@@ -0,0 +1,318 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+HTML parser factory.
+
+All HTML parsing in the package goes through this module so the BeautifulSoup
+tree builder can be chosen in one place. Supported backends are:
+
+- ``html.parser``: the pure-Python standard library parser (default)
+- ``lxml``: the lxml C parser, if lxml is installed
+- ``selectolax``: the lexbor C parser, if selectolax is installed. Only used for
+  read-only passes such as the accessibility audit.
+
+The backends can be set with :func:`configure_html_parser` or the
+``DOC_ACCESS_HTML_PARSER`` and ``DOC_ACCESS_HTML_PARSER_READ_ONLY`` environment
+variables. Backends that are not installed fall back to ``html.parser``.
+
+HTML fragments that are inserted into other documents are always parsed with
+``html.parser``, because the other backends wrap fragments in ``<html>`` and
+``<body>`` elements.
+"""
+
+import os
+import re
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup, Comment, Doctype, NavigableString
+from bs4.builder import HTMLTreeBuilder
+
+from content_accessibility_utility_on_aws.utils.logging_helper import (
+    setup_logger,
+    ConfigurationError,
+)
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+PARSER_HTML = "html.parser"
+PARSER_LXML = "lxml"
+PARSER_SELECTOLAX = "selectolax"
+
+# Backends that can be used for every parse
+SUPPORTED_PARSERS = (PARSER_HTML, PARSER_LXML)
+
+# Backends that can be used for read-only parses
+SUPPORTED_READ_ONLY_PARSERS = (PARSER_HTML, PARSER_LXML, PARSER_SELECTOLAX)
+
+# Whitespace between a leading doctype and the root element
+_PROLOG_WHITESPACE = re.compile(r"\s*<!doctype[^>]*>(\s+)<", re.IGNORECASE)
+
+# Whitespace around the document structure that lexbor drops or moves
+_HTML_START_WHITESPACE = re.compile(r"<html\b[^>]*>(\s+)<head\b", re.IGNORECASE)
+_BODY_END_WHITESPACE = re.compile(r"(\s*)</body\s*>", re.IGNORECASE)
+_HTML_END_WHITESPACE = re.compile(r"</body\s*>(\s+)</html\s*>", re.IGNORECASE)
+_TRAILING_WHITESPACE = re.compile(r"</html\s*>(\s+)$", re.IGNORECASE)
+
+# Number of characters searched for the whitespace at the start or end of a document
+_BOUNDARY_SEARCH_SIZE = 4096
+
+_configured_parser: Optional[str] = None
+_configured_read_only_parser: Optional[str] = None
+_unavailable_warned = set()
+
+
+class SelectolaxTreeBuilder(HTMLTreeBuilder):
+    """
+    BeautifulSoup tree builder backed by the selectolax lexbor parser.
+
+    The document is parsed in C by lexbor and the resulting tree is replayed
+    into BeautifulSoup, so checks can keep using the BeautifulSoup API.
+    """
+
+    NAME = PARSER_SELECTOLAX
+    features = [NAME]
+
+    def prepare_markup(
+        self,
+        markup,
+        user_specified_encoding=None,
+        document_declared_encoding=None,
+        exclude_encodings=None,
+    ):
+        """Yield the markup as Unicode for :meth:`feed`."""
+        if isinstance(markup, bytes):
+            markup = markup.decode(user_specified_encoding or "utf-8", "replace")
+        yield markup, None, None, False
+
+    def feed(self, markup):
+        """Parse the markup with lexbor and replay it into the soup."""
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(markup)
+        document = tree.root.parent if tree.root is not None else None
+        if document is not None:
+            # lexbor inserts <tbody> into tables as the HTML5 spec requires;
+            # html.parser does not, so drop it when the markup has none
+            self._replay(
+                document.child,
+                skip_tbody="<tbody" not in markup.lower(),
+                whitespace=self._structure_whitespace(markup),
+            )
+
+    @staticmethod
+    def _structure_whitespace(markup):
+        """
+        Find the whitespace around <head>, </body> and </html> in the markup.
+
+        As the HTML5 spec requires, lexbor drops the whitespace after <html>
+        and around </html> or moves it into <body>, while html.parser keeps it
+        where it is, so it is put back to serialize documents the same way.
+
+        Returns:
+            Dict with the whitespace after <html> (``html_start``), before
+            </body> (``body_end``), before </html> (``html_end``) and after
+            </html> (``trailing``). Keys are missing where the markup has no
+            such tags.
+        """
+        head = markup[:_BOUNDARY_SEARCH_SIZE]
+        tail = markup[-_BOUNDARY_SEARCH_SIZE:]
+        found = {}
+        for name, pattern, text in (
+            ("html_start", _HTML_START_WHITESPACE, head),
+            ("body_end", _BODY_END_WHITESPACE, tail),
+            ("html_end", _HTML_END_WHITESPACE, tail),
+            ("trailing", _TRAILING_WHITESPACE, tail),
+        ):
+            match = pattern.search(text)
+            if match:
+                found[name] = match.group(1)
+        return found
+
+    def _replay(self, node, skip_tbody=False, whitespace=None):
+        """Replay a lexbor node and its following siblings into the soup."""
+        soup = self.soup
+        whitespace = whitespace or {}
+        # Stack of (node, emitted) pairs whose end tag is still pending
+        stack = []
+        while node is not None or stack:
+            if node is None:
+                parent, emitted = stack.pop()
+                if emitted:
+                    if parent.tag == "html" and whitespace.get("html_end"):
+                        soup.handle_data(whitespace["html_end"])
+                    soup.endData()
+                    soup.handle_endtag(parent.tag)
+                    if parent.tag == "html" and whitespace.get("trailing"):
+                        soup.handle_data(whitespace["trailing"])
+                node = parent.next
+                continue
+
+            tag = node.tag
+            if tag == "-text":
+                text = node.text_content or ""
+                if (
+                    node.next is None
+                    and stack
+                    and stack[-1][0].tag == "body"
+                    and "body_end" in whitespace
+                ):
+                    # The trailing whitespace of the body may include whitespace
+                    # lexbor moved there from after </body>
+                    text = text.rstrip() + whitespace["body_end"]
+                if text:
+                    soup.handle_data(text)
+            elif tag == "-comment":
+                soup.endData()
+                soup.handle_data(node.html[4:-3])
+                soup.endData(Comment)
+            elif tag == "-doctype":
+                soup.endData()
+                soup.handle_data(node.html[2:-1].replace("DOCTYPE ", "", 1))
+                soup.endData(Doctype)
+            elif not tag.startswith(("-", "_", "!")):
+                attrs = {
+                    name: "" if value is None else value
+                    for name, value in node.attributes.items()
+                }
+                emitted = not (skip_tbody and tag == "tbody")
+                if emitted:
+                    soup.handle_starttag(tag, None, None, attrs)
+                    if tag == "html" and whitespace.get("html_start"):
+                        soup.handle_data(whitespace["html_start"])
+                stack.append((node, emitted))
+                node = node.child
+                continue
+
+            node = node.next
+
+
+def _backend_available(backend: str) -> bool:
+    """Check whether the library behind a backend is installed."""
+    module_name = {PARSER_LXML: "lxml", PARSER_SELECTOLAX: "selectolax"}.get(backend)
+    if module_name is None:
+        return True
+    try:
+        __import__(module_name)
+        return True
+    except ImportError:
+        if backend not in _unavailable_warned:
+            _unavailable_warned.add(backend)
+            logger.warning(
+                f"HTML parser backend '{backend}' is not installed, using '{PARSER_HTML}'"
+            )
+        return False
+
+
+def _validate_backend(backend: str, read_only: bool) -> str:
+    """Validate a backend name."""
+    supported = SUPPORTED_READ_ONLY_PARSERS if read_only else SUPPORTED_PARSERS
+    if backend not in supported:
+        raise ConfigurationError(
+            f"Unsupported HTML parser '{backend}'. Supported parsers: {', '.join(supported)}"
+        )
+    return backend
+
+
+def configure_html_parser(
+    backend: Optional[str] = None, read_only_backend: Optional[str] = None
+) -> None:
+    """
+    Set the HTML parser backends.
+
+    Args:
+        backend: Backend used for all parses, or None to keep the current setting
+        read_only_backend: Backend used for read-only parses, or None to keep the
+            current setting. Defaults to ``backend`` when never set.
+
+    Raises:
+        ConfigurationError: If a backend name is not supported
+    """
+    global _configured_parser, _configured_read_only_parser
+    if backend is not None:
+        _configured_parser = _validate_backend(backend, read_only=False)
+    if read_only_backend is not None:
+        _configured_read_only_parser = _validate_backend(
+            read_only_backend, read_only=True
+        )
+
+
+def get_html_parser(read_only: bool = False) -> str:
+    """
+    Get the name of the HTML parser backend in effect.
+
+    Args:
+        read_only: Whether the parse is for a read-only pass
+
+    Returns:
+        str: The backend name, after falling back for missing libraries
+    """
+    backend = _configured_parser or _validate_backend(
+        os.environ.get("DOC_ACCESS_HTML_PARSER", PARSER_HTML), read_only=False
+    )
+    if read_only:
+        backend = (
+            _configured_read_only_parser
+            or _validate_backend(
+                os.environ.get("DOC_ACCESS_HTML_PARSER_READ_ONLY", backend),
+                read_only=True,
+            )
+        )
+
+    return backend if _backend_available(backend) else PARSER_HTML
+
+
+def parse_html(markup: Union[str, bytes], read_only: bool = False) -> BeautifulSoup:
+    """
+    Parse an HTML document with the configured backend.
+
+    Args:
+        markup: The HTML document
+        read_only: Whether the tree is only read, never modified or serialized
+            back to a file. Read-only parses may use a faster backend.
+
+    Returns:
+        BeautifulSoup: The parsed document
+    """
+    backend = get_html_parser(read_only)
+    if backend == PARSER_SELECTOLAX:
+        soup = BeautifulSoup(markup, builder=SelectolaxTreeBuilder())
+    else:
+        soup = BeautifulSoup(markup, backend)
+    if backend != PARSER_HTML:
+        _restore_prolog_whitespace(soup, markup)
+    return soup
+
+
+def _restore_prolog_whitespace(soup: BeautifulSoup, markup: Union[str, bytes]) -> None:
+    """
+    Put back the whitespace after the doctype, which lxml and lexbor drop.
+
+    html.parser keeps it as a text node, so without it the two backends would
+    serialize the same document differently.
+    """
+    if not soup.contents or not isinstance(soup.contents[0], Doctype):
+        return
+    following = soup.contents[0].next_sibling
+    if isinstance(following, NavigableString) and not following.strip():
+        return
+    head = markup[:1024]
+    if isinstance(head, bytes):
+        head = head.decode("latin-1")
+    match = _PROLOG_WHITESPACE.match(head)
+    if match:
+        soup.contents[0].insert_after(NavigableString(match.group(1)))
+
+
+def parse_html_fragment(markup: Union[str, bytes]) -> BeautifulSoup:
+    """
+    Parse an HTML fragment without adding document wrapper elements.
+
+    Args:
+        markup: The HTML fragment
+
+    Returns:
+        BeautifulSoup: The parsed fragment
+    """
+    return BeautifulSoup(markup, PARSER_HTML)
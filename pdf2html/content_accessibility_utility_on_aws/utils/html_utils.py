@@ -6,42 +6,138 @@ HTML utility functions for document accessibility.
 """
 
 import os
-from typing import List
-from bs4 import BeautifulSoup
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+from bs4 import Comment
+
+from content_accessibility_utility_on_aws.utils.html_parser import parse_html
+from content_accessibility_utility_on_aws.utils.path_utils import sort_html_files_by_page
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def combine_html_files(html_files: List[str], output_path: str) -> str:
+# Style added to combined documents for page containers and breaks
+_COMBINED_PAGE_STYLE = """
+        .page-break {
+            page-break-after: always;
+            margin-bottom: 30px;
+            border-bottom: 1px dashed #ccc;
+            padding-bottom: 30px;
+        }
+        .page-container {
+            margin-bottom: 2em;
+        }
+        .page-title {
+            margin-top: 1em;
+            padding-top: 1em;
+            border-top: 1px solid #eee;
+            font-size: 1.5em;
+            color: #333;
+        }
     """
-    Combine multiple HTML files into a single HTML file.
 
-    Args:
-        html_files: List of paths to HTML files to combine
-        output_path: Path to save the combined HTML file
+# Placeholder marking where page content goes in a combined document template
+_PAGES_PLACEHOLDER = "combined-document-pages"
 
-    Returns:
-        Path to the combined HTML file
+
+class StreamedHTMLDocument:
     """
-    if not html_files:
-        raise ValueError("No HTML files provided to combine")
+    Writer for an HTML document assembled from page sections.
 
-    # Sort the HTML files by name to ensure correct order
-    html_files.sort()
+    Sections are spooled to a temporary file as they are added, so only one
+    section is held in memory at a time. The navigation entries collected for
+    the sections are written ahead of them when the document is finished.
+    """
+
+    def __init__(self, output_path: str, separator: str = ""):
+        """
+        Initialize the writer.
+
+        Args:
+            output_path: Path of the HTML file to write
+            separator: Markup written between consecutive sections
+        """
+        self.output_path = output_path
+        self.separator = separator
+        self.section_count = 0
+        self._nav_entries: List[str] = []
+
+        output_dir = os.path.dirname(output_path) or "."
+        os.makedirs(output_dir, exist_ok=True)
+        self._spool = tempfile.TemporaryFile(
+            mode="w+", encoding="utf-8", dir=output_dir
+        )
 
-    # Get the first HTML file to use as a template
-    with open(html_files[0], "r", encoding="utf-8") as f:
-        first_page_content = f.read()
+    def add_section(self, section_html: str, nav_entry: Optional[str] = None) -> None:
+        """
+        Append a section to the document body.
+
+        Args:
+            section_html: Markup of the section
+            nav_entry: Optional navigation entry for the section
+        """
+        if self.section_count:
+            self._spool.write(self.separator)
+        self._spool.write(section_html)
+        self.section_count += 1
+        if nav_entry is not None:
+            self._nav_entries.append(nav_entry)
+
+    def finish(
+        self, prefix: str, suffix: str, nav_start: str = "", nav_end: str = ""
+    ) -> str:
+        """
+        Write the document and release the spooled sections.
+
+        Args:
+            prefix: Markup before the navigation and sections
+            suffix: Markup after the sections
+            nav_start: Markup before the navigation entries
+            nav_end: Markup after the navigation entries
+
+        Returns:
+            Path to the written HTML file
+        """
+        try:
+            with open(self.output_path, "w", encoding="utf-8") as f:
+                f.write(prefix)
+                f.write(nav_start)
+                f.writelines(self._nav_entries)
+                f.write(nav_end)
+                self._spool.seek(0)
+                shutil.copyfileobj(self._spool, f)
+                f.write(suffix)
+        finally:
+            self.close()
+        return self.output_path
+
+    def close(self) -> None:
+        """Discard the spooled sections."""
+        self._spool.close()
+        self._nav_entries = []
+
+
+def _combined_document_template(first_page_content: str) -> Tuple[str, str]:
+    """
+    Build the markup around the pages of a combined document.
 
+    Args:
+        first_page_content: HTML of the first page, used as the template
+
+    Returns:
+        Tuple of the markup before and after the page content
+    """
     # Parse the HTML
-    combined_soup = BeautifulSoup(first_page_content, "html.parser")
+    combined_soup = parse_html(first_page_content)
 
     # Make sure we have a proper HTML structure
     if not combined_soup.html:
-        combined_soup = BeautifulSoup(
-            '<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8"><title>Combined Document</title></head><body></body></html>',
-            "html.parser",
+        combined_soup = parse_html(
+            '<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8"><title>Combined Document</title></head><body></body></html>'
         )
 
     # Update the title
@@ -62,79 +158,90 @@ def combine_html_files(html_files: List[str], output_path: str) -> str:
         body = combined_soup.new_tag("body")
         combined_soup.html.append(body)
 
-    # Clear the body content from the template
+    # Clear the body content from the template and mark where pages go
     body.clear()
+    body.append(Comment(_PAGES_PLACEHOLDER))
 
     # Add a style tag for page breaks
     style_tag = combined_soup.new_tag("style")
-    style_tag.string = """
-        .page-break {
-            page-break-after: always;
-            margin-bottom: 30px;
-            border-bottom: 1px dashed #ccc;
-            padding-bottom: 30px;
-        }
-        .page-container {
-            margin-bottom: 2em;
-        }
-        .page-title {
-            margin-top: 1em;
-            padding-top: 1em;
-            border-top: 1px solid #eee;
-            font-size: 1.5em;
-            color: #333;
-        }
-    """
+    style_tag.string = _COMBINED_PAGE_STYLE
     combined_soup.head.append(style_tag)
 
-    # Process each HTML file
-    for i, html_file in enumerate(html_files):
-        try:
-            with open(html_file, "r", encoding="utf-8") as f:
-                page_content = f.read()
-
-            # Parse the HTML
-            page_soup = BeautifulSoup(page_content, "html.parser")
-
-            # Create a container for this page
-            page_div = combined_soup.new_tag("div")
-            page_div["class"] = "page-container"
-            page_div["id"] = f"page-{i+1}"
-
-            # Add a page title
-            page_title = combined_soup.new_tag("h2")
-            page_title["class"] = "page-title"
-            page_title.string = f"Page {i+1}"
-            page_div.append(page_title)
-
-            # Extract all content from the body
-            if page_soup.body:
-                # Get all direct children of the body
-                for element in page_soup.body.children:
-                    # Skip empty elements and whitespace
-                    if element.name is not None:
-                        # Clone the element to avoid modifying the original
-                        cloned = element.extract()
-                        page_div.append(cloned)
+    prefix, suffix = str(combined_soup).split(f"<!--{_PAGES_PLACEHOLDER}-->", 1)
+    return prefix, suffix
 
-            # Add the page to the combined document
-            body.append(page_div)
 
-            # Add a page break after each page except the last one
-            if i < len(html_files) - 1:
-                page_break = combined_soup.new_tag("div")
-                page_break["class"] = "page-break"
-                body.append(page_break)
+def combine_html_files(
+    html_files: List[str], output_path: str, page_store: Optional[PageStore] = None
+) -> str:
+    """
+    Combine multiple HTML files into a single HTML file.
 
-            logger.debug(f"Added page {i+1} from {html_file}")
+    Pages are combined in page-number order and streamed to the output file
+    one at a time, so only one page is parsed in memory at once.
 
-        except Exception as e:
-            logger.error(f"Error processing HTML file {html_file}: {e}")
+    Args:
+        html_files: List of paths to HTML files to combine
+        output_path: Path to save the combined HTML file
+        page_store: Optional store holding pages that were already read. Pages
+            are removed from it once combined.
+
+    Returns:
+        Path to the combined HTML file
+    """
+    if not html_files:
+        raise ValueError("No HTML files provided to combine")
+
+    # Sort the HTML files by page number to ensure correct order
+    html_files = sort_html_files_by_page(html_files)
+
+    if page_store is None:
+        page_store = PageStore()
+
+    # Get the first HTML file to use as a template; it stays in the store
+    # until it is combined, so it is read once
+    prefix, suffix = _combined_document_template(page_store.read(html_files[0]))
+
+    document = StreamedHTMLDocument(output_path, separator='<div class="page-break"></div>')
+    try:
+        # Process each HTML file
+        for i, html_file in enumerate(html_files):
+            try:
+                page_soup = parse_html(page_store.take(html_file))
+
+                # Create a container for this page
+                page_div = page_soup.new_tag("div")
+                page_div["class"] = "page-container"
+                page_div["id"] = f"page-{i+1}"
+
+                # Add a page title
+                page_title = page_soup.new_tag("h2")
+                page_title["class"] = "page-title"
+                page_title.string = f"Page {i+1}"
+                page_div.append(page_title)
+
+                # Extract all content from the body
+                if page_soup.body:
+                    # Skip empty elements and whitespace. The children are
+                    # listed first, because extracting them while iterating
+                    # skips the sibling after each extracted element.
+                    for element in [
+                        child for child in page_soup.body.children if child.name is not None
+                    ]:
+                        page_div.append(element.extract())
+
+            except Exception as e:
+                logger.error(f"Error processing HTML file {html_file}: {e}")
+                continue
+
+            # Add the page to the combined document
+            document.add_section(str(page_div))
+            logger.debug(f"Added page {i+1} from {html_file}")
 
-    # Write the combined HTML to the output file
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(str(combined_soup))
+        # Write the combined HTML to the output file
+        document.finish(prefix, suffix)
+    finally:
+        document.close()
 
     logger.info(
         f"Created combined HTML file with {len(html_files)} pages at {output_path}"
@@ -9,11 +9,11 @@ finding, copying, and updating image references.
 """
 
 import os
-import shutil
 from typing import List, Optional
 from bs4 import BeautifulSoup
 from PIL import Image
 
+from content_accessibility_utility_on_aws.utils.asset_registry import AssetRegistry
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 
 # Set up module-level logger
@@ -291,6 +291,7 @@ def copy_images_to_output(
 
     # Find all images in the HTML
     images = find_images_in_html(html_soup)
+    registry = AssetRegistry.for_directory(os.path.dirname(os.path.abspath(src_dir)))
 
     copied_count = 0
     not_found_count = 0
@@ -317,14 +318,18 @@ def copy_images_to_output(
                 path_mapping[filename] = rel_path
                 continue
 
-            # Try to find the image file
-            src_path = resolve_image_path(filename, [src_dir, os.path.dirname(src_dir)])
+            # Try to find the image file, using the asset index instead of walking
+            # the directory tree for every image
+            src_path = os.path.join(src_dir, filename)
+            if not os.path.isfile(src_path):
+                src_path = registry.find(filename, allow_similar=True)
 
             if src_path:
                 try:
-                    logger.debug(f"Copying image from {src_path} to {dest_path}")
-                    shutil.copy2(src_path, dest_path)
-                    logger.debug(f"Successfully copied image: {filename}")
+                    logger.debug(f"Staging image from {src_path} to {dest_path}")
+                    if not registry.stage(src_path, dest_dir, os.path.basename(src_path)):
+                        raise IOError(f"Could not stage {src_path}")
+                    logger.debug(f"Successfully staged image: {filename}")
                     copied_count += 1
 
                     # Check if we're using a different filename due to similarity
@@ -0,0 +1,252 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Streaming reports in JSON Lines format.
+
+A JSONL report holds one JSON record per line::
+
+    {"record": "header", "data": {"report_type": "accessibility", ...}}
+    {"record": "issue", "data": {...}}
+    {"record": "issue", "data": {...}}
+    {"record": "summary", "data": {"summary": {...}, ...}}
+
+The header is written first, then one record per issue (or per file result and
+remediation detail), as they become available, and a summary record last. The
+groupings of issues by page and by status of the JSON report are not repeated;
+readers regroup the issue records instead. Since every line is a complete
+record, a report can be read incrementally, including while it is written.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+from content_accessibility_utility_on_aws.utils.report_generator import json_ready
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# Bump when the layout of the records changes
+JSONL_FORMAT_VERSION = 1
+
+HEADER_RECORD = "header"
+SUMMARY_RECORD = "summary"
+
+# Report fields written as one record per item, with the record kind of the items
+RECORD_FIELDS = {
+    "issues": "issue",
+    "details": "detail",
+    "file_results": "file_result",
+}
+
+# Report fields that only regroup the issue records
+GROUPING_FIELDS = ("by_page", "by_status")
+
+
+class JSONLReportWriter:
+    """Writer of a JSONL report, usable as a context manager."""
+
+    def __init__(self, output_path: str, report_type: str = "accessibility"):
+        """
+        Create the report file.
+
+        Args:
+            output_path: Path where the report will be saved
+            report_type: Type of report ('accessibility', 'remediation', or 'unified')
+        """
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        self.output_path = output_path
+        self.report_type = report_type
+        self.records = 0
+        self._file = open(output_path, "w", encoding="utf-8")
+
+    def __enter__(self) -> "JSONLReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write_record(self, kind: str, data: Any) -> None:
+        """
+        Write one record.
+
+        Args:
+            kind: Record kind, such as 'issue'
+            data: Record data
+        """
+        record = {"record": kind, "data": json_ready(data)}
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+        self.records += 1
+
+    def write_header(self, **fields: Any) -> None:
+        """
+        Write the header record.
+
+        Args:
+            **fields: Report fields known before any record, such as html_path
+        """
+        self.write_record(
+            HEADER_RECORD,
+            {
+                "report_type": self.report_type,
+                "format_version": JSONL_FORMAT_VERSION,
+                **fields,
+            },
+        )
+        self._file.flush()
+
+    def write_issues(
+        self, issues: Iterable[Dict[str, Any]], kind: str = "issue"
+    ) -> None:
+        """
+        Write one record per issue and flush them to the file.
+
+        Args:
+            issues: Issues, file results or remediation details
+            kind: Record kind of the items
+        """
+        for issue in issues:
+            self.write_record(kind, issue)
+        self._file.flush()
+
+    def write_summary(self, report_data: Dict[str, Any]) -> None:
+        """
+        Write the summary record from a complete report.
+
+        Record fields and issue groupings are left out, as they are already
+        written as records.
+
+        Args:
+            report_data: The report data
+        """
+        fields = {
+            key: value
+            for key, value in report_data.items()
+            if key not in RECORD_FIELDS
+            and key not in GROUPING_FIELDS
+            and value is not report_data
+        }
+        self.write_record(SUMMARY_RECORD, fields)
+
+    def close(self) -> None:
+        """Close the report file."""
+        if not self._file.closed:
+            self._file.close()
+            logger.debug(f"Wrote {self.records} records to {self.output_path}")
+
+
+def write_jsonl_report(
+    report_data: Dict[str, Any], output_path: str, report_type: str
+) -> None:
+    """
+    Write a complete report in JSONL format.
+
+    Args:
+        report_data: Dictionary containing the report data
+        output_path: Path where the report will be saved
+        report_type: Type of report ('accessibility', 'remediation', or 'unified')
+    """
+    with JSONLReportWriter(output_path, report_type) as writer:
+        writer.write_header()
+        for field, kind in RECORD_FIELDS.items():
+            items = report_data.get(field)
+            if isinstance(items, list):
+                writer.write_issues(items, kind)
+        writer.write_summary(report_data)
+
+
+def iter_jsonl_report(path: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Read the records of a JSONL report lazily.
+
+    Args:
+        path: Path to the report
+
+    Yields:
+        Tuples of (record kind, record data)
+
+    Raises:
+        ValueError: If a line is not a report record
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield record["record"], record.get("data")
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(
+                    f"Invalid record on line {line_number} of {path}: {e}"
+                ) from e
+
+
+def read_jsonl_report(
+    path: str, record_filter: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Read a JSONL report into the layout of a JSON report.
+
+    Header and summary fields become top-level fields, and the records of each
+    kind are collected into the matching list ('issues', 'details',
+    'file_results').
+
+    Args:
+        path: Path to the report
+        record_filter: Only keep records whose data has these field values,
+            for example {"remediation_status": "needs_remediation"}
+
+    Returns:
+        The report data
+    """
+    fields_by_kind = {kind: field for field, kind in RECORD_FIELDS.items()}
+    report: Dict[str, Any] = {"issues": []}
+    for kind, data in iter_jsonl_report(path):
+        if kind in (HEADER_RECORD, SUMMARY_RECORD):
+            report.update(data or {})
+            continue
+
+        field = fields_by_kind.get(kind)
+        if field is None:
+            logger.debug(f"Skipping unknown {kind} record in {path}")
+            continue
+        if record_filter and not all(
+            isinstance(data, dict) and data.get(key) == value
+            for key, value in record_filter.items()
+        ):
+            continue
+        report.setdefault(field, []).append(data)
+    return report
+
+
+def read_remediable_issues(path: str) -> Dict[str, Any]:
+    """
+    Read the input of remediation from a JSONL audit report.
+
+    Unlike read_jsonl_report, the records are consumed as they are read: only
+    the issues that need remediation and the summary are kept.
+
+    Args:
+        path: Path to the audit report
+
+    Returns:
+        Dictionary with the 'issues' that need remediation and the 'summary'
+    """
+    issues = []
+    summary: Dict[str, Any] = {}
+    for kind, data in iter_jsonl_report(path):
+        if kind == "issue":
+            if (
+                isinstance(data, dict)
+                and data.get("remediation_status") == "needs_remediation"
+            ):
+                issues.append(data)
+        elif kind == SUMMARY_RECORD:
+            summary = (data or {}).get("summary", {})
+    return {"issues": issues, "summary": summary}
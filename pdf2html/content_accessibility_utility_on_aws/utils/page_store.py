@@ -0,0 +1,127 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+In-memory store of the HTML of the pages of a document.
+
+The audit and the remediation of a document both need the HTML of every page.
+Sharing a PageStore between them hands each page read by the audit over to the
+remediation, which then does not read it from disk again, and lets the
+remediation keep remediated pages in memory for the combined document. Pages
+are kept as their HTML text rather than as parsed trees: the audit may parse
+pages with a read-only backend or in worker processes, and text is much smaller
+than a tree, so a store of every page of a large document stays affordable.
+
+The handoff is of text only. In a process run each page is read once and
+parsed twice: by the audit, with the read-only backend, and by the
+remediation, which needs a mutable tree. The remediation strategies find the
+elements of issues in their own tree; the element ordinals recorded by the
+audit are not used, as they depend on the backend that built the tree.
+
+Pages are keyed by absolute path. A store is not thread-safe.
+"""
+
+import os
+from typing import Dict, Optional
+
+
+class PageStore:
+    """HTML of page files, read from disk at most once."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._pages: Dict[str, str] = {}
+        self.reads = 0
+        self.hits = 0
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
+
+    def _read_file(self, path: str) -> str:
+        """Read a page file from disk."""
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        self.reads += 1
+        return content
+
+    def read(self, path: str) -> str:
+        """
+        Get the HTML of a page, reading it from disk and keeping it if needed.
+
+        Args:
+            path: Path to the page file
+
+        Returns:
+            str: The HTML of the page
+
+        Raises:
+            OSError: If the page is not in the store and cannot be read
+        """
+        key = self._key(path)
+        content = self._pages.get(key)
+        if content is not None:
+            self.hits += 1
+            return content
+        content = self._read_file(path)
+        self._pages[key] = content
+        return content
+
+    def take(self, path: str) -> str:
+        """
+        Get the HTML of a page and remove it from the store.
+
+        Used by the last reader of a page, so the page is not kept in memory
+        after it is processed.
+
+        Args:
+            path: Path to the page file
+
+        Returns:
+            str: The HTML of the page
+
+        Raises:
+            OSError: If the page is not in the store and cannot be read
+        """
+        content = self._pages.pop(self._key(path), None)
+        if content is not None:
+            self.hits += 1
+            return content
+        return self._read_file(path)
+
+    def get(self, path: str) -> Optional[str]:
+        """
+        Get the HTML of a page if it is in the store, without reading it.
+
+        Args:
+            path: Path to the page file
+
+        Returns:
+            The HTML of the page, or None if it is not in the store
+        """
+        return self._pages.get(self._key(path))
+
+    def put(self, path: str, content: str) -> None:
+        """
+        Keep the HTML of a page, for example a page that was just written.
+
+        Args:
+            path: Path to the page file
+            content: HTML of the page
+        """
+        self._pages[self._key(path)] = content
+
+    def discard(self, path: str) -> None:
+        """
+        Remove a page from the store, if it is there.
+
+        Args:
+            path: Path to the page file
+        """
+        self._pages.pop(self._key(path), None)
+
+    def __contains__(self, path: str) -> bool:
+        return self._key(path) in self._pages
+
+    def __len__(self) -> int:
+        return len(self._pages)
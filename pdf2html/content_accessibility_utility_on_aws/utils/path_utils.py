@@ -16,6 +16,9 @@ from content_accessibility_utility_on_aws.utils.logging_helper import setup_logg
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Page number in the file name of a page of a multi-page document
+PAGE_FILE_PATTERN = re.compile(r"page[_-]?(\d+)\.html$", re.IGNORECASE)
+
 
 def ensure_directory(path: str) -> str:
     """
@@ -132,7 +135,7 @@ def sort_html_files_by_page(html_files: List[str]) -> List[str]:
         filename = os.path.basename(html_file)
 
         # Try to extract page number from filename using various patterns
-        match = re.search(r"page[_-]?(\d+)\.html$", filename, re.IGNORECASE)
+        match = PAGE_FILE_PATTERN.search(filename)
         if match:
             try:
                 page_num = int(match.group(1))
@@ -149,68 +152,169 @@ def sort_html_files_by_page(html_files: List[str]) -> List[str]:
     return [f for _, f in sorted_files]
 
 
+def page_number_from_file_name(file_name: str) -> Optional[int]:
+    """
+    Get the page number of a page file from its name, such as page-12.html.
+
+    Args:
+        file_name: Name or path of the HTML file
+
+    Returns:
+        The page number, or None if the name has none
+    """
+    match = PAGE_FILE_PATTERN.search(os.path.basename(file_name))
+    return int(match.group(1)) if match else None
+
+
+def issue_location(issue: Dict[str, Any]) -> Tuple[str, str, Optional[Any]]:
+    """
+    Get the file path, file name and page number of an issue.
+
+    Fields at the root of the issue take precedence over those of its location.
+
+    Args:
+        issue: An accessibility issue
+
+    Returns:
+        Tuple of (file path, file name, page number), empty or None if unknown
+    """
+    issue_path = issue.get("file_path", "")
+    issue_file_name = issue.get("file_name", "")
+    issue_page_number = issue.get("page_number")
+
+    location = issue.get("location")
+    if location:
+        if not issue_path:
+            issue_path = location.get("file_path", "")
+        if not issue_file_name:
+            issue_file_name = location.get("file_name", "")
+        if issue_page_number is None:
+            issue_page_number = location.get("page_number")
+    return issue_path, issue_file_name, issue_page_number
+
+
+class IssueFileIndex:
+    """
+    Assignment of the issues of an audit report to the files of a document.
+
+    The files are indexed once by absolute path, file name and page number, so
+    each issue is assigned by a few lookups instead of being compared with every
+    file. An issue belongs to every file that:
+
+    - has the issue's file path (as given, by file name, or absolute path);
+    - has the issue's file name;
+    - has the issue's page number in its name (page-N.html).
+
+    Issues without any location go to the first file.
+    """
+
+    def __init__(
+        self,
+        issues: List[Dict[str, Any]],
+        html_files: List[str],
+        status: Optional[str] = "needs_remediation",
+    ):
+        """
+        Index the issues.
+
+        Args:
+            issues: Issues of the audit report
+            html_files: HTML files of the document, the first one receiving the
+                issues without location
+            status: Only index issues with this remediation status, or None for
+                all issues
+        """
+        self.html_files = list(html_files)
+        self._issues_by_file: Dict[str, List[Dict[str, Any]]] = {
+            html_file: [] for html_file in self.html_files
+        }
+
+        files_by_path: Dict[str, List[str]] = {}
+        files_by_name: Dict[str, List[str]] = {}
+        files_by_page: Dict[int, List[str]] = {}
+        for html_file in self.html_files:
+            files_by_path.setdefault(os.path.abspath(html_file), []).append(html_file)
+            files_by_name.setdefault(os.path.basename(html_file), []).append(html_file)
+            page_number = page_number_from_file_name(html_file)
+            if page_number is not None:
+                files_by_page.setdefault(page_number, []).append(html_file)
+
+        for issue in issues:
+            if status is not None and issue.get("remediation_status") != status:
+                continue
+
+            issue_path, issue_file_name, issue_page_number = issue_location(issue)
+            if not issue_path and not issue_file_name and issue_page_number is None:
+                if self.html_files:
+                    self._issues_by_file[self.html_files[0]].append(issue)
+                continue
+
+            matched: List[str] = []
+            if issue_path:
+                matched += files_by_name.get(os.path.basename(issue_path), ())
+                matched += files_by_path.get(os.path.abspath(issue_path), ())
+            if issue_file_name:
+                matched += files_by_name.get(issue_file_name, ())
+            if issue_page_number is not None:
+                try:
+                    matched += files_by_page.get(issue_page_number, ())
+                except TypeError:
+                    # Unhashable page number, which matches no file
+                    pass
+
+            for html_file in dict.fromkeys(matched):
+                self._issues_by_file[html_file].append(issue)
+
+    def issues_for(self, html_file: str) -> List[Dict[str, Any]]:
+        """
+        Get the issues of a file, in report order.
+
+        Args:
+            html_file: One of the indexed HTML files
+
+        Returns:
+            List of issues that match this HTML file
+        """
+        return self._issues_by_file.get(html_file, [])
+
+
 def match_issues_to_file(
     issues: List[Dict[str, Any]],
     html_file: str,
     html_files: Optional[List[str]] = None,
     base_dir: Optional[str] = None,
+    index: Optional[IssueFileIndex] = None,
 ) -> List[Dict[str, Any]]:
     """
     Match accessibility issues to a specific HTML file.
 
+    When matching issues to several files of a document, build an
+    IssueFileIndex once and pass it, instead of matching every issue again for
+    each file.
+
     Args:
         issues: List of accessibility issues
         html_file: Path to the HTML file to match issues against
         html_files: Optional list of all HTML files (to determine if this is the first file)
         base_dir: Optional base directory for resolving relative paths
+        index: Optional index of the issues over html_files
 
     Returns:
         List of issues that match this HTML file
     """
-    file_issues = []
-
-    # Process each issue to see if it belongs to this file
-    for issue in issues:
-        if issue.get("remediation_status") != "needs_remediation":
-            continue
-
-        # Try multiple places where the path might be stored
-        issue_path = issue.get("file_path", "")
-        if not issue_path and "location" in issue and issue["location"]:
-            issue_path = issue["location"].get("file_path", "")
-
-        # If no file path in issue, try to match by page number
-        if not issue_path and "location" in issue and issue["location"]:
-            page_num = issue["location"].get("page_number")
-            if page_num is not None:
-                # Try to extract page number from filename
-                match = re.search(
-                    r"page[_-]?(\d+)\.html$", os.path.basename(html_file), re.IGNORECASE
-                )
-                if match and int(match.group(1)) == page_num:
-                    # Match by page number
-                    file_issues.append(issue)
-                    continue
-
-        # If there is a file path, try different matching approaches
-        if issue_path:
-            if (
-                issue_path == html_file
-                or os.path.basename(issue_path) == os.path.basename(html_file)
-                or os.path.abspath(issue_path) == os.path.abspath(html_file)
-            ):
-                file_issues.append(issue)
-                continue
-
-        # If no file_path found and this is the first HTML file,
-        # assign all issues with no file path to it
-        if not issue_path and html_files and html_file == html_files[0]:
-            file_issues.append(issue)
+    if index is None:
+        files = list(html_files or [])
+        if html_file not in files:
+            files.append(html_file)
+        index = IssueFileIndex(issues, files)
+    file_issues = index.issues_for(html_file)
 
     logger.debug(
         f"Matched {len(file_issues)} issues to file: {os.path.basename(html_file)}"
     )
     return file_issues
+
+
 def zip_output_files(output_files, zip_filename):
     """
     Zip specific output files and folders into a single zip file.
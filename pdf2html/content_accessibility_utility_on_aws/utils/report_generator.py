@@ -10,6 +10,7 @@ including a unified report that combines audit and remediation data.
 
 import os
 import json
+from itertools import islice
 from typing import Dict, Any
 
 from flask import Flask, render_template
@@ -20,6 +21,14 @@ from content_accessibility_utility_on_aws.utils.logging_helper import setup_logg
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Keys skipped when serializing, as they might cause circular references
+SKIPPED_KEYS = frozenset(
+    ("parent", "children", "_parent", "_children", "references", "_references")
+)
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+_EXACT_SCALAR_TYPES = frozenset(_SCALAR_TYPES)
+
 
 def generate_report(
     report_data: Dict[str, Any],
@@ -33,7 +42,8 @@ def generate_report(
     Args:
         report_data: Dictionary containing the report data
         output_path: Path where the report will be saved
-        report_format: Type of report to generate ('html', 'json', 'text', or 'csv')
+        report_format: Type of report to generate ('html', 'json', 'jsonl', 'text',
+            or 'csv')
         report_type: Type of report ('accessibility', 'remediation', or 'unified')
 
     Returns:
@@ -66,6 +76,8 @@ def generate_report(
     # Generate the report based on the format
     if report_format == "json":
         return generate_json_report(report_data, output_path)
+    elif report_format == "jsonl":
+        return generate_jsonl_report(report_data, output_path, report_type)
     elif report_format == "html":
         return generate_html_report(report_data, output_path, report_type)
     elif report_format == "text":
@@ -92,8 +104,8 @@ def generate_json_report(
         The report data
     """
     try:
-        # Create a serializable copy of the data
-        serializable_data = prepare_for_json_serialization(report_data)
+        # Get a serializable version of the data
+        serializable_data = json_ready(report_data)
 
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(serializable_data, f, indent=2)
@@ -110,6 +122,143 @@ def generate_json_report(
         return report_data
 
 
+def generate_jsonl_report(
+    report_data: Dict[str, Any], output_path: str, report_type: str
+) -> Dict[str, Any]:
+    """
+    Generate a JSONL report, with one record per line.
+
+    Args:
+        report_data: Dictionary containing the report data
+        output_path: Path where the report will be saved
+        report_type: Type of report ('accessibility', 'remediation', or 'unified')
+
+    If the JSONL report cannot be written, the partial file is removed and a
+    JSON report is written next to it instead, with a .json extension.
+
+    Returns:
+        The report data
+    """
+    from content_accessibility_utility_on_aws.utils.jsonl_report import (
+        write_jsonl_report,
+    )
+
+    try:
+        write_jsonl_report(report_data, output_path, report_type)
+        logger.info(f"Generated JSONL report: {output_path}")
+    except Exception as e:
+        logger.warning(f"Error generating JSONL report: {str(e)}")
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        json_path = os.path.splitext(output_path)[0] + ".json"
+        logger.warning(f"Falling back to JSON report: {json_path}")
+        generate_json_report(report_data, json_path)
+    return report_data
+
+
+def json_ready(data, depth=20, visited=None):
+    """
+    Get a JSON-serializable version of a data structure, copying only what needs it.
+
+    The result serializes exactly like the result of
+    :func:`prepare_for_json_serialization`, but dictionaries and lists that hold
+    only strings, numbers, booleans, None and other such containers, within the
+    depth limit, are returned as they are instead of being copied. Containers
+    shared across the structure, such as issues listed both in the report and
+    in its groupings, are prepared once.
+
+    Args:
+        data: The data to prepare
+        depth: Maximum recursion depth (default: 20)
+        visited: Set of object IDs to detect circular references (default: None)
+
+    Returns:
+        A JSON-serializable version of the data
+    """
+    visited = set() if visited is None else visited
+    return _json_ready(data, depth, visited, {})[0]
+
+
+def _json_ready(data, depth, visited, prepared):
+    """
+    Prepare data for :func:`json_ready`.
+
+    Args:
+        data: The data to prepare
+        depth: Remaining recursion depth
+        visited: IDs of the dictionaries being prepared
+        prepared: Complete results by container ID, with the remaining depth
+            they were prepared at
+
+    Returns:
+        Tuple of (prepared data, whether it is complete, i.e. no value was
+        replaced because of the depth limit or a circular reference)
+    """
+    if depth <= 0:
+        return "Recursion depth exceeded", False
+
+    if isinstance(data, _SCALAR_TYPES):
+        return data, True
+
+    is_list = isinstance(data, list)
+    if not is_list and not isinstance(data, dict):
+        return prepare_for_json_serialization(data, depth, visited), False
+
+    # A complete result holds no cycle and fits in its depth, so it is the same
+    # at any larger remaining depth
+    object_id = id(data)
+    cached = prepared.get(object_id)
+    if cached is not None and cached[0] <= depth:
+        return cached[1], True
+
+    # Scalar items are kept without a call unless they are past the depth limit
+    inline_scalars = depth > 1
+    complete = True
+    result = None
+
+    if is_list:
+        for position, item in enumerate(data):
+            if inline_scalars and type(item) in _EXACT_SCALAR_TYPES:
+                value = item
+            else:
+                value, item_complete = _json_ready(item, depth - 1, visited, prepared)
+                complete = complete and item_complete
+            if result is None:
+                if value is item:
+                    continue
+                # Copy from the first item that differs
+                result = list(islice(data, position))
+            result.append(value)
+    else:
+        if object_id in visited:
+            return "Circular reference detected", False
+        visited.add(object_id)
+
+        for position, (key, item) in enumerate(data.items()):
+            skipped = key in SKIPPED_KEYS
+            if skipped:
+                value = None
+            elif inline_scalars and type(item) in _EXACT_SCALAR_TYPES:
+                value = item
+            else:
+                value, item_complete = _json_ready(item, depth - 1, visited, prepared)
+                complete = complete and item_complete
+            if result is None:
+                if not skipped and value is item:
+                    continue
+                # Copy from the first value that differs
+                result = dict(islice(data.items(), position))
+            if not skipped:
+                result[key] = value
+        visited.remove(object_id)
+
+    if result is None:
+        result = data
+    if complete:
+        prepared[object_id] = (depth, result)
+    return result, complete
+
+
 def prepare_for_json_serialization(data, depth=20, visited=None):
     """
     Prepare a data structure for JSON serialization by removing circular references and limiting recursion depth.
@@ -147,14 +296,7 @@ def prepare_for_json_serialization(data, depth=20, visited=None):
         result = {}
         for key, value in data.items():
             # Skip problematic keys that might cause circular references
-            if key in (
-                "parent",
-                "children",
-                "_parent",
-                "_children",
-                "references",
-                "_references",
-            ):
+            if key in SKIPPED_KEYS:
                 continue
 
             # Handle nested structures
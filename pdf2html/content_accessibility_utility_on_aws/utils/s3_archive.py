@@ -0,0 +1,271 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Streaming zip archives to S3.
+
+This module writes zip archives of an output directory straight to S3 multipart
+uploads, so archives never have to be staged on local disk. A directory is walked
+once and each file is read once, however many archives it is written to.
+Already-compressed media is deflated at level 0, which copies it without
+compressing it. It is not stored: the archives are not seekable, so every entry
+is followed by a data descriptor, and Java's ZipInputStream only accepts data
+descriptors after deflated entries.
+"""
+
+import os
+import zipfile
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
+
+# Set up module-level logger
+logger = setup_logger(__name__)
+
+# Minimum size of a multipart upload part (except the last one) accepted by S3
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Default size of the parts uploaded to S3
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+# Size of the chunks read from the files being archived
+READ_CHUNK_SIZE = 1024 * 1024
+
+# File types that are already compressed and gain nothing from deflate
+PRECOMPRESSED_EXTENSIONS = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".pdf",
+    ".zip",
+    ".gz",
+)
+
+
+class S3MultipartWriter:
+    """
+    Write-only file object that uploads its content as an S3 multipart upload.
+
+    The object is not seekable, so :class:`zipfile.ZipFile` writes archives to it
+    with data descriptors instead of seeking back to patch local headers.
+    Archive entries written to it must be deflated, see :func:`compression_for`.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        content_type: str = "application/zip",
+    ):
+        """
+        Initialize the writer and start the multipart upload.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Destination bucket
+            key: Destination object key
+            part_size: Size of the uploaded parts, at least MIN_PART_SIZE
+            content_type: Content type of the uploaded object
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self._buffer = bytearray()
+        self._parts: List[Dict] = []
+        self._position = 0
+        self.closed = False
+
+        response = s3_client.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType=content_type
+        )
+        self._upload_id = response["UploadId"]
+
+    def write(self, data) -> int:
+        """
+        Buffer data and upload every complete part.
+
+        Args:
+            data: Bytes to write
+
+        Returns:
+            int: Number of bytes written
+        """
+        if self.closed:
+            raise ValueError("write to closed S3MultipartWriter")
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(data)
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self._position
+
+    def flush(self) -> None:
+        """Parts are uploaded as they fill up, so there is nothing to flush."""
+
+    def close(self) -> None:
+        """Upload the remaining data and complete the multipart upload."""
+        if self.closed:
+            return
+        # The last part may be smaller than the minimum part size, and an empty
+        # object still needs one part
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer = bytearray()
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        self.closed = True
+        logger.debug(
+            f"Uploaded s3://{self.bucket}/{self.key} ({self._position} bytes, "
+            f"{len(self._parts)} parts)"
+        )
+
+    def abort(self) -> None:
+        """Abort the multipart upload and discard the uploaded parts."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+        except Exception as e:
+            logger.warning(f"Failed to abort upload of s3://{self.bucket}/{self.key}: {e}")
+
+    def _upload_part(self, data: bytes) -> None:
+        """Upload one part of the object."""
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+
+def compression_for(path: str) -> Tuple[int, Optional[int]]:
+    """
+    Choose the zip compression method and level for a file.
+
+    Args:
+        path: File path or archive name
+
+    Returns:
+        Tuple of (compression method, compression level): zipfile.ZIP_DEFLATED
+        at level 0 for already-compressed media, otherwise at the default level
+    """
+    if path.lower().endswith(PRECOMPRESSED_EXTENSIONS):
+        return zipfile.ZIP_DEFLATED, 0
+    return zipfile.ZIP_DEFLATED, None
+
+
+def write_directory_archives(
+    source_dir: str,
+    archives: Sequence[Tuple[zipfile.ZipFile, Optional[Callable[[str], bool]]]],
+) -> List[int]:
+    """
+    Add the files of a directory to several zip archives in a single pass.
+
+    The directory is walked once and each file is read once; its content is fed
+    to every archive whose filter accepts it.
+
+    Args:
+        source_dir: Directory to archive
+        archives: Pairs of (archive, filter). The filter gets the path relative
+            to ``source_dir`` and returns whether to include the file; None
+            includes every file.
+
+    Returns:
+        List with the number of files added to each archive
+    """
+    counts = [0] * len(archives)
+    for root, _, files in os.walk(source_dir):
+        for file in sorted(files):
+            file_path = os.path.join(root, file)
+            rel_path = os.path.relpath(file_path, source_dir)
+            targets = [
+                index
+                for index, (_, include) in enumerate(archives)
+                if include is None or include(rel_path)
+            ]
+            if not targets:
+                continue
+
+            # Each archive records its own offsets and CRC in the entry
+            handles = []
+            for index in targets:
+                zinfo = zipfile.ZipInfo.from_file(file_path, rel_path)
+                # ZipFile.open() only takes the level from the entry
+                zinfo.compress_type, zinfo._compresslevel = compression_for(rel_path)
+                handles.append(archives[index][0].open(zinfo, "w"))
+            try:
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                        for handle in handles:
+                            handle.write(chunk)
+            finally:
+                for handle in handles:
+                    handle.close()
+
+            for index in targets:
+                counts[index] += 1
+            logger.debug(f"Archived {rel_path} into {len(targets)} archive(s)")
+
+    return counts
+
+
+def upload_directory_archives(
+    s3_client,
+    source_dir: str,
+    targets: Sequence[Tuple[str, str, Optional[Callable[[str], bool]]]],
+    part_size: int = DEFAULT_PART_SIZE,
+) -> List[int]:
+    """
+    Stream zip archives of a directory to S3 without staging them on disk.
+
+    Args:
+        s3_client: boto3 S3 client
+        source_dir: Directory to archive
+        targets: Triples of (bucket, key, filter), one per archive. See
+            :func:`write_directory_archives` for the filter.
+        part_size: Size of the multipart upload parts
+
+    Returns:
+        List with the number of files added to each archive
+
+    Raises:
+        Exception: Any upload error. Incomplete uploads are aborted.
+    """
+    writers = []
+    try:
+        for bucket, key, _ in targets:
+            writers.append(S3MultipartWriter(s3_client, bucket, key, part_size))
+
+        zips = [zipfile.ZipFile(writer, "w") for writer in writers]
+        counts = write_directory_archives(
+            source_dir, [(zipf, include) for zipf, (_, _, include) in zip(zips, targets)]
+        )
+        # Closing the archives writes their central directories
+        for zipf in zips:
+            zipf.close()
+        for writer in writers:
+            writer.close()
+        return counts
+    except Exception:
+        for writer in writers:
+            writer.abort()
+        raise
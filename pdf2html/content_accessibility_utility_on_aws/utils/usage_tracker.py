@@ -11,6 +11,7 @@ It records usage metrics for the current session and supports exporting to S3.
 import os
 import uuid
 import json
+import threading
 import boto3
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -30,6 +31,7 @@ class SessionUsageTracker:
     """
 
     _instance = None
+    _instance_lock = threading.Lock()
 
     @classmethod
     def get_instance(cls):
@@ -40,11 +42,15 @@ class SessionUsageTracker:
             SessionUsageTracker: The singleton instance
         """
         if cls._instance is None:
-            cls._instance = SessionUsageTracker()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = SessionUsageTracker()
         return cls._instance
 
     def __init__(self):
         """Initialize a new SessionUsageTracker."""
+        # Bedrock calls may be tracked from several threads at once
+        self._lock = threading.Lock()
         self.session_id = str(uuid.uuid4())
         self.start_time = datetime.utcnow()
         self.end_time = None
@@ -62,6 +68,14 @@ class SessionUsageTracker:
             "calls_by_purpose": {},
             "call_details": []
         }
+        self.alt_text_cache_usage = {
+            "lookups": 0,
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+            "input_tokens_saved": 0,
+            "output_tokens_saved": 0
+        }
 
     def track_bedrock_call(
         self,
@@ -83,51 +97,77 @@ class SessionUsageTracker:
         """
         timestamp = datetime.utcnow().isoformat() + "Z"
         
-        # Update total counts
-        self.bedrock_usage["total_calls"] += 1
-        self.bedrock_usage["total_input_tokens"] += input_tokens
-        self.bedrock_usage["total_output_tokens"] += output_tokens
-        
-        # Update model-specific stats
-        if model_id not in self.bedrock_usage["calls_by_model"]:
-            self.bedrock_usage["calls_by_model"][model_id] = {
-                "total_calls": 0,
-                "input_tokens": 0,
-                "output_tokens": 0
-            }
-        
-        self.bedrock_usage["calls_by_model"][model_id]["total_calls"] += 1
-        self.bedrock_usage["calls_by_model"][model_id]["input_tokens"] += input_tokens
-        self.bedrock_usage["calls_by_model"][model_id]["output_tokens"] += output_tokens
-        
-        # Update purpose-specific stats
-        if purpose not in self.bedrock_usage["calls_by_purpose"]:
-            self.bedrock_usage["calls_by_purpose"][purpose] = {
-                "total_calls": 0,
-                "input_tokens": 0,
-                "output_tokens": 0
+        with self._lock:
+            # Update total counts
+            self.bedrock_usage["total_calls"] += 1
+            self.bedrock_usage["total_input_tokens"] += input_tokens
+            self.bedrock_usage["total_output_tokens"] += output_tokens
+
+            # Update model-specific stats
+            if model_id not in self.bedrock_usage["calls_by_model"]:
+                self.bedrock_usage["calls_by_model"][model_id] = {
+                    "total_calls": 0,
+                    "input_tokens": 0,
+                    "output_tokens": 0
+                }
+
+            self.bedrock_usage["calls_by_model"][model_id]["total_calls"] += 1
+            self.bedrock_usage["calls_by_model"][model_id]["input_tokens"] += input_tokens
+            self.bedrock_usage["calls_by_model"][model_id]["output_tokens"] += output_tokens
+
+            # Update purpose-specific stats
+            if purpose not in self.bedrock_usage["calls_by_purpose"]:
+                self.bedrock_usage["calls_by_purpose"][purpose] = {
+                    "total_calls": 0,
+                    "input_tokens": 0,
+                    "output_tokens": 0
+                }
+
+            self.bedrock_usage["calls_by_purpose"][purpose]["total_calls"] += 1
+            self.bedrock_usage["calls_by_purpose"][purpose]["input_tokens"] += input_tokens
+            self.bedrock_usage["calls_by_purpose"][purpose]["output_tokens"] += output_tokens
+
+            # Add detailed record
+            call_detail = {
+                "timestamp": timestamp,
+                "model_id": model_id,
+                "purpose": purpose,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens
             }
-        
-        self.bedrock_usage["calls_by_purpose"][purpose]["total_calls"] += 1
-        self.bedrock_usage["calls_by_purpose"][purpose]["input_tokens"] += input_tokens
-        self.bedrock_usage["calls_by_purpose"][purpose]["output_tokens"] += output_tokens
-        
-        # Add detailed record
-        call_detail = {
-            "timestamp": timestamp,
-            "model_id": model_id,
-            "purpose": purpose,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens
-        }
-        
-        if processing_time_ms is not None:
-            call_detail["processing_time_ms"] = processing_time_ms
-            
-        self.bedrock_usage["call_details"].append(call_detail)
+
+            if processing_time_ms is not None:
+                call_detail["processing_time_ms"] = processing_time_ms
+
+            self.bedrock_usage["call_details"].append(call_detail)
         
         logger.debug(f"Tracked Bedrock call: model={model_id}, purpose={purpose}, input_tokens={input_tokens}, output_tokens={output_tokens}")
 
+    def track_alt_text_cache_lookup(
+        self,
+        hit: bool,
+        input_tokens: int = 0,
+        output_tokens: int = 0
+    ) -> None:
+        """
+        Track a lookup in the alt text cache.
+
+        Args:
+            hit: Whether cached alt text was found
+            input_tokens: Input tokens of the Bedrock call saved by a hit
+            output_tokens: Output tokens of the Bedrock call saved by a hit
+        """
+        with self._lock:
+            usage = self.alt_text_cache_usage
+            usage["lookups"] += 1
+            if hit:
+                usage["hits"] += 1
+                usage["input_tokens_saved"] += input_tokens
+                usage["output_tokens_saved"] += output_tokens
+            else:
+                usage["misses"] += 1
+            usage["hit_rate"] = round(usage["hits"] / usage["lookups"], 4)
+
     def track_bda_processing(
         self,
         project_arn: str,
@@ -186,7 +226,8 @@ class SessionUsageTracker:
             "start_time": self.start_time.isoformat() + "Z",
             "end_time": self.end_time.isoformat() + "Z",
             "bda_usage": self.bda_usage,
-            "bedrock_usage": self.bedrock_usage
+            "bedrock_usage": self.bedrock_usage,
+            "alt_text_cache_usage": self.alt_text_cache_usage
         }
 
     def save_to_file(
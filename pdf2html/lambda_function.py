@@ -2,11 +2,11 @@ import os
 import boto3
 import json
 import traceback
-import zipfile
 import tempfile
 import shutil
 import urllib.parse
 from content_accessibility_utility_on_aws.api import process_pdf_accessibility
+from content_accessibility_utility_on_aws.utils.s3_archive import upload_directory_archives
 
 s3 = boto3.client("s3")
 
@@ -257,59 +257,35 @@ def lambda_handler(event, context):
             else:
                 print(f"[INFO] Cleanup of intermediate files is disabled")
             
-            # Create the zip file at the end after all processing is complete
-            # This ensures all files are included in the zip
-            zip_path = f"/tmp/{filename_base}.zip"
-            
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Walk through the output directory and add files to zip
-                for root, dirs, files in os.walk(temp_output_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Calculate relative path to maintain directory structure
-                        rel_path = os.path.relpath(file_path, temp_output_dir)
-                        zipf.write(file_path, rel_path)
-                        print(f"[INFO] Added to zip: {rel_path}")
-            
-            # Upload zip to the output folder so head_object can detect it
-            # This MUST match the path we check in the idempotency check above
+            # Create the zip files at the end after all processing is complete
+            # This ensures all files are included in the zips. The output
+            # directory is walked once and both archives are streamed straight
+            # to S3, so nothing is staged on /tmp.
+            # The output zip MUST match the path we check in the idempotency check above
             output_s3_key = f"output/{filename_base}.zip"
-            s3.upload_file(zip_path, bucket, output_s3_key)
-            print(f"[INFO] Uploaded complete zip file to s3://{bucket}/{output_s3_key}")
-            
-            # Create a separate "final" zip for the remediated folder with only specific files
-            final_zip_path = f"/tmp/final_{filename_base}.zip"
-            
+            remediated_s3_key = f"remediated/final_{filename_base}.zip"
+
             # List of files/folders to include in the final zip
             include_patterns = [
                 "remediated_html/",
                 "usage_data.json",
                 "remediation_report.html"
             ]
-            
-            with zipfile.ZipFile(final_zip_path, 'w', zipfile.ZIP_DEFLATED) as final_zipf:
-                # Walk through the output directory and add only specific files to zip
-                for root, dirs, files in os.walk(temp_output_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Calculate relative path to maintain directory structure
-                        rel_path = os.path.relpath(file_path, temp_output_dir)
-                        
-                        # Check if this file should be included
-                        should_include = False
-                        for pattern in include_patterns:
-                            if pattern.lower() in rel_path.lower():
-                                should_include = True
-                                break
-                        
-                        if should_include:
-                            final_zipf.write(file_path, rel_path)
-                            print(f"[INFO] Added to final zip: {rel_path}")
-            
-            # Upload the final zip to the remediated folder
-            remediated_s3_key = f"remediated/final_{filename_base}.zip"
-            s3.upload_file(final_zip_path, bucket, remediated_s3_key)
-            print(f"[INFO] Uploaded final zip file to s3://{bucket}/{remediated_s3_key}")
+
+            def include_in_final_zip(rel_path):
+                rel_path = rel_path.replace(os.sep, "/").lower()
+                return any(pattern.lower() in rel_path for pattern in include_patterns)
+
+            output_count, final_count = upload_directory_archives(
+                s3,
+                temp_output_dir,
+                [
+                    (bucket, output_s3_key, None),
+                    (bucket, remediated_s3_key, include_in_final_zip),
+                ],
+            )
+            print(f"[INFO] Uploaded complete zip file ({output_count} files) to s3://{bucket}/{output_s3_key}")
+            print(f"[INFO] Uploaded final zip file ({final_count} files) to s3://{bucket}/{remediated_s3_key}")
                 
         except Exception as e:
             print(f"[ERROR] Creating or uploading zip failed: {e}")
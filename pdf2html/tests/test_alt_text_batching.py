@@ -0,0 +1,222 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for alt text prompts and batched alt text requests."""
+
+import io
+import json
+import os
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+from PIL import Image
+
+from content_accessibility_utility_on_aws.remediate.prompt_generators.alt_text_generator import (
+    ALT_TEXT_PROMPT_VERSION,
+    generate_alt_text_prompt,
+    parse_batch_alt_text,
+)
+from content_accessibility_utility_on_aws.remediate.remediation_manager import (
+    RemediationManager,
+)
+from content_accessibility_utility_on_aws.remediate.services import bedrock_scheduler
+from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
+    BedrockClient,
+)
+from content_accessibility_utility_on_aws.remediate.services.bedrock_scheduler import (
+    BedrockRequest,
+    BedrockRequestScheduler,
+)
+
+SINGLE_PROMPT = """You are an accessibility expert specializing in generating descriptive alt text for images.
+
+I need you to generate concise, accurate alt text for an image with the following characteristics:
+- Dimensions: 40x20 pixels
+
+Guidelines for generating good alt text:
+1. Be concise but descriptive (aim for 125 characters or less)
+2. Describe the content and function of the image
+3. Don't start with phrases like "Image of" or "Picture of"
+4. Include relevant details but omit unnecessary information
+5. If the image contains text, include the important text in the alt text
+6. Focus on what's important about the image in its context
+
+Please provide only the alt text with no additional explanation or commentary.
+
+The image has this caption: Sales by region
+"""
+
+
+class FakeRuntimeClient:
+    """Bedrock runtime client describing images by their width."""
+
+    def __init__(self, missing=()):
+        # Image numbers left out of batched responses
+        self.missing = set(missing)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def converse(self, modelId, messages, inferenceConfig):
+        content = messages[0]["content"]
+        images = [
+            block["image"]["source"]["bytes"] for block in content if "image" in block
+        ]
+        with self._lock:
+            self.requests.append(len(images))
+        if "JSON" not in content[-1].get("text", ""):
+            text = _alt_text(images[0])
+        else:
+            text = "```json\n" + json.dumps(
+                {
+                    str(number): _alt_text(image)
+                    for number, image in enumerate(images, 1)
+                    if number not in self.missing
+                }
+            ) + "\n```"
+        return {"output": {"message": {"content": [{"text": text}]}}}
+
+
+def _alt_text(image_data):
+    """Alt text naming the width of an image, which differs for every image."""
+    with Image.open(io.BytesIO(image_data)) as image:
+        return f"Chart {image.width} pixels wide"
+
+
+def _image(path, width):
+    Image.new("RGB", (width, 20), (width % 256, 0, 0)).save(path)
+    return str(path)
+
+
+def _requests(paths, max_tokens=100):
+    return [
+        BedrockRequest(
+            "generate_alt_text_for_image",
+            (path, generate_alt_text_prompt(path), max_tokens),
+        )
+        for path in paths
+    ]
+
+
+@pytest.fixture
+def images(tmp_path):
+    return [_image(tmp_path / f"image-{i}.png", 40 + i) for i in range(10)]
+
+
+def test_single_image_prompt_is_unchanged(tmp_path):
+    path = _image(tmp_path / "chart.png", 40)
+
+    prompt = generate_alt_text_prompt(path, {"caption": "Sales by region"})
+
+    assert prompt == SINGLE_PROMPT
+    assert prompt.details == (
+        "- Dimensions: 40x20 pixels\n\nThe image has this caption: Sales by region\n"
+    )
+    assert ALT_TEXT_PROMPT_VERSION == 1
+
+
+def test_parse_batch_alt_text():
+    response = 'Sure:\n```json\n{"1": " First ", "3": "Third", "2": "", "4": 7}\n```'
+
+    assert parse_batch_alt_text(response, 4) == ["First", None, "Third", None]
+    assert parse_batch_alt_text('{"1": "First", "2": ', 2) == [None, None]
+    assert parse_batch_alt_text('["First", "Second"]', 2) == [None, None]
+    assert parse_batch_alt_text("No JSON here", 2) == [None, None]
+
+
+def test_batches_respect_the_limits(images, monkeypatch):
+    scheduler = BedrockRequestScheduler(batch_size=4)
+
+    assert scheduler._plan_jobs(_requests(images)) == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9],
+    ]
+    # Output tokens: at most 4096 tokens for the whole batch
+    assert scheduler._plan_jobs(_requests(images[:5], max_tokens=2000)) == [
+        [0, 1],
+        [2, 3],
+        [4],
+    ]
+    # A different token budget starts a new batch
+    requests = _requests(images[:2]) + _requests(images[2:4], max_tokens=200)
+    assert scheduler._plan_jobs(requests) == [[0, 1], [2, 3]]
+
+    # Room for one image and a half
+    image_bytes = os.path.getsize(images[0])
+    monkeypatch.setattr(bedrock_scheduler, "MAX_BATCH_IMAGE_BYTES", image_bytes * 3 // 2)
+    assert scheduler._plan_jobs(_requests(images[:3])) == [[0], [1], [2]]
+
+    monkeypatch.undo()
+    monkeypatch.setattr(bedrock_scheduler, "MAX_BATCH_INPUT_TOKENS", 2500)
+    assert scheduler._plan_jobs(_requests(images[:4])) == [[0, 1], [2, 3]]
+
+
+def test_only_alt_text_prompts_are_batched(images):
+    scheduler = BedrockRequestScheduler(batch_size=4)
+    requests = _requests(images[:2])
+    requests.insert(1, BedrockRequest("generate_text", ("Summarize", "table", 100)))
+    requests.append(
+        BedrockRequest("generate_alt_text_for_image", (images[2], "Custom prompt", 100))
+    )
+
+    assert scheduler._plan_jobs(requests) == [[1], [3], [0, 2]]
+    assert BedrockRequestScheduler()._plan_jobs(requests) == [[0], [1], [2], [3]]
+
+
+def test_missing_batch_results_fall_back_to_single_requests(images):
+    runtime = FakeRuntimeClient(missing={2})
+    client = BedrockClient(model_id="model", runtime_client=runtime)
+    scheduler = BedrockRequestScheduler(max_concurrency=2, batch_size=4)
+    requests = _requests(images[:6])
+
+    outcomes = scheduler.run(client, requests)
+
+    assert outcomes == [(f"Chart {40 + i} pixels wide", None) for i in range(6)]
+    # Two batches, then image 2 of each batch on its own
+    assert sorted(runtime.requests) == [1, 1, 2, 4]
+
+
+def test_failed_batch_is_sent_image_by_image(images, monkeypatch):
+    client = BedrockClient(model_id="model", runtime_client=FakeRuntimeClient())
+
+    def fail(images, max_tokens):
+        raise ValueError("bad request")
+
+    monkeypatch.setattr(client, "generate_alt_text_for_images", fail)
+    scheduler = BedrockRequestScheduler(batch_size=4)
+
+    outcomes = scheduler.run(client, _requests(images[:3]))
+
+    assert [error for _, error in outcomes] == [None, None, None]
+    assert client.client.requests == [1, 1, 1]
+
+
+def test_batched_alt_text_is_applied_in_issue_order(images, tmp_path):
+    html = "<html><body>" + "".join(
+        f'<p>Paragraph {i}</p><img src="image-{i}.png">' for i in range(10)
+    ) + "</body></html>"
+    issues = [
+        {"type": "missing_alt_text", "element": f'<img src="image-{i}.png">'}
+        for i in range(10)
+    ]
+
+    def remediate(options, runtime):
+        soup = BeautifulSoup(html, "html.parser")
+        soup.original_url = str(tmp_path / "index.html")
+        manager = RemediationManager(soup, {"disable_ai": True, **options})
+        manager.bedrock_client = BedrockClient(model_id="model", runtime_client=runtime)
+        manager.remediate_issues([dict(issue) for issue in issues])
+        return [img.get("alt") for img in soup.find_all("img")]
+
+    serial_runtime = FakeRuntimeClient()
+    serial = remediate({"ai_concurrency": 1}, serial_runtime)
+    batched_runtime = FakeRuntimeClient(missing={3})
+    batched = remediate(
+        {"ai_concurrency": 3, "alt_text_batch_size": 4}, batched_runtime
+    )
+
+    assert serial == [f"Chart {40 + i} pixels wide" for i in range(10)]
+    assert batched == serial
+    assert serial_runtime.requests == [1] * 10
+    assert sorted(batched_runtime.requests) == [1, 1, 2, 4, 4]
@@ -0,0 +1,133 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the alt text cache."""
+
+import threading
+
+import pytest
+from PIL import Image, ImageDraw
+
+from content_accessibility_utility_on_aws.remediate.services.alt_text_cache import (
+    AltTextCache,
+    SQLiteAltTextStore,
+    perceptual_hash,
+)
+
+MODEL_ID = "model"
+
+
+def _flat_image(path, color):
+    Image.new("RGB", (40, 30), color).save(path)
+    return str(path)
+
+
+def _logo_image(path, size=(180, 160)):
+    # Blocks aligned with the 9x8 grid of the perceptual hash, alternately
+    # brighter and darker than their left neighbour
+    image = Image.new("L", (180, 160))
+    draw = ImageDraw.Draw(image)
+    for row in range(8):
+        for col in range(9):
+            level = 60 + 120 * ((row + col) % 2) + 5 * row
+            draw.rectangle((col * 20, row * 20, col * 20 + 19, row * 20 + 19), fill=level)
+    image.resize(size).save(path)
+    return str(path)
+
+
+class RecordingStore:
+    """In-memory store that checks the cache lock is free during its I/O."""
+
+    path = "memory"
+
+    def __init__(self):
+        self.entries = {}
+        self.cache = None
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        assert not self.cache._lock.locked()
+        return self.entries.get(key)
+
+    def put(self, key, entry):
+        self.calls += 1
+        assert not self.cache._lock.locked()
+        self.entries[key] = entry
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AltTextCache(SQLiteAltTextStore(str(tmp_path / "cache")), perceptual=True)
+    yield cache
+    cache.close()
+
+
+def test_flat_images_have_no_perceptual_hash(tmp_path):
+    assert perceptual_hash(_flat_image(tmp_path / "white.png", "white")) is None
+    assert perceptual_hash(_flat_image(tmp_path / "red.png", "red")) is None
+    assert perceptual_hash(_logo_image(tmp_path / "logo.png")) is not None
+
+
+def test_flat_images_do_not_share_alt_text(cache, tmp_path):
+    red = _flat_image(tmp_path / "red.png", "red")
+    blue = _flat_image(tmp_path / "blue.png", "blue")
+
+    cache.put(cache.image_keys(red, MODEL_ID), "Red square")
+
+    assert cache.get(cache.image_keys(blue, MODEL_ID)) is None
+    assert cache.get(cache.image_keys(red, MODEL_ID)) == "Red square"
+
+
+def test_resized_copy_matches_by_perceptual_hash(cache, tmp_path):
+    logo = _logo_image(tmp_path / "logo.png")
+    resized = _logo_image(tmp_path / "logo_small.png", size=(90, 80))
+
+    cache.put(cache.image_keys(logo, MODEL_ID), "Agency logo")
+
+    assert len(cache.image_keys(resized, MODEL_ID)) == 2
+    assert cache.get(cache.image_keys(resized, MODEL_ID)) == "Agency logo"
+
+
+def test_store_is_used_outside_the_cache_lock(tmp_path):
+    store = RecordingStore()
+    cache = AltTextCache(store)
+    store.cache = cache
+    keys = cache.image_keys(_logo_image(tmp_path / "logo.png"), MODEL_ID)
+
+    assert cache.get(keys) is None
+    cache.put(keys, "Agency logo")
+    # Answered from memory, without reading the store
+    calls = store.calls
+    assert cache.get(keys) == "Agency logo"
+    assert store.calls == calls
+
+    other = AltTextCache(store)
+    store.cache = other
+    assert other.get(keys) == "Agency logo"
+    assert (other.hits, other.misses) == (1, 0)
+
+
+def test_sqlite_store_is_shared_by_threads(cache, tmp_path):
+    images = [_flat_image(tmp_path / f"{i}.png", (i, 0, 0)) for i in range(20)]
+    errors = []
+
+    def remediate(image):
+        try:
+            keys = cache.image_keys(image, MODEL_ID)
+            cache.put(keys, f"alt {image}")
+            assert cache.get(keys) == f"alt {image}"
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=remediate, args=(image,)) for image in images]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.hits == len(images)
@@ -0,0 +1,67 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the conversion-scoped image asset registry."""
+
+import os
+
+from content_accessibility_utility_on_aws.utils.asset_registry import (
+    AssetRegistry,
+    asset_scope,
+)
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_registry_is_shared_within_a_scope_only(tmp_path):
+    _write(tmp_path / "assets" / "a.png", b"a")
+
+    with asset_scope():
+        registry = AssetRegistry.for_directory(str(tmp_path))
+        assert AssetRegistry.for_directory(str(tmp_path)) is registry
+        with asset_scope():
+            assert AssetRegistry.for_directory(str(tmp_path)) is registry
+
+    assert AssetRegistry.for_directory(str(tmp_path)) is not registry
+    assert AssetRegistry.for_directory(str(tmp_path)) is not AssetRegistry.for_directory(
+        str(tmp_path)
+    )
+
+
+def test_later_runs_do_not_reuse_an_earlier_index(tmp_path):
+    first = _write(tmp_path / "assets" / "a.png", b"a")
+
+    @asset_scope()
+    def find(name):
+        return AssetRegistry.for_directory(str(tmp_path)).find(name)
+
+    assert find("a.png") == first
+    os.remove(first)
+    second = _write(tmp_path / "assets" / "b.png", b"b")
+
+    assert find("a.png") is None
+    assert find("b.png") == second
+
+
+def test_identical_images_share_one_staged_file(tmp_path):
+    first = _write(tmp_path / "assets" / "one.png", b"same bytes")
+    second = _write(tmp_path / "assets" / "two.png", b"same bytes")
+    other = _write(tmp_path / "assets" / "three.png", b"other bytes")
+    dest_dir = str(tmp_path / "extracted_html")
+
+    with asset_scope():
+        registry = AssetRegistry.for_directory(str(tmp_path))
+        staged = [registry.stage(path, dest_dir) for path in (first, second, other)]
+
+    assert [os.path.basename(path) for path in staged] == [
+        "one.png",
+        "two.png",
+        "three.png",
+    ]
+    assert os.path.samefile(staged[0], staged[1])
+    assert not os.path.samefile(staged[0], staged[2])
+    assert open(staged[1], "rb").read() == b"same bytes"
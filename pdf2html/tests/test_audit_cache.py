@@ -0,0 +1,97 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the reuse of cached page audits."""
+
+import os
+
+import pytest
+
+from content_accessibility_utility_on_aws.audit.audit_cache import AuditCache
+from content_accessibility_utility_on_aws.audit.auditor import AccessibilityAuditor
+
+PAGE = (
+    '<html lang="en"><head><title>Page {number}</title></head><body><main>'
+    '<h1>Page {number}</h1><img src="a.png"><a href="#"></a>'
+    "</main></body></html>"
+)
+
+
+@pytest.fixture
+def html_dir(tmp_path):
+    html_dir = tmp_path / "html"
+    html_dir.mkdir()
+    for number in range(1, 4):
+        (html_dir / f"page-{number}.html").write_text(
+            PAGE.format(number=number), encoding="utf-8"
+        )
+    return html_dir
+
+
+@pytest.fixture
+def audited_pages(monkeypatch):
+    """File names of the pages audited rather than read from the cache."""
+    audited = []
+    audit_page = AccessibilityAuditor._audit_page
+
+    def recording_audit_page(self, soup, page_num=None, file_path=None, *args, **kwargs):
+        audited.append(os.path.basename(file_path))
+        return audit_page(self, soup, page_num, file_path, *args, **kwargs)
+
+    monkeypatch.setattr(AccessibilityAuditor, "_audit_page", recording_audit_page)
+    return audited
+
+
+def _audit(html_dir, cache_dir, **options):
+    options = {"audit_cache": str(cache_dir), **options}
+    return AccessibilityAuditor(html_path=str(html_dir), options=options).audit()
+
+
+def test_unchanged_pages_are_read_from_the_cache(html_dir, tmp_path, audited_pages):
+    first = _audit(html_dir, tmp_path / "cache")
+    assert audited_pages == ["page-1.html", "page-2.html", "page-3.html"]
+
+    audited_pages.clear()
+    second = _audit(html_dir, tmp_path / "cache")
+
+    assert audited_pages == []
+    assert second["issues"] == first["issues"]
+
+
+def test_changed_page_is_audited_again(html_dir, tmp_path, audited_pages):
+    _audit(html_dir, tmp_path / "cache")
+    (html_dir / "page-2.html").write_text(
+        PAGE.format(number=2).replace("<h1>", '<h1 class="x">'), encoding="utf-8"
+    )
+
+    audited_pages.clear()
+    report = _audit(html_dir, tmp_path / "cache")
+
+    assert audited_pages == ["page-2.html"]
+    audited_pages.clear()
+    assert report["issues"] == _audit(html_dir, tmp_path / "fresh")["issues"]
+
+
+def test_audit_settings_change_is_a_miss(html_dir, tmp_path, audited_pages):
+    _audit(html_dir, tmp_path / "cache")
+
+    audited_pages.clear()
+    _audit(html_dir, tmp_path / "cache", severity_threshold="critical")
+
+    assert len(audited_pages) == 3
+
+
+def test_report_settings_do_not_change_the_options_hash():
+    options_hash = AuditCache.options_hash({"report_format": "json"}, "images")
+
+    for options in (
+        {"report_format": "html"},
+        {"report_format": "jsonl", "summary_only": True},
+        {"drop_context_after_report": True, "audit_workers": 4},
+        {"audit_cache": "other", "severity_threshold": "minor", "detailed": True},
+    ):
+        assert AuditCache.options_hash(options, "images") == options_hash
+
+    assert AuditCache.options_hash({"detailed": False}, "images") != options_hash
+    assert AuditCache.options_hash({"issue_types": ["x"]}, "images") != options_hash
+    assert AuditCache.options_hash({}, "other_images") != options_hash
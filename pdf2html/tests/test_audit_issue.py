@@ -0,0 +1,137 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the audit issue records and their deferred context."""
+
+import pickle
+
+import pytest
+
+from content_accessibility_utility_on_aws.audit.audit_issue import (
+    ISSUE_FIELDS,
+    AuditIssue,
+    PageSource,
+    issues_to_dicts,
+)
+from content_accessibility_utility_on_aws.audit.auditor import AccessibilityAuditor
+
+PAGE = (
+    '<html lang="en"><head><title>Page</title></head><body><main>'
+    '<p>Intro</p><img src="a.png"><a href="#"></a><img src="b.png">'
+    "</main></body></html>"
+)
+
+
+@pytest.fixture
+def page_file(tmp_path):
+    path = tmp_path / "page-1.html"
+    path.write_text(PAGE, encoding="utf-8")
+    return str(path)
+
+
+def _live_contexts(page_file):
+    """Contexts of the issues of a page, collected while it is parsed."""
+    auditor = AccessibilityAuditor(html_path=page_file)
+    report = auditor.audit()
+    return [issue["context"] for issue in report["issues"]]
+
+
+def test_page_issues_release_their_elements(page_file):
+    auditor = AccessibilityAuditor()
+    succeeded, issues = auditor._collect_file_issues(page_file)
+
+    assert succeeded and issues
+    deferred = [issue for issue in issues if not issue.context_loaded]
+    assert deferred
+    for issue in deferred:
+        assert issue._context_source.element is None
+        assert issue.page_source.path == page_file
+
+    # All issues of the page share one source, parsed once and released
+    page = deferred[0].page_source
+    assert all(issue.page_source is page for issue in deferred)
+    contexts = [d["context"] for d in issues_to_dicts(issues)]
+    assert page._index is None
+    assert contexts == _live_contexts(page_file)
+
+
+def test_issue_dict_keeps_report_field_order(page_file):
+    auditor = AccessibilityAuditor()
+    _, issues = auditor._collect_file_issues(page_file)
+
+    data = issues[0].to_dict()
+
+    assert list(data) == list(ISSUE_FIELDS) + ["file_path", "file_name", "page_number"]
+    assert data["page_number"] == 1
+    assert issues[0].to_dict(include_context=False)["context"] is None
+    assert isinstance(issues[0], AuditIssue) and not isinstance(issues[0], dict)
+
+
+def test_pickled_issues_keep_deferred_context(page_file):
+    auditor = AccessibilityAuditor()
+    _, issues = auditor._collect_file_issues(page_file, keep_elements=True)
+    assert any(issue._context_source is not None for issue in issues)
+
+    restored = pickle.loads(pickle.dumps(issues))
+
+    assert [issue.to_dict() for issue in restored] == [
+        issue.to_dict() for issue in issues
+    ]
+
+
+def test_state_round_trip_refers_to_the_page(page_file):
+    auditor = AccessibilityAuditor()
+    _, issues = auditor._collect_file_issues(page_file)
+    page = next(issue.page_source for issue in issues if not issue.context_loaded)
+    states = [issue.to_state() for issue in issues]
+
+    restored = [
+        AuditIssue.from_state(state, PageSource(page.path, page.content_hash))
+        for state in states
+    ]
+
+    assert all(
+        state["context"] is None for state in states if "context_ordinal" in state
+    )
+    assert [issue.to_dict() for issue in restored] == [
+        issue.to_dict() for issue in issues
+    ]
+
+
+def test_changed_page_gives_an_error_context(page_file):
+    auditor = AccessibilityAuditor()
+    _, issues = auditor._collect_file_issues(page_file)
+    with open(page_file, "a", encoding="utf-8") as f:
+        f.write("<p>changed</p>")
+
+    issue = next(issue for issue in issues if not issue.context_loaded)
+
+    assert "error" in issue.context
+
+
+def test_drop_context_releases_the_source(page_file):
+    auditor = AccessibilityAuditor()
+    _, issues = auditor._collect_file_issues(page_file)
+
+    for issue in issues:
+        issue.drop_context()
+
+    assert all(issue.context_loaded and issue.context is None for issue in issues)
+
+
+def test_pool_audit_matches_serial_audit(tmp_path):
+    for number in range(1, 6):
+        (tmp_path / f"page-{number}.html").write_text(PAGE, encoding="utf-8")
+    html_files = sorted(str(path) for path in tmp_path.glob("page-*.html"))
+    auditor = AccessibilityAuditor(options={"audit_workers": 2})
+
+    results = auditor._audit_files_in_pool(html_files, 2)
+
+    # Without a shared store the workers read the pages themselves
+    assert auditor.page_store._pages == {}
+    for html_file in html_files:
+        succeeded, issues = results[html_file]
+        assert succeeded
+        assert issues_to_dicts(issues) == issues_to_dicts(
+            AccessibilityAuditor()._collect_file_issues(html_file)[1]
+        )
@@ -0,0 +1,57 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for multi-page audits in worker processes."""
+
+import pytest
+
+from content_accessibility_utility_on_aws.audit.auditor import AccessibilityAuditor
+from content_accessibility_utility_on_aws.utils.page_store import PageStore
+
+
+def _page(number):
+    """A page with a number of issues that depends on the page number."""
+    images = "".join(f'<img src="image-{i}.png">' for i in range(number % 3))
+    links = '<a href="#"></a>' * (number % 2)
+    table = "<table><tr><td>cell</td></tr></table>" if number % 4 == 0 else ""
+    return (
+        f'<html lang="en"><head><title>Page {number}</title></head><body>'
+        f"<main><h1>Page {number}</h1>{images}{links}{table}"
+        f"<h3>Skipped level</h3><p>Text of page {number}</p></main></body></html>"
+    )
+
+
+@pytest.fixture
+def html_dir(tmp_path):
+    html_dir = tmp_path / "html"
+    html_dir.mkdir()
+    # More pages than the pool window of two workers
+    for number in range(1, 10):
+        (html_dir / f"page-{number}.html").write_text(_page(number), encoding="utf-8")
+    return html_dir
+
+
+@pytest.mark.parametrize("page_store", [None, PageStore()])
+def test_pooled_audit_matches_serial_audit(html_dir, monkeypatch, page_store):
+    serial = AccessibilityAuditor(
+        html_path=str(html_dir), options={"audit_workers": 1}
+    ).audit()
+
+    pooled_pages = []
+    audit_files_in_pool = AccessibilityAuditor._audit_files_in_pool
+
+    def recording_pool(self, html_files, workers):
+        pooled_pages.extend(html_files)
+        return audit_files_in_pool(self, html_files, workers)
+
+    monkeypatch.setattr(AccessibilityAuditor, "_audit_files_in_pool", recording_pool)
+    pooled = AccessibilityAuditor(
+        html_path=str(html_dir), options={"audit_workers": 2}, page_store=page_store
+    ).audit()
+
+    assert len(pooled_pages) == 9
+    assert [issue["id"] for issue in pooled["issues"]] == [
+        f"issue-{number}" for number in range(1, len(serial["issues"]) + 1)
+    ]
+    assert pooled["issues"] == serial["issues"]
+    assert pooled["summary"] == serial["summary"]
@@ -0,0 +1,91 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the Bedrock clients shared across a remediation run."""
+
+import threading
+
+import pytest
+
+from content_accessibility_utility_on_aws.remediate.services import bedrock_client
+from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    clear_bedrock_clients,
+    get_bedrock_client,
+)
+from content_accessibility_utility_on_aws.remediate.services.response_cache import (
+    CACHE_PATH_VARIABLE,
+)
+
+REGION = "us-east-1"
+
+
+@pytest.fixture(autouse=True)
+def shared_clients(monkeypatch):
+    # Creating a runtime client needs a region but no credentials or network
+    monkeypatch.delenv(CACHE_PATH_VARIABLE, raising=False)
+    clear_bedrock_clients()
+    yield
+    clear_bedrock_clients()
+
+
+def _pool_size(client):
+    return client.client.meta.config.max_pool_connections
+
+
+def test_concurrent_calls_share_one_client():
+    barrier = threading.Barrier(8)
+    clients = []
+
+    def get_client():
+        barrier.wait()
+        clients.append(get_bedrock_client(region=REGION))
+
+    threads = [threading.Thread(target=get_client) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(clients) == 8
+    assert all(client is clients[0] for client in clients)
+    assert len(bedrock_client._runtime_clients) == 1
+
+
+def test_clients_are_kept_apart_by_model_and_cache():
+    client = get_bedrock_client(region=REGION)
+
+    other_model = get_bedrock_client(model_id="other-model", region=REGION)
+    other_cache = get_bedrock_client(region=REGION, alt_text_cache=object())
+
+    assert other_model is not client and other_cache is not client
+    # They still share the runtime client of the profile and region
+    assert other_model.client is client.client is other_cache.client
+
+
+def test_pool_grows_for_more_concurrent_requests():
+    client = get_bedrock_client(region=REGION)
+    assert _pool_size(client) == DEFAULT_MAX_POOL_CONNECTIONS
+
+    same = get_bedrock_client(region=REGION, max_pool_connections=32)
+
+    assert same is client
+    assert _pool_size(client) == 32
+    # A smaller pool request keeps the larger pool
+    client.ensure_pool_size(16)
+    assert _pool_size(client) == 32
+    assert get_bedrock_client(model_id="other-model", region=REGION).client is (
+        client.client
+    )
+
+
+def test_clear_forgets_the_shared_clients():
+    client = get_bedrock_client(region=REGION)
+
+    clear_bedrock_clients()
+
+    assert bedrock_client._bedrock_clients == {}
+    assert bedrock_client._runtime_clients == {}
+    new_client = get_bedrock_client(region=REGION)
+    assert new_client is not client
+    assert new_client.client is not client.client
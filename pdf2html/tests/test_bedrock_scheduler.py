@@ -0,0 +1,99 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the Bedrock stand-in clients and the request prefetch pass."""
+
+import logging
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+
+from content_accessibility_utility_on_aws.remediate import remediation_manager
+from content_accessibility_utility_on_aws.remediate.remediation_manager import (
+    RemediationManager,
+)
+from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
+    AltTextGenerationError,
+    BedrockClient,
+)
+from content_accessibility_utility_on_aws.remediate.services.bedrock_scheduler import (
+    RecordingBedrockClient,
+    ScheduledBedrockClient,
+    _DelegatingBedrockClient,
+)
+
+STRATEGY_LOGGER = (
+    "content_accessibility_utility_on_aws.remediate.remediation_strategies"
+    ".image_remediation"
+)
+
+
+class FakeRuntimeClient:
+    """Bedrock runtime client answering every request with the same text."""
+
+    def converse(self, modelId, messages, inferenceConfig):
+        return {"output": {"message": {"content": [{"text": "A chart"}]}}}
+
+
+@pytest.fixture
+def client():
+    return BedrockClient(
+        model_id="model", profile="profile", runtime_client=FakeRuntimeClient()
+    )
+
+
+def test_stand_ins_are_bedrock_clients_sharing_the_runtime_client(client):
+    recorder = RecordingBedrockClient(client)
+
+    assert isinstance(recorder, BedrockClient)
+    assert recorder.client is client.client
+    assert (recorder.model_id, recorder.profile) == ("model", "profile")
+    with pytest.raises(AltTextGenerationError):
+        recorder.generate_text("prompt")
+    assert len(recorder.requests) == 1
+
+    scheduled = ScheduledBedrockClient(client, recorder.requests, [("text", None)])
+    assert scheduled.generate_text("prompt") == "text"
+    assert scheduled.generate_text("prompt") == "A chart"
+    assert (scheduled.hits, scheduled.misses) == (1, 1)
+
+
+def test_delegating_client_is_abstract(client):
+    with pytest.raises(TypeError):
+        _DelegatingBedrockClient(client)
+
+
+def test_only_strategy_loggers_of_the_thread_are_muted(caplog):
+    caplog.set_level(logging.INFO)
+    other_logger = logging.getLogger(remediation_manager.__name__)
+    strategy_logger = logging.getLogger(STRATEGY_LOGGER)
+
+    with remediation_manager._muted_strategy_loggers():
+        strategy_logger.error("deferred request")
+        other_logger.info("manager message")
+        thread = threading.Thread(target=strategy_logger.error, args=("other thread",))
+        thread.start()
+        thread.join()
+    strategy_logger.error("after collection")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["manager message", "other thread", "after collection"]
+
+
+def test_bedrock_client_is_restored_when_remediation_fails(client, monkeypatch):
+    soup = BeautifulSoup('<html><body><img src="a.png"></body></html>', "html.parser")
+    manager = RemediationManager(soup, {"disable_ai": True})
+    manager.bedrock_client = client
+    scheduled = ScheduledBedrockClient(client, [], [])
+    monkeypatch.setattr(manager, "_prefetch_ai_responses", lambda issues: scheduled)
+
+    def fail(issue):
+        assert manager.bedrock_client is scheduled
+        raise RuntimeError("strategy bug")
+
+    monkeypatch.setattr(manager, "remediate_issue", fail)
+
+    with pytest.raises(RuntimeError):
+        manager.remediate_issues([{"type": "missing_alt_text", "severity": "critical"}])
+    assert manager.bedrock_client is client
@@ -0,0 +1,68 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the color contrast check."""
+
+import pytest
+
+from content_accessibility_utility_on_aws.api import audit_html_accessibility
+
+
+@pytest.fixture
+def contrast_issues(tmp_path):
+    """Audit a page body and return the insufficient contrast issues."""
+
+    def audit(body):
+        html_path = tmp_path / "page.html"
+        html_path.write_text(
+            '<!DOCTYPE html><html lang="en"><head><title>Page</title></head>'
+            f"<body><main>{body}</main></body></html>",
+            encoding="utf-8",
+        )
+        report = audit_html_accessibility(
+            str(html_path), output_path=str(tmp_path / "audit.json")
+        )
+        return [
+            issue
+            for issue in report["issues"]
+            if issue["type"] == "insufficient-color-contrast"
+        ]
+
+    return audit
+
+
+def test_inherited_colors_are_reported_once(contrast_issues):
+    issues = contrast_issues(
+        '<div style="color:#999;background:#fff">Intro<p>one</p><p>two</p>'
+        "<span>three</span><ul><li>a</li><li>b</li></ul></div>"
+    )
+
+    assert [issue["element"] for issue in issues] == ["div"]
+
+
+def test_new_color_pair_inside_reported_container_is_reported(contrast_issues):
+    issues = contrast_issues(
+        '<div style="color:#999;background:#fff">Intro<p>inherits</p>'
+        '<p style="background-color:#333">own colors</p></div>'
+    )
+
+    assert [issue["element"] for issue in issues] == ["div", "p"]
+    assert issues[1]["location"]["background_color"] == "#333333"
+
+
+def test_colors_set_on_non_text_container_are_reported_once(contrast_issues):
+    issues = contrast_issues(
+        '<section style="color:#999"><p>one</p><p>two</p><p>three</p></section>'
+    )
+
+    assert [issue["element"] for issue in issues] == ["p"]
+
+
+def test_smaller_inherited_text_is_still_checked(contrast_issues):
+    # 3.5:1 passes for the large container text but not for the small paragraph
+    issues = contrast_issues(
+        '<div style="color:#888;background:#fff;font-size:32px">Large'
+        '<p style="font-size:12px">small</p><p style="font-size:12px">more</p></div>'
+    )
+
+    assert [issue["element"] for issue in issues] == ["p"]
@@ -0,0 +1,138 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests that the document index answers lookups like BeautifulSoup."""
+
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from content_accessibility_utility_on_aws.audit.document_index import DocumentIndex
+
+TAGS = ["div", "section", "p", "span", "a", "img", "table", "tr", "td", "th", "h2"]
+CLASSES = ["a", "b", "c"]
+ROLES = ["main", "navigation", "banner"]
+
+
+def _random_element(rng, depth):
+    """Generate a random element with nested children, text and attributes."""
+    tag = rng.choice(TAGS)
+    attrs = []
+    if rng.random() < 0.4:
+        attrs.append(f'class="{" ".join(rng.sample(CLASSES, rng.randint(1, 3)))}"')
+    if rng.random() < 0.2:
+        attrs.append(f'role="{rng.choice(ROLES)}"')
+    if rng.random() < 0.2:
+        attrs.append(f'id="id-{rng.randint(0, 5)}"')
+    if tag == "a" and rng.random() < 0.5:
+        attrs.append('target="_blank"')
+    children = []
+    if depth < 4:
+        for _ in range(rng.randint(0, 4)):
+            if rng.random() < 0.3:
+                children.append(rng.choice(["text", "  ", "\n", "more text"]))
+            else:
+                children.append(_random_element(rng, depth + 1))
+    attributes = (" " + " ".join(attrs)) if attrs else ""
+    return f"<{tag}{attributes}>{''.join(children)}</{tag}>"
+
+
+def _ids(elements):
+    """Identities of elements; equal-looking elements compare equal in bs4."""
+    return [id(element) for element in elements]
+
+
+def _same(found, expected):
+    """Check that two lookups found the same elements, by identity."""
+    if isinstance(expected, list):
+        return _ids(found) == _ids(expected)
+    return found is expected
+
+
+@pytest.fixture(params=range(5))
+def soup(request):
+    rng = random.Random(request.param)
+    body = "".join(_random_element(rng, 0) for _ in range(8))
+    return BeautifulSoup(
+        f"<html><head><title>T</title></head><body>{body}</body></html>",
+        "html.parser",
+    )
+
+
+def test_tag_lookups_match_find_all(soup):
+    index = DocumentIndex(soup)
+
+    assert _same(index.elements, soup.find_all(True))
+    for tag in TAGS + ["missing"]:
+        assert _same(index.find_all(tag), soup.find_all(tag))
+        assert _same(index.find(tag), soup.find(tag))
+    assert _same(index.find_all(["td", "th", "td"]), soup.find_all(["td", "th"]))
+    assert _same(index.find_all("p", limit=2), soup.find_all("p", limit=2))
+
+
+def test_scoped_lookups_match_find_all(soup):
+    index = DocumentIndex(soup)
+
+    for container in soup.find_all(True):
+        for tag in ("p", "span", "a", "td"):
+            assert _same(
+                index.find_all(tag, within=container), container.find_all(tag)
+            )
+            assert _same(index.find(tag, within=container), container.find(tag))
+        assert _same(
+            index.find_all(["td", "th"], within=container),
+            container.find_all(["td", "th"]),
+        )
+        assert _same(
+            index.find_all(attrs={"class": "a"}, within=container),
+            container.find_all(attrs={"class": "a"}),
+        )
+        descendants = set(_ids(container.find_all(True)))
+        for element in soup.find_all(True):
+            assert index.contains(container, element) == (id(element) in descendants)
+
+
+def test_attribute_lookups_match_find_all(soup):
+    index = DocumentIndex(soup)
+    filters = [{"class": value} for value in CLASSES + ["a b", "b a", "a b c"]]
+    filters += [{"role": role} for role in ROLES]
+    filters += [{"id": f"id-{number}"} for number in range(6)]
+    filters += [{"class": True}, {"role": True}, {"class": "a", "role": True}]
+
+    for attrs in filters:
+        assert _same(index.find_all(attrs=attrs), soup.find_all(attrs=attrs))
+        assert _same(index.find(attrs=attrs), soup.find(attrs=attrs))
+        assert _same(
+            index.find_all("div", attrs=attrs), soup.find_all("div", attrs=attrs)
+        )
+    assert _same(
+        index.find_all("a", attrs={"target": "_blank"}),
+        soup.find_all("a", attrs={"target": "_blank"}),
+    )
+
+
+def test_positions_and_text_match_the_tree(soup):
+    index = DocumentIndex(soup)
+
+    for element in soup.find_all(True):
+        assert index.has_text(element) == bool(element.get_text(strip=True))
+        assert _same(index.closest(element, "div"), element.find_parent("div"))
+
+        same_tag = _ids(soup.find_all(element.name))
+        assert index.tag_position(element) == (
+            same_tag.index(id(element)),
+            len(same_tag),
+        )
+        siblings = element.find_previous_siblings(element.name)
+        assert index.sibling_rank(element) == len(siblings)
+
+
+def test_elements_outside_the_index(soup):
+    index = DocumentIndex(soup)
+    other = BeautifulSoup("<div><p>text</p></div>", "html.parser").div
+
+    assert index.ordinal(other) == -1
+    assert index.tag_position(other) is None
+    assert index.has_text(other)
+    assert _same(index.find_all("p", within=other), other.find_all("p"))
@@ -0,0 +1,144 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests that the HTML parser backends give the same audit and remediation results."""
+
+import json
+
+import pytest
+
+from content_accessibility_utility_on_aws.api import (
+    audit_html_accessibility,
+    remediate_html_accessibility,
+)
+from content_accessibility_utility_on_aws.utils import html_parser
+
+REPORT_DOCUMENT = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head>
+<body>
+<div class="page"><h3>Quarterly report</h3>
+<p style="color:#999;background-color:#fff">Low contrast <span>text</span></p>
+<img src="chart.png">
+<table><tr><td>Name</td><td>Value</td></tr><tr><td>A</td><td>1</td></tr></table>
+<a href="#">click here</a>
+<form><input type="text" id="q"></form>
+<h1>Title</h1><h4>Skipped level</h4>
+<ul><li>One</li><li>Two &amp; three</li></ul>
+<!-- generated -->
+</div></body></html>
+"""
+
+ARTICLE_DOCUMENT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<title>Article</title>
+</head>
+<body>
+<header><h1>Article</h1></header>
+<main>
+<h2>Section</h2>
+<p>See <a href="https://example.com">https://example.com</a> for details.</p>
+<figure><img src="photo.jpg" alt="image"><figcaption>Photo</figcaption></figure>
+<table>
+<thead><tr><th>Year</th><th>Total</th></tr></thead>
+<tbody><tr><td>2024</td><td>12</td></tr></tbody>
+</table>
+<h4>Notes</h4>
+<p style="color:#777777">Small print</p>
+</main>
+</body>
+</html>
+"""
+
+# (document backend, read-only backend) pairs compared with html.parser
+BACKENDS = [
+    pytest.param("lxml", "lxml", id="lxml"),
+    pytest.param("html.parser", "selectolax", id="selectolax"),
+]
+
+
+@pytest.fixture(autouse=True)
+def offline_aws(monkeypatch, tmp_path):
+    """Keep remediation from reaching AWS, whatever the local configuration."""
+    for name in (
+        "AWS_PROFILE",
+        "AWS_REGION",
+        "AWS_DEFAULT_REGION",
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "AWS_SESSION_TOKEN",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(tmp_path / "missing-config"))
+    monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(tmp_path / "missing-credentials"))
+
+
+@pytest.fixture(autouse=True)
+def reset_parser(monkeypatch):
+    """Restore the default backends after each test."""
+    monkeypatch.setattr(html_parser, "_configured_parser", None)
+    monkeypatch.setattr(html_parser, "_configured_read_only_parser", None)
+
+
+def _audit_and_remediate(tmp_path, document, backend, read_only_backend):
+    """Audit and remediate a document with the given backends."""
+    html_parser.configure_html_parser(backend, read_only_backend)
+    work_dir = tmp_path / f"{backend}-{read_only_backend}"
+    work_dir.mkdir()
+    html_path = work_dir / "document.html"
+    html_path.write_text(document, encoding="utf-8")
+    output_path = work_dir / "remediated.html"
+
+    audit = audit_html_accessibility(
+        str(html_path), output_path=str(work_dir / "audit.json")
+    )
+    # Issues record the file they were found in, which differs per run
+    issues_json = json.dumps(audit["issues"], default=str)
+    issues = [
+        {key: value for key, value in issue.items() if key != "id"}
+        for issue in json.loads(issues_json.replace(str(work_dir), "<work_dir>"))
+    ]
+    remediate_html_accessibility(
+        str(html_path),
+        audit_report=audit,
+        options={"disable_ai": True},
+        output_path=str(output_path),
+    )
+    return issues, output_path.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("document", [REPORT_DOCUMENT, ARTICLE_DOCUMENT], ids=["report", "article"])
+@pytest.mark.parametrize("backend,read_only_backend", BACKENDS)
+def test_backends_match_html_parser(tmp_path, document, backend, read_only_backend):
+    for name in {backend, read_only_backend}:
+        if name != html_parser.PARSER_HTML:
+            pytest.importorskip(name)
+
+    expected_issues, expected_html = _audit_and_remediate(
+        tmp_path, document, html_parser.PARSER_HTML, html_parser.PARSER_HTML
+    )
+    issues, html = _audit_and_remediate(tmp_path, document, backend, read_only_backend)
+
+    assert expected_issues
+    assert issues == expected_issues
+    assert html == expected_html
+
+
+@pytest.mark.parametrize("backend", ["lxml", "selectolax"])
+@pytest.mark.parametrize(
+    "markup",
+    [
+        "<!DOCTYPE html>\n<html><head></head><body><p>a</p></body></html>",
+        "<!DOCTYPE html>\n<html>\n<head><title>t</title></head>\n<body>x</body>\n</html>\n\n",
+        "<html><head></head><body><div>a</div></body></html>\n",
+    ],
+    ids=["doctype", "around-structure", "after-html"],
+)
+def test_backends_keep_document_whitespace(backend, markup):
+    pytest.importorskip(backend)
+
+    html_parser.configure_html_parser(read_only_backend=backend)
+    output = str(html_parser.parse_html(markup, read_only=True))
+    html_parser.configure_html_parser(read_only_backend=html_parser.PARSER_HTML)
+
+    assert output == str(html_parser.parse_html(markup, read_only=True))
@@ -0,0 +1,215 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for HTML updater transactions and undoing remediation fixes."""
+
+import pytest
+
+from content_accessibility_utility_on_aws.remediate.bda_integration.element_index import (
+    ElementIndex,
+)
+from content_accessibility_utility_on_aws.remediate.bda_integration.remediation_manager import (
+    RemediationManager,
+)
+from content_accessibility_utility_on_aws.remediate.helpers.html_updater import (
+    HTMLUpdater,
+)
+
+HTML = (
+    "<html><body>"
+    '<img data-bda-id="img-1" src="one.png">'
+    '<p data-bda-id="p-1" class="intro">Intro</p>'
+    '<img data-bda-id="img-2" src="two.png" alt="">'
+    "</body></html>"
+)
+
+ELEMENTS = [
+    {
+        "id": "img-1",
+        "page_indices": [0],
+        "representation": {"html": '<img data-bda-id="img-1" src="one.png">'},
+    },
+    {
+        "id": "p-1",
+        "page_indices": [0],
+        "representation": {"html": '<p data-bda-id="p-1" class="intro">Intro</p>'},
+    },
+    {
+        "id": "img-2",
+        "page_indices": [0],
+        "representation": {"html": '<img data-bda-id="img-2" src="two.png" alt="">'},
+    },
+]
+
+
+class CountingUpdater(HTMLUpdater):
+    """HTML updater counting its saves, which can be made to fail."""
+
+    def __init__(self, html_path):
+        self.saves = 0
+        self.fail_saves = False
+        super().__init__(html_path)
+
+    def save_html(self, output_path=None):
+        if self.fail_saves:
+            return False
+        self.saves += 1
+        return super().save_html(output_path)
+
+
+@pytest.fixture
+def html_path(tmp_path):
+    path = tmp_path / "document.html"
+    path.write_text(HTML, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def updater(html_path):
+    return CountingUpdater(str(html_path))
+
+
+@pytest.fixture
+def manager(updater):
+    manager = RemediationManager(ElementIndex(ELEMENTS), updater)
+    manager.current_page = 0
+    return manager
+
+
+def _alt_fix(element_id, value):
+    return {
+        "type": "attribute_update",
+        "attribute": "alt",
+        "value": value,
+        "element_id": element_id,
+        "issue_type": "missing-alt-text",
+    }
+
+
+def test_nested_transactions_save_once(updater, html_path):
+    with updater.transaction():
+        with updater.transaction():
+            assert updater.update_element_attribute('[data-bda-id="img-1"]', "alt", "A")
+        assert updater.apply_fix(
+            selector='[data-bda-id="img-2"]', attribute_updates={"alt": "B"}
+        )
+        assert updater.saves == 0
+
+    assert updater.saves == 1
+    saved = html_path.read_text(encoding="utf-8")
+    assert 'alt="A"' in saved and 'alt="B"' in saved
+
+
+def test_apply_fix_reports_a_failed_save(updater):
+    updater.fail_saves = True
+
+    assert not updater.apply_fix(
+        selector='[data-bda-id="img-1"]', attribute_updates={"alt": "A"}
+    )
+    # Inside a transaction the fix is saved later, by the outermost commit
+    with updater.transaction():
+        assert updater.apply_fix(
+            selector='[data-bda-id="img-2"]', attribute_updates={"alt": "B"}
+        )
+
+
+def test_rollback_restores_attributes_and_replaced_elements(updater, html_path):
+    original = updater.get_html_content()
+
+    with pytest.raises(RuntimeError):
+        with updater.transaction():
+            updater.update_element_attribute('[data-bda-id="img-1"]', "alt", "A")
+            updater.update_element_attribute('[data-bda-id="img-2"]', "alt", "B")
+            updater.update_element_content(
+                '[data-bda-id="p-1"]', "<h2>Intro</h2><p>Text</p>"
+            )
+            updater.replace_element('[data-bda-id="img-1"]', "<figure>F</figure>")
+            raise RuntimeError("fix failed")
+
+    assert updater.get_html_content() == original
+    # The restored elements are the original ones, found again by selector
+    assert updater.soup.select_one('[data-bda-id="p-1"]').get_text() == "Intro"
+    assert "alt" not in updater.soup.select_one('[data-bda-id="img-1"]').attrs
+    assert updater.saves == 0
+    assert html_path.read_text(encoding="utf-8") == HTML
+
+
+def test_undo_to_a_journal_mark(updater, html_path):
+    updater.update_element_attribute('[data-bda-id="img-1"]', "alt", "A")
+    mark = updater.journal_mark
+    after_first = updater.get_html_content()
+    updater.update_element_attribute('[data-bda-id="img-1"]', "alt", "B")
+    updater.update_element_content('[data-bda-id="p-1"]', "<h2>Intro</h2>")
+
+    assert updater.undo_to(mark) == 2
+    assert updater.get_html_content() == after_first
+    assert html_path.read_text(encoding="utf-8") == after_first
+    assert updater.undo_to(mark) == 0
+
+    # Inside a transaction, edits made before it are kept
+    with updater.transaction():
+        updater.update_element_attribute('[data-bda-id="img-2"]', "alt", "C")
+        assert updater.undo_to(0) == 1
+    assert updater.get_html_content() == after_first
+
+
+def test_failed_fix_is_rolled_back(manager, updater, html_path, monkeypatch):
+    original = updater.get_html_content()
+    apply_content_fix = manager._apply_content_fix
+
+    def partial_fix(*args, **kwargs):
+        # A fallback attempt edits the document, then the fix fails
+        assert apply_content_fix(*args, **kwargs)
+        return False
+
+    monkeypatch.setattr(manager, "_apply_content_fix", partial_fix)
+    manager.current_element_id = "p-1"
+
+    applied = manager.apply_fix(
+        {"type": "content_update", "content": "<h2>Intro</h2>", "element_id": "p-1"}
+    )
+
+    assert not applied
+    assert updater.get_html_content() == original
+    assert updater.journal_mark == 0
+    assert manager.remediation_history == []
+    assert updater.saves == 0
+    assert html_path.read_text(encoding="utf-8") == HTML
+
+
+def test_batch_keeps_the_fixes_that_applied(manager, updater, html_path):
+    results = manager.apply_fixes(
+        [
+            ("img-1", _alt_fix("img-1", "First image"), None),
+            ("p-1", {"type": "unknown"}, None),
+            ("img-2", _alt_fix("img-2", "Second image"), None),
+        ]
+    )
+
+    assert results == [True, False, True]
+    assert updater.saves == 1
+    saved = html_path.read_text(encoding="utf-8")
+    assert 'alt="First image"' in saved and 'alt="Second image"' in saved
+    assert [entry["element_id"] for entry in manager.remediation_history] == [
+        "img-1",
+        "img-2",
+    ]
+
+
+def test_undo_last_fix(manager, updater, html_path):
+    original = updater.get_html_content()
+    manager.current_element_id = "img-1"
+    assert manager.apply_fix(_alt_fix("img-1", "First"))
+    after_first = updater.get_html_content()
+    assert manager.apply_fix(_alt_fix("img-1", "Second"))
+
+    context = manager.undo_last_fix()
+
+    assert context["element"]["id"] == "img-1"
+    assert updater.get_html_content() == after_first
+    assert html_path.read_text(encoding="utf-8") == after_first
+    assert manager.get_element_fixes("img-1") == [_alt_fix("img-1", "First")]
+
+    manager.undo_last_fix()
+    assert updater.get_html_content() == original
+    assert manager.undo_last_fix() is None
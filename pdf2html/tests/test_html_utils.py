@@ -0,0 +1,59 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for combining page files into a single HTML document."""
+
+from bs4 import BeautifulSoup
+
+from content_accessibility_utility_on_aws.utils.html_utils import combine_html_files
+
+
+def _write_page(directory, name, body):
+    path = directory / name
+    path.write_text(
+        f"<!DOCTYPE html><html><head><title>{name}</title></head><body>{body}</body></html>",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+def test_combine_keeps_adjacent_body_children(tmp_path):
+    # No whitespace between the elements: the previous implementation
+    # extracted children while iterating and dropped every other one
+    page = _write_page(
+        tmp_path, "page-1.html", "<h1>Title</h1><p>one</p><p>two</p><p>three</p><ul><li>x</li></ul>"
+    )
+    output_path = str(tmp_path / "out" / "combined.html")
+
+    combine_html_files([page], output_path)
+
+    with open(output_path, encoding="utf-8") as f:
+        soup = BeautifulSoup(f.read(), "html.parser")
+    container = soup.find("div", id="page-1")
+    assert [child.name for child in container.find_all(recursive=False)] == [
+        "h2",
+        "h1",
+        "p",
+        "p",
+        "p",
+        "ul",
+    ]
+    assert [p.get_text() for p in container.find_all("p")] == ["one", "two", "three"]
+
+
+def test_combine_orders_pages_by_number(tmp_path):
+    pages = [
+        _write_page(tmp_path, f"page-{number}.html", f"<p>content {number}</p>")
+        for number in (10, 2, 1)
+    ]
+    output_path = str(tmp_path / "combined.html")
+
+    combine_html_files(pages, output_path)
+
+    with open(output_path, encoding="utf-8") as f:
+        soup = BeautifulSoup(f.read(), "html.parser")
+    assert [p.get_text() for p in soup.find_all("p")] == [
+        "content 1",
+        "content 2",
+        "content 10",
+    ]
@@ -0,0 +1,81 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for JSONL audit reports: the JSON fallback and the CLI lookup."""
+
+import json
+
+from content_accessibility_utility_on_aws.cli import find_default_audit_report
+from content_accessibility_utility_on_aws.utils import report_generator
+from content_accessibility_utility_on_aws.utils.jsonl_report import (
+    read_jsonl_report,
+    read_remediable_issues,
+)
+
+REPORT = {
+    "summary": {"total_issues": 1},
+    "issues": [{"id": "issue-1", "remediation_status": "needs_remediation"}],
+}
+
+
+def test_jsonl_report_round_trip(tmp_path):
+    output_path = str(tmp_path / "audit_report.jsonl")
+
+    report_generator.generate_jsonl_report(REPORT, output_path, "accessibility")
+
+    assert read_jsonl_report(output_path)["issues"] == REPORT["issues"]
+
+
+def test_remediable_issues_are_read_record_by_record(tmp_path):
+    output_path = str(tmp_path / "audit_report.jsonl")
+    issues = [
+        {"id": "issue-1", "remediation_status": "needs_remediation"},
+        {"id": "issue-2", "remediation_status": "compliant"},
+        {"id": "issue-3", "remediation_status": "needs_remediation"},
+    ]
+    report = {"summary": {"total_issues": 3}, "issues": issues, "by_page": {}}
+
+    report_generator.generate_jsonl_report(report, output_path, "accessibility")
+
+    assert read_remediable_issues(output_path) == {
+        "issues": [issues[0], issues[2]],
+        "summary": {"total_issues": 3},
+    }
+
+
+def test_failed_jsonl_report_falls_back_to_json_file(tmp_path, monkeypatch):
+    output_path = tmp_path / "audit_report.jsonl"
+
+    def fail(report_data, path, report_type):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"record": "header"')
+        raise OSError("disk full")
+
+    monkeypatch.setattr(
+        "content_accessibility_utility_on_aws.utils.jsonl_report.write_jsonl_report",
+        fail,
+    )
+
+    report_generator.generate_jsonl_report(REPORT, str(output_path), "accessibility")
+
+    assert not output_path.exists()
+    fallback = json.loads((tmp_path / "audit_report.json").read_text())
+    assert fallback["issues"] == REPORT["issues"]
+
+
+def test_default_audit_report_lookup(tmp_path):
+    html_dir = tmp_path / "output" / "remediated_html"
+    html_dir.mkdir(parents=True)
+    page = html_dir / "page-1.html"
+    page.write_text("<html></html>")
+
+    assert find_default_audit_report(str(page)) is None
+
+    jsonl_report = tmp_path / "output" / "audit_report.jsonl"
+    jsonl_report.write_text("")
+    assert find_default_audit_report(str(page)) == str(jsonl_report)
+    assert find_default_audit_report(str(html_dir) + "/") == str(jsonl_report)
+
+    json_report = html_dir / "audit_report.json"
+    json_report.write_text("{}")
+    assert find_default_audit_report(str(page)) == str(json_report)
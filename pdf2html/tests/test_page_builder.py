@@ -0,0 +1,189 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for building the HTML pages of a BDA result."""
+
+import hashlib
+import os
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from content_accessibility_utility_on_aws.pdf2html.services import page_builder
+from content_accessibility_utility_on_aws.pdf2html.services.page_builder import (
+    HTMLPageWriter,
+    deduplicate_html_elements,
+    resolve_page_workers,
+)
+
+PAGE_COUNT = 11
+
+SIGNIFICANT_TAGS = [
+    "p", "h1", "h2", "h3", "h4", "h5", "h6", "div", "table", "ul", "ol"
+]
+
+
+def scan_duplicates(html):
+    """
+    Remove duplicated elements by comparing element text and serializations,
+    as identify/remove_duplicate_html_elements did before the text index.
+    """
+    elements = BeautifulSoup(html, "html.parser").find_all(SIGNIFICANT_TAGS)
+    seen = set()
+    duplicates = []
+    for idx, element in enumerate(elements):
+        text = element.get_text().strip()
+        if not text:
+            continue
+        signature = f"{element.name}:{text}"
+        if len(signature) > 100:
+            signature = hashlib.md5(signature.encode()).hexdigest()
+        if signature in seen:
+            duplicates.append((idx, str(element)))
+        seen.add(signature)
+    if not duplicates:
+        return html, 0
+
+    soup = BeautifulSoup(html, "html.parser")
+    elements = soup.find_all(SIGNIFICANT_TAGS)
+    for idx, markup in reversed(duplicates):
+        if str(elements[idx]) == markup:
+            elements[idx].decompose()
+    return str(soup), len(duplicates)
+
+
+def _random_fragment(rng, depth=0):
+    """Generate nested markup with few distinct texts, so many elements repeat."""
+    parts = []
+    for _ in range(rng.randint(1, 4)):
+        if depth > 3 or rng.random() < 0.3:
+            parts.append(
+                rng.choice(["X", "Y", " X ", "\n", "<b>X</b>", "<span>Y</span>"])
+            )
+        else:
+            tag = rng.choice(["p", "h1", "h2", "div", "div", "span", "ul", "li"])
+            parts.append(f"<{tag}>{_random_fragment(rng, depth + 1)}</{tag}>")
+    return "".join(parts)
+
+
+def _pages():
+    pages = []
+    for index in range(PAGE_COUNT):
+        paragraph = f"<p>Paragraph {index} with enough text to be a duplicate</p>"
+        pages.append(
+            {
+                "representation": {
+                    "html": f"<h2>Page {index}</h2>{paragraph}<div>{paragraph}</div>"
+                    f'<img src="figure-{index}.png">'
+                }
+            }
+        )
+    # A page without HTML is skipped in multi-page mode
+    pages[4] = {"representation": {}}
+    return pages
+
+
+def _build(output_dir, is_single_page, workers):
+    with HTMLPageWriter(
+        str(output_dir),
+        is_single_page,
+        workers=workers,
+        parallel_threshold=2,
+        chunk_size=2,
+    ) as writer:
+        writer.title = "Report"
+        for index, page in enumerate(_pages()):
+            writer.add_page(index, page)
+        result = writer.finish()
+
+    files = {}
+    for path in result["html_files"]:
+        with open(path, "rb") as f:
+            files[os.path.relpath(path, output_dir)] = f.read()
+    return result, files
+
+
+@pytest.mark.parametrize("is_single_page", [False, True])
+def test_pooled_build_matches_serial_build(tmp_path, is_single_page):
+    serial, serial_files = _build(tmp_path / "serial", is_single_page, workers=1)
+    pooled, pooled_files = _build(tmp_path / "pooled", is_single_page, workers=2)
+
+    assert pooled["page_count"] == serial["page_count"] == PAGE_COUNT
+    assert list(pooled_files) == list(serial_files)
+    assert pooled_files == serial_files
+    if is_single_page:
+        assert list(serial_files) == [os.path.join("extracted_html", "remediated.html")]
+    else:
+        assert len(serial_files) == PAGE_COUNT - 1
+        # Duplicated paragraphs are removed from every page
+        assert serial_files[os.path.join("extracted_html", "page-0.html")].count(
+            b"Paragraph 0"
+        ) == 1
+
+
+def test_pool_is_shut_down_when_reading_pages_fails(tmp_path):
+    with pytest.raises(ValueError):
+        with HTMLPageWriter(
+            str(tmp_path), workers=2, parallel_threshold=2, chunk_size=2
+        ) as writer:
+            for index, page in enumerate(_pages()[:5]):
+                writer.add_page(index, page)
+            executor = writer._executor
+            assert executor is not None
+            raise ValueError("truncated result file")
+
+    assert writer._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_pages_are_built_serially_by_default(monkeypatch):
+    monkeypatch.delenv("PDF2HTML_PAGE_WORKERS", raising=False)
+    assert resolve_page_workers() == 1
+    assert resolve_page_workers(3) == 3
+
+    monkeypatch.setenv("PDF2HTML_PAGE_WORKERS", "4")
+    assert resolve_page_workers() == 4
+    assert resolve_page_workers(2) == 2
+
+    monkeypatch.setenv("PDF2HTML_PAGE_WORKERS", "many")
+    assert resolve_page_workers() == 1
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        # Duplicate siblings, with whitespace and inline markup around the text
+        "<p>Intro</p><p> Intro </p><p><b>Intro</b></p><div>Intro</div><p>Other</p>",
+        # Nested elements with the same text as their parent
+        "<div><p>Text</p></div><div><p>Text</p></div>",
+        "<div><div>Text</div></div><div>Text</div>",
+        "<ul><li>A</li></ul><div><ul><li>A</li></ul><p>A</p></div><p>A</p>",
+        # Long text, hashed by the old signature
+        "<p>" + "Long text " * 20 + "</p><h2>x</h2><p>" + "Long text " * 20 + "</p>",
+        "<p>No duplicates</p><h2>No duplicates</h2><p></p><p> </p>",
+    ],
+)
+def test_duplicates_are_removed_as_before(html):
+    assert deduplicate_html_elements(html) == scan_duplicates(html)
+
+
+def test_random_pages_are_deduplicated_as_before():
+    for seed in range(300):
+        html = _random_fragment(random.Random(seed))
+        assert deduplicate_html_elements(html) == scan_duplicates(html), html
+
+
+def test_hash_collisions_are_confirmed_against_the_text(monkeypatch):
+    # Every text of the same length gets the same signature
+    monkeypatch.setattr(page_builder, "_text_hash", lambda text: 0)
+    html = "<p>ab</p><p>cd</p><p>cd</p><p>ab</p><div>ab</div><p>ef</p>"
+
+    assert deduplicate_html_elements(html) == (
+        "<p>ab</p><p>cd</p><div>ab</div><p>ef</p>",
+        2,
+    )
+    for seed in range(100):
+        html = _random_fragment(random.Random(seed))
+        assert deduplicate_html_elements(html) == scan_duplicates(html), html
@@ -0,0 +1,102 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests that a process run reads, parses and writes each page once per stage."""
+
+import builtins
+import os
+import sys
+from collections import Counter
+
+import pytest
+
+from content_accessibility_utility_on_aws import api
+from content_accessibility_utility_on_aws.utils import html_parser
+
+PAGE_COUNT = 4
+
+
+def _page(number):
+    return (
+        "<!DOCTYPE html><html><head><title>Report</title></head><body>"
+        f'<h2>Section {number}</h2><p>Text of page {number}</p><img src="figure-{number}.png">'
+        f'<table><tr><td>Page {number}</td><td>{number}</td></tr></table>'
+        "</body></html>"
+    )
+
+
+@pytest.fixture
+def converted_pdf(tmp_path, monkeypatch):
+    """A PDF whose conversion writes the page files without calling BDA."""
+    pdf_path = tmp_path / "document.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    output_dir = tmp_path / "output"
+
+    def convert(pdf_path, output_dir=None, options=None, **kwargs):
+        html_dir = os.path.join(output_dir, "extracted_html")
+        os.makedirs(html_dir, exist_ok=True)
+        html_files = []
+        for number in range(1, PAGE_COUNT + 1):
+            path = os.path.join(html_dir, f"page-{number}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(_page(number))
+            html_files.append(path)
+        return {"html_path": html_files[0], "html_files": html_files}
+
+    monkeypatch.setattr(api, "convert_pdf_to_html", convert)
+    return str(pdf_path), str(output_dir)
+
+
+@pytest.fixture
+def page_io(monkeypatch):
+    """Count the reads, writes and full-document parses of every page."""
+    reads, writes, parses = Counter(), Counter(), Counter()
+    open_file = builtins.open
+    parse_html = html_parser.parse_html
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        name = os.path.basename(str(file))
+        if name.startswith("page-") and name.endswith(".html"):
+            counter = writes if any(flag in mode for flag in "wax") else reads
+            counter[(os.path.basename(os.path.dirname(str(file))), name)] += 1
+        return open_file(file, mode, *args, **kwargs)
+
+    def counting_parse_html(markup, read_only=False):
+        for number in range(1, PAGE_COUNT + 1):
+            if f"Text of page {number}<" in str(markup):
+                parses[number] += 1
+        return parse_html(markup, read_only=read_only)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    for module in list(sys.modules.values()):
+        if getattr(module, "parse_html", None) is parse_html:
+            monkeypatch.setattr(module, "parse_html", counting_parse_html)
+    return reads, writes, parses
+
+
+def test_process_reads_and_writes_each_page_once(converted_pdf, page_io):
+    pdf_path, output_dir = converted_pdf
+    reads, writes, parses = page_io
+
+    result = api.process_pdf_accessibility(
+        pdf_path,
+        output_dir,
+        audit_options={"multi_page": True},
+        remediation_options={"disable_ai": True},
+        perform_remediation=True,
+    )
+
+    pages = [f"page-{number}.html" for number in range(1, PAGE_COUNT + 1)]
+    assert result["audit_result"]["issues"]
+    assert result["audit_result"]["issues"][0]["context"]
+    assert len(result["remediation_result"]["html_files"]) == PAGE_COUNT
+    # The conversion writes each page; the audit reads it once and the
+    # remediation takes it from the store and writes its remediated version
+    assert reads == Counter({("extracted_html", page): 1 for page in pages})
+    assert writes == Counter(
+        {("extracted_html", page): 1 for page in pages}
+        | {("remediated_html", page): 1 for page in pages}
+    )
+    # Parsed once by the audit, with the read-only backend, and once by the
+    # remediation; report contexts are collected from the audit's tree
+    assert parses == Counter({number: 2 for number in range(1, PAGE_COUNT + 1)})
@@ -0,0 +1,171 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for page classification and the image-only PDF check."""
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+)
+
+from content_accessibility_utility_on_aws.pdf2html.utils import pdf_utils
+from content_accessibility_utility_on_aws.pdf2html.utils.pdf_utils import (
+    PAGE_EMPTY,
+    PAGE_IMAGE,
+    PAGE_TEXT,
+    _sample_page_indices,
+    classify_pdf_page,
+    classify_pdf_pages,
+    is_image_only_pdf,
+)
+
+TEXT_CONTENT = b"BT /F1 12 Tf 72 712 Td (Hello) Tj ET"
+IMAGE_CONTENT = b"q 100 0 0 100 0 0 cm /Im1 Do Q"
+FORM_CONTENT = b"q /Fm1 Do Q"
+
+
+def _stream(writer, data, **entries):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    for key, value in entries.items():
+        stream[NameObject(f"/{key}")] = value
+    return writer._add_object(stream)
+
+
+def _font(writer):
+    return DictionaryObject(
+        {
+            NameObject("/F1"): writer._add_object(
+                DictionaryObject(
+                    {
+                        NameObject("/Type"): NameObject("/Font"),
+                        NameObject("/Subtype"): NameObject("/Type1"),
+                        NameObject("/BaseFont"): NameObject("/Helvetica"),
+                    }
+                )
+            )
+        }
+    )
+
+
+def _image(writer):
+    return _stream(
+        writer,
+        b"\x00",
+        Type=NameObject("/XObject"),
+        Subtype=NameObject("/Image"),
+        Width=NumberObject(1),
+        Height=NumberObject(1),
+        ColorSpace=NameObject("/DeviceGray"),
+        BitsPerComponent=NumberObject(8),
+    )
+
+
+def _add_page(writer, kind):
+    """Add a page that draws text, an image, text in a form XObject, or nothing."""
+    page = writer.add_blank_page(width=200, height=200)
+    resources = DictionaryObject()
+    content = b""
+    if kind == "text":
+        resources[NameObject("/Font")] = _font(writer)
+        content = TEXT_CONTENT
+    elif kind == "image":
+        resources[NameObject("/XObject")] = DictionaryObject(
+            {NameObject("/Im1"): _image(writer)}
+        )
+        content = IMAGE_CONTENT
+    elif kind == "form":
+        form = _stream(
+            writer,
+            TEXT_CONTENT,
+            Type=NameObject("/XObject"),
+            Subtype=NameObject("/Form"),
+            BBox=ArrayObject([NumberObject(0)] * 2 + [NumberObject(200)] * 2),
+            Resources=DictionaryObject({NameObject("/Font"): _font(writer)}),
+        )
+        resources[NameObject("/XObject")] = DictionaryObject({NameObject("/Fm1"): form})
+        content = FORM_CONTENT
+    page[NameObject("/Resources")] = resources
+    page[NameObject("/Contents")] = _stream(writer, content)
+
+
+def _write_pdf(path, kinds):
+    writer = PdfWriter()
+    for kind in kinds:
+        _add_page(writer, kind)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "kind, expected",
+    [
+        ("text", PAGE_TEXT),
+        ("image", PAGE_IMAGE),
+        ("form", PAGE_TEXT),
+        ("empty", PAGE_EMPTY),
+    ],
+)
+def test_classify_pdf_page(tmp_path, kind, expected):
+    pdf_path = _write_pdf(tmp_path / "doc.pdf", [kind])
+
+    assert classify_pdf_pages(pdf_path) == {0: expected}
+
+
+def test_text_operators_without_fonts_are_not_text(tmp_path):
+    writer = PdfWriter()
+    _add_page(writer, "empty")
+    page = writer.pages[0]
+    page[NameObject("/Contents")] = _stream(writer, TEXT_CONTENT)
+
+    assert classify_pdf_page(page) == PAGE_EMPTY
+
+
+def test_sampled_pages_are_evenly_spaced_and_stable():
+    assert _sample_page_indices(5, 8) == [0, 1, 2, 3, 4]
+    assert _sample_page_indices(100, None) == list(range(100))
+    assert _sample_page_indices(100, 5) == [0, 99, 24, 49, 74]
+
+    for num_pages in range(9, 200):
+        indices = _sample_page_indices(num_pages, 8)
+        assert len(set(indices)) == 8
+        assert all(0 <= index < num_pages for index in indices)
+        assert indices == _sample_page_indices(num_pages, 8)
+
+
+def test_image_only_check_stops_at_the_first_text_page(tmp_path, monkeypatch):
+    kinds = ["image"] * 20
+    kinds[10] = "text"
+    pdf_path = _write_pdf(tmp_path / "doc.pdf", kinds)
+    classified = []
+    classify = pdf_utils.classify_pdf_page
+
+    def recording_classify(page):
+        classified.append(page.page_number)
+        return classify(page)
+
+    monkeypatch.setattr(pdf_utils, "classify_pdf_page", recording_classify)
+
+    assert _sample_page_indices(20, 8) == [0, 19, 2, 5, 8, 10, 13, 16]
+    assert not is_image_only_pdf(pdf_path, sample_size=8)
+    assert classified == [0, 19, 2, 5, 8, 10]
+
+    classified.clear()
+    assert not is_image_only_pdf(pdf_path, sample_size=None)
+    assert classified == list(range(11))
+
+
+def test_text_pages_outside_the_sample_are_not_seen(tmp_path):
+    kinds = ["image"] * 20
+    kinds[11] = "text"
+    pdf_path = _write_pdf(tmp_path / "doc.pdf", kinds)
+
+    assert is_image_only_pdf(pdf_path, sample_size=8)
+    assert is_image_only_pdf(pdf_path, sample_size=8)
+    assert not is_image_only_pdf(pdf_path, sample_size=None)
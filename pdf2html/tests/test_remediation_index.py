@@ -0,0 +1,305 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests that the remediation index resolves elements like document scans."""
+
+import os
+import random
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from content_accessibility_utility_on_aws.remediate.helpers.remediation_index import (
+    get_remediation_index,
+    invalidate_remediation_index,
+)
+from content_accessibility_utility_on_aws.remediate.remediation_manager import (
+    RemediationManager,
+)
+from content_accessibility_utility_on_aws.remediate.remediation_strategies.image_remediation import (
+    find_image_by_issue,
+)
+from content_accessibility_utility_on_aws.remediate.remediation_strategies.table_remediation import (
+    get_table_from_issue,
+)
+
+ALTS = ["image", "Image", "IMAGE", "chart", "Sales chart", ""]
+GENERIC_ALT_PATTERNS = [r"^image$", r"^picture$", r"^photo$", r"^img\d*$", r"^[\d\s]*$"]
+TABLE_ISSUE_TYPES = [
+    "table-missing-headers",
+    "table-missing-scope",
+    "table-missing-thead",
+    "table-missing-tbody",
+    "table-irregular-headers",
+    "table-missing-caption",
+]
+
+
+def scan_image(soup, issue):
+    """Find the image of an issue by scanning the document, as before the index."""
+    element_str = issue.get("element", "")
+    if issue.get("selector"):
+        img = soup.select_one(issue["selector"])
+        if img and img.name == "img":
+            return img
+    src_match = re.search(r'src="([^"]*)"', element_str)
+    alt_match = re.search(r'alt="([^"]*)"', element_str)
+    bda_id_match = re.search(r'data-bda-id="([^"]*)"', element_str)
+    if bda_id_match:
+        img = soup.find("img", attrs={"data-bda-id": bda_id_match.group(1)})
+        if img:
+            return img
+    if src_match:
+        src = src_match.group(1)
+        img = soup.find("img", src=src)
+        if img:
+            return img
+        for image in soup.find_all("img"):
+            if image.get("src") and os.path.basename(image["src"]) == (
+                os.path.basename(src)
+            ):
+                return image
+    if alt_match:
+        alt = alt_match.group(1)
+        images = soup.find_all("img", alt=alt)
+        if images:
+            return images[0]
+        for image in soup.find_all("img"):
+            if image.get("alt") and image["alt"].upper() == alt.upper():
+                return image
+    position = issue.get("context", {}).get("position")
+    if position:
+        images = soup.find_all("img")
+        if 0 <= int(position) - 1 < len(images):
+            return images[int(position) - 1]
+    if issue.get("type") == "generic-alt-text":
+        for image in soup.find_all("img"):
+            alt = image.get("alt", "").strip().lower()
+            if alt and any(re.match(pattern, alt) for pattern in GENERIC_ALT_PATTERNS):
+                return image
+    return None
+
+
+def scan_table(soup, issue):
+    """Find the table of an issue by scanning the document, as before the index."""
+    element_str = issue.get("element", "")
+    if issue.get("selector"):
+        table = soup.select_one(issue["selector"])
+        if table and table.name == "table":
+            return table
+    if element_str == "table":
+        text = issue.get("context", {}).get("text", "")
+        if text:
+            for table in soup.find_all("table"):
+                if text in table.get_text():
+                    return table
+        position = issue.get("context", {}).get("index", 0)
+        tables = soup.find_all("table")
+        if 0 <= position < len(tables):
+            return tables[position]
+    elif element_str.startswith("<table"):
+        for table in soup.find_all("table"):
+            if re.sub(r"\s+", "", str(table)) == re.sub(r"\s+", "", element_str):
+                return table
+    issue_type = issue.get("type", "")
+    for table in soup.find_all("table"):
+        if issue_type == "table-missing-headers" and not table.find("th"):
+            return table
+        if issue_type == "table-missing-scope" and table.find("th", scope=False):
+            return table
+        if issue_type == "table-missing-thead" and not table.find("thead"):
+            return table
+        if issue_type == "table-missing-tbody" and not table.find("tbody"):
+            return table
+        if issue_type == "table-irregular-headers" and table.find("th"):
+            if any(not th.get("scope") for th in table.find_all("th")):
+                return table
+    if issue_type.startswith("table-"):
+        return soup.find("table")
+    return None
+
+
+def _document(rng):
+    """Generate a document with images and tables sharing sources and captions."""
+    parts = []
+    for i in range(30):
+        if rng.random() < 0.6:
+            attrs = [f'src="{rng.choice(["a", "b"])}/img-{rng.randint(0, 9)}.png"']
+            if rng.random() < 0.7:
+                attrs.append(f'alt="{rng.choice(ALTS)}"')
+            if rng.random() < 0.5:
+                attrs.append(f'data-bda-id="bda-{rng.randint(0, 9)}"')
+            if rng.random() < 0.2:
+                attrs.append(f'id="image-{i}"')
+            parts.append(f"<p>Text {i}</p><img {' '.join(attrs)}>")
+        else:
+            caption = (
+                f"<caption>Table {rng.randint(0, 3)}</caption>"
+                if rng.random() < 0.5
+                else ""
+            )
+            header = rng.choice(
+                [
+                    "<tr><td>A</td><td>B</td></tr>",
+                    "<tr><th>A</th><th>B</th></tr>",
+                    '<tr><th scope="col">A</th><th>B</th></tr>',
+                ]
+            )
+            rows = f"<tr><td>{i}</td><td>{rng.randint(0, 3)}</td></tr>"
+            body = f"{header}{rows}"
+            if rng.random() < 0.3:
+                body = f"<thead>{header}</thead><tbody>{rows}</tbody>"
+            table_id = f' id="table-{i}"' if rng.random() < 0.3 else ""
+            parts.append(f"<table{table_id}>{caption}{body}</table>")
+    return BeautifulSoup(
+        f"<html><body><main>{''.join(parts)}</main></body></html>", "html.parser"
+    )
+
+
+def _image_issue(rng, soup):
+    """Generate an image issue from an image of the document, or a made-up one."""
+    images = soup.find_all("img")
+    image = rng.choice(images)
+    issue = {"type": rng.choice(["missing_alt_text", "generic-alt-text"])}
+    kind = rng.randrange(5)
+    if kind == 0:
+        issue["element"] = str(image)
+    elif kind == 1:
+        issue["element"] = f'<img src="c/{os.path.basename(image.get("src", ""))}">'
+    elif kind == 2:
+        issue["element"] = f'<img alt="{rng.choice(ALTS).swapcase()}">'
+    elif kind == 3:
+        issue["context"] = {"position": rng.randint(1, len(images) + 1)}
+    elif image.get("id"):
+        issue["selector"] = f"#{image['id']}"
+    else:
+        issue["selector"] = f'[data-bda-id="bda-{rng.randint(0, 9)}"]'
+    return issue
+
+
+def _table_issue(rng, soup):
+    """Generate a table issue from a table of the document, or a made-up one."""
+    tables = soup.find_all("table")
+    issue = {"type": rng.choice(TABLE_ISSUE_TYPES)}
+    kind = rng.randrange(4)
+    if kind == 0 and tables:
+        issue["element"] = str(rng.choice(tables))
+    elif kind == 1:
+        issue["element"] = "table"
+        issue["context"] = {
+            "text": rng.choice(["Table 1", "Table 3", "B", "7", "missing"]),
+            "index": rng.randint(0, len(tables)),
+        }
+    elif kind == 2 and tables and tables[0].get("id"):
+        issue["selector"] = f"#{tables[0]['id']}"
+    return issue
+
+
+def _change_image(rng, soup, image):
+    """Change an image the way the image strategies do."""
+    change = rng.randrange(4)
+    if change == 0:
+        image["alt"] = rng.choice(ALTS + ["A new description"])
+    elif change == 1:
+        image["src"] = f"{rng.choice(['a', 'b'])}/img-{rng.randint(0, 9)}.png"
+    elif change == 2:
+        image["data-bda-id"] = f"bda-{rng.randint(0, 9)}"
+    elif not image.find_parent("figure"):
+        image.wrap(soup.new_tag("figure"))
+
+
+def _change_table(rng, soup, table):
+    """Change a table the way the table strategies do."""
+    change = rng.randrange(4)
+    if change == 0:
+        for th in table.find_all("th"):
+            th["scope"] = "col"
+    elif change == 1 and not table.find("caption"):
+        caption = soup.new_tag("caption")
+        caption.string = f"Table {rng.randint(0, 3)}"
+        table.insert(0, caption)
+    elif change == 2 and not table.find("thead"):
+        first_row = table.find("tr")
+        thead = soup.new_tag("thead")
+        first_row.wrap(thead)
+        for cell in first_row.find_all("td"):
+            cell.name = "th"
+    else:
+        table.find("td").string = str(rng.randint(0, 3))
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_lookups_match_scans_while_strategies_change_the_document(seed):
+    rng = random.Random(seed)
+    soup = _document(rng)
+
+    for _ in range(120):
+        if rng.random() < 0.5:
+            issue = _image_issue(rng, soup)
+            expected = scan_image(soup, issue)
+            found = find_image_by_issue(soup, issue)
+            assert found is expected, issue
+            if found is not None:
+                _change_image(rng, soup, found)
+        else:
+            issue = _table_issue(rng, soup)
+            expected = scan_table(soup, issue)
+            found = get_table_from_issue(soup, issue)
+            assert found is expected, issue
+            if found is not None:
+                _change_table(rng, soup, found)
+
+
+def test_invalidated_index_is_rebuilt():
+    soup = _document(random.Random(7))
+    index = get_remediation_index(soup)
+    first_image = soup.find("img")
+    position_issue = {"type": "missing_alt_text", "context": {"position": 1}}
+    assert find_image_by_issue(soup, position_issue) is first_image
+
+    # Changes made without the index: a new first image and table
+    first_image.decompose()
+    new_nodes = BeautifulSoup(
+        '<table><tr><td>New</td></tr></table><img src="new.png">', "html.parser"
+    )
+    soup.main.insert(0, new_nodes.img)
+    soup.main.insert(0, new_nodes.table)
+    invalidate_remediation_index(soup)
+
+    assert get_remediation_index(soup) is not index
+    assert find_image_by_issue(soup, position_issue) is soup.find("img")
+    assert soup.find("img")["src"] == "new.png"
+    table_issue = {
+        "type": "table-missing-caption",
+        "element": "table",
+        "context": {"text": "New"},
+    }
+    assert get_table_from_issue(soup, table_issue) is soup.find("table")
+
+
+def test_manager_rebuilds_the_index_after_other_strategies():
+    html = (
+        "<html><body><main>"
+        '<img src="logo.png"><p>Figure 1: Logo</p>'
+        '<table><tr><th>A</th></tr><tr><td>1</td></tr></table>'
+        "</main></body></html>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    manager = RemediationManager(soup, {"disable_ai": True})
+    index = get_remediation_index(soup)
+
+    # A table strategy changes the document through the index, which is kept
+    manager.remediate_issues([{"type": "table-missing-scope", "element": "table"}])
+    assert soup.th["scope"] == "col"
+    assert get_remediation_index(soup) is index
+
+    # The figure strategy changes the document without it, so it is dropped
+    manager.remediate_issues(
+        [{"type": "improper-figure-structure", "location": {"path": "logo.png"}}]
+    )
+    assert soup.figure is not None and soup.find("p") is None
+    rebuilt = get_remediation_index(soup)
+    assert rebuilt is not index
+    assert rebuilt.image_at(0) is soup.img
+    assert rebuilt.table_at(0) is soup.table
@@ -0,0 +1,134 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the Bedrock response cache and its record and replay modes."""
+
+import pytest
+
+from content_accessibility_utility_on_aws.remediate.services import bedrock_client
+from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
+    AltTextGenerationError,
+    BedrockClient,
+)
+from content_accessibility_utility_on_aws.remediate.services.response_cache import (
+    CACHE_MODE_VARIABLE,
+    CACHE_PATH_VARIABLE,
+    PASSTHROUGH_MODE,
+    RECORD_MODE,
+    REPLAY_MODE,
+    BedrockResponseCache,
+    ResponseCacheMissError,
+    request_key,
+    response_cache_from_environment,
+)
+
+MODEL_ID = "model"
+
+
+class FakeRuntimeClient:
+    """Bedrock runtime client numbering its responses."""
+
+    def __init__(self):
+        self.requests = []
+
+    def converse(self, **kwargs):
+        self.requests.append(kwargs)
+        text = f"response {len(self.requests)}"
+        return {
+            "output": {"message": {"content": [{"text": text}]}},
+            "stopReason": "end_turn",
+            "ResponseMetadata": {"RequestId": "not stored"},
+        }
+
+
+def _request(text="Describe the image", **arguments):
+    return {
+        "modelId": MODEL_ID,
+        "messages": [{"role": "user", "content": [{"text": text}]}],
+        "inferenceConfig": {"maxTokens": 100},
+        **arguments,
+    }
+
+
+def _cache(tmp_path, mode):
+    return BedrockResponseCache(str(tmp_path / "cache"), mode)
+
+
+def test_recorded_responses_are_replayed(tmp_path):
+    runtime = FakeRuntimeClient()
+    recorder = _cache(tmp_path, RECORD_MODE).wrap(runtime)
+
+    first = recorder.converse(**_request())
+    assert recorder.converse(**_request()) == {
+        "output": first["output"],
+        "stopReason": "end_turn",
+    }
+    assert len(runtime.requests) == 1
+
+    # Replay needs no runtime client; whitespace in the text does not matter
+    replayer = _cache(tmp_path, REPLAY_MODE).wrap(None)
+    replayed = replayer.converse(**_request("  Describe\n the   image "))
+
+    assert replayed["output"] == first["output"]
+    assert replayer.cache.hits == 1
+
+
+def test_replay_miss_raises(tmp_path):
+    _cache(tmp_path, RECORD_MODE).wrap(FakeRuntimeClient()).converse(**_request())
+    replayer = _cache(tmp_path, REPLAY_MODE).wrap(None)
+
+    with pytest.raises(ResponseCacheMissError):
+        replayer.converse(**_request("Describe another image"))
+    assert replayer.cache.misses == 1
+
+
+def test_every_request_argument_is_part_of_the_key(tmp_path):
+    runtime = FakeRuntimeClient()
+    recorder = _cache(tmp_path, RECORD_MODE).wrap(runtime)
+    system = [{"text": "You write alt text."}]
+
+    recorder.converse(**_request())
+    recorder.converse(**_request(system=system))
+    recorder.converse(**_request(additionalModelRequestFields={"top_k": 5}))
+    recorder.converse(**_request(system=system))
+
+    assert len(runtime.requests) == 3
+    assert request_key(_request(system=system)) != request_key(_request())
+    assert request_key(_request(inferenceConfig={"maxTokens": 200})) != (
+        request_key(_request())
+    )
+
+
+def test_passthrough_sends_every_request_and_stores_nothing(tmp_path):
+    runtime = FakeRuntimeClient()
+    client = _cache(tmp_path, PASSTHROUGH_MODE).wrap(runtime)
+
+    client.converse(**_request())
+    second = client.converse(**_request())
+
+    assert len(runtime.requests) == 2
+    assert second["ResponseMetadata"] == {"RequestId": "not stored"}
+    with pytest.raises(ResponseCacheMissError):
+        _cache(tmp_path, REPLAY_MODE).wrap(None).converse(**_request())
+
+
+def test_bedrock_client_replays_without_a_runtime_client(tmp_path, monkeypatch):
+    recorder = BedrockClient(
+        model_id=MODEL_ID,
+        runtime_client=_cache(tmp_path, RECORD_MODE).wrap(FakeRuntimeClient()),
+    )
+    text = recorder.generate_text("Summarize the table")
+
+    def no_endpoint(*args, **kwargs):
+        raise ValueError("You must specify a region.")
+
+    monkeypatch.setattr(bedrock_client, "get_runtime_client", no_endpoint)
+    monkeypatch.setenv(CACHE_PATH_VARIABLE, str(tmp_path / "cache"))
+    monkeypatch.setenv(CACHE_MODE_VARIABLE, REPLAY_MODE)
+    replayer = BedrockClient(model_id=MODEL_ID)
+
+    assert replayer.response_cache is response_cache_from_environment()
+    assert replayer.client.client is None
+    assert replayer.generate_text("Summarize the table") == text
+    with pytest.raises(AltTextGenerationError):
+        replayer.generate_text("Summarize another table")
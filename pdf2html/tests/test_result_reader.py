@@ -0,0 +1,82 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the streaming BDA result.json reader."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from content_accessibility_utility_on_aws.pdf2html.services.result_reader import (
+    BDAResultReader,
+)
+
+
+def _write_result(path, document_size):
+    """Write a result.json with a large whole-document representation."""
+    # Quotes, backslashes and non-ASCII text exercise the string scanning
+    paragraph = '<p class=\\"x\\">caf\\u00e9 \\\\ "quoted" ü {[ ' + "text " * 40 + "</p>\n"
+    repeat = document_size // len(paragraph) + 1
+    data = {
+        "metadata": {"asset_id": "doc"},
+        "document": {
+            "representation": {"html": paragraph * repeat, "markdown": "# x"}
+        },
+        "pages": [
+            {"page_index": i, "representation": {"html": f"<p>page {i} \"q\"</p>"}}
+            for i in range(5)
+        ],
+        "elements": [
+            {"id": f"e{i}", "type": "FIGURE", "value": [1, 2.5, None, True]}
+            for i in range(5)
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    return data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_items_match_json_load(tmp_path, chunk_size):
+    path = tmp_path / "result.json"
+    data = _write_result(path, 2000)
+
+    items = list(BDAResultReader(str(path), chunk_size=chunk_size).iter_items())
+
+    assert items == (
+        [("metadata", data["metadata"]), ("document", None)]
+        + [("pages", page) for page in data["pages"]]
+        + [("elements", element) for element in data["elements"]]
+    )
+
+
+def test_truncated_file_raises(tmp_path):
+    path = tmp_path / "result.json"
+    path.write_text('{"pages": [{"a": "b"}, {"a": ', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(BDAResultReader(str(path), chunk_size=4).iter_items())
+
+
+def test_skipping_document_uses_bounded_memory(tmp_path):
+    path = tmp_path / "result.json"
+    _write_result(path, 7 * 1024 * 1024)
+    file_size = path.stat().st_size
+
+    tracemalloc.start()
+    try:
+        for _ in BDAResultReader(str(path)).iter_items():
+            pass
+        _, reader_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)
+        _, load_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Only a fixed-size buffer is held while the document value is skipped
+    assert reader_peak < 2 * 1024 * 1024
+    assert reader_peak < file_size / 4
+    assert reader_peak < load_peak / 4
@@ -0,0 +1,128 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for streaming zip archives of a directory to S3."""
+
+import io
+import os
+import zipfile
+
+import pytest
+
+from content_accessibility_utility_on_aws.utils.s3_archive import (
+    MIN_PART_SIZE,
+    upload_directory_archives,
+)
+
+BUCKET = "bucket"
+
+# Zip entry flag set when a data descriptor follows the entry's data
+DATA_DESCRIPTOR_FLAG = 0x08
+
+
+class StubS3Client:
+    """S3 client keeping multipart uploads in memory."""
+
+    def __init__(self, fail_on_part=None):
+        # Number of the upload_part call that fails, counted across uploads
+        self.fail_on_part = fail_on_part
+        self.part_calls = 0
+        self.uploads = {}
+        self.objects = {}
+        self.aborted = []
+
+    def create_multipart_upload(self, Bucket, Key, ContentType):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.part_calls += 1
+        if self.part_calls == self.fail_on_part:
+            raise ConnectionError("connection reset")
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts)
+        # Every part but the last one must be at least the minimum size
+        assert all(len(parts[number]) >= MIN_PART_SIZE for number in numbers[:-1])
+        self.objects[Key] = b"".join(parts[number] for number in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(Key)
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    files = {
+        "index.html": b"<html><body>" + b"<p>Text</p>" * 1000 + b"</body></html>",
+        os.path.join("images", "figure.png"): os.urandom(MIN_PART_SIZE + 1000),
+        os.path.join("images", "photo.JPG"): os.urandom(2000),
+        os.path.join("reports", "report.json"): b'{"issues": []}',
+    }
+    for name, content in files.items():
+        path = tmp_path / "output" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return str(tmp_path / "output"), files
+
+
+def _html_only(rel_path):
+    return rel_path.endswith(".html")
+
+
+def test_archives_are_streamed_to_s3(source_dir):
+    directory, files = source_dir
+    s3 = StubS3Client()
+
+    counts = upload_directory_archives(
+        s3,
+        directory,
+        [(BUCKET, "all.zip", None), (BUCKET, "html.zip", _html_only)],
+        part_size=MIN_PART_SIZE,
+    )
+
+    assert counts == [4, 1]
+    assert s3.uploads == {} and s3.aborted == []
+    # The large image spans two parts of the full archive
+    assert s3.part_calls == 3
+    with zipfile.ZipFile(io.BytesIO(s3.objects["all.zip"])) as archive:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == sorted(
+            name.replace(os.sep, "/") for name in files
+        )
+        for name, content in files.items():
+            assert archive.read(name.replace(os.sep, "/")) == content
+        for info in archive.infolist():
+            # Entries with data descriptors must be deflated to be readable
+            # by Java's ZipInputStream
+            assert info.flag_bits & DATA_DESCRIPTOR_FLAG
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+        media = [
+            archive.getinfo("images/figure.png"),
+            archive.getinfo("images/photo.JPG"),
+        ]
+        assert all(info.compress_size >= info.file_size for info in media)
+        html = archive.getinfo("index.html")
+        assert html.compress_size < html.file_size // 10
+    with zipfile.ZipFile(io.BytesIO(s3.objects["html.zip"])) as archive:
+        assert archive.namelist() == ["index.html"]
+
+
+def test_failed_upload_aborts_every_archive(source_dir):
+    directory, _ = source_dir
+    s3 = StubS3Client(fail_on_part=1)
+
+    with pytest.raises(ConnectionError):
+        upload_directory_archives(
+            s3,
+            directory,
+            [(BUCKET, "all.zip", None), (BUCKET, "html.zip", _html_only)],
+        )
+
+    assert s3.aborted == ["all.zip", "html.zip"]
+    assert s3.uploads == {} and s3.objects == {}